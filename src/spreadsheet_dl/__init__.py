@@ -57,447 +57,820 @@
 For complete feature history and migration guides, see CHANGELOG.md
 """
 
-# Import version from dedicated module for fast CLI startup
-# Account Management
-# Format Adapters
-# =============================================================================
-# Modular Packages - Public namespace access
-# =============================================================================
-# Import packages for users who want to access modular structure
-# Example: from spreadsheet_dl import mcp_pkg; config = mcp_pkg.MCPConfig()
-from spreadsheet_dl import _builder as builder_pkg  # noqa: F401
-from spreadsheet_dl import _cli as cli_pkg  # noqa: F401
-from spreadsheet_dl import _mcp as mcp_pkg  # noqa: F401
-from spreadsheet_dl._version import __author__, __version__
-from spreadsheet_dl.adapters import (
-    AdapterOptions,
-    AdapterRegistry,
-    CsvAdapter,
-    ExportFormat,
-    FormatAdapter,
-    HtmlAdapter,
-    ImportFormat,
-    JsonAdapter,
-    OdsAdapter,
-    TsvAdapter,
-    export_to,
-    import_from,
-)
-
-# AI Export
-from spreadsheet_dl.ai_export import (
-    AIExporter,
-    CellRelationship,
-    SemanticCell,
-    SemanticCellType,
-    SemanticSheet,
-    SemanticTag,
-    export_dual,
-    export_for_ai,
-)
-
-# AI Training Data Export
-from spreadsheet_dl.ai_training import (
-    AnonymizationConfig,
-    AnonymizationLevel,
-    DataAnonymizer,
-    PIIDetector,
-    TrainingDataExporter,
-    TrainingDataset,
-    export_training_data,
-)
-
-# Backup
-from spreadsheet_dl.backup import (
-    BackupManager,
-    BackupReason,
-    auto_backup,
-)
-
-# Builder API
-from spreadsheet_dl.builder import (
-    CellRef,
-    CellSpec,
-    ColumnSpec,
-    FormulaBuilder,
-    RangeRef,
-    RowSpec,
-    SheetRef,
-    SheetSpec,
-    SpreadsheetBuilder,
-    create_spreadsheet,
-    formula,
-)
-
-# ============================================================================
-# v2.0.0 Professional Spreadsheet System (95 new requirements)
-# ============================================================================
-# Charts
-from spreadsheet_dl.charts import (
-    AxisConfig,
-    AxisType,
-    ChartBuilder,
-    ChartPosition,
-    ChartSize,
-    ChartSpec,
-    ChartTitle,
-    ChartType,
-    DataLabelConfig,
-    DataLabelPosition,
-    DataSeries,
-    LegendConfig,
-    LegendPosition,
-    PlotAreaStyle,
-    Sparkline,
-    SparklineBuilder,
-    SparklineMarkers,
-    SparklineType,
-    Trendline,
-    TrendlineType,
-    budget_comparison_chart,
-    chart,
-    sparkline,
-    spending_pie_chart,
-    trend_line_chart,
-)
-
-# Shell Completions
-from spreadsheet_dl.completions import (
-    detect_shell,
-    generate_bash_completions,
-    generate_fish_completions,
-    generate_zsh_completions,
-    install_completions,
-    print_completion_script,
-)
-from spreadsheet_dl.config import (
-    Config,
-    get_config,
-    init_config_file,
-)
-from spreadsheet_dl.domains.finance.accounts import (
-    Account,
-    AccountManager,
-    AccountTransaction,
-    AccountType,
-    NetWorth,
-    Transfer,
-    get_default_accounts,
-)
-from spreadsheet_dl.domains.finance.alerts import (
-    Alert,
-    AlertConfig,
-    AlertMonitor,
-    AlertSeverity,
-    AlertType,
-    check_budget_alerts,
-)
-from spreadsheet_dl.domains.finance.analytics import (
-    AnalyticsDashboard,
-    generate_dashboard,
-)
+from __future__ import annotations
 
-# Extended Bank Formats
-from spreadsheet_dl.domains.finance.bank_formats import (
-    BUILTIN_FORMATS,
-    BankFormatDefinition,
-    BankFormatRegistry,
-    FormatBuilder,
-    count_formats,
-    detect_format,
-    get_format,
-    list_formats,
-)
-from spreadsheet_dl.domains.finance.budget_analyzer import (
-    BudgetAnalyzer,
-    analyze_budget,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Custom Categories
-from spreadsheet_dl.domains.finance.categories import (
-    Category,
-    CategoryManager,
-    StandardCategory,
-    category_from_string,
-    get_category_manager,
-)
-from spreadsheet_dl.domains.finance.csv_import import (
-    BANK_FORMATS,
-    CSVImporter,
-    TransactionCategorizer,
-    import_bank_csv,
-)
-
-# Multi-Currency Support
-from spreadsheet_dl.domains.finance.currency import (
-    CURRENCIES,
-    Currency,
-    CurrencyCode,
-    CurrencyConverter,
-    ExchangeRate,
-    ExchangeRateProvider,
-    MoneyAmount,
-    convert,
-    format_currency,
-    get_currency,
-    list_currencies,
-    money,
-)
-
-# Goals and Debt Payoff
-from spreadsheet_dl.domains.finance.goals import (
-    Debt,
-    DebtPayoffMethod,
-    DebtPayoffPlan,
-    GoalCategory,
-    GoalManager,
-    GoalStatus,
-    SavingsGoal,
-    compare_payoff_methods,
-    create_debt_payoff_plan,
-    create_emergency_fund,
-)
-from spreadsheet_dl.domains.finance.ods_generator import (
-    BudgetAllocation,
-    ExpenseCategory,
-    ExpenseEntry,
-    OdsGenerator,
-    create_monthly_budget,
-)
-
-# Plaid Integration
-from spreadsheet_dl.domains.finance.plaid_integration import (
-    AccessToken,
-    LinkStatus,
-    LinkToken,
-    PlaidAccount,
-    PlaidAPIError,
-    PlaidAuthError,
-    PlaidClient,
-    PlaidConfig,
-    PlaidConnectionError,
-    PlaidEnvironment,
-    PlaidError,
-    PlaidInstitution,
-    PlaidProduct,
-    PlaidRateLimitError,
-    PlaidSyncError,
-    PlaidSyncManager,
-    PlaidTransaction,
-    SyncResult,
-    SyncStatus,
-)
-
-# Recurring expenses (Enhanced in Phase 4)
-from spreadsheet_dl.domains.finance.recurring import (
-    COMMON_RECURRING,
-    RecurrenceFrequency,
-    RecurringExpense,
-    RecurringExpenseManager,
-    create_common_recurring,
-)
-
-# Bill Reminders
-from spreadsheet_dl.domains.finance.reminders import (
-    COMMON_BILLS,
-    BillReminder,
-    BillReminderManager,
-    ReminderFrequency,
-    ReminderStatus,
-    create_bill_from_template,
-)
-from spreadsheet_dl.domains.finance.report_generator import (
-    ReportConfig,
-    ReportGenerator,
-    generate_monthly_report,
-)
-from spreadsheet_dl.exceptions import (
-    ConfigurationError,
-    CSVImportError,
-    DecryptionError,
-    EncryptionError,
-    FileError,
-    IntegrityError,
-    OdsError,
-    OperationCancelledError,
-    SpreadsheetDLError,
-    TemplateError,
-    ValidationError,
-    WebDAVError,
-)
+# Version is imported eagerly from a dependency-free module for fast CLI startup
+from spreadsheet_dl._version import __author__, __version__
 
-# Multi-format Export
-from spreadsheet_dl.export import (
-    ExportOptions,
-    MultiFormatExporter,
-    export_to_csv,
-    export_to_pdf,
-    export_to_xlsx,
-)
-from spreadsheet_dl.interactive import (
-    DashboardGenerator as OdsDashboardGenerator,
-)
+if TYPE_CHECKING:
+    from spreadsheet_dl import _builder as builder_pkg  # noqa: F401
+    from spreadsheet_dl import _cli as cli_pkg  # noqa: F401
+    from spreadsheet_dl import _mcp as mcp_pkg  # noqa: F401
+    from spreadsheet_dl.adapters import (
+        AdapterOptions,
+        AdapterRegistry,
+        CsvAdapter,
+        ExportFormat,
+        FormatAdapter,
+        HtmlAdapter,
+        ImportFormat,
+        JsonAdapter,
+        OdsAdapter,
+        TsvAdapter,
+        export_to,
+        import_from,
+    )
+    from spreadsheet_dl.ai_export import (
+        AIExporter,
+        CellRelationship,
+        SemanticCell,
+        SemanticCellType,
+        SemanticSheet,
+        SemanticTag,
+        export_dual,
+        export_for_ai,
+    )
+    from spreadsheet_dl.ai_training import (
+        AnonymizationConfig,
+        AnonymizationLevel,
+        DataAnonymizer,
+        PIIDetector,
+        TrainingDataExporter,
+        TrainingDataset,
+        export_training_data,
+    )
+    from spreadsheet_dl.backup import (
+        BackupManager,
+        BackupReason,
+        auto_backup,
+    )
+    from spreadsheet_dl.builder import (
+        CellRef,
+        CellSpec,
+        ColumnSpec,
+        FormulaBuilder,
+        RangeRef,
+        RowSpec,
+        SheetRef,
+        SheetSpec,
+        SpreadsheetBuilder,
+        create_spreadsheet,
+        formula,
+    )
+    from spreadsheet_dl.charts import (
+        AxisConfig,
+        AxisType,
+        ChartBuilder,
+        ChartPosition,
+        ChartSize,
+        ChartSpec,
+        ChartTitle,
+        ChartType,
+        DataLabelConfig,
+        DataLabelPosition,
+        DataSeries,
+        LegendConfig,
+        LegendPosition,
+        PlotAreaStyle,
+        Sparkline,
+        SparklineBuilder,
+        SparklineMarkers,
+        SparklineType,
+        Trendline,
+        TrendlineType,
+        budget_comparison_chart,
+        chart,
+        sparkline,
+        spending_pie_chart,
+        trend_line_chart,
+    )
+    from spreadsheet_dl.completions import (
+        detect_shell,
+        generate_bash_completions,
+        generate_fish_completions,
+        generate_zsh_completions,
+        install_completions,
+        print_completion_script,
+    )
+    from spreadsheet_dl.config import (
+        Config,
+        get_config,
+        init_config_file,
+    )
+    from spreadsheet_dl.domains.finance.accounts import (
+        Account,
+        AccountManager,
+        AccountTransaction,
+        AccountType,
+        NetWorth,
+        Transfer,
+        get_default_accounts,
+    )
+    from spreadsheet_dl.domains.finance.alerts import (
+        Alert,
+        AlertConfig,
+        AlertMonitor,
+        AlertSeverity,
+        AlertType,
+        check_budget_alerts,
+    )
+    from spreadsheet_dl.domains.finance.analytics import (
+        AnalyticsDashboard,
+        generate_dashboard,
+    )
+    from spreadsheet_dl.domains.finance.bank_formats import (
+        BUILTIN_FORMATS,
+        BankFormatDefinition,
+        BankFormatRegistry,
+        FormatBuilder,
+        count_formats,
+        detect_format,
+        get_format,
+        list_formats,
+    )
+    from spreadsheet_dl.domains.finance.budget_analyzer import (
+        BudgetAnalyzer,
+        analyze_budget,
+    )
+    from spreadsheet_dl.domains.finance.cashflow import (
+        CashFlowProjector,
+    )
+    from spreadsheet_dl.domains.finance.categories import (
+        Category,
+        CategoryManager,
+        StandardCategory,
+        category_from_string,
+        get_category_manager,
+    )
+    from spreadsheet_dl.domains.finance.csv_import import (
+        BANK_FORMATS,
+        CSVImporter,
+        TransactionCategorizer,
+        import_bank_csv,
+    )
+    from spreadsheet_dl.domains.finance.currency import (
+        CURRENCIES,
+        Currency,
+        CurrencyCode,
+        CurrencyConverter,
+        ExchangeRate,
+        ExchangeRateProvider,
+        MoneyAmount,
+        convert,
+        format_currency,
+        get_currency,
+        list_currencies,
+        money,
+    )
+    from spreadsheet_dl.domains.finance.goals import (
+        Debt,
+        DebtPayoffMethod,
+        DebtPayoffPlan,
+        GoalCategory,
+        GoalManager,
+        GoalStatus,
+        SavingsGoal,
+        compare_payoff_methods,
+        create_debt_payoff_plan,
+        create_emergency_fund,
+    )
+    from spreadsheet_dl.domains.finance.ods_generator import (
+        BudgetAllocation,
+        ExpenseCategory,
+        ExpenseEntry,
+        OdsGenerator,
+        create_monthly_budget,
+    )
+    from spreadsheet_dl.domains.finance.plaid_integration import (
+        AccessToken,
+        LinkStatus,
+        LinkToken,
+        PlaidAccount,
+        PlaidAPIError,
+        PlaidAuthError,
+        PlaidClient,
+        PlaidConfig,
+        PlaidConnectionError,
+        PlaidEnvironment,
+        PlaidError,
+        PlaidInstitution,
+        PlaidProduct,
+        PlaidRateLimitError,
+        PlaidSyncError,
+        PlaidSyncManager,
+        PlaidTransaction,
+        SyncResult,
+        SyncStatus,
+    )
+    from spreadsheet_dl.domains.finance.recurring import (
+        COMMON_RECURRING,
+        RecurrenceFrequency,
+        RecurringExpense,
+        RecurringExpenseManager,
+        create_common_recurring,
+    )
+    from spreadsheet_dl.domains.finance.reminders import (
+        COMMON_BILLS,
+        BillReminder,
+        BillReminderManager,
+        ReminderFrequency,
+        ReminderStatus,
+        create_bill_from_template,
+    )
+    from spreadsheet_dl.domains.finance.report_generator import (
+        ReportConfig,
+        ReportGenerator,
+        generate_monthly_report,
+    )
+    from spreadsheet_dl.exceptions import (
+        ConfigurationError,
+        CSVImportError,
+        DecryptionError,
+        EncryptionError,
+        FileError,
+        IntegrityError,
+        OdsError,
+        OperationCancelledError,
+        SpreadsheetDLError,
+        TemplateError,
+        ValidationError,
+        WebDAVError,
+    )
+    from spreadsheet_dl.export import (
+        ExportOptions,
+        MultiFormatExporter,
+        export_to_csv,
+        export_to_pdf,
+        export_to_xlsx,
+    )
+    from spreadsheet_dl.interactive import DashboardGenerator as OdsDashboardGenerator
+    from spreadsheet_dl.interactive import (
+        DashboardKPI,
+        DropdownList,
+        InteractiveOdsBuilder,
+        ValidationRule,
+        add_interactive_features,
+        generate_budget_dashboard,
+    )
+    from spreadsheet_dl.mcp_server import (
+        MCPConfig,
+        MCPServer,
+        MCPTool,
+        MCPToolResult,
+        create_mcp_server,
+    )
+    from spreadsheet_dl.notifications import (
+        EmailChannel,
+        EmailConfig,
+        Notification,
+        NotificationManager,
+        NotificationPriority,
+        NotificationTemplates,
+        NotificationType,
+        NtfyChannel,
+        NtfyConfig,
+    )
+    from spreadsheet_dl.ods_editor import (
+        OdsEditor,
+        append_expense_to_file,
+    )
+    from spreadsheet_dl.performance import (
+        BatchProcessor,
+        BatchResult,
+        Benchmark,
+        BenchmarkResult,
+        FileCache,
+        Lazy,
+        LazyProperty,
+        LRUCache,
+        batch_process,
+        cached,
+        clear_cache,
+        get_cache,
+        timed,
+    )
+    from spreadsheet_dl.renderer import (
+        OdsRenderer,
+        render_sheets,
+    )
+    from spreadsheet_dl.schema.advanced import (
+        AutoFilter,
+        CellComment,
+        DataTable,
+        FilterCriteria,
+        HiddenRowsColumns,
+        Hyperlink,
+        Image,
+        NamedRange,
+        OutlineGroup,
+        OutlineSettings,
+        Shape,
+    )
+    from spreadsheet_dl.schema.conditional import (
+        ConditionalFormat,
+        ConditionalRule,
+    )
+    from spreadsheet_dl.schema.data_validation import (
+        DataValidation,
+        ValidationType,
+    )
+    from spreadsheet_dl.schema.print_layout import (
+        HeaderFooter,
+        HeaderFooterContent,
+        PageBreak,
+        PageMargins,
+        PageOrientation,
+        PageSetup,
+        PageSetupBuilder,
+        PageSize,
+        PrintPresets,
+        PrintQuality,
+        PrintScale,
+        RepeatConfig,
+    )
+    from spreadsheet_dl.schema.typography import (
+        FontPairing,
+        Typography,
+    )
+    from spreadsheet_dl.schema.units import (
+        Length,
+        LengthUnit,
+    )
+    from spreadsheet_dl.security import (
+        CredentialStore,
+        EncryptionMetadata,
+        FileEncryptor,
+        SecurityAuditLog,
+        check_password_strength,
+        generate_password,
+    )
+    from spreadsheet_dl.serialization import (
+        DefinitionFormat,
+        Serializer,
+        SpreadsheetDecoder,
+        SpreadsheetEncoder,
+        load_definition,
+        save_definition,
+    )
+    from spreadsheet_dl.streaming import (
+        StreamingCell,
+        StreamingReader,
+        StreamingRow,
+        StreamingWriter,
+        stream_read,
+        stream_write,
+    )
+    from spreadsheet_dl.template_engine import (
+        ComponentDefinition,
+        TemplateLoader,
+        TemplateRenderer,
+        TemplateVariable,
+    )
+    from spreadsheet_dl.visualization import (
+        CATEGORY_COLORS,
+        ChartConfig,
+        ChartDataPoint,
+        ChartGenerator,
+        ChartSeries,
+        DashboardGenerator,
+        create_budget_dashboard,
+        create_spending_pie_chart,
+    )
+    from spreadsheet_dl.webdav_upload import (
+        NextcloudConfig,
+        WebDAVClient,
+        upload_budget,
+    )
 
-# Interactive ODS Features
-from spreadsheet_dl.interactive import (
-    DashboardKPI,
-    DropdownList,
-    InteractiveOdsBuilder,
-    ValidationRule,
-    add_interactive_features,
-    generate_budget_dashboard,
-)
+# =============================================================================
+# Lazy exports (PEP 562)
+# =============================================================================
+# Public names are resolved on first attribute access so that
+# ``import spreadsheet_dl`` does not pay for pandas, odfpy or openpyxl.
+# Keep this table in sync with the TYPE_CHECKING imports above and __all__.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "spreadsheet_dl.adapters": (
+        "AdapterOptions",
+        "AdapterRegistry",
+        "CsvAdapter",
+        "ExportFormat",
+        "FormatAdapter",
+        "HtmlAdapter",
+        "ImportFormat",
+        "JsonAdapter",
+        "OdsAdapter",
+        "TsvAdapter",
+        "export_to",
+        "import_from",
+    ),
+    "spreadsheet_dl.ai_export": (
+        "AIExporter",
+        "CellRelationship",
+        "SemanticCell",
+        "SemanticCellType",
+        "SemanticSheet",
+        "SemanticTag",
+        "export_dual",
+        "export_for_ai",
+    ),
+    "spreadsheet_dl.ai_training": (
+        "AnonymizationConfig",
+        "AnonymizationLevel",
+        "DataAnonymizer",
+        "PIIDetector",
+        "TrainingDataExporter",
+        "TrainingDataset",
+        "export_training_data",
+    ),
+    "spreadsheet_dl.backup": (
+        "BackupManager",
+        "BackupReason",
+        "auto_backup",
+    ),
+    "spreadsheet_dl.builder": (
+        "CellRef",
+        "CellSpec",
+        "ColumnSpec",
+        "FormulaBuilder",
+        "RangeRef",
+        "RowSpec",
+        "SheetRef",
+        "SheetSpec",
+        "SpreadsheetBuilder",
+        "create_spreadsheet",
+        "formula",
+    ),
+    "spreadsheet_dl.charts": (
+        "AxisConfig",
+        "AxisType",
+        "ChartBuilder",
+        "ChartPosition",
+        "ChartSize",
+        "ChartSpec",
+        "ChartTitle",
+        "ChartType",
+        "DataLabelConfig",
+        "DataLabelPosition",
+        "DataSeries",
+        "LegendConfig",
+        "LegendPosition",
+        "PlotAreaStyle",
+        "Sparkline",
+        "SparklineBuilder",
+        "SparklineMarkers",
+        "SparklineType",
+        "Trendline",
+        "TrendlineType",
+        "budget_comparison_chart",
+        "chart",
+        "sparkline",
+        "spending_pie_chart",
+        "trend_line_chart",
+    ),
+    "spreadsheet_dl.completions": (
+        "detect_shell",
+        "generate_bash_completions",
+        "generate_fish_completions",
+        "generate_zsh_completions",
+        "install_completions",
+        "print_completion_script",
+    ),
+    "spreadsheet_dl.config": (
+        "Config",
+        "get_config",
+        "init_config_file",
+    ),
+    "spreadsheet_dl.domains.finance.accounts": (
+        "Account",
+        "AccountManager",
+        "AccountTransaction",
+        "AccountType",
+        "NetWorth",
+        "Transfer",
+        "get_default_accounts",
+    ),
+    "spreadsheet_dl.domains.finance.alerts": (
+        "Alert",
+        "AlertConfig",
+        "AlertMonitor",
+        "AlertSeverity",
+        "AlertType",
+        "check_budget_alerts",
+    ),
+    "spreadsheet_dl.domains.finance.analytics": (
+        "AnalyticsDashboard",
+        "generate_dashboard",
+    ),
+    "spreadsheet_dl.domains.finance.bank_formats": (
+        "BUILTIN_FORMATS",
+        "BankFormatDefinition",
+        "BankFormatRegistry",
+        "FormatBuilder",
+        "count_formats",
+        "detect_format",
+        "get_format",
+        "list_formats",
+    ),
+    "spreadsheet_dl.domains.finance.budget_analyzer": (
+        "BudgetAnalyzer",
+        "analyze_budget",
+    ),
+    "spreadsheet_dl.domains.finance.cashflow": ("CashFlowProjector",),
+    "spreadsheet_dl.domains.finance.categories": (
+        "Category",
+        "CategoryManager",
+        "StandardCategory",
+        "category_from_string",
+        "get_category_manager",
+    ),
+    "spreadsheet_dl.domains.finance.csv_import": (
+        "BANK_FORMATS",
+        "CSVImporter",
+        "TransactionCategorizer",
+        "import_bank_csv",
+    ),
+    "spreadsheet_dl.domains.finance.currency": (
+        "CURRENCIES",
+        "Currency",
+        "CurrencyCode",
+        "CurrencyConverter",
+        "ExchangeRate",
+        "ExchangeRateProvider",
+        "MoneyAmount",
+        "convert",
+        "format_currency",
+        "get_currency",
+        "list_currencies",
+        "money",
+    ),
+    "spreadsheet_dl.domains.finance.goals": (
+        "Debt",
+        "DebtPayoffMethod",
+        "DebtPayoffPlan",
+        "GoalCategory",
+        "GoalManager",
+        "GoalStatus",
+        "SavingsGoal",
+        "compare_payoff_methods",
+        "create_debt_payoff_plan",
+        "create_emergency_fund",
+    ),
+    "spreadsheet_dl.domains.finance.ods_generator": (
+        "BudgetAllocation",
+        "ExpenseCategory",
+        "ExpenseEntry",
+        "OdsGenerator",
+        "create_monthly_budget",
+    ),
+    "spreadsheet_dl.domains.finance.plaid_integration": (
+        "AccessToken",
+        "LinkStatus",
+        "LinkToken",
+        "PlaidAccount",
+        "PlaidAPIError",
+        "PlaidAuthError",
+        "PlaidClient",
+        "PlaidConfig",
+        "PlaidConnectionError",
+        "PlaidEnvironment",
+        "PlaidError",
+        "PlaidInstitution",
+        "PlaidProduct",
+        "PlaidRateLimitError",
+        "PlaidSyncError",
+        "PlaidSyncManager",
+        "PlaidTransaction",
+        "SyncResult",
+        "SyncStatus",
+    ),
+    "spreadsheet_dl.domains.finance.recurring": (
+        "COMMON_RECURRING",
+        "RecurrenceFrequency",
+        "RecurringExpense",
+        "RecurringExpenseManager",
+        "create_common_recurring",
+    ),
+    "spreadsheet_dl.domains.finance.reminders": (
+        "COMMON_BILLS",
+        "BillReminder",
+        "BillReminderManager",
+        "ReminderFrequency",
+        "ReminderStatus",
+        "create_bill_from_template",
+    ),
+    "spreadsheet_dl.domains.finance.report_generator": (
+        "ReportConfig",
+        "ReportGenerator",
+        "generate_monthly_report",
+    ),
+    "spreadsheet_dl.exceptions": (
+        "ConfigurationError",
+        "CSVImportError",
+        "DecryptionError",
+        "EncryptionError",
+        "FileError",
+        "IntegrityError",
+        "OdsError",
+        "OperationCancelledError",
+        "SpreadsheetDLError",
+        "TemplateError",
+        "ValidationError",
+        "WebDAVError",
+    ),
+    "spreadsheet_dl.export": (
+        "ExportOptions",
+        "MultiFormatExporter",
+        "export_to_csv",
+        "export_to_pdf",
+        "export_to_xlsx",
+    ),
+    "spreadsheet_dl.interactive": (
+        "DashboardKPI",
+        "DropdownList",
+        "InteractiveOdsBuilder",
+        "ValidationRule",
+        "add_interactive_features",
+        "generate_budget_dashboard",
+    ),
+    "spreadsheet_dl.mcp_server": (
+        "MCPConfig",
+        "MCPServer",
+        "MCPTool",
+        "MCPToolResult",
+        "create_mcp_server",
+    ),
+    "spreadsheet_dl.notifications": (
+        "EmailChannel",
+        "EmailConfig",
+        "Notification",
+        "NotificationManager",
+        "NotificationPriority",
+        "NotificationTemplates",
+        "NotificationType",
+        "NtfyChannel",
+        "NtfyConfig",
+    ),
+    "spreadsheet_dl.ods_editor": (
+        "OdsEditor",
+        "append_expense_to_file",
+    ),
+    "spreadsheet_dl.performance": (
+        "BatchProcessor",
+        "BatchResult",
+        "Benchmark",
+        "BenchmarkResult",
+        "FileCache",
+        "Lazy",
+        "LazyProperty",
+        "LRUCache",
+        "batch_process",
+        "cached",
+        "clear_cache",
+        "get_cache",
+        "timed",
+    ),
+    "spreadsheet_dl.renderer": (
+        "OdsRenderer",
+        "render_sheets",
+    ),
+    "spreadsheet_dl.schema.advanced": (
+        "AutoFilter",
+        "CellComment",
+        "DataTable",
+        "FilterCriteria",
+        "HiddenRowsColumns",
+        "Hyperlink",
+        "Image",
+        "NamedRange",
+        "OutlineGroup",
+        "OutlineSettings",
+        "Shape",
+    ),
+    "spreadsheet_dl.schema.conditional": (
+        "ConditionalFormat",
+        "ConditionalRule",
+    ),
+    "spreadsheet_dl.schema.data_validation": (
+        "DataValidation",
+        "ValidationType",
+    ),
+    "spreadsheet_dl.schema.print_layout": (
+        "HeaderFooter",
+        "HeaderFooterContent",
+        "PageBreak",
+        "PageMargins",
+        "PageOrientation",
+        "PageSetup",
+        "PageSetupBuilder",
+        "PageSize",
+        "PrintPresets",
+        "PrintQuality",
+        "PrintScale",
+        "RepeatConfig",
+    ),
+    "spreadsheet_dl.schema.typography": (
+        "FontPairing",
+        "Typography",
+    ),
+    "spreadsheet_dl.schema.units": (
+        "Length",
+        "LengthUnit",
+    ),
+    "spreadsheet_dl.security": (
+        "CredentialStore",
+        "EncryptionMetadata",
+        "FileEncryptor",
+        "SecurityAuditLog",
+        "check_password_strength",
+        "generate_password",
+    ),
+    "spreadsheet_dl.serialization": (
+        "DefinitionFormat",
+        "Serializer",
+        "SpreadsheetDecoder",
+        "SpreadsheetEncoder",
+        "load_definition",
+        "save_definition",
+    ),
+    "spreadsheet_dl.streaming": (
+        "StreamingCell",
+        "StreamingReader",
+        "StreamingRow",
+        "StreamingWriter",
+        "stream_read",
+        "stream_write",
+    ),
+    "spreadsheet_dl.template_engine": (
+        "ComponentDefinition",
+        "TemplateLoader",
+        "TemplateRenderer",
+        "TemplateVariable",
+    ),
+    "spreadsheet_dl.visualization": (
+        "CATEGORY_COLORS",
+        "ChartConfig",
+        "ChartDataPoint",
+        "ChartGenerator",
+        "ChartSeries",
+        "DashboardGenerator",
+        "create_budget_dashboard",
+        "create_spending_pie_chart",
+    ),
+    "spreadsheet_dl.webdav_upload": (
+        "NextcloudConfig",
+        "WebDAVClient",
+        "upload_budget",
+    ),
+}
 
-# MCP Server
-from spreadsheet_dl.mcp_server import (
-    MCPConfig,
-    MCPServer,
-    MCPTool,
-    MCPToolResult,
-    create_mcp_server,
-)
+_ALIASES: dict[str, tuple[str, str]] = {
+    "OdsDashboardGenerator": ("spreadsheet_dl.interactive", "DashboardGenerator"),
+}
 
-# Notifications
-from spreadsheet_dl.notifications import (
-    EmailChannel,
-    EmailConfig,
-    Notification,
-    NotificationManager,
-    NotificationPriority,
-    NotificationTemplates,
-    NotificationType,
-    NtfyChannel,
-    NtfyConfig,
-)
+# Modular packages - public namespace access
+# Example: from spreadsheet_dl import mcp_pkg; config = mcp_pkg.MCPConfig()
+_SUBPACKAGES: dict[str, str] = {
+    "builder_pkg": "spreadsheet_dl._builder",
+    "cli_pkg": "spreadsheet_dl._cli",
+    "mcp_pkg": "spreadsheet_dl._mcp",
+}
 
-# ODS Editor
-from spreadsheet_dl.ods_editor import (
-    OdsEditor,
-    append_expense_to_file,
-)
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    name: (module, name) for module, names in _EXPORTS.items() for name in names
+}
+_LAZY_EXPORTS.update(_ALIASES)
 
-# Performance Optimization
-from spreadsheet_dl.performance import (
-    BatchProcessor,
-    BatchResult,
-    Benchmark,
-    BenchmarkResult,
-    FileCache,
-    Lazy,
-    LazyProperty,
-    LRUCache,
-    batch_process,
-    cached,
-    clear_cache,
-    get_cache,
-    timed,
-)
 
-# Renderer
-from spreadsheet_dl.renderer import (
-    OdsRenderer,
-    render_sheets,
-)
+def __getattr__(name: str) -> Any:
+    """Import a public name or subpackage on first access.
 
-# Schema Extensions
-from spreadsheet_dl.schema.advanced import (
-    AutoFilter,
-    CellComment,
-    DataTable,
-    FilterCriteria,
-    HiddenRowsColumns,
-    Hyperlink,
-    Image,
-    NamedRange,
-    OutlineGroup,
-    OutlineSettings,
-    Shape,
-)
-from spreadsheet_dl.schema.conditional import (
-    ConditionalFormat,
-    ConditionalRule,
-)
-from spreadsheet_dl.schema.data_validation import (
-    DataValidation,
-    ValidationType,
-)
-from spreadsheet_dl.schema.print_layout import (
-    HeaderFooter,
-    HeaderFooterContent,
-    PageBreak,
-    PageMargins,
-    PageOrientation,
-    PageSetup,
-    PageSetupBuilder,
-    PageSize,
-    PrintPresets,
-    PrintQuality,
-    PrintScale,
-    RepeatConfig,
-)
-from spreadsheet_dl.schema.typography import (
-    FontPairing,
-    Typography,
-)
-from spreadsheet_dl.schema.units import (
-    Length,
-    LengthUnit,
-)
+    Args:
+        name: Attribute being looked up on the package
 
-# Security
-from spreadsheet_dl.security import (
-    CredentialStore,
-    EncryptionMetadata,
-    FileEncryptor,
-    SecurityAuditLog,
-    check_password_strength,
-    generate_password,
-)
+    Returns:
+        The exported object, cached in the module namespace
 
-# Serialization
-from spreadsheet_dl.serialization import (
-    DefinitionFormat,
-    Serializer,
-    SpreadsheetDecoder,
-    SpreadsheetEncoder,
-    load_definition,
-    save_definition,
-)
+    Raises:
+        AttributeError: If ``name`` is not a public export
+    """
+    if name in _LAZY_EXPORTS:
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(_SUBPACKAGES[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
-# Streaming I/O
-from spreadsheet_dl.streaming import (
-    StreamingCell,
-    StreamingReader,
-    StreamingRow,
-    StreamingWriter,
-    stream_read,
-    stream_write,
-)
 
-# Template Engine
-from spreadsheet_dl.template_engine import (
-    ComponentDefinition,
-    TemplateLoader,
-    TemplateRenderer,
-    TemplateVariable,
-)
+def __dir__() -> list[str]:
+    """List eager attributes together with the lazy public exports."""
+    return sorted({*globals(), *_LAZY_EXPORTS, *_SUBPACKAGES})
 
-# Interactive Visualization
-from spreadsheet_dl.visualization import (
-    CATEGORY_COLORS,
-    ChartConfig,
-    ChartDataPoint,
-    ChartGenerator,
-    ChartSeries,
-    DashboardGenerator,
-    create_budget_dashboard,
-    create_spending_pie_chart,
-)
-from spreadsheet_dl.webdav_upload import (
-    NextcloudConfig,
-    WebDAVClient,
-    upload_budget,
-)
 
 __all__ = [  # noqa: RUF022  # Intentionally organized by category, not alphabetically
     # Constants (uppercase first)
@@ -541,6 +914,7 @@
     "BudgetAnalyzer",
     "CSVImportError",
     "CSVImporter",
+    "CashFlowProjector",
     "Category",
     "CategoryManager",
     "CellComment",
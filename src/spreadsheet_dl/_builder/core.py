@@ -669,13 +669,16 @@ def get_named_ranges(self) -> list[NamedRange]:
         """
         return self._named_ranges
 
-    def save(self, path: Path | str) -> Path:
+    def save(self, path: Path | str, *, collapse_repeats: bool = False) -> Path:
         """Generate and save the ODS file.
 
         Exports all sheets, named ranges, and styling to ODS format.
 
         Args:
             path: Output file path
+            collapse_repeats: Collapse identical adjacent cells and rows
+                (e.g. blank entry rows from data_rows()) into repeated
+                elements to shrink the output
 
         Returns:
             Path to saved file
@@ -688,7 +691,7 @@ def save(self, path: Path | str) -> Path:
 
         from spreadsheet_dl.renderer import OdsRenderer
 
-        renderer = OdsRenderer(self._get_theme())
+        renderer = OdsRenderer(self._get_theme(), collapse_repeats=collapse_repeats)
         return renderer.render(self._sheets, Path(path), self._named_ranges)
 
     def export(self, path: Path | str, format: str = "xlsx") -> Path:
@@ -22,6 +22,7 @@
 from spreadsheet_dl._cli import commands
 from spreadsheet_dl._version import __version__
 from spreadsheet_dl.exceptions import OperationCancelledError, SpreadsheetDLError
+from spreadsheet_dl.ods_packaging import COMPRESSION_PRESETS
 
 
 def _should_disable_color() -> bool:
@@ -197,6 +198,16 @@ def _add_generate_parser(
         type=str,
         help="Visual theme (default, corporate, minimal, dark, high_contrast)",
     )
+    gen_parser.add_argument(
+        "--compression",
+        type=str,
+        choices=[*COMPRESSION_PRESETS, *(str(level) for level in range(10))],
+        metavar="LEVEL",
+        help=(
+            "ODS zip compression: store, fast, default, archive or 0-9 "
+            "(default: odfpy packaging)"
+        ),
+    )
     gen_parser.add_argument(
         "--empty-rows",
         type=int,
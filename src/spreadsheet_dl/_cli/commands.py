@@ -49,6 +49,14 @@ def cmd_generate(args: argparse.Namespace) -> int:
     if theme:
         print(f"Using theme: {theme}")
 
+    # Zip packaging (compression level) if specified
+    package = None
+    compression = getattr(args, "compression", None)
+    if compression is not None:
+        from spreadsheet_dl.ods_packaging import PackageOptions
+
+        package = PackageOptions.from_preset(compression)
+
     if output.is_dir():
         today = date.today()
         month = args.month or today.month
@@ -64,7 +72,7 @@ def cmd_generate(args: argparse.Namespace) -> int:
 
     if output.is_dir():
         if allocations or theme:
-            generator = OdsGenerator(theme=theme)
+            generator = OdsGenerator(theme=theme, package=package)
             today = date.today()
             month = args.month or today.month
             year = getattr(args, "year", None) or today.year
@@ -76,10 +84,14 @@ def cmd_generate(args: argparse.Namespace) -> int:
             )
         else:
             path = create_monthly_budget(
-                output, month=args.month, year=getattr(args, "year", None), theme=theme
+                output,
+                month=args.month,
+                year=getattr(args, "year", None),
+                theme=theme,
+                package=package,
             )
     else:
-        generator = OdsGenerator(theme=theme)
+        generator = OdsGenerator(theme=theme, package=package)
         path = generator.create_budget_spreadsheet(
             output,
             month=args.month,
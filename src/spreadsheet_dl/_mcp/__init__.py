@@ -8,7 +8,9 @@
     - config: Configuration classes (MCPConfig, MCPCapabilities, MCPVersion)
     - exceptions: MCP-specific exceptions
     - handlers: Common handler utilities
+    - metrics: Per-tool latency metrics and slow-call profiling
     - models: Data models (MCPToolParameter, MCPTool, MCPToolResult)
+    - pagination: Cursor-based paging and compact encoding for large results
     - registry: Tool registry with decorator-based registration
     - server: Core MCPServer implementation
     - tools/: Tool handler implementations organized by category
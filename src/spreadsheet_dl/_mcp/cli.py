@@ -17,17 +17,24 @@
 
 def create_mcp_server(
     allowed_paths: list[str | Path] | None = None,
+    *,
+    metrics_path: str | Path | None = None,
+    profile_dir: str | Path | None = None,
 ) -> MCPServer:
     """Create an MCP server with optional path restrictions.
 
     Args:
         allowed_paths: List of paths the server can access.
+        metrics_path: File for a periodic Prometheus text dump of tool metrics.
+        profile_dir: Directory for cProfile dumps of the slowest tool calls.
 
     Returns:
         Configured MCPServer instance.
     """
     config = MCPConfig(
         allowed_paths=[Path(p) for p in allowed_paths] if allowed_paths else [],
+        metrics_path=Path(metrics_path) if metrics_path else None,
+        profile_dir=Path(profile_dir) if profile_dir else None,
     )
     return MCPServer(config)
 
@@ -47,6 +54,14 @@ def main() -> None:
         action="store_true",
         help="Enable debug logging",
     )
+    parser.add_argument(
+        "--metrics-file",
+        help="Write per-tool metrics in Prometheus text format to this file",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        help="Keep cProfile dumps of the slowest tool calls in this directory",
+    )
 
     args = parser.parse_args()
 
@@ -59,7 +74,11 @@ def main() -> None:
     )
 
     # Create and run server
-    server = create_mcp_server(args.allowed_paths)
+    server = create_mcp_server(
+        args.allowed_paths,
+        metrics_path=args.metrics_file,
+        profile_dir=args.profile_dir,
+    )
     server.run()
 
 
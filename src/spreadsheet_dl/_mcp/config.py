@@ -37,6 +37,13 @@ class MCPConfig:
     rate_limit_per_minute: int = 60
     enable_audit_log: bool = True
     audit_log_path: Path | None = None
+    # Prometheus text dump of per-tool metrics, rewritten at most this often
+    metrics_path: Path | None = None
+    metrics_interval_seconds: float = 15.0
+    # cProfile the slowest calls into this directory (sampled)
+    profile_dir: Path | None = None
+    profile_slowest: int = 10
+    profile_sample_rate: float = 1.0
 
     def __post_init__(self) -> None:
         """Set default allowed paths."""
@@ -7,7 +7,11 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import queue
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -18,8 +22,6 @@
 from spreadsheet_dl.exceptions import FileError
 
 if TYPE_CHECKING:
-    import logging
-
     from spreadsheet_dl._mcp.config import MCPConfig
     from spreadsheet_dl._mcp.models import MCPToolResult
 
@@ -196,6 +198,93 @@ def _compress_file(self, path: Path) -> None:
                 compressed_path.unlink()
 
 
+class BufferedAuditWriter:
+    """Append audit log lines from a background thread.
+
+    Tool calls only enqueue a line; a daemon thread drains the queue in
+    batches and appends each batch with a single open/write. Call flush()
+    to wait until every queued line is on disk.
+    """
+
+    def __init__(
+        self,
+        log_path: Path,
+        rotator: AuditLogRotator | None = None,
+        max_batch: int = 256,
+    ) -> None:
+        """Initialize the writer. The thread starts on the first write.
+
+        Args:
+            log_path: Path to the audit log file
+            rotator: Optional rotator checked before each batch is written
+            max_batch: Maximum number of lines appended per write
+        """
+        self.log_path = log_path
+        self._rotator = rotator
+        self._max_batch = max_batch
+        self._queue: queue.Queue[str | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._logger = logging.getLogger("spreadsheet-dl-mcp")
+
+    def write(self, line: str) -> None:
+        """Queue one log line (without trailing newline)."""
+        if self._thread is None:
+            self._start()
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        """Block until every queued line has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write pending lines and stop the background thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="mcp-audit-writer", daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            batch = [first]
+            while len(batch) < self._max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            try:
+                if lines:
+                    self._append(lines)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if None in batch:
+                return
+
+    def _append(self, lines: list[str]) -> None:
+        try:
+            if self._rotator and self._rotator.should_rotate():
+                self._rotator.rotate()
+            with open(self.log_path, "a") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            self._logger.warning(f"Failed to write audit log: {e}")
+
+
 class HandlerUtils:
     """Common utilities for MCP tool handlers."""
 
@@ -424,6 +513,7 @@ def rotate_audit_log(self) -> bool:
     "DEFAULT_TOOL_RATE_LIMITS",
     "AuditLogConfig",
     "AuditLogRotator",
+    "BufferedAuditWriter",
     "HandlerUtils",
     "ToolRateLimit",
     "ToolUsageStats",
@@ -0,0 +1,353 @@
+"""Per-tool latency metrics and slow-call profiling for the MCP server.
+
+Part of the modular MCP server implementation.
+
+MetricsCollector keeps, for every tool, call and error counts, bytes in and
+out, a latency histogram with recent samples for percentiles, and the time
+split between file load, operation and save (from
+``spreadsheet_dl.performance.phase``). The snapshot is served by the
+``server_metrics`` tool and can be dumped in the Prometheus text format.
+
+SlowCallProfiler runs sampled calls under cProfile and keeps the profiles
+of the slowest N on disk.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import heapq
+import logging
+import math
+import os
+import random
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+_logger = logging.getLogger("spreadsheet-dl-mcp")
+
+# Histogram bucket upper bounds in seconds (Prometheus ``le`` labels)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Phases reported in the time split; anything else counts as operation
+PHASES = ("load", "save")
+
+
+@dataclass
+class ToolMetrics:
+    """Accumulated metrics for one tool.
+
+    Attributes:
+        calls: Number of completed calls.
+        errors: Calls that returned an error result or raised.
+        seconds: Total wall time of all calls.
+        bytes_in: Total size of the JSON-encoded arguments.
+        bytes_out: Total size of the returned content text.
+        phase_seconds: Total time per phase (``load``, ``operation``, ``save``).
+        bucket_counts: Calls per LATENCY_BUCKETS bucket, plus one overflow.
+        samples: Most recent call durations, used for percentiles.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    phase_seconds: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys((*PHASES, "operation"), 0.0)
+    )
+    bucket_counts: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile of the recent samples, in seconds.
+
+        Args:
+            q: Percentile between 0 and 100.
+
+        Returns:
+            The percentile, or 0.0 when there are no samples.
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+
+class MetricsCollector:
+    """Thread-safe per-tool metrics store.
+
+    Example:
+        >>> metrics = MetricsCollector()
+        >>> metrics.record("cell_get", 0.012, bytes_in=40, bytes_out=90)
+        >>> metrics.snapshot()["tools"]["cell_get"]["calls"]
+        1
+    """
+
+    def __init__(self, sample_size: int = 1024) -> None:
+        """Initialize the collector.
+
+        Args:
+            sample_size: Recent durations kept per tool for percentiles.
+        """
+        self._sample_size = sample_size
+        self._tools: dict[str, ToolMetrics] = {}
+        self._lock = threading.Lock()
+        self._started = time.time()
+
+    def record(
+        self,
+        tool: str,
+        seconds: float,
+        *,
+        bytes_in: int = 0,
+        bytes_out: int = 0,
+        is_error: bool = False,
+        phases: dict[str, float] | None = None,
+    ) -> None:
+        """Record one completed tool call.
+
+        Args:
+            tool: Tool name.
+            seconds: Wall time of the call.
+            bytes_in: Size of the encoded arguments.
+            bytes_out: Size of the returned content.
+            is_error: Whether the call failed.
+            phases: Seconds spent per phase during the call.
+        """
+        phases = phases or {}
+        with self._lock:
+            stats = self._tools.get(tool)
+            if stats is None:
+                stats = ToolMetrics(samples=deque(maxlen=self._sample_size))
+                self._tools[tool] = stats
+            stats.calls += 1
+            stats.errors += is_error
+            stats.seconds += seconds
+            stats.bytes_in += bytes_in
+            stats.bytes_out += bytes_out
+            other = 0.0
+            for name, spent in phases.items():
+                if name in stats.phase_seconds and name != "operation":
+                    stats.phase_seconds[name] += spent
+                    other += spent
+            stats.phase_seconds["operation"] += max(seconds - other, 0.0)
+            stats.bucket_counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.samples.append(seconds)
+
+    def snapshot(self, tool: str | None = None) -> dict[str, Any]:
+        """Summarize the collected metrics.
+
+        Args:
+            tool: Only include this tool (all tools when None).
+
+        Returns:
+            Dictionary with uptime and, per tool, counts, latency
+            percentiles and the load/operation/save split in milliseconds.
+        """
+        with self._lock:
+            tools = {
+                name: _summarize(stats)
+                for name, stats in sorted(self._tools.items())
+                if tool is None or name == tool
+            }
+        return {
+            "uptime_seconds": round(time.time() - self._started, 3),
+            "total_calls": sum(t["calls"] for t in tools.values()),
+            "tools": tools,
+        }
+
+    def reset(self) -> None:
+        """Discard all collected metrics."""
+        with self._lock:
+            self._tools.clear()
+            self._started = time.time()
+
+    def to_prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP spreadsheet_dl_mcp_tool_calls_total Completed MCP tool calls.",
+            "# TYPE spreadsheet_dl_mcp_tool_calls_total counter",
+        ]
+        with self._lock:
+            tools = sorted(self._tools.items())
+            for name, stats in tools:
+                lines.append(
+                    f'spreadsheet_dl_mcp_tool_calls_total{{tool="{_label(name)}"}} '
+                    f"{stats.calls}"
+                )
+            lines += [
+                "# HELP spreadsheet_dl_mcp_tool_errors_total Failed MCP tool calls.",
+                "# TYPE spreadsheet_dl_mcp_tool_errors_total counter",
+            ]
+            for name, stats in tools:
+                lines.append(
+                    f'spreadsheet_dl_mcp_tool_errors_total{{tool="{_label(name)}"}} '
+                    f"{stats.errors}"
+                )
+            for direction in ("in", "out"):
+                metric = f"spreadsheet_dl_mcp_tool_bytes_{direction}_total"
+                lines += [
+                    f"# HELP {metric} Bytes of tool {direction}put JSON.",
+                    f"# TYPE {metric} counter",
+                ]
+                for name, stats in tools:
+                    value = stats.bytes_in if direction == "in" else stats.bytes_out
+                    lines.append(f'{metric}{{tool="{_label(name)}"}} {value}')
+            lines += [
+                "# HELP spreadsheet_dl_mcp_tool_phase_seconds_total Time per phase.",
+                "# TYPE spreadsheet_dl_mcp_tool_phase_seconds_total counter",
+            ]
+            for name, stats in tools:
+                for phase_name, spent in stats.phase_seconds.items():
+                    lines.append(
+                        "spreadsheet_dl_mcp_tool_phase_seconds_total"
+                        f'{{tool="{_label(name)}",phase="{phase_name}"}} {spent:.6f}'
+                    )
+            lines += [
+                "# HELP spreadsheet_dl_mcp_tool_duration_seconds Tool call latency.",
+                "# TYPE spreadsheet_dl_mcp_tool_duration_seconds histogram",
+            ]
+            for name, stats in tools:
+                label = _label(name)
+                cumulative = 0
+                for bound, count in zip(
+                    (*LATENCY_BUCKETS, math.inf), stats.bucket_counts, strict=True
+                ):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(
+                        "spreadsheet_dl_mcp_tool_duration_seconds_bucket"
+                        f'{{tool="{label}",le="{le}"}} {cumulative}'
+                    )
+                lines.append(
+                    "spreadsheet_dl_mcp_tool_duration_seconds_sum"
+                    f'{{tool="{label}"}} {stats.seconds:.6f}'
+                )
+                lines.append(
+                    "spreadsheet_dl_mcp_tool_duration_seconds_count"
+                    f'{{tool="{label}"}} {stats.calls}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        """Atomically write the Prometheus text dump to a file.
+
+        The file is replaced in one step so a textfile collector never
+        reads a partial dump.
+
+        Args:
+            path: Destination file.
+        """
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(self.to_prometheus(), encoding="utf-8")
+        tmp.replace(path)
+
+
+class SlowCallProfiler:
+    """Profile sampled tool calls and keep the slowest N profiles on disk.
+
+    Each kept profile is a ``pstats``-compatible file named
+    ``<tool>-<milliseconds>ms-<timestamp>.prof``; when a slower call
+    arrives, the fastest kept profile is deleted.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        keep: int = 10,
+        sample_rate: float = 1.0,
+    ) -> None:
+        """Initialize the profiler.
+
+        Args:
+            directory: Directory for ``.prof`` files (created if missing).
+            keep: Number of slowest profiles to retain.
+            sample_rate: Fraction of calls to run under cProfile (0-1).
+        """
+        self.directory = directory
+        self.keep = keep
+        self.sample_rate = sample_rate
+        self._kept: list[tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+    def call[T](self, tool: str, func: Callable[[], T]) -> T:
+        """Run func, profiling it if this call is sampled.
+
+        Args:
+            tool: Tool name, used in the profile file name.
+            func: Zero-argument callable performing the tool call.
+
+        Returns:
+            Whatever func returns.
+        """
+        if self.keep <= 0 or random.random() >= self.sample_rate:
+            return func()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        try:
+            return profiler.runcall(func)
+        finally:
+            self._maybe_keep(tool, time.perf_counter() - start, profiler)
+
+    def profiles(self) -> list[Path]:
+        """Kept profile files, slowest first."""
+        with self._lock:
+            return [self.directory / name for _, name in sorted(self._kept)[::-1]]
+
+    def _maybe_keep(
+        self, tool: str, seconds: float, profiler: cProfile.Profile
+    ) -> None:
+        with self._lock:
+            if len(self._kept) >= self.keep and seconds <= self._kept[0][0]:
+                return
+            name = (
+                f"{re.sub(r'[^A-Za-z0-9_.-]', '_', tool)}-"
+                f"{seconds * 1000:.0f}ms-{time.time_ns()}.prof"
+            )
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                profiler.dump_stats(self.directory / name)
+            except OSError as e:
+                _logger.warning(f"Failed to write profile {name}: {e}")
+                return
+            heapq.heappush(self._kept, (seconds, name))
+            if len(self._kept) > self.keep:
+                _, evicted = heapq.heappop(self._kept)
+                (self.directory / evicted).unlink(missing_ok=True)
+
+
+def _summarize(stats: ToolMetrics) -> dict[str, Any]:
+    """JSON-friendly summary of one tool's metrics."""
+    return {
+        "calls": stats.calls,
+        "errors": stats.errors,
+        "bytes_in": stats.bytes_in,
+        "bytes_out": stats.bytes_out,
+        "latency_ms": {
+            "mean": round(stats.seconds / stats.calls * 1000, 3) if stats.calls else 0,
+            "p50": round(stats.percentile(50) * 1000, 3),
+            "p95": round(stats.percentile(95) * 1000, 3),
+            "p99": round(stats.percentile(99) * 1000, 3),
+            "max": round(max(stats.samples, default=0.0) * 1000, 3),
+        },
+        "time_split_ms": {
+            name: round(spent * 1000, 3) for name, spent in stats.phase_seconds.items()
+        },
+    }
+
+
+def _label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
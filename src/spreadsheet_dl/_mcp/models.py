@@ -81,16 +81,18 @@ def text(cls, text: str) -> MCPToolResult:
         return cls(content=[{"type": "text", "text": text}])
 
     @classmethod
-    def json(cls, data: Any) -> MCPToolResult:
-        """Create a JSON result."""
-        return cls(
-            content=[
-                {
-                    "type": "text",
-                    "text": json.dumps(data, indent=2, default=str),
-                }
-            ]
-        )
+    def json(cls, data: Any, *, compact: bool = False) -> MCPToolResult:
+        """Create a JSON result.
+
+        Args:
+            data: JSON-serializable payload.
+            compact: Omit indentation and separator spaces (for large results).
+        """
+        if compact:
+            text = json.dumps(data, separators=(",", ":"), default=str)
+        else:
+            text = json.dumps(data, indent=2, default=str)
+        return cls(content=[{"type": "text", "text": text}])
 
     @classmethod
     def error(cls, message: str) -> MCPToolResult:
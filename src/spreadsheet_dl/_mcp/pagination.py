@@ -0,0 +1,266 @@
+"""Cursor-based pagination for large MCP tool results.
+
+Part of the modular MCP server implementation.
+
+Tools that can return thousands of rows (``query_select``, ``query_find``,
+``cell_batch_get``) accept optional ``page_size``, ``cursor`` and ``format``
+arguments. The first paginated call computes the full result once and parks
+it in a TTL cache; the response carries a ``next_cursor`` that later calls
+pass back to fetch the following page without re-reading the workbook.
+
+The ``rows`` format sends column names once followed by one value array per
+row instead of repeating every column name in a per-row object.
+"""
+
+from __future__ import annotations
+
+import secrets
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from spreadsheet_dl._mcp.exceptions import MCPToolError
+from spreadsheet_dl._mcp.models import MCPToolParameter
+from spreadsheet_dl.performance import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+# Seconds a paginated result stays fetchable after its first page
+RESULT_TTL_SECONDS = 300.0
+
+# Upper bound on page_size so one page cannot rebuild the full-blob problem
+MAX_PAGE_SIZE = 10_000
+
+RESULT_FORMATS = ("objects", "rows")
+
+
+@dataclass(frozen=True)
+class ResultPage:
+    """One page of a tabular tool result.
+
+    Attributes:
+        columns: Column names, shared by every row.
+        rows: Row value lists for this page.
+        offset: Index of the first row of this page in the full result.
+        total: Number of rows in the full result.
+        next_cursor: Token for the next page, or None on the last page.
+        paginated: Whether the caller asked for paging at all.
+    """
+
+    columns: list[str]
+    rows: list[list[Any]]
+    offset: int
+    total: int
+    next_cursor: str | None
+    paginated: bool
+
+    def page_info(self) -> dict[str, Any]:
+        """Pagination fields to merge into a response (empty if unpaged)."""
+        if not self.paginated:
+            return {}
+        return {
+            "offset": self.offset,
+            "total": self.total,
+            "next_cursor": self.next_cursor,
+        }
+
+
+@dataclass(frozen=True)
+class _StoredResult:
+    """Materialized result kept between page requests."""
+
+    request: tuple[Hashable, ...]
+    columns: list[str]
+    rows: list[list[Any]]
+    page_size: int
+
+
+class ResultPager:
+    """Serve tabular results page by page from a TTL cache.
+
+    Example:
+        >>> pager = ResultPager()
+        >>> rows = [[i] for i in range(5)]
+        >>> first = pager.page(("demo",), lambda: (["n"], rows), page_size=2)
+        >>> first.rows, first.total
+        ([[0], [1]], 5)
+        >>> pager.page(("demo",), lambda: ([], []), cursor=first.next_cursor).rows
+        [[2], [3]]
+    """
+
+    def __init__(self, maxsize: int = 32, ttl: float = RESULT_TTL_SECONDS) -> None:
+        """Initialize the pager.
+
+        Args:
+            maxsize: Maximum number of results kept for continuation.
+            ttl: Seconds a result stays available after it was computed.
+        """
+        self._results: LRUCache[str, _StoredResult] = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def page(
+        self,
+        request: tuple[Hashable, ...],
+        compute: Callable[[], tuple[list[str], list[list[Any]]]],
+        *,
+        page_size: int | None = None,
+        cursor: str | None = None,
+    ) -> ResultPage:
+        """Return one page of a result, computing it only for the first page.
+
+        Args:
+            request: Identity of the request (tool name and arguments). A
+                cursor is only accepted for the request that issued it.
+            compute: Produces ``(columns, rows)`` for the full result.
+            page_size: Rows per page. None without a cursor returns the
+                whole result; None with a cursor keeps the original size.
+            cursor: ``next_cursor`` from a previous page.
+
+        Returns:
+            The requested page.
+
+        Raises:
+            MCPToolError: If the cursor is malformed, expired or issued for
+                a different request, or page_size is out of range.
+        """
+        if page_size is not None and not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise MCPToolError(
+                f"page_size must be between 1 and {MAX_PAGE_SIZE}, got {page_size}"
+            )
+
+        if cursor:
+            token, offset = _parse_cursor(cursor)
+            stored = self._results.get(token)
+            if stored is None:
+                raise MCPToolError(
+                    "Cursor expired or unknown; repeat the request without a cursor"
+                )
+            if stored.request != request:
+                raise MCPToolError("Cursor was issued for a different request")
+            size = page_size or stored.page_size
+        else:
+            columns, rows = compute()
+            if page_size is None:
+                return ResultPage(columns, rows, 0, len(rows), None, paginated=False)
+            token, offset, size = "", 0, page_size
+            stored = _StoredResult(request, columns, rows, size)
+
+        end = offset + size
+        next_cursor = None
+        if end < len(stored.rows):
+            if not token:
+                token = secrets.token_urlsafe(12)
+                self._results.set(token, stored)
+            next_cursor = f"{token}.{end}"
+        return ResultPage(
+            stored.columns,
+            stored.rows[offset:end],
+            offset,
+            len(stored.rows),
+            next_cursor,
+            paginated=True,
+        )
+
+    def clear(self) -> None:
+        """Drop every stored result, invalidating outstanding cursors."""
+        self._results.clear()
+
+
+def _parse_cursor(cursor: str) -> tuple[str, int]:
+    """Split a cursor into its result token and row offset."""
+    token, sep, offset = cursor.rpartition(".")
+    if not sep or not token or not offset.isdigit():
+        raise MCPToolError(f"Invalid cursor: {cursor!r}")
+    return token, int(offset)
+
+
+def check_format(fmt: str) -> None:
+    """Validate a ``format`` tool argument.
+
+    Raises:
+        MCPToolError: If fmt is not one of RESULT_FORMATS.
+    """
+    if fmt not in RESULT_FORMATS:
+        raise MCPToolError(
+            f"Unknown result format: {fmt!r}. Use one of {', '.join(RESULT_FORMATS)}"
+        )
+
+
+def encode_page(page: ResultPage, fmt: str, key: str) -> dict[str, Any]:
+    """Encode a page as per-row objects or as a compact column/row table.
+
+    Args:
+        page: Page to encode.
+        fmt: ``"objects"`` or ``"rows"``.
+        key: Response key holding the object list in ``objects`` format.
+
+    Returns:
+        ``{key: [{column: value}, ...]}`` for ``objects``, or
+        ``{"columns": [...], "rows": [[...], ...]}`` for ``rows``, plus the
+        pagination fields when the caller asked for paging.
+
+    Raises:
+        MCPToolError: If fmt is not a known format.
+
+    Example:
+        >>> page = ResultPage(["a", "b"], [[1, 2]], 0, 1, None, paginated=False)
+        >>> encode_page(page, "objects", "results")
+        {'results': [{'a': 1, 'b': 2}]}
+        >>> encode_page(page, "rows", "results")
+        {'columns': ['a', 'b'], 'rows': [[1, 2]]}
+    """
+    check_format(fmt)
+    data: dict[str, Any]
+    if fmt == "rows":
+        data = {"columns": page.columns, "rows": page.rows}
+    else:
+        data = {key: [dict(zip(page.columns, row, strict=True)) for row in page.rows]}
+    data.update(page.page_info())
+    return data
+
+
+def pagination_parameters(*, formats: bool = True) -> list[MCPToolParameter]:
+    """Optional tool parameters shared by paginated tools.
+
+    Args:
+        formats: Include the ``format`` parameter (tabular results only).
+    """
+    params = [
+        MCPToolParameter(
+            name="page_size",
+            type="integer",
+            description=(
+                f"Rows per page (1-{MAX_PAGE_SIZE}). Omit to return the whole "
+                "result in one response"
+            ),
+            required=False,
+        ),
+        MCPToolParameter(
+            name="cursor",
+            type="string",
+            description=(
+                "next_cursor from the previous page; other arguments must match "
+                f"the first call. Cursors expire after {int(RESULT_TTL_SECONDS)}s"
+            ),
+            required=False,
+        ),
+    ]
+    if not formats:
+        return params
+    return [
+        *params,
+        MCPToolParameter(
+            name="format",
+            type="string",
+            description=(
+                "'objects' for one JSON object per row, or 'rows' to send column "
+                "names once followed by value arrays"
+            ),
+            required=False,
+            enum=list(RESULT_FORMATS),
+            default="objects",
+        ),
+    ]
+
+
+# Shared by every paginated tool handler in the server process
+RESULT_PAGER = ResultPager()
@@ -37,6 +37,9 @@ def __init__(self) -> None:
         """Initialize the tool registry."""
         self._tools: dict[str, MCPTool] = {}
         self._categories: dict[str, list[str]] = {}
+        # Bumped on every registration so callers can cache derived views
+        self._generation = 0
+        self._schemas: list[dict[str, Any]] | None = None
 
     def tool(
         self,
@@ -68,14 +71,7 @@ def decorator(
                 handler=func,
             )
 
-            # Register tool
-            self._tools[name] = tool
-
-            # Add to category
-            if category not in self._categories:
-                self._categories[category] = []
-            self._categories[category].append(name)
-
+            self._add(tool, category)
             return func
 
         return decorator
@@ -103,11 +99,23 @@ def register(
             parameters=parameters or [],
             handler=handler,
         )
-        self._tools[name] = tool
+        self._add(tool, category)
+
+    def _add(self, tool: MCPTool, category: str) -> None:
+        """Store a tool and invalidate cached schemas."""
+        self._tools[tool.name] = tool
 
         if category not in self._categories:
             self._categories[category] = []
-        self._categories[category].append(name)
+        self._categories[category].append(tool.name)
+
+        self._generation += 1
+        self._schemas = None
+
+    @property
+    def generation(self) -> int:
+        """Registration counter; changes whenever a tool is registered."""
+        return self._generation
 
     def get_tool(self, name: str) -> MCPTool | None:
         """Get a tool by name."""
@@ -129,10 +137,14 @@ def get_categories(self) -> list[str]:
     def list_tools(self) -> list[dict[str, Any]]:
         """List all tools with metadata.
 
+        Schemas are generated once and reused until the next registration.
+
         Returns:
             List of tool schemas
         """
-        return [tool.to_schema() for tool in self._tools.values()]
+        if self._schemas is None:
+            self._schemas = [tool.to_schema() for tool in self._tools.values()]
+        return list(self._schemas)
 
     def get_tool_count(self) -> int:
         """Get total number of registered tools."""
@@ -19,18 +19,24 @@
 import json
 import logging
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from spreadsheet_dl._mcp.config import MCPConfig, MCPVersion
 from spreadsheet_dl._mcp.exceptions import MCPSecurityError
+from spreadsheet_dl._mcp.handlers import BufferedAuditWriter
+from spreadsheet_dl._mcp.metrics import MetricsCollector, SlowCallProfiler
+from spreadsheet_dl._mcp.models import MCPToolParameter, MCPToolResult
 from spreadsheet_dl._mcp.registry import MCPToolRegistry
 from spreadsheet_dl._mcp.tools import register_all_tools
 from spreadsheet_dl.exceptions import FileError
+from spreadsheet_dl.performance import record_phases
 
 if TYPE_CHECKING:
-    from spreadsheet_dl._mcp.models import MCPToolResult
+    from collections.abc import Callable, Mapping
 
 
 class MCPServer:
@@ -107,17 +113,144 @@ def __init__(
         self._registry = MCPToolRegistry()
         self._request_count = 0
         self._last_reset = datetime.now()
+        self._dispatch: Mapping[str, Callable[..., MCPToolResult] | None] = (
+            MappingProxyType({})
+        )
+        self._tools_list_json = "{}"
+        self._dispatch_generation = -1
+        self._audit_writer: BufferedAuditWriter | None = None
+        if self.config.audit_log_path:
+            self._audit_writer = BufferedAuditWriter(self.config.audit_log_path)
+        self.metrics = MetricsCollector()
+        self._metrics_written = time.monotonic()
+        self._profiler: SlowCallProfiler | None = None
+        if self.config.profile_dir:
+            self._profiler = SlowCallProfiler(
+                self.config.profile_dir,
+                keep=self.config.profile_slowest,
+                sample_rate=self.config.profile_sample_rate,
+            )
         self._register_tools()
 
     def _register_tools(self) -> None:
         """Register all available tools from modular tool packages."""
         register_all_tools(self._registry, self._validate_path)
+        self._registry.register(
+            name="server_metrics",
+            description=(
+                "Get per-tool call counts, latency percentiles (p50/p95/p99), "
+                "bytes in/out and load/operation/save time split"
+            ),
+            handler=self._server_metrics,
+            parameters=[
+                MCPToolParameter(
+                    name="tool",
+                    type="string",
+                    description="Only report this tool",
+                    required=False,
+                ),
+                MCPToolParameter(
+                    name="reset",
+                    type="boolean",
+                    description="Clear the metrics after reporting them",
+                    required=False,
+                ),
+            ],
+            category="server",
+        )
+
+    def _server_metrics(
+        self, tool: str | None = None, reset: bool = False
+    ) -> MCPToolResult:
+        """Handle the server_metrics tool."""
+        data = self.metrics.snapshot(tool)
+        if self._profiler is not None:
+            data["profiles"] = [str(p) for p in self._profiler.profiles()]
+        if reset:
+            self.metrics.reset()
+        return MCPToolResult.json(data)
+
+    def _invoke(
+        self, tool_name: str, handler: Callable[..., Any], arguments: dict[str, Any]
+    ) -> tuple[Any, float]:
+        """Run a tool handler and record its metrics.
+
+        Returns:
+            The handler result and the call duration in seconds.
+        """
+        result = None
+        start = time.perf_counter()
+        with record_phases() as phases:
+            try:
+                if self._profiler is None:
+                    result = handler(**arguments)
+                else:
+                    result = self._profiler.call(
+                        tool_name, lambda: handler(**arguments)
+                    )
+            finally:
+                elapsed = time.perf_counter() - start
+                bytes_out = 0
+                for item in getattr(result, "content", None) or ():
+                    bytes_out += len(str(item.get("text", "")).encode())
+                self.metrics.record(
+                    tool_name,
+                    elapsed,
+                    bytes_in=len(json.dumps(arguments, default=str).encode()),
+                    bytes_out=bytes_out,
+                    is_error=result is None or getattr(result, "is_error", False),
+                    phases=phases,
+                )
+                if self.config.metrics_path is not None:
+                    self._maybe_write_metrics()
+        return result, elapsed
+
+    def _maybe_write_metrics(self, force: bool = False) -> None:
+        """Rewrite the Prometheus dump if configured and the interval elapsed."""
+        path = self.config.metrics_path
+        if path is None:
+            return
+        now = time.monotonic()
+        if (
+            not force
+            and now - self._metrics_written < self.config.metrics_interval_seconds
+        ):
+            return
+        self._metrics_written = now
+        try:
+            self.metrics.write_prometheus(path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write metrics file: {e}")
 
     @property
     def _tools(self) -> dict[str, Any]:
         """Get registered tools from registry."""
         return self._registry._tools
 
+    def _refresh_dispatch(self) -> None:
+        """Rebuild the dispatch table and tools/list payload after registration."""
+        if self._dispatch_generation == self._registry.generation:
+            return
+        self._dispatch = MappingProxyType(
+            {name: tool.handler for name, tool in self._registry._tools.items()}
+        )
+        self._tools_list_json = json.dumps({"tools": self._registry.list_tools()})
+        self._dispatch_generation = self._registry.generation
+
+    def _lookup_handler(self, tool_name: Any) -> tuple[bool, Any]:
+        """Find a tool handler, preferring the frozen dispatch table.
+
+        Returns:
+            ``(found, handler)``; handler is None for a tool without one.
+        """
+        self._refresh_dispatch()
+        try:
+            return True, self._dispatch[tool_name]
+        except (KeyError, TypeError):
+            # Tools added to the registry dict directly bypass the table
+            tool = self._tools.get(tool_name)
+            return tool is not None, None if tool is None else tool.handler
+
     def _validate_path(self, file_path: str) -> Path:
         """Validate and resolve a file path.
 
@@ -169,23 +302,32 @@ def _log_audit(
         tool: str,
         params: dict[str, Any],
         result: MCPToolResult,
+        duration: float | None = None,
     ) -> None:
         """Log tool invocation for audit."""
         if not self.config.enable_audit_log:
             return
 
-        entry = {
+        entry: dict[str, Any] = {
             "timestamp": datetime.now().isoformat(),
             "tool": tool,
             "params": {k: str(v) for k, v in params.items()},
             "success": not getattr(result, "is_error", False),
         }
+        if duration is not None:
+            entry["duration_ms"] = round(duration * 1000, 3)
+        line = json.dumps(entry)
 
-        self.logger.info(json.dumps(entry))
+        self.logger.info(line)
 
-        if self.config.audit_log_path:
-            with open(self.config.audit_log_path, "a") as f:
-                f.write(json.dumps(entry) + "\n")
+        if self._audit_writer is not None:
+            # Appended by a background thread; see flush_audit_log()
+            self._audit_writer.write(line)
+
+    def flush_audit_log(self) -> None:
+        """Block until all queued audit entries are written to the log file."""
+        if self._audit_writer is not None:
+            self._audit_writer.flush()
 
     def _call_tool(self, tool_name: str, **kwargs: Any) -> MCPToolResult:
         """Call a tool by name with arguments.
@@ -201,14 +343,14 @@ def _call_tool(self, tool_name: str, **kwargs: Any) -> MCPToolResult:
             KeyError: If tool is not found.
             ValueError: If tool has no handler.
         """
-        if tool_name not in self._tools:
+        found, handler = self._lookup_handler(tool_name)
+        if not found:
             raise KeyError(f"Unknown tool: {tool_name}")
-
-        tool = self._tools[tool_name]
-        if tool.handler is None:
+        if handler is None:
             raise ValueError(f"Tool has no handler: {tool_name}")
 
-        return tool.handler(**kwargs)  # type: ignore[no-any-return]
+        result, _ = self._invoke(tool_name, handler, kwargs)
+        return result  # type: ignore[no-any-return]
 
     # =========================================================================
     # Convenience Methods for Direct Tool Access (used by tests)
@@ -259,11 +401,11 @@ def _handle_cell_move(
         )
 
     def _handle_cell_batch_get(
-        self, file_path: str, sheet: str, cells: str
+        self, file_path: str, sheet: str, cells: str, **kwargs: Any
     ) -> MCPToolResult:
         """Get multiple cell values."""
         return self._call_tool(
-            "cell_batch_get", file_path=file_path, sheet=sheet, cells=cells
+            "cell_batch_get", file_path=file_path, sheet=sheet, cells=cells, **kwargs
         )
 
     def _handle_cell_batch_set(
@@ -958,7 +1100,7 @@ def _handle_initialize(
 
     def _handle_tools_list(self, msg_id: Any) -> dict[str, Any]:
         """Handle tools/list request."""
-        tools = [tool.to_schema() for tool in self._tools.values()]
+        tools = self._registry.list_tools()
         return {
             "jsonrpc": "2.0",
             "id": msg_id,
@@ -974,15 +1116,15 @@ def _handle_tools_call(
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
 
-        if tool_name not in self._tools:
+        found, handler = self._lookup_handler(tool_name)
+        if not found:
             return self._error_response(
                 msg_id,
                 -32602,
                 f"Unknown tool: {tool_name}",
             )
 
-        tool = self._tools[tool_name]
-        if tool.handler is None:
+        if handler is None:
             return self._error_response(
                 msg_id,
                 -32603,
@@ -990,10 +1132,10 @@ def _handle_tools_call(
             )
 
         # Execute tool
-        result = tool.handler(**arguments)
+        result, elapsed = self._invoke(str(tool_name), handler, arguments)
 
         # Audit log
-        self._log_audit(tool_name, arguments, result)
+        self._log_audit(str(tool_name), arguments, result, elapsed)
 
         return {
             "jsonrpc": "2.0",
@@ -1020,6 +1162,33 @@ def _error_response(
             },
         }
 
+    def handle_message_json(self, message: dict[str, Any]) -> str | None:
+        """Handle an MCP message and return the serialized JSON-RPC response.
+
+        ``tools/list`` responses splice in the tool schemas serialized once
+        per registration instead of re-encoding them on every request.
+
+        Args:
+            message: JSON-RPC message.
+
+        Returns:
+            JSON text of the response, or None for notifications.
+        """
+        if message.get("method") == "tools/list":
+            msg_id = message.get("id")
+            if not self._check_rate_limit():
+                return json.dumps(
+                    self._error_response(msg_id, -32000, "Rate limit exceeded")
+                )
+            self._refresh_dispatch()
+            return (
+                f'{{"jsonrpc": "2.0", "id": {json.dumps(msg_id)}, '
+                f'"result": {self._tools_list_json}}}'
+            )
+
+        response = self.handle_message(message)
+        return None if response is None else json.dumps(response)
+
     def run(self) -> None:
         """Run the MCP server in stdio mode.
 
@@ -1038,11 +1207,11 @@ def run(self) -> None:
                 message = json.loads(line)
 
                 # Handle message
-                response = self.handle_message(message)
+                response = self.handle_message_json(message)
 
                 # Send response (if not a notification)
                 if response is not None:
-                    sys.stdout.write(json.dumps(response) + "\n")
+                    sys.stdout.write(response + "\n")
                     sys.stdout.flush()
 
             except json.JSONDecodeError as e:
@@ -1053,6 +1222,9 @@ def run(self) -> None:
                 self.logger.error(f"Server error: {e}")
                 break
 
+        if self._audit_writer is not None:
+            self._audit_writer.close()
+        self._maybe_write_metrics(force=True)
         self.logger.info("MCP server stopped")
 
 
@@ -13,6 +13,12 @@
 from typing import Any
 
 from spreadsheet_dl._mcp.models import MCPToolParameter, MCPToolResult
+from spreadsheet_dl._mcp.pagination import (
+    RESULT_PAGER,
+    check_format,
+    encode_page,
+    pagination_parameters,
+)
 
 
 def register_chart_tools(
@@ -270,8 +276,13 @@ def _register_named_range_tools(registry: Any, validate_path: Any) -> None:
             MCPToolParameter(
                 name="query",
                 type="string",
-                description="Query string (e.g., 'SELECT A, B WHERE C > 10')",
+                description=(
+                    "Query string (e.g., 'SELECT A, B WHERE C > 10', "
+                    "'SELECT Category, SUM(Amount) GROUP BY Category "
+                    "ORDER BY SUM(Amount) DESC LIMIT 5')"
+                ),
             ),
+            *pagination_parameters(),
         ],
         category="advanced_operations",
     )
@@ -295,8 +306,12 @@ def _register_named_range_tools(registry: Any, validate_path: Any) -> None:
             MCPToolParameter(
                 name="criteria",
                 type="string",
-                description="JSON object with search criteria",
+                description=(
+                    'JSON object with search criteria (e.g., {"Status": "Active", '
+                    '"Amount": {"$gt": 100}})'
+                ),
             ),
+            *pagination_parameters(formats=False),
         ],
         category="advanced_operations",
     )
@@ -526,17 +541,34 @@ def handler(
 def _make_query_select_handler(validate_path: Any) -> Any:
     """Create query_select handler."""
 
-    def handler(file_path: str, sheet: str, query: str) -> MCPToolResult:
+    def handler(
+        file_path: str,
+        sheet: str,
+        query: str,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        format: str = "objects",
+    ) -> MCPToolResult:
         try:
+            check_format(format)
             path = validate_path(file_path)
-            from spreadsheet_dl.ods_editor import OdsEditor
-
-            editor = OdsEditor(path)
-            results = editor.query_data(sheet, query)
-
-            return MCPToolResult.json(
-                {"sheet": sheet, "query": query, "results": results}
+            from spreadsheet_dl.query import query_file
+
+            def compute() -> tuple[list[str], list[list[Any]]]:
+                # Streams the sheet without loading the document; cached per mtime
+                results = query_file(path, sheet, query)
+                columns = list(results[0]) if results else []
+                return columns, [list(row.values()) for row in results]
+
+            page = RESULT_PAGER.page(
+                ("query_select", str(path), sheet, query),
+                compute,
+                page_size=page_size,
+                cursor=cursor,
             )
+            data = {"sheet": sheet, "query": query}
+            data.update(encode_page(page, format, "results"))
+            return MCPToolResult.json(data, compact=format == "rows")
         except Exception as e:
             return MCPToolResult.error(str(e))
 
@@ -547,17 +579,36 @@ def _make_query_find_handler(validate_path: Any) -> Any:
     """Create query_find handler."""
     import json
 
-    def handler(file_path: str, sheet: str, criteria: str) -> MCPToolResult:
+    def handler(
+        file_path: str,
+        sheet: str,
+        criteria: str,
+        page_size: int | None = None,
+        cursor: str | None = None,
+    ) -> MCPToolResult:
         try:
             path = validate_path(file_path)
-            from spreadsheet_dl.ods_editor import OdsEditor
+            from spreadsheet_dl.query import OdsFileScanner, match_rows
 
-            editor = OdsEditor(path)
             crit = json.loads(criteria)
-            matches = editor.find_rows(sheet, crit)
 
+            def compute() -> tuple[list[str], list[list[Any]]]:
+                matches = match_rows(OdsFileScanner(path, sheet), crit)
+                return ["row"], [[row] for row in matches]
+
+            page = RESULT_PAGER.page(
+                ("query_find", str(path), sheet, criteria),
+                compute,
+                page_size=page_size,
+                cursor=cursor,
+            )
             return MCPToolResult.json(
-                {"sheet": sheet, "criteria": crit, "matches": matches}
+                {
+                    "sheet": sheet,
+                    "criteria": crit,
+                    "matches": [row for (row,) in page.rows],
+                    **page.page_info(),
+                }
             )
         except Exception as e:
             return MCPToolResult.error(str(e))
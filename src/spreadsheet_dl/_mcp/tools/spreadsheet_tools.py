@@ -16,6 +16,12 @@
 from typing import Any
 
 from spreadsheet_dl._mcp.models import MCPToolParameter, MCPToolResult
+from spreadsheet_dl._mcp.pagination import (
+    RESULT_PAGER,
+    check_format,
+    encode_page,
+    pagination_parameters,
+)
 
 
 def register_spreadsheet_tools(
@@ -198,6 +204,7 @@ def _register_cell_tools(registry: Any, validate_path: Any) -> None:
                 type="string",
                 description="Comma-separated cell references or range (e.g., 'A1,B2,C3' or 'A1:C10')",
             ),
+            *pagination_parameters(),
         ],
         category="cell_operations",
     )
@@ -762,40 +769,73 @@ def handler(
 def _make_cell_batch_get_handler(validate_path: Any) -> Any:
     """Create cell_batch_get handler with path validation."""
 
-    def handler(file_path: str, sheet: str, cells: str) -> MCPToolResult:
+    def handler(
+        file_path: str,
+        sheet: str,
+        cells: str,
+        page_size: int | None = None,
+        cursor: str | None = None,
+        format: str = "objects",
+    ) -> MCPToolResult:
         try:
+            check_format(format)
             path = validate_path(file_path)
             from spreadsheet_dl.ods_editor import OdsEditor
 
-            editor = OdsEditor(path)
-
-            # Parse cells (comma-separated or range)
-            if ":" in cells:
-                # OdsEditor doesn't have get_range_values, iterate manually
-                # Parse range and get individual cells
-                from spreadsheet_dl.ods_editor import OdsEditor as OE
-
-                start_ref, end_ref = cells.split(":", 1)
-                start_row, start_col = OE._parse_cell_reference(start_ref)
-                end_row, end_col = OE._parse_cell_reference(end_ref)
-
-                values = {}
-                for row in range(start_row, end_row + 1):
-                    for col in range(start_col, end_col + 1):
-                        col_letter = OE._col_index_to_letter(col)
-                        cell_ref = f"{col_letter}{row + 1}"
-                        values[cell_ref] = editor.get_cell_value(sheet, cell_ref)
-            else:
+            def compute() -> tuple[list[str], list[list[Any]]]:
+                editor = OdsEditor(path)
+                # Parse cells (comma-separated or range)
+                if ":" in cells:
+                    # Ranges page by sheet row: [row_number, value, value, ...]
+                    start_ref, end_ref = cells.split(":", 1)
+                    start_row, start_col = OdsEditor._parse_cell_reference(start_ref)
+                    end_col = OdsEditor._parse_cell_reference(end_ref)[1]
+                    letters = [
+                        OdsEditor._col_index_to_letter(col)
+                        for col in range(start_col, end_col + 1)
+                    ]
+                    grid = editor.get_range_values(sheet, cells)
+                    rows = [
+                        [start_row + offset + 1, *values]
+                        for offset, values in enumerate(grid)
+                    ]
+                    return ["row", *letters], rows
                 cell_list = [c.strip() for c in cells.split(",")]
-                values = {c: editor.get_cell_value(sheet, c) for c in cell_list}
-
-            return MCPToolResult.json({"sheet": sheet, "values": values})
+                return ["cell", "value"], [
+                    [c, editor.get_cell_value(sheet, c)] for c in cell_list
+                ]
+
+            page = RESULT_PAGER.page(
+                ("cell_batch_get", str(path), sheet, cells),
+                compute,
+                page_size=page_size,
+                cursor=cursor,
+            )
+            data: dict[str, Any] = {"sheet": sheet}
+            if format == "rows":
+                data.update(encode_page(page, format, "values"))
+            else:
+                data["values"] = _cell_values(page.columns, page.rows)
+                data.update(page.page_info())
+            return MCPToolResult.json(data, compact=format == "rows")
         except Exception as e:
             return MCPToolResult.error(str(e))
 
     return handler
 
 
+def _cell_values(columns: list[str], rows: list[list[Any]]) -> dict[str, Any]:
+    """Flatten cell_batch_get rows back into a ``{cell_ref: value}`` mapping."""
+    if columns[0] == "cell":
+        return dict(rows)
+    letters = columns[1:]
+    return {
+        f"{letter}{row[0]}": value
+        for row in rows
+        for letter, value in zip(letters, row[1:], strict=True)
+    }
+
+
 def _make_cell_batch_set_handler(validate_path: Any) -> Any:
     """Create cell_batch_set handler with path validation."""
     import json
@@ -11,16 +11,24 @@
     - Auto-backup before destructive operations
     - Configurable backup retention (default 30 days)
     - Manual backup triggers
-    - Compressed backup files (gzip)
+    - Compressed backup files (gzip; zip containers such as ODS are stored)
+    - Content-addressed, deduplicating backup store (SHA-256 chunk blobs)
+    - Streaming hashing and compression (files are never read whole)
     - Restore from backup with validation
     - Backup integrity verification
 """
 
 from __future__ import annotations
 
+import contextlib
 import gzip
 import hashlib
+import itertools
 import json
+import os
+import struct
+import zipfile
+import zlib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -31,9 +39,14 @@
     FileError,
     SpreadsheetDLError,
 )
+from spreadsheet_dl.ods_packaging import is_zip_container
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
+    from typing import BinaryIO
+
+# Fixed part of a zip local file header (name and extra field follow)
+_ZIP_LOCAL_HEADER_SIZE = 30
 
 
 class BackupReason(Enum):
@@ -52,6 +65,7 @@ class BackupCompression(Enum):
 
     NONE = "none"
     GZIP = "gzip"
+    DEDUP = "dedup"  # Content-addressed chunk store shared across backups
 
 
 # Exception classes for backup module
@@ -201,6 +215,11 @@ class BackupManager:
     Provides automatic and manual backup creation, retention management,
     and restore functionality with integrity verification.
 
+    With ``BackupCompression.DEDUP`` each backup is a small JSON manifest
+    listing SHA-256 addressed chunk blobs kept under ``blobs/``. ODS and
+    other zip containers are split on member boundaries, so unchanged
+    members (styles, meta, images) are stored once across all backups.
+
     Example:
         >>> import tempfile
         >>> manager = BackupManager(backup_dir=tempfile.mkdtemp())
@@ -215,12 +234,16 @@ class BackupManager:
     METADATA_SUFFIX = ".meta.json"
     BACKUP_SUFFIX = ".bak"
     COMPRESSED_SUFFIX = ".gz"
+    MANIFEST_SUFFIX = ".chunks"
+    BLOB_DIR = "blobs"
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
 
     def __init__(
         self,
         backup_dir: Path | str | None = None,
         retention_days: int = DEFAULT_RETENTION_DAYS,
         compression: BackupCompression = BackupCompression.GZIP,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> None:
         """Initialize backup manager.
 
@@ -229,13 +252,24 @@ def __init__(
                         ~/.spreadsheet-dl-backups/ or project-local directory.
             retention_days: Number of days to keep backups (default 30).
             compression: Compression algorithm to use.
+            chunk_size: Maximum bytes read, hashed and stored at a time.
+                        Also the largest blob size in the dedup store.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
         """
+        if chunk_size <= 0:
+            raise ValueError(
+                f"chunk_size must be positive, got {chunk_size}. "
+                "Fix: Use a block size such as 1048576 (1 MiB)."
+            )
         if backup_dir is None:
             # Default to user's home directory backup location
             backup_dir = Path.home() / self.DEFAULT_BACKUP_DIR
         self.backup_dir = Path(backup_dir)
         self.retention_days = retention_days
         self.compression = compression
+        self.chunk_size = chunk_size
 
         # Ensure backup directory exists
         self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -271,33 +305,45 @@ def create_backup(
             raise FileError(f"Cannot backup: not a file: {file_path}")
 
         try:
-            # Read original file and compute hash
-            with open(file_path, "rb") as f:
-                content = f.read()
-
-            content_hash = hashlib.sha256(content).hexdigest()
-            file_size = len(content)
+            # ODS/XLSX files are already deflated zips; gzipping them again
+            # costs CPU for almost no size gain, so store them as-is.
+            compression = self.compression
+            if compression == BackupCompression.GZIP and is_zip_container(file_path):
+                compression = BackupCompression.NONE
 
             # Generate backup filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             safe_filename = self._safe_filename(file_path.name)
             backup_name = f"{safe_filename}_{timestamp}{self.BACKUP_SUFFIX}"
 
-            if self.compression == BackupCompression.GZIP:
+            if compression == BackupCompression.GZIP:
                 backup_name += self.COMPRESSED_SUFFIX
+            elif compression == BackupCompression.DEDUP:
+                backup_name += self.MANIFEST_SUFFIX
 
             backup_path = self.backup_dir / backup_name
             metadata_path = backup_path.with_suffix(
                 backup_path.suffix + self.METADATA_SUFFIX
             )
 
-            # Create backup (compressed or raw)
-            if self.compression == BackupCompression.GZIP:
-                with gzip.open(backup_path, "wb") as f:
-                    f.write(content)
-            else:
-                with open(backup_path, "wb") as f:
-                    f.write(content)
+            # Create backup, hashing the source as it streams through
+            with open(file_path, "rb") as src:
+                if compression == BackupCompression.DEDUP:
+                    content_hash, file_size = self._write_dedup(
+                        src, backup_path, self._chunk_lengths(file_path)
+                    )
+                else:
+                    opener = (
+                        gzip.open if compression == BackupCompression.GZIP else open
+                    )
+                    with opener(backup_path, "wb") as dst:
+                        hasher = hashlib.sha256()
+                        file_size = 0
+                        while block := src.read(self.chunk_size):
+                            hasher.update(block)
+                            dst.write(block)
+                            file_size += len(block)
+                    content_hash = hasher.hexdigest()
 
             # Create metadata
             metadata = BackupMetadata(
@@ -305,7 +351,7 @@ def create_backup(
                 original_filename=file_path.name,
                 backup_time=datetime.now().isoformat(),
                 reason=reason.value,
-                compression=self.compression.value,
+                compression=compression.value,
                 content_hash=content_hash,
                 file_size=file_size,
                 user=getpass.getuser(),
@@ -363,11 +409,12 @@ def restore_backup(
                 metadata = BackupMetadata.from_file(metadata_path)
             else:
                 # Try to infer compression from filename
-                compression = (
-                    BackupCompression.GZIP
-                    if backup_path.suffix == self.COMPRESSED_SUFFIX
-                    else BackupCompression.NONE
-                )
+                if backup_path.suffix == self.COMPRESSED_SUFFIX:
+                    compression = BackupCompression.GZIP
+                elif backup_path.suffix == self.MANIFEST_SUFFIX:
+                    compression = BackupCompression.DEDUP
+                else:
+                    compression = BackupCompression.NONE
                 metadata = BackupMetadata(compression=compression.value)
         else:
             backup_path = backup.backup_path
@@ -391,19 +438,24 @@ def restore_backup(
                 f"Target file already exists: {target_path}. Use overwrite=True to replace."
             )
 
+        # Stream into a sibling temp file so a corrupt backup never
+        # clobbers the target.
+        temp_path = target_path.with_name(f".{target_path.name}.restore")
         try:
-            # Read backup content
             compression = BackupCompression(metadata.compression)
-            if compression == BackupCompression.GZIP:
-                with gzip.open(backup_path, "rb") as f:
-                    content = f.read()
-            else:
-                with open(backup_path, "rb") as f:
-                    content = f.read()
+
+            # Create parent directories if needed
+            target_path.parent.mkdir(parents=True, exist_ok=True)
+
+            hasher = hashlib.sha256()
+            with open(temp_path, "wb") as f:
+                for block in self._iter_content(backup_path, compression):
+                    hasher.update(block)
+                    f.write(block)
 
             # Verify integrity if requested
             if verify and metadata.content_hash:
-                actual_hash = hashlib.sha256(content).hexdigest()
+                actual_hash = hasher.hexdigest()
                 if actual_hash != metadata.content_hash:
                     raise BackupCorruptError(
                         str(backup_path),
@@ -411,18 +463,14 @@ def restore_backup(
                         f"got {actual_hash[:16]}...",
                     )
 
-            # Create parent directories if needed
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write restored file
-            with open(target_path, "wb") as f:
-                f.write(content)
-
+            os.replace(temp_path, target_path)
             return target_path
 
         except SpreadsheetDLError:
+            temp_path.unlink(missing_ok=True)
             raise
-        except (OSError, ValueError, gzip.BadGzipFile, KeyError) as e:
+        except (OSError, EOFError, ValueError, zlib.error, KeyError) as e:
+            temp_path.unlink(missing_ok=True)
             # OSError: File I/O errors, ValueError: JSON/encoding, gzip errors, KeyError: metadata
             raise RestoreError(f"Failed to restore backup: {e}") from e
 
@@ -545,16 +593,15 @@ def verify_backup(self, backup: BackupInfo | Path | str) -> dict[str, Any]:
 
             # Read and decompress backup
             compression = BackupCompression(metadata.compression)
-            if compression == BackupCompression.GZIP:
-                with gzip.open(backup_path, "rb") as f:
-                    content = f.read()
-            else:
-                with open(backup_path, "rb") as f:
-                    content = f.read()
+            hasher = hashlib.sha256()
+            content_size = 0
+            for block in self._iter_content(backup_path, compression):
+                hasher.update(block)
+                content_size += len(block)
 
             # Verify hash
             if metadata.content_hash:
-                actual_hash = hashlib.sha256(content).hexdigest()
+                actual_hash = hasher.hexdigest()
                 result["hash_valid"] = actual_hash == metadata.content_hash
                 if not result["hash_valid"]:
                     issues.append(
@@ -568,11 +615,11 @@ def verify_backup(self, backup: BackupInfo | Path | str) -> dict[str, Any]:
 
             # Verify size
             if metadata.file_size:
-                result["size_valid"] = len(content) == metadata.file_size
+                result["size_valid"] = content_size == metadata.file_size
                 if not result["size_valid"]:
                     issues.append(
                         f"Size mismatch: expected {metadata.file_size}, "
-                        f"got {len(content)}"
+                        f"got {content_size}"
                     )
                     result["valid"] = False
             else:
@@ -581,7 +628,10 @@ def verify_backup(self, backup: BackupInfo | Path | str) -> dict[str, Any]:
         except gzip.BadGzipFile:
             issues.append("Backup file is not valid gzip data")
             result["valid"] = False
-        except (OSError, ValueError, KeyError) as e:
+        except BackupCorruptError as e:
+            issues.append(e.reason)
+            result["valid"] = False
+        except (OSError, EOFError, ValueError, zlib.error, KeyError) as e:
             # OSError: File I/O, ValueError: JSON/hash, KeyError: metadata fields
             issues.append(f"Verification error: {e}")
             result["valid"] = False
@@ -602,6 +652,10 @@ def cleanup_old_backups(
 
         Returns:
             List of BackupInfo objects that were (or would be) deleted.
+
+        Note:
+            Blobs of the dedup store that are no longer referenced by any
+            remaining backup are removed as well.
         """
         if days is None:
             days = self.retention_days
@@ -620,8 +674,36 @@ def cleanup_old_backups(
                         pass
                 deleted.append(backup)
 
+        if deleted and not dry_run:
+            self.prune_blobs()
+
         return deleted
 
+    def prune_blobs(self) -> int:
+        """Delete dedup blobs that no backup manifest references.
+
+        Returns:
+            Number of blob files removed.
+        """
+        blob_root = self.backup_dir / self.BLOB_DIR
+        if not blob_root.is_dir():
+            return 0
+
+        referenced: set[str] = set()
+        for manifest_path in self.backup_dir.glob(f"*{self.MANIFEST_SUFFIX}"):
+            try:
+                referenced.update(d for d, _ in self._read_manifest(manifest_path))
+            except (OSError, ValueError, KeyError):
+                # Unreadable manifest: keep everything rather than guess
+                return 0
+
+        removed = 0
+        for blob_path in blob_root.glob("*/*"):
+            if blob_path.name not in referenced:
+                blob_path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
     def get_backup_stats(self) -> dict[str, Any]:
         """Get statistics about backups.
 
@@ -633,10 +715,17 @@ def get_backup_stats(self) -> dict[str, Any]:
             - newest_backup: str (ISO date) or None
             - by_reason: dict[str, int]
             - by_file: dict[str, int]
+            - logical_size_bytes: int - Sum of original file sizes
+            - dedup_ratio: float - logical size / bytes on disk
+            - unique_chunks: int - Blobs in the dedup store
+            - referenced_chunks: int - Chunk references across manifests
+            - chunk_dedup_ratio: float - referenced / unique chunks
         """
         backups = self.list_backups(include_expired=True)
 
         total_size = 0
+        logical_size = 0
+        referenced_chunks = 0
         by_reason: dict[str, int] = {}
         by_file: dict[str, int] = {}
 
@@ -644,6 +733,11 @@ def get_backup_stats(self) -> dict[str, Any]:
             # Track size
             if backup.backup_path.exists():
                 total_size += backup.backup_path.stat().st_size
+            logical_size += backup.metadata.file_size
+
+            if backup.metadata.compression == BackupCompression.DEDUP.value:
+                with contextlib.suppress(OSError, ValueError, KeyError):
+                    referenced_chunks += len(self._read_manifest(backup.backup_path))
 
             # Track by reason
             reason = backup.metadata.reason
@@ -653,6 +747,14 @@ def get_backup_stats(self) -> dict[str, Any]:
             filename = backup.metadata.original_filename
             by_file[filename] = by_file.get(filename, 0) + 1
 
+        # Shared blobs are counted once, which is where dedup pays off
+        unique_chunks = 0
+        blob_root = self.backup_dir / self.BLOB_DIR
+        if blob_root.is_dir():
+            for blob_path in blob_root.glob("*/*"):
+                unique_chunks += 1
+                total_size += blob_path.stat().st_size
+
         oldest = backups[-1].created.isoformat() if backups else None
         newest = backups[0].created.isoformat() if backups else None
 
@@ -664,8 +766,160 @@ def get_backup_stats(self) -> dict[str, Any]:
             "newest_backup": newest,
             "by_reason": by_reason,
             "by_file": by_file,
+            "logical_size_bytes": logical_size,
+            "dedup_ratio": round(logical_size / total_size, 2) if total_size else 0.0,
+            "unique_chunks": unique_chunks,
+            "referenced_chunks": referenced_chunks,
+            "chunk_dedup_ratio": (
+                round(referenced_chunks / unique_chunks, 2) if unique_chunks else 0.0
+            ),
         }
 
+    def _chunk_lengths(self, file_path: Path) -> list[int]:
+        """Plan chunk lengths for a file in the dedup store.
+
+        Zip containers are cut around every member's payload. Local
+        headers carry the member timestamp, which odfpy refreshes on every
+        save, so each header becomes its own small chunk and the payloads
+        of unchanged members are shared between saves. Segments are then
+        split into pieces of at most ``chunk_size`` bytes.
+        """
+        size = file_path.stat().st_size
+        cuts = {0, size}
+        if is_zip_container(file_path):
+            try:
+                with zipfile.ZipFile(file_path) as zf, open(file_path, "rb") as f:
+                    for info in zf.infolist():
+                        f.seek(info.header_offset)
+                        header = f.read(_ZIP_LOCAL_HEADER_SIZE)
+                        if header[:4] != b"PK\x03\x04":
+                            continue
+                        name_length, extra_length = struct.unpack_from(
+                            "<2H", header, 26
+                        )
+                        data_start = (
+                            info.header_offset
+                            + _ZIP_LOCAL_HEADER_SIZE
+                            + name_length
+                            + extra_length
+                        )
+                        cuts.update(
+                            (
+                                info.header_offset,
+                                data_start,
+                                data_start + info.compress_size,
+                            )
+                        )
+            except (zipfile.BadZipFile, OSError, struct.error):
+                pass
+
+        lengths: list[int] = []
+        bounds = sorted(cut for cut in cuts if 0 <= cut <= size)
+        for start, end in itertools.pairwise(bounds):
+            while start < end:
+                step = min(self.chunk_size, end - start)
+                lengths.append(step)
+                start += step
+        return lengths
+
+    def _write_dedup(
+        self, src: BinaryIO, manifest_path: Path, lengths: list[int]
+    ) -> tuple[str, int]:
+        """Store a file as chunk blobs plus a manifest.
+
+        Returns:
+            Tuple of (SHA-256 of the whole file, file size).
+        """
+        hasher = hashlib.sha256()
+        chunks: list[list[Any]] = []
+        file_size = 0
+        for length in lengths:
+            data = src.read(length)
+            if not data:
+                break
+            hasher.update(data)
+            file_size += len(data)
+            chunks.append([self._store_blob(data), len(data)])
+
+        # Pick up anything appended after the chunk plan was made
+        while data := src.read(self.chunk_size):
+            hasher.update(data)
+            file_size += len(data)
+            chunks.append([self._store_blob(data), len(data)])
+
+        with open(manifest_path, "w") as f:
+            json.dump({"version": "1.0", "chunks": chunks}, f)
+        return hasher.hexdigest(), file_size
+
+    def _blob_path(self, digest: str) -> Path:
+        """Return the blob path for a chunk digest."""
+        return self.backup_dir / self.BLOB_DIR / digest[:2] / digest
+
+    def _store_blob(self, data: bytes) -> str:
+        """Write a chunk blob unless the store already holds it.
+
+        Blobs start with a one-byte codec tag: ``Z`` for zlib, ``R`` for
+        raw bytes (used when deflate does not help, e.g. zip members).
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+        if blob_path.exists():
+            return digest
+
+        packed = zlib.compress(data, 6)
+        payload = b"Z" + packed if len(packed) < len(data) else b"R" + data
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = blob_path.with_name(f"{digest}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(payload)
+        os.replace(temp_path, blob_path)
+        return digest
+
+    def _read_manifest(self, manifest_path: Path) -> list[tuple[str, int]]:
+        """Load the (digest, size) chunk list of a dedup backup."""
+        with open(manifest_path) as f:
+            data = json.load(f)
+        return [(str(digest), int(size)) for digest, size in data["chunks"]]
+
+    def _load_blob(self, digest: str, size: int, backup_path: Path) -> bytes:
+        """Read and check one chunk blob.
+
+        Raises:
+            BackupCorruptError: If the blob is missing or damaged.
+        """
+        blob_path = self._blob_path(digest)
+        try:
+            with open(blob_path, "rb") as f:
+                payload = f.read()
+        except FileNotFoundError:
+            raise BackupCorruptError(
+                str(backup_path), f"Missing chunk blob: {digest[:16]}..."
+            ) from None
+
+        try:
+            data = zlib.decompress(payload[1:]) if payload[:1] == b"Z" else payload[1:]
+        except zlib.error:
+            data = b""
+        if len(data) != size or hashlib.sha256(data).hexdigest() != digest:
+            raise BackupCorruptError(
+                str(backup_path), f"Damaged chunk blob: {digest[:16]}..."
+            )
+        return data
+
+    def _iter_content(
+        self, backup_path: Path, compression: BackupCompression
+    ) -> Iterator[bytes]:
+        """Yield the original file content of a backup in blocks."""
+        if compression == BackupCompression.DEDUP:
+            for digest, size in self._read_manifest(backup_path):
+                yield self._load_blob(digest, size, backup_path)
+            return
+
+        opener = gzip.open if compression == BackupCompression.GZIP else open
+        with opener(backup_path, "rb") as f:
+            while block := f.read(self.chunk_size):
+                yield block
+
     def _safe_filename(self, filename: str) -> str:
         """Convert filename to safe backup filename."""
         # Replace potentially problematic characters
@@ -35,6 +35,11 @@
                 "description": "Visual theme",
             },
             "--income": {"type": "float", "description": "Monthly income"},
+            "--compression": {
+                "type": "choice",
+                "choices": ["store", "fast", "default", "archive"],
+                "description": "ODS zip compression level",
+            },
         },
     },
     "expense": {
@@ -39,17 +39,25 @@ def cleanup(self) -> None:
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import itertools
+import os
+import pickle
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
-    from pathlib import Path
+    from collections.abc import Callable, Iterable, Iterator, Sequence
 
     from spreadsheet_dl.builder import FormulaBuilder, SpreadsheetBuilder
+    from spreadsheet_dl.streaming import StreamingWriter
 
 
 # ============================================================================
@@ -765,6 +773,33 @@ class FormulaMetadata:
     examples: tuple[str, ...] = field(default_factory=tuple)
 
 
+class _ClassCachedMetadata:
+    """Descriptor caching a BaseFormula ``metadata`` property per class.
+
+    Formula metadata is static per class, so the wrapped getter runs once
+    per concrete class instead of rebuilding FormulaMetadata and its
+    argument tuples on every access.
+    """
+
+    def __init__(self, fget: Callable[[Any], FormulaMetadata]) -> None:
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+        self._cache: dict[type, FormulaMetadata] = {}
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        cls = type(instance)
+        metadata = self._cache.get(cls)
+        if metadata is None:
+            metadata = self._cache[cls] = self.fget(instance)
+        return metadata
+
+
+# (required, total) argument counts per formula class, filled on first use
+_FORMULA_ARITY: dict[type, tuple[int, int]] = {}
+
+
 class BaseFormula(ABC):
     """Abstract base class for domain-specific formulas.
 
@@ -783,6 +818,11 @@ class BaseFormula(ABC):
     Optional overrides:
     - validate_arguments() method: Custom argument validation
 
+    A ``metadata`` property defined on a subclass is cached per class, and
+    argument counts are kept in a class-level arity table, so metadata must
+    not depend on instance state. build_many() builds a whole column of
+    formulas in one call.
+
     Example:
         >>> class PMTFormula(BaseFormula):
         ...     @property
@@ -804,6 +844,13 @@ class BaseFormula(ABC):
         ...         return f"PMT({rate};{nper};{pv})"
     """
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Wrap a subclass ``metadata`` property in the class-level cache."""
+        super().__init_subclass__(**kwargs)
+        prop = cls.__dict__.get("metadata")
+        if isinstance(prop, property) and prop.fget is not None:
+            cls.metadata = _ClassCachedMetadata(prop.fget)  # type: ignore[assignment,method-assign]
+
     # ========================================================================
     # Abstract Properties and Methods
     # ========================================================================
@@ -876,9 +923,7 @@ def validate_arguments(self, args: tuple[Any, ...]) -> None:
             ...     if len(args) < required:
             ...         raise ValueError(f"Expected at least {required} arguments")
         """
-        # Count required arguments
-        required_count = sum(1 for arg in self.metadata.arguments if arg.required)
-        total_count = len(self.metadata.arguments)
+        required_count, total_count = self.arity
 
         if len(args) < required_count:
             msg = (
@@ -894,6 +939,60 @@ def validate_arguments(self, args: tuple[Any, ...]) -> None:
             )
             raise ValueError(msg)
 
+    @property
+    def arity(self) -> tuple[int, int]:
+        """Get required and total argument counts.
+
+        Returns:
+            Tuple of (required, total) argument counts, computed once per class
+        """
+        cls = type(self)
+        arity = _FORMULA_ARITY.get(cls)
+        if arity is None:
+            arguments = self.metadata.arguments
+            arity = (sum(1 for arg in arguments if arg.required), len(arguments))
+            _FORMULA_ARITY[cls] = arity
+        return arity
+
+    # ========================================================================
+    # Batch Building
+    # ========================================================================
+
+    def build_many(
+        self, rows_of_args: Iterable[Sequence[Any]], **kwargs: Any
+    ) -> list[str]:
+        """Build formula strings for a whole column in one call.
+
+        Each row is a sequence of positional arguments for build(). Rows are
+        checked against the arity table before any formula is built, so a
+        bad row fails fast with its index.
+
+        Args:
+            rows_of_args: Positional argument sequences, one per row
+            **kwargs: Keyword arguments passed to every build() call
+
+        Returns:
+            Formula strings in row order
+
+        Raises:
+            ValueError: If any row has the wrong number of arguments
+
+        Example:
+            >>> from spreadsheet_dl.domains.finance.formulas.time_value import PresentValue
+            >>> PresentValue().build_many([("A2", "B2", "C2"), ("A3", "B3", "C3", "D3")])
+            ['of:=PV(A2;B2;C2;0;0)', 'of:=PV(A3;B3;C3;D3;0)']
+        """
+        rows = [tuple(args) for args in rows_of_args]
+        required_count, total_count = self.arity
+        for index, args in enumerate(rows):
+            if not required_count <= len(args) <= total_count:
+                try:
+                    self.validate_arguments(args)
+                except ValueError as e:
+                    raise ValueError(f"Row {index}: {e}") from e
+        build = self.build
+        return [build(*args, **kwargs) for args in rows]
+
     # ========================================================================
     # Integration with FormulaBuilder
     # ========================================================================
@@ -967,6 +1066,7 @@ class BaseImporter[T](ABC):
     - Import validation and type mapping
     - Error handling and reporting
     - Progress reporting support
+    - Parallel batch import (import_many(), import_directory())
 
     Subclasses must implement:
     - metadata property: Return ImporterMetadata
@@ -976,6 +1076,7 @@ class BaseImporter[T](ABC):
     Optional overrides:
     - transform() method: Transform imported data
     - on_progress() method: Progress callback
+    - iter_records() method: Incremental record streaming
 
     Exception Handling Pattern:
         Importer implementations use broad `except Exception` clauses to ensure
@@ -1128,8 +1229,48 @@ def on_progress(self, current: int, total: int) -> None:
             >>> def on_progress(self, current: int, total: int) -> None:
             ...     print(f"Progress: {current}/{total}")
         """
-        if self._progress_callback:
-            self._progress_callback(current, total)
+        callback = getattr(self, "_progress_callback", None)
+        if callback:
+            callback(current, total)
+
+    def iter_records(
+        self,
+        source: Path | str,
+        *,
+        errors: list[str] | None = None,
+    ) -> Iterator[Any]:
+        """Yield imported records one at a time.
+
+        The default implementation runs import_data() and yields the items
+        of a list result (or the result itself otherwise), so every importer
+        supports the protocol. Importers of large line-oriented formats
+        override it to parse incrementally, keeping memory bounded by one
+        record instead of the file size.
+
+        Args:
+            source: Path to data source file
+            errors: If given, per-record problems (skipped rows) are
+                appended to it
+
+        Yields:
+            Records in source order
+
+        Raises:
+            ValueError: If the source is invalid or cannot be imported
+
+        Example:
+            >>> for record in importer.iter_records("readings.csv"):  # doctest: +SKIP
+            ...     process(record)
+        """
+        result = self.import_data(source)
+        if not result.success:
+            raise ValueError("; ".join(result.errors) or f"Cannot import {source}")
+        if errors is not None:
+            errors.extend(result.errors)
+        if isinstance(result.data, list):
+            yield from result.data
+        else:
+            yield result.data
 
     # ========================================================================
     # Utilities
@@ -1158,6 +1299,275 @@ def get_config(self, key: str, default: Any = None) -> Any:
         """
         return self._config.get(key, default)
 
+    def write_records(
+        self,
+        source: Path | str,
+        writer: StreamingWriter,
+        sheet: str,
+        columns: Sequence[str] | None = None,
+        *,
+        errors: list[str] | None = None,
+    ) -> int:
+        """Stream records from iter_records() into a sheet of a StreamingWriter.
+
+        Args:
+            source: Path to data source file
+            writer: Open StreamingWriter
+            sheet: Name of the sheet to write
+            columns: Dictionary keys to write, in order (default: the keys of
+                the first record). Records that are not dictionaries are
+                written as rows unchanged.
+            errors: If given, per-record problems are appended to it
+
+        Returns:
+            Number of records written
+
+        Raises:
+            ValueError: If the source is invalid or cannot be imported
+
+        Example:
+            >>> with StreamingWriter("readings.ods") as writer:  # doctest: +SKIP
+            ...     importer.write_records("readings.csv", writer, "Readings")
+        """
+        records = self.iter_records(source, errors=errors)
+        first = next(records, None)
+        if first is None:
+            writer.start_sheet(sheet, list(columns) if columns else None)
+            writer.end_sheet()
+            return 0
+        if columns is None and isinstance(first, dict):
+            columns = list(first)
+        writer.start_sheet(sheet, list(columns) if columns else None)
+
+        count = 0
+        for record in itertools.chain((first,), records):
+            if isinstance(record, dict):
+                writer.write_row([record.get(c) for c in columns or ()])
+            else:
+                writer.write_row(list(record))
+            count += 1
+        writer.end_sheet()
+        return count
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the progress callback (for worker processes)."""
+        state = self.__dict__.copy()
+        state["_progress_callback"] = None
+        return state
+
+    # ========================================================================
+    # Batch Import
+    # ========================================================================
+
+    def import_many(
+        self,
+        paths: Iterable[Path | str],
+        *,
+        max_workers: int | None = None,
+        seen_hashes: set[str] | None = None,
+    ) -> ImportResult[list[T]]:
+        """Import several files, fanning out over a process pool.
+
+        Each file is imported by a copy of this importer in a worker
+        process, so one failing or crashing file only fails its own entry:
+        if a worker dies, the files left unfinished are retried one at a
+        time in fresh worker processes.
+        on_progress() is called with (files done, total files) as each file
+        completes. Importers that cannot be pickled, or batches that need
+        only one worker, run in the current process.
+
+        Args:
+            paths: Files to import
+            max_workers: Worker processes (default: one per CPU, at most
+                one per file)
+            seen_hashes: SHA-256 digests of files already imported. Files
+                whose content matches are skipped, and digests of newly
+                imported files are added to the set so it can be persisted
+                and passed to the next call.
+
+        Returns:
+            ImportResult whose data holds the data of each imported file in
+            input order. Errors and warnings are prefixed with the file
+            path; metadata["files"] has one entry per imported or failed
+            file and metadata["skipped"] lists skipped files.
+
+        Example:
+            >>> result = importer.import_many(["a.csv", "b.csv"])  # doctest: +SKIP
+            >>> result.records_imported, result.metadata["skipped"]  # doctest: +SKIP
+            (120, [])
+        """
+        sources = [Path(p) for p in paths]
+        errors: list[str] = []
+        warnings: list[str] = []
+        skipped: list[str] = []
+        pending: list[tuple[Path, str | None]] = []
+
+        batch_hashes: set[str] = set()
+        for path in sources:
+            digest = None
+            if seen_hashes is not None:
+                try:
+                    digest = _file_sha256(path)
+                except OSError as e:
+                    errors.append(f"{path}: Cannot read file: {e}")
+                    continue
+                if digest in seen_hashes or digest in batch_hashes:
+                    skipped.append(str(path))
+                    warnings.append(f"{path}: Skipped, content already imported")
+                    continue
+                batch_hashes.add(digest)
+            pending.append((path, digest))
+
+        results = self._run_imports([path for path, _ in pending], max_workers)
+
+        data: list[T] = []
+        files: list[dict[str, Any]] = []
+        records = 0
+        for (path, digest), result in zip(pending, results, strict=True):
+            errors.extend(f"{path}: {e}" for e in result.errors)
+            warnings.extend(f"{path}: {w}" for w in result.warnings)
+            files.append(
+                {
+                    "path": str(path),
+                    "success": result.success,
+                    "records_imported": result.records_imported,
+                    "sha256": digest,
+                }
+            )
+            if not result.success:
+                continue
+            data.append(result.data)
+            records += result.records_imported
+            if seen_hashes is not None and digest is not None:
+                seen_hashes.add(digest)
+
+        return ImportResult(
+            success=not errors,
+            data=data,
+            records_imported=records,
+            errors=errors,
+            warnings=warnings,
+            metadata={"files": files, "skipped": skipped},
+        )
+
+    def import_directory(
+        self,
+        directory: Path | str,
+        pattern: str | None = None,
+        *,
+        recursive: bool = False,
+        max_workers: int | None = None,
+        seen_hashes: set[str] | None = None,
+    ) -> ImportResult[list[T]]:
+        """Import every matching file in a directory with import_many().
+
+        Args:
+            directory: Directory to scan
+            pattern: Glob pattern for file names (default: any file whose
+                extension is in metadata.supported_formats)
+            recursive: Also scan subdirectories
+            max_workers: Worker processes, see import_many()
+            seen_hashes: Digests of files already imported, see import_many()
+
+        Returns:
+            Merged ImportResult, files in sorted path order
+
+        Example:
+            >>> result = importer.import_directory("exports/", "*.csv")  # doctest: +SKIP
+        """
+        root = Path(directory)
+        candidates = (
+            root.rglob(pattern or "*") if recursive else root.glob(pattern or "*")
+        )
+        formats = {f".{fmt.lower()}" for fmt in self.metadata.supported_formats}
+        paths = sorted(
+            p
+            for p in candidates
+            if p.is_file() and (pattern is not None or p.suffix.lower() in formats)
+        )
+        return self.import_many(paths, max_workers=max_workers, seen_hashes=seen_hashes)
+
+    def _run_imports(
+        self, paths: list[Path], max_workers: int | None
+    ) -> list[ImportResult[T]]:
+        """Import paths in worker processes, returning results in input order."""
+        total = len(paths)
+        results: list[ImportResult[T] | None] = [None] * total
+        workers = min(max_workers or os.cpu_count() or 1, total)
+
+        if workers > 1:
+            try:
+                pickle.dumps(self)
+            except Exception:
+                workers = 1
+
+        if workers <= 1:
+            worker = copy.copy(self)
+            worker._progress_callback = None
+            for index, path in enumerate(paths):
+                results[index] = _import_file(worker, path)
+                self.on_progress(index + 1, total)
+        else:
+            done = 0
+            unfinished: list[int] = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(_import_file, self, path): index
+                    for index, path in enumerate(paths)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = future.result()
+                    except BrokenProcessPool:
+                        # A worker died; the culprit is unknown, so retry alone
+                        unfinished.append(index)
+                        continue
+                    except Exception as e:
+                        results[index] = _failed_import(f"Worker failed: {e}")
+                    done += 1
+                    self.on_progress(done, total)
+            for index in sorted(unfinished):
+                results[index] = _import_isolated(self, paths[index])
+                done += 1
+                self.on_progress(done, total)
+
+        return [r if r is not None else _failed_import("Not imported") for r in results]
+
+
+def _import_file[T](importer: BaseImporter[T], path: Path) -> ImportResult[T]:
+    """Import one file, turning an escaped exception into a failed result."""
+    try:
+        return importer.import_data(path)
+    except Exception as e:
+        return _failed_import(f"Import failed: {e}")
+
+
+def _import_isolated[T](importer: BaseImporter[T], path: Path) -> ImportResult[T]:
+    """Import one file in a worker process of its own.
+
+    Used after a worker crash, so a file that kills its process only fails
+    its own entry.
+    """
+    try:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            return pool.submit(_import_file, importer, path).result()
+    except BrokenProcessPool:
+        return _failed_import("Worker process crashed")
+    except Exception as e:
+        return _failed_import(f"Worker failed: {e}")
+
+
+def _failed_import(message: str) -> ImportResult[Any]:
+    """Failed ImportResult carrying a single error."""
+    return ImportResult(success=False, data=None, errors=[message])
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file's content."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
 # ============================================================================
 # Public API
@@ -78,6 +78,7 @@
 from spreadsheet_dl.domains.biology.utils import (
     calculate_dilution,
     calculate_gc_content,
+    calculate_gc_content_array,
     calculate_melting_temp,
     calculate_od_to_concentration,
     complement_dna,
@@ -130,6 +131,7 @@
     "VolumeOfDistributionFormula",
     "calculate_dilution",
     "calculate_gc_content",
+    "calculate_gc_content_array",
     "calculate_melting_temp",
     "calculate_od_to_concentration",
     "complement_dna",
@@ -54,6 +54,7 @@
     bearing_capacity_factors,
     calculate_cement_content,
     consolidation_settlement,
+    consolidation_settlement_array,
     design_concrete_mix,
     ft_to_m,
     get_load_combinations,
@@ -104,6 +105,7 @@
     "bearing_capacity_factors",
     "calculate_cement_content",
     "consolidation_settlement",
+    "consolidation_settlement_array",
     "design_concrete_mix",
     "ft_to_m",
     "get_load_combinations",
@@ -13,6 +13,12 @@
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 # ============================================================================
 # Unit Conversions
@@ -374,6 +380,38 @@ def consolidation_settlement(
     return H * Cc / (1 + e0) * math.log10((p0 + delta_p) / p0)
 
 
+def consolidation_settlement_array(
+    H: npt.ArrayLike,
+    Cc: npt.ArrayLike,
+    e0: npt.ArrayLike,
+    p0: npt.ArrayLike,
+    delta_p: npt.ArrayLike,
+) -> npt.NDArray[np.float64]:
+    """Vectorized consolidation_settlement; the arguments broadcast.
+
+    Args:
+        H: Layer thickness (mm)
+        Cc: Compression index
+        e0: Initial void ratio
+        p0: Initial effective stress (kPa)
+        delta_p: Stress increase (kPa)
+
+    Returns:
+        Settlement (mm) with the broadcast shape of the arguments
+
+    Example:
+        >>> consolidation_settlement_array(5000, 0.3, 0.8, 100, [50, 100]).round(1)
+        array([146.7, 250.9])
+    """
+    thickness, index, void_ratio, stress, increase = (
+        np.asarray(arg, dtype=np.float64) for arg in (H, Cc, e0, p0, delta_p)
+    )
+    settlement = (
+        thickness * index / (1 + void_ratio) * np.log10((stress + increase) / stress)
+    )
+    return np.asarray(settlement, dtype=np.float64)
+
+
 # ============================================================================
 # Concrete Mix Design
 # ============================================================================
@@ -534,6 +572,7 @@ def beam_self_weight(
     "bearing_capacity_factors",
     "calculate_cement_content",
     "consolidation_settlement",
+    "consolidation_settlement_array",
     "design_concrete_mix",
     "ft_to_m",
     "get_load_combinations",
@@ -9,9 +9,13 @@
 import re
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy.typing as npt
+
 
 def parse_si_prefix(value: str) -> float:
     """Parse value with SI prefix (e.g., "10k", "100mA", "3.3V").
@@ -142,6 +146,42 @@ def calculate_parallel_resistance(resistances: Sequence[float]) -> float:
     return 1.0 / reciprocal_sum
 
 
+def calculate_parallel_resistance_array(
+    resistances: npt.ArrayLike, axis: int = -1
+) -> npt.NDArray[np.float64]:
+    """Vectorized calculate_parallel_resistance over one axis.
+
+    Pass a matrix with one row per network, or a list of resistance
+    columns with ``axis=0``.
+
+    Args:
+        resistances: Resistance values in ohms
+        axis: Axis holding the resistors of one network (default: last)
+
+    Returns:
+        Total parallel resistance per network in ohms
+
+    Raises:
+        ValueError: If the axis is empty or any resistance is zero or negative
+
+    Example:
+        >>> calculate_parallel_resistance_array([[100, 100], [1000, 1000]])
+        array([ 50., 500.])
+        >>> calculate_parallel_resistance_array([[100, 200], [100, 200]], axis=0)
+        array([ 50., 100.])
+    """
+    values = np.asarray(resistances, dtype=np.float64)
+    if values.ndim == 0 or values.shape[axis] == 0:
+        msg = "At least one resistance value required"
+        raise ValueError(msg)
+
+    if not (values > 0).all():
+        msg = "All resistances must be positive"
+        raise ValueError(msg)
+
+    return np.asarray(1.0 / np.reciprocal(values).sum(axis=axis), dtype=np.float64)
+
+
 def calculate_series_resistance(resistances: Sequence[float]) -> float:
     """Calculate total series resistance.
 
@@ -320,6 +360,7 @@ def expand_ref_designators(ref_range: str) -> list[str]:
 __all__ = [
     "calculate_characteristic_impedance",
     "calculate_parallel_resistance",
+    "calculate_parallel_resistance_array",
     "calculate_power_dissipation",
     "calculate_propagation_delay",
     "calculate_series_resistance",
@@ -74,12 +74,15 @@
 # Utils
 from spreadsheet_dl.domains.environmental.utils import (
     calculate_aqi,
+    calculate_aqi_array,
     calculate_bod,
     calculate_carbon_equivalent,
     calculate_ecological_footprint,
     calculate_shannon_diversity,
+    calculate_shannon_diversity_array,
     calculate_simpson_index,
     calculate_wqi,
+    calculate_wqi_array,
     format_concentration,
     ppm_to_ugm3,
     ugm3_to_ppm,
@@ -122,12 +125,15 @@
     "WindTurbinePowerFormula",
     # Utils
     "calculate_aqi",
+    "calculate_aqi_array",
     "calculate_bod",
     "calculate_carbon_equivalent",
     "calculate_ecological_footprint",
     "calculate_shannon_diversity",
+    "calculate_shannon_diversity_array",
     "calculate_simpson_index",
     "calculate_wqi",
+    "calculate_wqi_array",
     "format_concentration",
     "ppm_to_ugm3",
     "ugm3_to_ppm",
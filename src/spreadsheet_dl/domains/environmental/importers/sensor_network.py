@@ -6,13 +6,36 @@
 from __future__ import annotations
 
 import csv
-import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from spreadsheet_dl.domains.base import BaseImporter, ImporterMetadata, ImportResult
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from spreadsheet_dl.domains.timeseries import TimeSeriesColumns
+
+# Source field (lower-case) to normalized field name
+_FIELD_MAPPINGS = {
+    "timestamp": "timestamp",
+    "time": "timestamp",
+    "datetime": "timestamp",
+    "sensor_id": "sensor_id",
+    "device_id": "sensor_id",
+    "temperature": "temperature",
+    "temp": "temperature",
+    "humidity": "humidity",
+    "rh": "humidity",
+    "pressure": "pressure",
+    "pm25": "pm25",
+    "pm2_5": "pm25",
+    "pm10": "pm10",
+    "co2": "co2",
+    "voc": "voc",
+}
+
 
 @dataclass
 class SensorNetworkImporter(BaseImporter[list[dict[str, Any]]]):
@@ -21,7 +44,7 @@ class SensorNetworkImporter(BaseImporter[list[dict[str, Any]]]):
         SensorNetworkImporter for environmental monitoring
 
     Supports importing data from:
-    - IoT sensor exports (CSV, JSON)
+    - IoT sensor exports (CSV, JSON, JSON Lines)
     - Time-series environmental data
     - Multi-parameter sensor readings
 
@@ -42,7 +65,7 @@ def metadata(self) -> ImporterMetadata:
         return ImporterMetadata(
             name="Sensor Network Importer",
             description="Import IoT environmental sensor data",
-            supported_formats=("csv", "json"),
+            supported_formats=("csv", "json", "jsonl"),
             category="environmental",
         )
 
@@ -64,21 +87,20 @@ def import_data(self, source: str | Path) -> ImportResult[list[dict[str, Any]]]:
             )
 
         suffix = source_path.suffix.lower()
+        if suffix not in (".csv", ".json", ".jsonl"):
+            return ImportResult(
+                success=False,
+                data=[],
+                records_imported=0,
+                errors=[f"Unsupported format: {suffix}"],
+                warnings=[],
+                metadata={},
+            )
 
         try:
-            if suffix == ".csv":
-                data, errors, warnings = self._import_csv(source_path)
-            elif suffix == ".json":
-                data, errors, warnings = self._import_json(source_path)
-            else:
-                return ImportResult(
-                    success=False,
-                    data=[],
-                    records_imported=0,
-                    errors=[f"Unsupported format: {suffix}"],
-                    warnings=[],
-                    metadata={},
-                )
+            data = list(
+                self.iter_records(source_path, errors=errors, warnings=warnings)
+            )
 
             return ImportResult(
                 success=len(errors) == 0,
@@ -99,75 +121,114 @@ def import_data(self, source: str | Path) -> ImportResult[list[dict[str, Any]]]:
                 metadata={},
             )
 
-    def _import_csv(
-        self, path: Path
-    ) -> tuple[list[dict[str, Any]], list[str], list[str]]:
-        """Import from CSV file."""
-        data: list[dict[str, Any]] = []
-        errors: list[str] = []
-        warnings: list[str] = []
-
-        with open(path, newline="", encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-
-            for row_num, row in enumerate(reader, start=2):
-                record = self._normalize_record(row)
-                data.append(record)
+    def iter_records(
+        self,
+        source: Path | str,
+        *,
+        errors: list[str] | None = None,
+        warnings: list[str] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield normalized sensor readings one at a time.
+
+        CSV and JSON Lines files are read row by row and JSON arrays are
+        decoded incrementally, so memory does not grow with the file size.
+
+        Args:
+            source: Path to a CSV, JSON or JSON Lines file
+            errors: Accepted for protocol compatibility (readings are not
+                rejected individually)
+            warnings: If given, out-of-range readings are reported here when
+                validate_ranges is enabled
+
+        Yields:
+            Normalized sensor records
+
+        Raises:
+            ValueError: If the source is missing, unsupported or malformed
+        """
+        from spreadsheet_dl.streaming import iter_json_array, iter_json_lines
 
-                # Validate ranges if enabled
-                if self.validate_ranges:
-                    row_warnings = self._validate_reading(record, row_num)
-                    warnings.extend(row_warnings)
-
-        return data, errors, warnings
-
-    def _import_json(
-        self, path: Path
-    ) -> tuple[list[dict[str, Any]], list[str], list[str]]:
-        """Import from JSON file."""
-        data: list[dict[str, Any]] = []
-        errors: list[str] = []
-        warnings: list[str] = []
+        path = Path(source)
+        suffix = path.suffix.lower()
+        if not path.exists():
+            msg = f"File not found: {path}"
+            raise ValueError(msg)
+
+        if suffix == ".csv":
+            with open(path, newline="", encoding="utf-8-sig") as f:
+                for row_num, row in enumerate(csv.DictReader(f), start=2):
+                    record = self._normalize_record(row)
+                    if self.validate_ranges and warnings is not None:
+                        warnings.extend(self._validate_reading(record, row_num))
+                    yield record
+        elif suffix in (".json", ".jsonl"):
+            with open(path, encoding="utf-8") as f:
+                items = (
+                    iter_json_lines(f)
+                    if suffix == ".jsonl"
+                    else iter_json_array(f, ("readings",), whole_object=True)
+                )
+                for item in items:
+                    yield self._normalize_record(item)
+        else:
+            msg = f"Unsupported format: {suffix}"
+            raise ValueError(msg)
+
+    def import_columns(self, source: str | Path) -> ImportResult[TimeSeriesColumns]:
+        """Import sensor readings into NumPy columns in bulk.
+
+        Uses the same field normalization as import_data() but parses
+        timestamps and readings column-wise, for networks producing
+        millions of readings. Resample or downsample the result before
+        writing it to a sheet.
+
+        Args:
+            source: Path to a CSV, JSON or JSON Lines file
+
+        Returns:
+            ImportResult with a TimeSeriesColumns
+        """
+        from spreadsheet_dl.domains.timeseries import (
+            TimeSeriesColumns,
+            read_sensor_columns,
+        )
 
-        with open(path, encoding="utf-8") as f:
-            content = json.load(f)
+        source_path = Path(source)
+        if not source_path.exists():
+            return ImportResult(
+                success=False,
+                data=TimeSeriesColumns.empty(),
+                errors=[f"File not found: {source_path}"],
+            )
 
-        if isinstance(content, list):
-            for item in content:
-                data.append(self._normalize_record(item))
-        elif isinstance(content, dict):
-            if "readings" in content:
-                for item in content["readings"]:
-                    data.append(self._normalize_record(item))
-            else:
-                data.append(self._normalize_record(content))
+        try:
+            columns = read_sensor_columns(
+                source_path, _FIELD_MAPPINGS, label_fields=("sensor_id",)
+            )
+        except Exception as e:
+            return ImportResult(
+                success=False,
+                data=TimeSeriesColumns.empty(),
+                errors=[f"Import error: {e!s}"],
+            )
 
-        return data, errors, warnings
+        return ImportResult(
+            success=True,
+            data=columns,
+            records_imported=len(columns),
+            metadata={
+                "sensor_type": self.sensor_type,
+                "source": str(source_path),
+                "time_range": columns.time_range(),
+            },
+        )
 
     def _normalize_record(self, record: dict[str, Any]) -> dict[str, Any]:
         """Normalize sensor reading fields."""
         normalized: dict[str, Any] = {}
 
-        field_mappings = {
-            "timestamp": "timestamp",
-            "time": "timestamp",
-            "datetime": "timestamp",
-            "sensor_id": "sensor_id",
-            "device_id": "sensor_id",
-            "temperature": "temperature",
-            "temp": "temperature",
-            "humidity": "humidity",
-            "rh": "humidity",
-            "pressure": "pressure",
-            "pm25": "pm25",
-            "pm2_5": "pm25",
-            "pm10": "pm10",
-            "co2": "co2",
-            "voc": "voc",
-        }
-
         for key, value in record.items():
-            normalized_key = field_mappings.get(key.lower(), key.lower())
+            normalized_key = _FIELD_MAPPINGS.get(key.lower(), key.lower())
             normalized[normalized_key] = value
 
         return normalized
@@ -201,7 +262,7 @@ def _validate_reading(self, record: dict[str, Any], row_num: int) -> list[str]:
     def validate_source(self, source: str | Path) -> bool:
         """Validate source file."""
         path = Path(source)
-        return path.exists() and path.suffix.lower() in (".csv", ".json")
+        return path.exists() and path.suffix.lower() in (".csv", ".json", ".jsonl")
 
 
 __all__ = ["SensorNetworkImporter"]
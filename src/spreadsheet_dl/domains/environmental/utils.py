@@ -11,9 +11,13 @@
 import math
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    import numpy.typing as npt
+
 # Molecular weights for unit conversions (g/mol)
 MOLECULAR_WEIGHTS = {
     "O3": 48.0,
@@ -26,6 +30,18 @@
 STANDARD_TEMP_K = 298.15  # 25 C
 STANDARD_PRESSURE_KPA = 101.325  # 1 atm
 
+# EPA AQI breakpoints for PM2.5 (24-hour average):
+# (concentration low, concentration high, index low, index high)
+PM25_AQI_BREAKPOINTS = (
+    (0.0, 12.0, 0, 50),
+    (12.1, 35.4, 51, 100),
+    (35.5, 55.4, 101, 150),
+    (55.5, 150.4, 151, 200),
+    (150.5, 250.4, 201, 300),
+    (250.5, 350.4, 301, 400),
+    (350.5, 500.4, 401, 500),
+)
+
 
 def ppm_to_ugm3(ppm: float, molecular_weight: float) -> float:
     """Convert gas concentration from ppm to ug/m3.
@@ -82,18 +98,7 @@ def calculate_aqi(pm25: float) -> int:
         >>> calculate_aqi(35.5)
         101
     """
-    # EPA AQI breakpoints for PM2.5 (24-hour average)
-    breakpoints = [
-        (0.0, 12.0, 0, 50),
-        (12.1, 35.4, 51, 100),
-        (35.5, 55.4, 101, 150),
-        (55.5, 150.4, 151, 200),
-        (150.5, 250.4, 201, 300),
-        (250.5, 350.4, 301, 400),
-        (350.5, 500.4, 401, 500),
-    ]
-
-    for bp_lo, bp_hi, i_lo, i_hi in breakpoints:
+    for bp_lo, bp_hi, i_lo, i_hi in PM25_AQI_BREAKPOINTS:
         if bp_lo <= pm25 <= bp_hi:
             # Linear interpolation
             aqi = ((i_hi - i_lo) / (bp_hi - bp_lo)) * (pm25 - bp_lo) + i_lo
@@ -106,6 +111,30 @@ def calculate_aqi(pm25: float) -> int:
     return 0
 
 
+def calculate_aqi_array(pm25: npt.ArrayLike) -> npt.NDArray[np.int64]:
+    """Vectorized calculate_aqi for a column of PM2.5 concentrations.
+
+    Args:
+        pm25: PM2.5 concentrations in ug/m3 (any array shape)
+
+    Returns:
+        Integer AQI values with the shape of pm25. Values between
+        breakpoint ranges, negative values and NaN map to 0, as in
+        calculate_aqi.
+
+    Example:
+        >>> calculate_aqi_array([10.0, 35.5, 600.0]).tolist()
+        [42, 101, 500]
+    """
+    conc = np.asarray(pm25, dtype=np.float64)
+    bp_lo, bp_hi, i_lo, i_hi = np.array(PM25_AQI_BREAKPOINTS, dtype=np.float64).T
+    band = np.clip(np.searchsorted(bp_lo, conc, side="right") - 1, 0, None)
+    aqi = ((i_hi - i_lo) / (bp_hi - bp_lo))[band] * (conc - bp_lo[band]) + i_lo[band]
+    inside = (conc >= bp_lo[band]) & (conc <= bp_hi[band])
+    aqi = np.where(inside, np.rint(aqi), np.where(conc > bp_hi[-1], 500.0, 0.0))
+    return aqi.astype(np.int64)
+
+
 def calculate_wqi(
     do_saturation: float,
     bod: float,
@@ -145,6 +174,41 @@ def calculate_wqi(
         return (do_index + bod_index + ph_index) / 3
 
 
+def calculate_wqi_array(
+    do_saturation: npt.ArrayLike,
+    bod: npt.ArrayLike,
+    ph: npt.ArrayLike,
+    turbidity: npt.ArrayLike = 0,
+) -> npt.NDArray[np.float64]:
+    """Vectorized calculate_wqi; the arguments broadcast against each other.
+
+    Rows with a turbidity of 0 (or less) average three sub-indices, as in
+    calculate_wqi.
+
+    Args:
+        do_saturation: Dissolved oxygen saturation (%)
+        bod: Biochemical oxygen demand (mg/L)
+        ph: pH values
+        turbidity: Turbidity (NTU, optional)
+
+    Returns:
+        WQI scores (0-100) with the broadcast shape of the arguments
+
+    Example:
+        >>> calculate_wqi_array([95, 95], 2, 7.2, [0, 5]).round(2).tolist()
+        [90.67, 90.5]
+    """
+    do_index = np.minimum(np.asarray(do_saturation, dtype=np.float64), 100)
+    bod_index = np.maximum(0, 100 - np.asarray(bod, dtype=np.float64) * 10)
+    ph_index = np.maximum(0, 100 - np.abs(np.asarray(ph, dtype=np.float64) - 7) * 15)
+    turbidity = np.asarray(turbidity, dtype=np.float64)
+    turb_index = np.maximum(0, 100 - turbidity * 2)
+    base = do_index + bod_index + ph_index
+    return np.asarray(
+        np.where(turbidity > 0, (base + turb_index) / 4, base / 3), dtype=np.float64
+    )
+
+
 def calculate_bod(
     initial_do: float,
     final_do: float,
@@ -199,6 +263,31 @@ def calculate_shannon_diversity(counts: Sequence[int | float]) -> float:
     return h_prime
 
 
+def calculate_shannon_diversity_array(
+    counts: npt.ArrayLike, axis: int = -1
+) -> npt.NDArray[np.float64]:
+    """Vectorized calculate_shannon_diversity over one axis of a count matrix.
+
+    Args:
+        counts: Species counts, e.g. one row per sample and one column
+            per species
+        axis: Axis holding the species counts (default: last)
+
+    Returns:
+        Shannon index (H') per sample; samples with no individuals give 0.0
+
+    Example:
+        >>> calculate_shannon_diversity_array([[10, 10, 10, 10], [5, 0, 0, 0]])
+        array([1.38629436, 0.        ])
+    """
+    counts = np.asarray(counts)
+    total = counts.sum(axis=axis, keepdims=True)
+    p_i = np.divide(counts, total, out=np.zeros(counts.shape), where=total > 0)
+    # Zero counts contribute nothing; skip them instead of computing log(0)
+    log_p = np.log(p_i, out=np.zeros_like(p_i), where=p_i > 0)
+    return np.asarray(0.0 - (p_i * log_p).sum(axis=axis), dtype=np.float64)
+
+
 def calculate_simpson_index(counts: Sequence[int | float]) -> float:
     """Calculate Simpson's Diversity Index (1-D).
 
@@ -502,7 +591,9 @@ def calculate_eroi(
 
 
 __all__ = [
+    "PM25_AQI_BREAKPOINTS",
     "calculate_aqi",
+    "calculate_aqi_array",
     "calculate_bod",
     "calculate_carbon_equivalent",
     "calculate_climate_sensitivity",
@@ -513,10 +604,12 @@ def calculate_eroi(
     "calculate_radiative_forcing",
     "calculate_sea_level_rise",
     "calculate_shannon_diversity",
+    "calculate_shannon_diversity_array",
     "calculate_simpson_index",
     "calculate_solar_panel_output",
     "calculate_wind_turbine_power",
     "calculate_wqi",
+    "calculate_wqi_array",
     "format_concentration",
     "ppm_to_ugm3",
     "ugm3_to_ppm",
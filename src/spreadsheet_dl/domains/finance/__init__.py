@@ -55,6 +55,9 @@
 # Budget Analyzer
 from spreadsheet_dl.domains.finance.budget_analyzer import BudgetAnalyzer
 
+# Cash Flow Projection
+from spreadsheet_dl.domains.finance.cashflow import CashFlowProjector
+
 # Categories
 from spreadsheet_dl.domains.finance.categories import (
     Category,
@@ -189,6 +192,8 @@
     "BudgetAnalyzer",
     # Classes - CSV Import
     "CSVImporter",
+    # Classes - Cash Flow
+    "CashFlowProjector",
     # Classes - Categories
     "Category",
     "CategoryManager",
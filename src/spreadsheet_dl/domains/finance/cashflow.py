@@ -0,0 +1,444 @@
+"""Cash Flow Projection Module.
+
+Projects future outflows by expanding recurring expenses, bill reminders,
+savings goal contributions and debt payoff payments over a date horizon.
+Schedules are expanded in bulk into NumPy ``datetime64`` arrays and
+aggregated into a daily or monthly pandas frame.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from spreadsheet_dl.domains.finance.recurring import (
+    RecurrenceFrequency,
+    RecurringExpenseManager,
+)
+from spreadsheet_dl.domains.finance.reminders import ReminderFrequency
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import date
+
+    import numpy.typing as npt
+
+    from spreadsheet_dl.builder import SpreadsheetBuilder
+    from spreadsheet_dl.domains.finance.goals import (
+        DebtPayoffPlan,
+        GoalManager,
+        SavingsGoal,
+    )
+    from spreadsheet_dl.domains.finance.recurring import RecurringExpense
+    from spreadsheet_dl.domains.finance.reminders import (
+        BillReminder,
+        BillReminderManager,
+    )
+
+CASH_FLOW_SOURCES = ("recurring", "bills", "goals", "debt")
+CASH_FLOW_PERIODS = ("daily", "monthly")
+
+_FIXED_STEP_DAYS = {
+    RecurrenceFrequency.DAILY: 1,
+    RecurrenceFrequency.WEEKLY: 7,
+    RecurrenceFrequency.BIWEEKLY: 14,
+    ReminderFrequency.WEEKLY: 7,
+    ReminderFrequency.BIWEEKLY: 14,
+}
+
+# Month-stepped schedules: (months per step, whether a clamped day sticks).
+# Recurring monthly expenses re-target ``day_of_month`` every month, while
+# the other schedules carry a clamped day (e.g. Jan 31 -> Apr 30) forward.
+_MONTH_STEPS = {
+    RecurrenceFrequency.MONTHLY: (1, False),
+    RecurrenceFrequency.QUARTERLY: (3, True),
+    RecurrenceFrequency.YEARLY: (12, True),
+    ReminderFrequency.MONTHLY: (1, True),
+    ReminderFrequency.QUARTERLY: (3, True),
+    ReminderFrequency.SEMI_ANNUAL: (6, True),
+    ReminderFrequency.ANNUAL: (12, True),
+}
+
+
+@dataclass
+class _Expansion:
+    """Flat occurrence arrays for every expanded schedule."""
+
+    dates: npt.NDArray[np.datetime64]
+    amounts: npt.NDArray[np.float64]
+    sources: npt.NDArray[np.int64]
+    items: npt.NDArray[np.int64]
+    names: list[str]
+
+
+def _empty_dates() -> npt.NDArray[np.datetime64]:
+    return np.empty(0, dtype="datetime64[D]")
+
+
+def _fixed_steps(
+    first: date, step_days: int, start: date, end: date
+) -> npt.NDArray[np.datetime64]:
+    """Dates ``first + k * step_days`` falling within ``[start, end]``."""
+    if end < start:
+        return _empty_dates()
+    skip = max(0, -(-(start - first).days // step_days))
+    origin = np.datetime64(first, "D") + np.timedelta64(skip * step_days, "D")
+    return np.arange(
+        origin,
+        np.datetime64(end, "D") + np.timedelta64(1, "D"),
+        np.timedelta64(step_days, "D"),
+    )
+
+
+def _month_steps(
+    first: date,
+    step_months: int,
+    day: int,
+    start: date,
+    end: date,
+    *,
+    sticky: bool,
+) -> npt.NDArray[np.datetime64]:
+    """Dates every ``step_months`` from ``first``, clamped to month length.
+
+    Args:
+        first: First occurrence; its month anchors the schedule.
+        step_months: Months between occurrences.
+        day: Target day of month.
+        start: Earliest date to keep.
+        end: Latest date to keep.
+        sticky: Keep a day clamped by a short month for later occurrences.
+
+    Returns:
+        Occurrence dates within ``[start, end]``.
+    """
+    span = (end.year - first.year) * 12 + end.month - first.month
+    if span < 0 or end < start:
+        return _empty_dates()
+    months = np.datetime64(first, "M") + np.arange(
+        0, span + 1, step_months, dtype="timedelta64[M]"
+    )
+    month_starts = months.astype("datetime64[D]")
+    month_ends = (months + np.timedelta64(1, "M")).astype("datetime64[D]")
+    lengths = (month_ends - month_starts).astype(np.int64)
+    days = np.minimum(day, lengths)
+    if sticky:
+        days = np.minimum.accumulate(days)
+    dates = month_starts + (days - 1).astype("timedelta64[D]")
+    kept: npt.NDArray[np.datetime64] = dates[
+        (dates >= np.datetime64(start, "D")) & (dates <= np.datetime64(end))
+    ]
+    return kept
+
+
+def _month_grid(start: date, end: date) -> npt.NDArray[np.datetime64]:
+    """First day of every month that starts within ``[start, end]``."""
+    skip = np.timedelta64(0 if start.day == 1 else 1, "M")
+    months = np.arange(
+        np.datetime64(start, "M") + skip,
+        np.datetime64(end, "M") + np.timedelta64(1, "M"),
+    )
+    return months.astype("datetime64[D]")
+
+
+@dataclass
+class CashFlowProjector:
+    """Project scheduled outflows across recurring items, bills and goals.
+
+    Every schedule is expanded for the whole horizon at once, so a
+    multi-year projection over hundreds of items stays cheap. Recurring
+    expenses and bills follow the same occurrence rules as
+    ``RecurringExpenseManager.generate_for_period`` and bill calendar
+    export. Goal contributions and debt payoff payments are booked on the
+    first day of each month in the horizon.
+
+    Attributes:
+        recurring: Recurring expenses; disabled ones are skipped.
+        bills: Bill reminders; inactive ones are skipped.
+        goals: Savings goals; completed or paused ones are skipped.
+        debt_plan: Debt payoff plan whose monthly payments are included.
+        opening_balance: Balance the projected outflows are drawn from.
+
+    Examples:
+        >>> from datetime import date
+        >>> from decimal import Decimal
+        >>> from spreadsheet_dl.domains.finance.recurring import (
+        ...     RecurrenceFrequency, RecurringExpense)
+        >>> from spreadsheet_dl.domains.finance.ods_generator import (
+        ...     ExpenseCategory)
+        >>> rent = RecurringExpense(
+        ...     name="Rent", category=ExpenseCategory.HOUSING,
+        ...     amount=Decimal("1500"), frequency=RecurrenceFrequency.MONTHLY,
+        ...     start_date=date(2025, 1, 1), day_of_month=1)
+        >>> projector = CashFlowProjector(
+        ...     recurring=[rent], opening_balance=Decimal("5000"))
+        >>> frame = projector.project(date(2025, 1, 1), date(2025, 3, 31))
+        >>> frame["balance"].tolist()
+        [3500.0, 2000.0, 500.0]
+    """
+
+    recurring: Sequence[RecurringExpense] = ()
+    bills: Sequence[BillReminder] = ()
+    goals: Sequence[SavingsGoal] = ()
+    debt_plan: DebtPayoffPlan | None = None
+    opening_balance: Decimal = Decimal("0")
+    _occurrences: RecurringExpenseManager = field(
+        default_factory=RecurringExpenseManager, init=False, repr=False
+    )
+
+    @classmethod
+    def from_managers(
+        cls,
+        recurring: RecurringExpenseManager | None = None,
+        reminders: BillReminderManager | None = None,
+        goals: GoalManager | None = None,
+        opening_balance: Decimal | float | str = Decimal("0"),
+    ) -> CashFlowProjector:
+        """Create a projector from the finance managers.
+
+        Args:
+            recurring: Recurring expense manager.
+            reminders: Bill reminder manager.
+            goals: Goal manager; its debt payoff plan is included too.
+            opening_balance: Starting balance.
+
+        Returns:
+            Projector over every item the managers hold.
+        """
+        return cls(
+            recurring=recurring.list_all() if recurring is not None else (),
+            bills=reminders.list_bills() if reminders is not None else (),
+            goals=goals.list_goals() if goals is not None else (),
+            debt_plan=goals.get_debt_plan() if goals is not None else None,
+            opening_balance=Decimal(str(opening_balance)),
+        )
+
+    def _recurring_dates(
+        self, expense: RecurringExpense, start: date, end: date
+    ) -> npt.NDArray[np.datetime64]:
+        if expense.end_date and expense.end_date < end:
+            end = expense.end_date
+        first = self._occurrences.first_occurrence(
+            expense, max(expense.start_date, start)
+        )
+        freq = expense.frequency
+        if freq in _FIXED_STEP_DAYS:
+            return _fixed_steps(first, _FIXED_STEP_DAYS[freq], first, end)
+        step, sticky = _MONTH_STEPS[freq]
+        day = (expense.day_of_month or 1) if not sticky else first.day
+        return _month_steps(first, step, day, first, end, sticky=sticky)
+
+    def _bill_dates(
+        self, bill: BillReminder, start: date, end: date
+    ) -> npt.NDArray[np.datetime64]:
+        first = bill.due_date
+        freq = bill.frequency
+        if freq == ReminderFrequency.ONE_TIME:
+            if start <= first <= end:
+                return np.array([first], dtype="datetime64[D]")
+            return _empty_dates()
+        if freq in _FIXED_STEP_DAYS:
+            return _fixed_steps(first, _FIXED_STEP_DAYS[freq], start, end)
+        step, sticky = _MONTH_STEPS[freq]
+        return _month_steps(first, step, first.day, start, end, sticky=sticky)
+
+    def _goal_amounts(self, goal: SavingsGoal, months: int) -> npt.NDArray[np.float64]:
+        if goal.is_completed or goal.is_paused:
+            return np.zeros(0)
+        monthly = goal.monthly_contribution or goal.monthly_needed_to_reach_target
+        if not monthly or monthly <= 0:
+            return np.zeros(0)
+        remaining = float(goal.remaining)
+        paid_before = float(monthly) * np.arange(months)
+        amounts = np.clip(remaining - paid_before, 0.0, float(monthly))
+        due: npt.NDArray[np.float64] = amounts[amounts > 0]
+        return due
+
+    def _debt_payments(self) -> npt.NDArray[np.float64]:
+        plan = self.debt_plan
+        if plan is None or not plan.debts:
+            return np.zeros(0)
+        return plan.monthly_payment_totals()
+
+    def _expand(self, start: date, end: date) -> _Expansion:
+        """Expand every schedule into flat, unsorted occurrence arrays."""
+        if end < start:
+            raise ValueError(
+                f"Projection end {end} is before start {start}. "
+                "Fix: Pass an end date on or after the start date."
+            )
+
+        dates: list[npt.NDArray[np.datetime64]] = []
+        amounts: list[npt.NDArray[np.float64]] = []
+        sources: list[int] = []
+        names: list[str] = []
+
+        def add(
+            source: int,
+            name: str,
+            when: npt.NDArray[np.datetime64],
+            amount: float | npt.NDArray[np.float64],
+        ) -> None:
+            if len(when):
+                dates.append(when)
+                amounts.append(np.broadcast_to(np.float64(amount), len(when)))
+                sources.append(source)
+                names.append(name)
+
+        for expense in self.recurring:
+            if expense.enabled:
+                when = self._recurring_dates(expense, start, end)
+                add(0, expense.name, when, float(expense.amount))
+        for bill in self.bills:
+            if bill.is_active:
+                when = self._bill_dates(bill, start, end)
+                add(1, bill.name, when, float(bill.amount))
+
+        grid = _month_grid(start, end)
+        for goal in self.goals:
+            goal_amounts = self._goal_amounts(goal, len(grid))
+            add(2, goal.name, grid[: len(goal_amounts)], goal_amounts)
+        debt = self._debt_payments()[: len(grid)]
+        add(3, "Debt payoff", grid[: len(debt)], debt)
+
+        counts = [len(when) for when in dates]
+        return _Expansion(
+            dates=np.concatenate(dates) if dates else _empty_dates(),
+            amounts=np.concatenate(amounts) if amounts else np.zeros(0),
+            sources=np.repeat(np.asarray(sources, dtype=np.int64), counts),
+            items=np.repeat(np.arange(len(names)), counts),
+            names=names,
+        )
+
+    def events(self, start: date, end: date) -> pd.DataFrame:
+        """Expand every schedule into individual cash outflows.
+
+        Args:
+            start: First day of the horizon.
+            end: Last day of the horizon (inclusive).
+
+        Returns:
+            Frame with ``date``, ``source``, ``name`` and ``amount`` columns,
+            sorted by date.
+
+        Raises:
+            ValueError: If end is before start.
+        """
+        expansion = self._expand(start, end)
+        order = np.argsort(expansion.dates, kind="stable")
+        return pd.DataFrame(
+            {
+                "date": expansion.dates[order].astype("datetime64[s]"),
+                "source": np.asarray(CASH_FLOW_SOURCES, dtype=object)[
+                    expansion.sources[order]
+                ],
+                "name": np.asarray(expansion.names, dtype=object)[
+                    expansion.items[order]
+                ],
+                "amount": expansion.amounts[order],
+            }
+        )
+
+    def project(
+        self, start: date, end: date, *, period: str = "monthly"
+    ) -> pd.DataFrame:
+        """Aggregate projected outflows into a cash-flow frame.
+
+        Args:
+            start: First day of the horizon.
+            end: Last day of the horizon (inclusive).
+            period: ``"daily"`` or ``"monthly"`` rows.
+
+        Returns:
+            Frame indexed by period start (``date``) with one column per
+            source (``recurring``, ``bills``, ``goals``, ``debt``), the
+            period ``outflow`` and the running ``balance``.
+
+        Raises:
+            ValueError: If the period is unknown or end is before start.
+        """
+        if period not in CASH_FLOW_PERIODS:
+            raise ValueError(
+                f"Unknown cash flow period: {period!r}. "
+                f"Fix: Use one of {', '.join(CASH_FLOW_PERIODS)}."
+            )
+        expansion = self._expand(start, end)
+
+        if period == "daily":
+            labels = np.arange(
+                np.datetime64(start, "D"),
+                np.datetime64(end, "D") + np.timedelta64(1, "D"),
+            )
+            slots = (expansion.dates - labels[0]).astype(np.int64)
+        else:
+            months = np.arange(
+                np.datetime64(start, "M"),
+                np.datetime64(end, "M") + np.timedelta64(1, "M"),
+            )
+            labels = months.astype("datetime64[D]")
+            slots = (expansion.dates.astype("datetime64[M]") - months[0]).astype(
+                np.int64
+            )
+
+        width = len(CASH_FLOW_SOURCES)
+        totals = np.bincount(
+            slots * width + expansion.sources,
+            weights=expansion.amounts,
+            minlength=len(labels) * width,
+        ).reshape(len(labels), width)
+
+        outflow = totals.sum(axis=1)
+        frame = pd.DataFrame(
+            totals.round(2),
+            index=pd.DatetimeIndex(labels.astype("datetime64[s]"), name="date"),
+            columns=list(CASH_FLOW_SOURCES),
+        )
+        frame["outflow"] = outflow.round(2)
+        frame["balance"] = (float(self.opening_balance) - np.cumsum(outflow)).round(2)
+        return frame
+
+    def write_sheet(
+        self,
+        builder: SpreadsheetBuilder,
+        start: date,
+        end: date,
+        *,
+        period: str = "monthly",
+        sheet_name: str = "Cash Flow",
+    ) -> SpreadsheetBuilder:
+        """Write the projection as a new sheet of a spreadsheet builder.
+
+        Args:
+            builder: Builder to add the sheet to.
+            start: First day of the horizon.
+            end: Last day of the horizon (inclusive).
+            period: ``"daily"`` or ``"monthly"`` rows.
+            sheet_name: Name of the new sheet.
+
+        Returns:
+            The builder, for chaining.
+        """
+        frame = self.project(start, end, period=period)
+        builder.sheet(sheet_name).column("Date", width="80pt", type="date")
+        for title in (*CASH_FLOW_SOURCES, "outflow", "balance"):
+            builder.column(title.title(), width="90pt", type="currency")
+        builder.header_row()
+
+        labels = pd.DatetimeIndex(frame.index).date.tolist()
+        for label, values in zip(labels, frame.to_numpy().tolist(), strict=True):
+            builder.row().cell(label)
+            builder.cells(*(Decimal(f"{value:.2f}") for value in values))
+
+        last = len(frame) + 1
+        builder.total_row(
+            formulas=[
+                "Total",
+                *(f"of:=SUM([.{col}2:.{col}{last}])" for col in "BCDEF"),
+                None,
+            ]
+        )
+        return builder
@@ -13,7 +13,15 @@
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+    import numpy.typing as npt
+
+MAX_PAYOFF_MONTHS = 600  # 50 year cap for payoff simulations
 
 
 class GoalCategory(Enum):
@@ -402,10 +410,151 @@ def from_dict(cls, data: dict[str, Any]) -> Debt:
         )
 
 
+@dataclass
+class _PayoffRun:
+    """Month-by-month arrays of one simulated payoff scenario.
+
+    All arrays have shape (months, debts) and follow the plan's debt order.
+    """
+
+    months: int
+    interest: npt.NDArray[np.float64]
+    interest_mask: npt.NDArray[np.bool_]
+    minimum: npt.NDArray[np.float64]
+    minimum_mask: npt.NDArray[np.bool_]
+    extra: npt.NDArray[np.float64]
+    extra_mask: npt.NDArray[np.bool_]
+    balances: npt.NDArray[np.float64]
+    _total_interest: Decimal | None = None
+
+    @property
+    def total_interest(self) -> Decimal:
+        """Total interest, summed from per-debt amounts rounded to cents."""
+        if self._total_interest is None:
+            cent = Decimal("0.01")
+            self._total_interest = sum(
+                (
+                    Decimal(str(value)).quantize(cent)
+                    for value in self.interest[self.interest_mask].tolist()
+                ),
+                Decimal("0"),
+            )
+        return self._total_interest
+
+
+def _simulate_payoffs(
+    balances: list[float],
+    rates: list[float],
+    minimums: list[float],
+    extras: list[float],
+    orders: list[list[int]],
+) -> list[_PayoffRun]:
+    """Simulate several payoff scenarios for the same debts at once.
+
+    Each month interest accrues, minimums are paid, and the extra payment
+    is applied to debts in the scenario's priority order. State is held in
+    (scenario, debt) NumPy arrays so every step covers all scenarios.
+
+    Args:
+        balances: Starting balance per debt
+        rates: Monthly interest rate per debt
+        minimums: Minimum payment per debt
+        extras: Extra monthly payment per scenario
+        orders: Debt index priority order per scenario
+
+    Returns:
+        One _PayoffRun per scenario
+    """
+    import numpy as np
+
+    n_scenarios, n_debts = len(extras), len(balances)
+    extra = np.asarray(extras, dtype=np.float64)
+    has_extra = bool((extra > 0).any())
+
+    # Work in each scenario's priority order so the extra payment walks
+    # plain columns; the inverse permutation restores plan order at the end.
+    order = np.asarray(orders, dtype=np.intp).reshape(n_scenarios, n_debts)
+    inverse = np.argsort(order, axis=1)
+    bal = np.asarray(balances, dtype=np.float64)[order]
+    rate = np.asarray(rates, dtype=np.float64)[order]
+    minimum = np.asarray(minimums, dtype=np.float64)[order]
+
+    history: list[tuple[np.ndarray, ...]] = []
+    months = np.zeros(n_scenarios, dtype=np.intp)
+    owing = bal > 0
+    active = owing.any(axis=1)
+
+    # Scenarios that have finished hold only non-positive balances, so
+    # every step below is a no-op for them; only the month count stops.
+    while active.any() and len(history) < MAX_PAYOFF_MONTHS:
+        # Apply interest first
+        interest = np.where(owing, bal * rate, 0.0)
+        bal = bal + interest
+
+        # Pay minimums
+        owing = bal > 0
+        paid = np.where(owing, np.minimum(minimum, bal), 0.0)
+        bal = bal - paid
+
+        # Apply the extra payment in priority order
+        extra_paid = np.zeros_like(bal)
+        applied = np.zeros_like(owing)
+        if has_extra:
+            remaining = extra.copy()
+            for rank in range(n_debts):
+                if not (remaining > 0).any():
+                    break
+                current = bal[:, rank]
+                applies = (remaining > 0) & (current > 0)
+                amount = np.where(applies, np.minimum(remaining, current), 0.0)
+                bal[:, rank] = current - amount
+                remaining -= amount
+                extra_paid[:, rank] = amount
+                applied[:, rank] = applies
+
+        history.append((interest, paid, owing, extra_paid, applied, bal))
+        months += active
+        owing = bal > 0
+        active = owing.any(axis=1)
+
+    index = inverse[:, None, :]
+    if history:
+        interest_h, paid_h, owing_h, extra_h, applied_h, bal_h = (
+            np.take_along_axis(np.stack(arrays, axis=1), index, axis=2)
+            for arrays in zip(*history, strict=True)
+        )
+    else:
+        interest_h = paid_h = extra_h = bal_h = np.zeros((n_scenarios, 0, n_debts))
+        owing_h = applied_h = np.zeros((n_scenarios, 0, n_debts), dtype=bool)
+
+    runs = []
+    for i in range(n_scenarios):
+        m = int(months[i])
+        runs.append(
+            _PayoffRun(
+                months=m,
+                interest=interest_h[i, :m],
+                # Interest accrues exactly where a minimum payment is due
+                interest_mask=owing_h[i, :m],
+                minimum=paid_h[i, :m],
+                minimum_mask=owing_h[i, :m],
+                extra=extra_h[i, :m],
+                extra_mask=applied_h[i, :m],
+                balances=bal_h[i, :m],
+            )
+        )
+    return runs
+
+
 @dataclass
 class DebtPayoffPlan:
     """A debt payoff plan using snowball or avalanche method.
 
+    Simulation results are cached per plan state (method, extra payment
+    and each debt's balance, rate and minimum), so repeated queries such
+    as months_to_payoff and total_interest_paid share one simulation until
+    the debts change.
+
     Attributes:
         method: Payoff method (snowball/avalanche).
         extra_payment: Extra monthly payment beyond minimums.
@@ -415,14 +564,23 @@ class DebtPayoffPlan:
     method: DebtPayoffMethod
     extra_payment: Decimal = Decimal("0")
     debts: list[Debt] = field(default_factory=list)
+    _runs: dict[tuple[Any, ...], _PayoffRun] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    _MAX_CACHED_RUNS = 64
 
     def get_ordered_debts(self) -> list[Debt]:
         """Get debts in payoff priority order."""
+        return self._ordered_debts(self.method)
+
+    def _ordered_debts(self, method: DebtPayoffMethod) -> list[Debt]:
+        """Get active debts in priority order for a payoff method."""
         active_debts = [d for d in self.debts if not d.is_paid_off]
 
-        if self.method == DebtPayoffMethod.SNOWBALL:
+        if method == DebtPayoffMethod.SNOWBALL:
             return sorted(active_debts, key=lambda d: d.current_balance)
-        elif self.method == DebtPayoffMethod.AVALANCHE:
+        elif method == DebtPayoffMethod.AVALANCHE:
             return sorted(active_debts, key=lambda d: d.interest_rate, reverse=True)
         else:
             return active_debts
@@ -444,25 +602,78 @@ def monthly_payment(self) -> Decimal:
         """Total monthly payment including extra."""
         return self.total_minimum_payment + self.extra_payment
 
+    def _run_key(
+        self, method: DebtPayoffMethod, extra_payment: Decimal
+    ) -> tuple[Any, ...]:
+        """Cache key describing everything a simulation depends on."""
+        # Without extra payment the priority order is never used
+        effective_method = method if extra_payment > 0 else None
+        return (
+            effective_method,
+            extra_payment,
+            tuple(
+                (d.id, d.current_balance, d.interest_rate, d.minimum_payment)
+                for d in self.debts
+            ),
+        )
+
+    def _simulate(
+        self, scenarios: Sequence[tuple[DebtPayoffMethod, Decimal]]
+    ) -> list[_PayoffRun]:
+        """Return simulations for (method, extra) pairs, batching misses."""
+        keys = [self._run_key(method, extra) for method, extra in scenarios]
+        missing = {
+            key: scenario
+            for key, scenario in zip(keys, scenarios, strict=True)
+            if key not in self._runs
+        }
+
+        if missing:
+            if len(self._runs) + len(missing) > self._MAX_CACHED_RUNS:
+                self._runs.clear()
+            position = {d.id: i for i, d in enumerate(self.debts)}
+            orders: list[list[int]] = []
+            for method, _ in missing.values():
+                ranked = [position[d.id] for d in self._ordered_debts(method)]
+                ranked_set = set(ranked)
+                ranked += [i for i in range(len(self.debts)) if i not in ranked_set]
+                orders.append(ranked)
+
+            runs = _simulate_payoffs(
+                balances=[float(d.current_balance) for d in self.debts],
+                rates=[float(d.interest_rate) / 12 for d in self.debts],
+                minimums=[float(d.minimum_payment) for d in self.debts],
+                extras=[float(extra) for _, extra in missing.values()],
+                orders=orders,
+            )
+            self._runs.update(zip(missing, runs, strict=True))
+
+        return [self._runs[key] for key in keys]
+
     def calculate_payoff_schedule(self) -> list[dict[str, Any]]:
         """Calculate month-by-month payoff schedule.
 
         Returns:
             List of monthly snapshots showing payments and balances.
         """
-        schedule = []
-        balances = {d.id: float(d.current_balance) for d in self.debts}
-        rates = {d.id: float(d.interest_rate) / 12 for d in self.debts}
-        minimums = {d.id: float(d.minimum_payment) for d in self.debts}
+        (run,) = self._simulate([(self.method, self.extra_payment)])
+        cent = Decimal("0.01")
+        ids = [d.id for d in self.debts]
+        today = date.today()
 
-        month = 0
-        max_months = 600  # 50 year cap
+        schedule = []
+        for month in range(run.months):
+            interest_row = run.interest[month].tolist()
+            interest_mask = run.interest_mask[month].tolist()
+            minimum_row = run.minimum[month].tolist()
+            minimum_mask = run.minimum_mask[month].tolist()
+            extra_row = run.extra[month].tolist()
+            extra_mask = run.extra_mask[month].tolist()
+            balance_row = run.balances[month].tolist()
 
-        while any(b > 0 for b in balances.values()) and month < max_months:
-            month += 1
             month_data: dict[str, Any] = {
-                "month": month,
-                "date": date.today() + timedelta(days=month * 30),
+                "month": month + 1,
+                "date": today + timedelta(days=(month + 1) * 30),
                 "payments": {},
                 "balances": {},
                 "interest": {},
@@ -470,82 +681,103 @@ def calculate_payoff_schedule(self) -> list[dict[str, Any]]:
                 "total_interest": Decimal("0"),
             }
 
-            # Apply interest first
-            for debt_id, balance in balances.items():
-                if balance > 0:
-                    interest = balance * rates[debt_id]
-                    balances[debt_id] += interest
-                    month_data["interest"][debt_id] = Decimal(str(interest)).quantize(
-                        Decimal("0.01")
-                    )
-
-            # Calculate available extra payment
-            extra_remaining = float(self.extra_payment)
-
-            # Pay minimums first
-            for debt_id, balance in balances.items():
-                if balance > 0:
-                    payment = min(minimums[debt_id], balance)
-                    balances[debt_id] -= payment
-                    month_data["payments"][debt_id] = Decimal(str(payment)).quantize(
-                        Decimal("0.01")
-                    )
-
-            # Apply extra payment using selected method
-            if extra_remaining > 0:
-                ordered = self.get_ordered_debts()
-                for debt in ordered:
-                    if balances[debt.id] > 0 and extra_remaining > 0:
-                        extra = min(extra_remaining, balances[debt.id])
-                        balances[debt.id] -= extra
-                        extra_remaining -= extra
-                        month_data["payments"][debt.id] += Decimal(str(extra)).quantize(
-                            Decimal("0.01")
-                        )
-
-            # Record final balances
-            for debt_id, balance in balances.items():
-                month_data["balances"][debt_id] = Decimal(
-                    str(max(0, balance))
-                ).quantize(Decimal("0.01"))
-                month_data["total_balance"] += month_data["balances"][debt_id]
+            for j, debt_id in enumerate(ids):
+                if interest_mask[j]:
+                    month_data["interest"][debt_id] = Decimal(
+                        str(interest_row[j])
+                    ).quantize(cent)
+                if minimum_mask[j]:
+                    payment = Decimal(str(minimum_row[j])).quantize(cent)
+                    if extra_mask[j]:
+                        payment += Decimal(str(extra_row[j])).quantize(cent)
+                    month_data["payments"][debt_id] = payment
+                balance = Decimal(str(max(0, balance_row[j]))).quantize(cent)
+                month_data["balances"][debt_id] = balance
+                month_data["total_balance"] += balance
 
             month_data["total_interest"] = sum(
                 month_data["interest"].values(), Decimal("0")
             )
-
             schedule.append(month_data)
 
-            # Check if all paid off
-            if all(b <= 0 for b in balances.values()):
-                break
-
         return schedule
 
     @property
     def months_to_payoff(self) -> int:
         """Calculate months until all debt is paid off."""
-        schedule = self.calculate_payoff_schedule()
-        return len(schedule)
+        (run,) = self._simulate([(self.method, self.extra_payment)])
+        return run.months
 
     @property
     def total_interest_paid(self) -> Decimal:
         """Calculate total interest that will be paid."""
-        schedule = self.calculate_payoff_schedule()
-        return sum((m["total_interest"] for m in schedule), Decimal("0"))
+        (run,) = self._simulate([(self.method, self.extra_payment)])
+        return run.total_interest
+
+    def monthly_payment_totals(self) -> npt.NDArray[np.float64]:
+        """Calculate the total payment across all debts for each month.
+
+        Returns:
+            Array with one total per month until all debt is paid off.
+        """
+        import numpy as np
+
+        (run,) = self._simulate([(self.method, self.extra_payment)])
+        payments = np.where(run.minimum_mask, run.minimum, 0.0) + np.where(
+            run.extra_mask, run.extra, 0.0
+        )
+        return np.asarray(payments.sum(axis=1))
 
     def interest_saved_vs_minimum(self) -> Decimal:
         """Calculate interest saved compared to minimum payments only."""
-        # Calculate with extra payment
-        with_extra = self.total_interest_paid
+        with_extra, minimum_only = self._simulate(
+            [(self.method, self.extra_payment), (self.method, Decimal("0"))]
+        )
+        return minimum_only.total_interest - with_extra.total_interest
 
-        # Calculate with minimums only
-        old_extra = self.extra_payment
-        self.extra_payment = Decimal("0")
-        minimum_only = self.total_interest_paid
-        self.extra_payment = old_extra
+    def simulate_scenarios(
+        self,
+        extra_payments: Sequence[Decimal | float | str],
+        methods: Sequence[DebtPayoffMethod] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Simulate every method x extra-payment combination in one batch.
 
-        return minimum_only - with_extra
+        Useful for "what if I pay $X more" sweeps: all scenarios advance
+        together through one vectorized simulation, and the results are
+        cached for later queries on this plan.
+
+        Args:
+            extra_payments: Extra monthly payments to try.
+            methods: Payoff methods to try (default: snowball and avalanche).
+
+        Returns:
+            One dict per scenario, in method-major order, with method,
+            extra_payment, months, total_interest and interest_saved
+            (versus minimum payments only).
+
+        Example:
+            >>> plan = create_debt_payoff_plan([
+            ...     {"name": "Card", "balance": 5000, "rate": 0.18, "minimum": 150},
+            ... ])
+            >>> [r["months"] for r in plan.simulate_scenarios([0, 100, 500])]
+            [47, 24, 9, 47, 24, 9]
+        """
+        if methods is None:
+            methods = [DebtPayoffMethod.SNOWBALL, DebtPayoffMethod.AVALANCHE]
+        extras = [Decimal(str(extra)) for extra in extra_payments]
+        scenarios = [(method, extra) for method in methods for extra in extras]
+
+        *runs, baseline = self._simulate([*scenarios, (self.method, Decimal("0"))])
+        return [
+            {
+                "method": method.value,
+                "extra_payment": extra,
+                "months": run.months,
+                "total_interest": run.total_interest,
+                "interest_saved": baseline.total_interest - run.total_interest,
+            }
+            for (method, extra), run in zip(scenarios, runs, strict=True)
+        ]
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -871,29 +1103,30 @@ def compare_payoff_methods(
     Returns:
         Comparison of both methods with months and interest.
     """
-    snowball = create_debt_payoff_plan(debts, DebtPayoffMethod.SNOWBALL, extra_payment)
-    avalanche = create_debt_payoff_plan(
-        debts, DebtPayoffMethod.AVALANCHE, extra_payment
+    plan = create_debt_payoff_plan(debts, DebtPayoffMethod.AVALANCHE, extra_payment)
+    snowball, avalanche = plan.simulate_scenarios(
+        [plan.extra_payment],
+        [DebtPayoffMethod.SNOWBALL, DebtPayoffMethod.AVALANCHE],
     )
 
     return {
         "snowball": {
             "method": "Smallest Balance First",
-            "months": snowball.months_to_payoff,
-            "total_interest": snowball.total_interest_paid,
+            "months": snowball["months"],
+            "total_interest": snowball["total_interest"],
         },
         "avalanche": {
             "method": "Highest Interest First",
-            "months": avalanche.months_to_payoff,
-            "total_interest": avalanche.total_interest_paid,
+            "months": avalanche["months"],
+            "total_interest": avalanche["total_interest"],
         },
         "difference": {
-            "months": snowball.months_to_payoff - avalanche.months_to_payoff,
-            "interest": snowball.total_interest_paid - avalanche.total_interest_paid,
+            "months": snowball["months"] - avalanche["months"],
+            "interest": snowball["total_interest"] - avalanche["total_interest"],
         },
         "recommendation": (
             "avalanche"
-            if avalanche.total_interest_paid < snowball.total_interest_paid
+            if avalanche["total_interest"] < snowball["total_interest"]
             else "snowball"
         ),
     }
@@ -24,6 +24,7 @@
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from spreadsheet_dl.ods_packaging import PackageOptions
     from spreadsheet_dl.schema.styles import CellStyle, Theme
 
 
@@ -95,6 +96,8 @@ def __init__(
         self,
         theme: str | Theme | None = None,
         theme_dir: Path | str | None = None,
+        *,
+        package: PackageOptions | None = None,
     ) -> None:
         """Initialize the ODS generator.
 
@@ -102,6 +105,8 @@ def __init__(
             theme: Theme name (e.g., "default", "corporate") or Theme object.
                    If None, uses legacy hardcoded styles.
             theme_dir: Directory containing theme YAML files.
+            package: Zip packaging options (compression level, parallel
+                     deflate). If None, uses odfpy's default packaging.
         """
         self._doc: OpenDocumentSpreadsheet | None = None
         self._styles: dict[str, Style] = {}
@@ -109,6 +114,7 @@ def __init__(
         self._theme_name: str | None = None
         self._theme_dir = Path(theme_dir) if theme_dir else None
         self._style_counter = 0
+        self._package = package
 
         if theme is not None:
             if isinstance(theme, str):
@@ -168,7 +174,7 @@ def create_budget_spreadsheet(
 
         # Save document
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        self._doc.save(str(output_path))
+        self._save(output_path)
         return output_path
 
     def create_expense_template(
@@ -196,9 +202,20 @@ def create_expense_template(
         self._create_expense_sheet([])
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        self._doc.save(str(output_path))
+        self._save(output_path)
         return output_path
 
+    def _save(self, output_path: Path) -> None:
+        """Write the current document, honouring packaging options."""
+        if self._doc is None:
+            return
+        if self._package is not None:
+            from spreadsheet_dl.ods_packaging import save_document
+
+            save_document(self._doc, output_path, self._package)
+        else:
+            self._doc.save(str(output_path))
+
     def _create_styles(self) -> None:
         """Create cell styles for the spreadsheet."""
         if self._doc is None:
@@ -580,6 +597,7 @@ def create_monthly_budget(
     month: int | None = None,
     year: int | None = None,
     theme: str | None = None,
+    package: PackageOptions | None = None,
 ) -> Path:
     """Convenience function to create a monthly budget spreadsheet.
 
@@ -588,6 +606,7 @@ def create_monthly_budget(
         month: Month number (1-12). Defaults to current.
         year: Year. Defaults to current.
         theme: Optional theme name (e.g., "default", "corporate").
+        package: Optional zip packaging options.
 
     Returns:
         Path to the created file.
@@ -602,5 +621,5 @@ def create_monthly_budget(
     filename = f"budget_{year}_{month:02d}.ods"
     output_path = output_dir / filename
 
-    generator = OdsGenerator(theme=theme)
+    generator = OdsGenerator(theme=theme, package=package)
     return generator.create_budget_spreadsheet(output_path, month=month, year=year)
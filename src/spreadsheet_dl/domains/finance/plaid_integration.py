@@ -39,7 +39,10 @@
 
 import hashlib
 import json
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from decimal import Decimal
@@ -1598,8 +1601,15 @@ class PlaidSyncManager:
         >>> manager = PlaidSyncManager(config)  # doctest: +SKIP
         >>> manager.add_connection(access_token)  # doctest: +SKIP
         >>> new_transactions = manager.sync_all()  # doctest: +SKIP
+        >>> nightly = manager.sync_all(max_workers=8)  # doctest: +SKIP
     """
 
+    # Retries per page when Plaid reports a rate limit, and the exponential
+    # backoff used when the error carries no Retry-After hint.
+    RATE_LIMIT_RETRIES = 5
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_MAX_SECONDS = 60.0
+
     def __init__(
         self,
         config: PlaidConfig,
@@ -1616,6 +1626,8 @@ def __init__(
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self._connections: dict[str, AccessToken] = {}
         self._cursors: dict[str, str] = {}
+        self._state_lock = threading.Lock()
+        self._resume_at = 0.0
         self._load_state()
 
     def add_connection(self, access_token: AccessToken) -> None:
@@ -1656,41 +1668,40 @@ def list_connections(self) -> list[dict[str, Any]]:
             conn.to_dict(include_token=False) for conn in self._connections.values()
         ]
 
-    def sync_all(self) -> dict[str, SyncResult]:
+    def sync_all(self, *, max_workers: int = 1) -> dict[str, SyncResult]:
         """Sync transactions for all connections.
 
-        Returns:
-            Dictionary mapping item_id to SyncResult.
-        """
-        results: dict[str, SyncResult] = {}
-
-        for item_id, connection in self._connections.items():
-            try:
-                cursor = self._cursors.get(item_id)
-                result = self.client.sync_transactions(
-                    connection.access_token,
-                    cursor=cursor,
-                )
+        With ``max_workers`` above one, connections are synced concurrently
+        on a bounded thread pool. Each item pages through its own cursor,
+        rate limits pause every worker until the backoff expires, and the
+        sync state is saved as soon as an item finishes.
 
-                if result.next_cursor:
-                    self._cursors[item_id] = result.next_cursor
+        Args:
+            max_workers: Maximum number of items synced at once.
 
-                connection.last_sync = datetime.now()
-                connection.status = LinkStatus.CONNECTED
-                connection.error = None
+        Returns:
+            Dictionary mapping item_id to SyncResult.
 
-                results[item_id] = result
+        Raises:
+            ValueError: If max_workers is less than one.
+        """
+        if max_workers < 1:
+            raise ValueError(
+                f"max_workers must be >= 1, got {max_workers}. "
+                "Fix: Use 1 for a serial sync or a small pool size such as 4."
+            )
 
-            except PlaidError as e:
-                connection.status = LinkStatus.ERROR
-                connection.error = str(e)
-                results[item_id] = SyncResult(
-                    status=SyncStatus.FAILED,
-                    error=str(e),
-                )
+        item_ids = list(self._connections)
+        if max_workers == 1 or len(item_ids) < 2:
+            outcomes = [self._sync_item(item_id) for item_id in item_ids]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(item_ids)),
+                thread_name_prefix="plaid-sync",
+            ) as pool:
+                outcomes = list(pool.map(self._sync_item, item_ids))
 
-        self._save_state()
-        return results
+        return dict(zip(item_ids, outcomes, strict=True))
 
     def sync_connection(self, item_id: str) -> SyncResult:
         """Sync transactions for a specific connection.
@@ -1707,22 +1718,84 @@ def sync_connection(self, item_id: str) -> SyncResult:
         if item_id not in self._connections:
             raise KeyError(f"Connection not found: {item_id}")
 
-        connection = self._connections[item_id]
-        cursor = self._cursors.get(item_id)
+        result = self._fetch_item(item_id)
+        self._connections[item_id].last_sync = datetime.now()
+        self._save_state()
 
-        result = self.client.sync_transactions(
-            connection.access_token,
-            cursor=cursor,
-        )
+        return result
 
-        if result.next_cursor:
-            self._cursors[item_id] = result.next_cursor
+    def _sync_item(self, item_id: str) -> SyncResult:
+        """Sync one connection, recording failures on the connection."""
+        connection = self._connections[item_id]
+        try:
+            result = self._fetch_item(item_id)
+        except PlaidError as e:
+            connection.status = LinkStatus.ERROR
+            connection.error = str(e)
+            return SyncResult(status=SyncStatus.FAILED, error=str(e))
 
         connection.last_sync = datetime.now()
+        connection.status = LinkStatus.CONNECTED
+        connection.error = None
         self._save_state()
-
         return result
 
+    def _fetch_item(self, item_id: str) -> SyncResult:
+        """Page through new transactions for one item.
+
+        The item's cursor only advances once every page has been fetched,
+        so an interrupted sync restarts from the last complete position.
+        """
+        access_token = self._connections[item_id].access_token
+        with self._state_lock:
+            cursor = self._cursors.get(item_id)
+
+        combined = SyncResult(status=SyncStatus.COMPLETED, next_cursor=cursor)
+        while True:
+            page = self._request_page(access_token, cursor)
+            combined.added += page.added
+            combined.modified += page.modified
+            combined.removed += page.removed
+            combined.transactions.extend(page.transactions)
+            combined.has_more = page.has_more
+            if not page.next_cursor or page.next_cursor == cursor:
+                break
+            cursor = combined.next_cursor = page.next_cursor
+            if not page.has_more:
+                break
+
+        if combined.next_cursor:
+            with self._state_lock:
+                self._cursors[item_id] = combined.next_cursor
+        return combined
+
+    def _request_page(self, access_token: str, cursor: str | None) -> SyncResult:
+        """Fetch one sync page, backing off while rate limited."""
+        attempt = 0
+        while True:
+            self._wait_for_rate_limit()
+            try:
+                return self.client.sync_transactions(access_token, cursor=cursor)
+            except PlaidRateLimitError as e:
+                if attempt >= self.RATE_LIMIT_RETRIES:
+                    raise
+                delay = e.retry_after or min(
+                    self.BACKOFF_MAX_SECONDS,
+                    self.BACKOFF_BASE_SECONDS * 2**attempt,
+                )
+                attempt += 1
+                with self._state_lock:
+                    self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until any shared rate-limit backoff has expired."""
+        while True:
+            with self._state_lock:
+                remaining = self._resume_at - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(remaining)
+
     def convert_to_expenses(
         self,
         transactions: list[PlaidTransaction],
@@ -1823,11 +1896,18 @@ def _load_state(self) -> None:
                 pass
 
     def _save_state(self) -> None:
-        """Save sync state to disk."""
+        """Save sync state to disk.
+
+        Safe to call from sync workers; the file is replaced atomically so
+        a crash mid-sync keeps the cursors of every finished item.
+        """
         state_file = self.data_dir / "sync_state.json"
-        state = {
-            "cursors": self._cursors,
-            "last_updated": datetime.now().isoformat(),
-        }
-        with open(state_file, "w") as f:
-            json.dump(state, f, indent=2)
+        with self._state_lock:
+            state = {
+                "cursors": dict(self._cursors),
+                "last_updated": datetime.now().isoformat(),
+            }
+            temp_file = state_file.with_name(f".{state_file.name}.tmp")
+            with open(temp_file, "w") as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp_file, state_file)
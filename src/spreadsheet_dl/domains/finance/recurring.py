@@ -233,6 +233,22 @@ def _get_occurrences(
 
         return occurrences
 
+    def first_occurrence(
+        self,
+        recurring: RecurringExpense,
+        from_date: date,
+    ) -> date:
+        """Find the first occurrence of an expense on or after a date.
+
+        Args:
+            recurring: Recurring expense.
+            from_date: Earliest acceptable date.
+
+        Returns:
+            Date of the first occurrence on or after from_date.
+        """
+        return self._find_first_occurrence(recurring, from_date)
+
     def _find_first_occurrence(
         self,
         recurring: RecurringExpense,
@@ -0,0 +1,532 @@
+"""Columnar time-series ingestion for sensor importers.
+
+Sensor exports can hold tens of millions of readings, far more than a sheet
+can hold or render. read_sensor_columns() parses a CSV, JSON or JSON Lines
+export in bulk into NumPy arrays (``datetime64[ns]`` timestamps, ``float64``
+readings) instead of one dict per reading. TimeSeriesColumns then aggregates
+readings per interval (mean/min/max/count) or keeps the visually significant
+points with Largest-Triangle-Three-Buckets (LTTB) downsampling before the
+series is written to a sheet.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+    from datetime import timedelta
+
+    import numpy.typing as npt
+
+    from spreadsheet_dl.streaming import StreamingWriter
+
+# Rows per sheet supported by LibreOffice Calc and Excel
+MAX_SHEET_ROWS = 1_048_576
+
+AGGREGATIONS = ("mean", "min", "max", "count")
+
+# Array keys searched in JSON objects, as in the row-based importers
+_JSON_ARRAY_KEYS = ("readings", "data", "samples")
+
+
+@dataclass(frozen=True)
+class TimeSeriesColumns:
+    """Sensor readings stored column by column.
+
+    Attributes:
+        timestamps: Reading times as naive UTC ``datetime64[ns]`` (NaT when
+            missing or unparseable).
+        values: Numeric columns as ``float64`` arrays (NaN when missing).
+        labels: Text columns such as sensor or equipment IDs.
+
+    Example:
+        >>> series = TimeSeriesColumns(
+        ...     np.array(["2024-01-01T00:00", "2024-01-01T00:30", "2024-01-01T01:10"],
+        ...              dtype="datetime64[ns]"),
+        ...     {"temperature": np.array([20.0, 22.0, 30.0])},
+        ... )
+        >>> hourly = series.resample("1h", ("mean", "max"))
+        >>> hourly.values["temperature_mean"].tolist()
+        [21.0, 30.0]
+    """
+
+    timestamps: npt.NDArray[np.datetime64]
+    values: dict[str, npt.NDArray[np.float64]] = field(default_factory=dict)
+    labels: dict[str, npt.NDArray[np.object_]] = field(default_factory=dict)
+
+    @classmethod
+    def empty(cls) -> TimeSeriesColumns:
+        """Series without readings."""
+        return cls(np.array([], dtype="datetime64[ns]"))
+
+    def __len__(self) -> int:
+        """Number of readings."""
+        return len(self.timestamps)
+
+    @property
+    def columns(self) -> list[str]:
+        """Column names in row order: timestamp, labels, then values."""
+        return ["timestamp", *self.labels, *self.values]
+
+    def time_range(self) -> dict[str, str]:
+        """ISO start and end of the readings (empty strings if none)."""
+        valid = self.timestamps[~np.isnat(self.timestamps)]
+        if not valid.size:
+            return {"start": "", "end": ""}
+        return {"start": _isoformat(valid.min()), "end": _isoformat(valid.max())}
+
+    def take(
+        self, indices: npt.NDArray[np.intp] | npt.NDArray[np.bool_]
+    ) -> TimeSeriesColumns:
+        """Select readings by position (or boolean mask) in every column."""
+        return TimeSeriesColumns(
+            self.timestamps[indices],
+            {name: arr[indices] for name, arr in self.values.items()},
+            {name: arr[indices] for name, arr in self.labels.items()},
+        )
+
+    def sort(self) -> TimeSeriesColumns:
+        """Readings in time order (stable; missing timestamps last)."""
+        return self.take(np.argsort(self.timestamps, kind="stable"))
+
+    def resample(
+        self,
+        interval: str | timedelta,
+        how: Sequence[str] = ("mean",),
+        *,
+        by: str | None = None,
+    ) -> TimeSeriesColumns:
+        """Aggregate readings into fixed time intervals.
+
+        Readings without a timestamp are dropped. NaN readings are ignored
+        by every aggregation; an interval without any reading of a column
+        yields NaN (0 for ``count``).
+
+        Args:
+            interval: Interval length, e.g. ``"15min"``, ``"1h"`` or a
+                timedelta
+            how: Aggregations from AGGREGATIONS. Each numeric column ``x``
+                becomes ``x_<aggregation>``.
+            by: Label column to aggregate separately (e.g. ``"sensor_id"``)
+
+        Returns:
+            One row per (label, interval) with the interval start as the
+            timestamp, ordered by label then time
+
+        Raises:
+            KeyError: If by is not a label column
+            ValueError: If the interval is not positive or an aggregation
+                is unknown
+        """
+        step = pd.Timedelta(interval).value
+        if step <= 0:
+            msg = f"Resample interval must be positive, got {interval!r}"
+            raise ValueError(msg)
+        unknown = [agg for agg in how if agg not in AGGREGATIONS]
+        if unknown or not how:
+            msg = f"Unknown aggregation {unknown}. Use any of {', '.join(AGGREGATIONS)}"
+            raise ValueError(msg)
+
+        stamps = self.timestamps.view(np.int64)
+        codes, groups = self._group_codes(by)
+        rows = _sorted_rows(~np.isnat(self.timestamps), stamps, codes, len(groups))
+        if rows is not None:
+            stamps, codes = stamps[rows], codes[rows]
+        starts, bins = _interval_starts(stamps, codes, step, len(groups))
+        ends = np.append(starts[1:], len(stamps))
+
+        timestamps = (bins * step).view("datetime64[ns]")
+        labels = {by: groups[codes[starts]]} if by is not None else {}
+        values: dict[str, npt.NDArray[np.float64]] = {}
+        for name, column in self.values.items():
+            if rows is not None:
+                column = column[rows]
+            finite = ~np.isnan(column)
+            if finite.all():
+                counts = ends - starts
+            else:
+                seen = np.concatenate(([0], np.cumsum(finite)))
+                counts = seen[ends] - seen[starts]
+            for agg in how:
+                values[f"{name}_{agg}"] = _aggregate(
+                    column, finite, counts, starts, agg
+                )
+        return TimeSeriesColumns(timestamps, values, labels)
+
+    def downsample(
+        self,
+        threshold: int,
+        column: str,
+        *,
+        by: str | None = None,
+    ) -> TimeSeriesColumns:
+        """Keep the visually significant readings using LTTB.
+
+        Readings without a timestamp or a value in the chosen column are
+        dropped; the rest are sorted by time before downsampling.
+
+        Args:
+            threshold: Readings to keep (per label group when by is given)
+            column: Numeric column that drives point selection
+            by: Label column to downsample separately (e.g. ``"sensor_id"``)
+
+        Returns:
+            Selected readings in time order (grouped by label when by is
+            given), with all columns kept
+
+        Raises:
+            KeyError: If column or by does not exist
+            ValueError: If threshold is less than 3
+        """
+        if threshold < 3:
+            msg = f"LTTB threshold must be at least 3, got {threshold}"
+            raise ValueError(msg)
+        y_all = self.values[column]
+        stamps = self.timestamps.view(np.int64)
+        codes, groups = self._group_codes(by)
+        valid = ~np.isnat(self.timestamps) & ~np.isnan(y_all)
+        rows = _sorted_rows(valid, stamps, codes, len(groups))
+        if rows is not None:
+            stamps, y_all, codes = stamps[rows], y_all[rows], codes[rows]
+
+        selected = []
+        for lo, hi in itertools.pairwise(_group_bounds(codes, len(groups))):
+            x = (stamps[lo:hi] - stamps[lo]).astype(np.float64)
+            kept = lttb_indices(x, y_all[lo:hi], threshold) + lo
+            selected.append(kept if rows is None else rows[kept])
+        if not selected:
+            return self.take(np.zeros(0, dtype=np.intp))
+        return self.take(np.concatenate(selected))
+
+    def to_rows(self) -> Iterator[list[Any]]:
+        """Yield sheet rows matching ``columns`` (NaN and NaT become None)."""
+        stamps = [None if np.isnat(ts) else _isoformat(ts) for ts in self.timestamps]
+        columns: list[list[Any]] = [stamps]
+        columns.extend(arr.tolist() for arr in self.labels.values())
+        columns.extend(
+            [None if v != v else v for v in arr.tolist()]
+            for arr in self.values.values()
+        )
+        for row in zip(*columns, strict=True):
+            yield list(row)
+
+    def write_sheet(self, writer: StreamingWriter, sheet: str) -> int:
+        """Write the readings as one sheet of a StreamingWriter.
+
+        Args:
+            writer: Open StreamingWriter
+            sheet: Sheet name
+
+        Returns:
+            Number of data rows written
+
+        Raises:
+            ValueError: If the series does not fit in a sheet; resample or
+                downsample it first
+        """
+        if len(self) >= MAX_SHEET_ROWS:
+            msg = (
+                f"{len(self)} readings exceed the sheet limit of "
+                f"{MAX_SHEET_ROWS - 1} data rows; resample or downsample first"
+            )
+            raise ValueError(msg)
+        writer.start_sheet(sheet, self.columns)
+        for row in self.to_rows():
+            writer.write_row(row)
+        writer.end_sheet()
+        return len(self)
+
+    def _group_codes(
+        self, by: str | None
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.object_]]:
+        """Integer group code per reading, and the group labels."""
+        if by is None:
+            return np.zeros(len(self), dtype=np.intp), np.array([""], dtype=object)
+        codes, groups = pd.factorize(self.labels[by], sort=True)
+        return codes.astype(np.intp), np.asarray(groups, dtype=object)
+
+
+def _sorted_rows(
+    valid: npt.NDArray[np.bool_],
+    stamps: npt.NDArray[np.int64],
+    codes: npt.NDArray[np.intp],
+    n_groups: int,
+) -> npt.NDArray[np.intp] | None:
+    """Valid row indices ordered by (group, time), or None for all rows as-is."""
+    positions = None if valid.all() else np.flatnonzero(valid)
+    if positions is not None:
+        stamps = stamps[positions]
+        if n_groups > 1:
+            codes = codes[positions]
+    order = _group_order(stamps, codes, n_groups)
+    if order is None:
+        return positions
+    return order if positions is None else positions[order]
+
+
+def _group_order(
+    stamps: npt.NDArray[np.int64], codes: npt.NDArray[np.intp], n_groups: int
+) -> npt.NDArray[np.intp] | None:
+    """Permutation sorting readings by (group, time), or None if already sorted."""
+    if stamps.size < 2:
+        return None
+    if n_groups <= 1:
+        if bool((stamps[1:] >= stamps[:-1]).all()):
+            return None
+        return np.argsort(stamps, kind="stable")
+    # Fold group and time into one key when it cannot overflow
+    offset = stamps - stamps.min()
+    span = int(offset.max()) + 1
+    if span * n_groups >= 2**62:
+        return np.lexsort((stamps, codes))
+    key = codes.astype(np.int64) * span + offset
+    if bool((key[1:] >= key[:-1]).all()):
+        return None
+    return np.argsort(key, kind="stable")
+
+
+def _group_bounds(codes: npt.NDArray[np.intp], n_groups: int) -> list[int]:
+    """Start of every group in group-sorted codes, plus the end."""
+    if n_groups <= 1 or not codes.size:
+        return [0, len(codes)] if codes.size else []
+    changed = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    return [0, *changed.tolist(), len(codes)]
+
+
+def _interval_starts(
+    stamps: npt.NDArray[np.int64],
+    codes: npt.NDArray[np.intp],
+    step: int,
+    n_groups: int,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.int64]]:
+    """First index and interval number of every non-empty (group, interval).
+
+    stamps must be sorted by (group, time). Within a group the interval
+    boundaries are located with a binary search, which avoids dividing
+    every timestamp when intervals hold many readings.
+    """
+    starts = [np.zeros(0, dtype=np.intp)]
+    bins = [np.zeros(0, dtype=np.int64)]
+    for lo, hi in itertools.pairwise(_group_bounds(codes, n_groups)):
+        segment = stamps[lo:hi]
+        first, last = int(segment[0]) // step, int(segment[-1]) // step
+        if last - first + 1 > len(segment):
+            # Sparse readings: more intervals than readings
+            numbers = segment // step
+            changed = np.flatnonzero(numbers[1:] != numbers[:-1]) + 1
+            positions = np.concatenate(([0], changed))
+            starts.append(positions + lo)
+            bins.append(numbers[positions])
+            continue
+        numbers = np.arange(first, last + 1, dtype=np.int64)
+        positions = np.searchsorted(segment, numbers * step)
+        nonempty = np.diff(np.append(positions, len(segment))) > 0
+        starts.append(positions[nonempty] + lo)
+        bins.append(numbers[nonempty])
+    return np.concatenate(starts).astype(np.intp), np.concatenate(bins)
+
+
+def lttb_indices(
+    x: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    threshold: int,
+) -> npt.NDArray[np.intp]:
+    """Largest-Triangle-Three-Buckets point selection.
+
+    Splits the points between the first and last into threshold - 2
+    buckets and keeps, per bucket, the point forming the largest triangle
+    with the previously kept point and the average of the next bucket.
+
+    Args:
+        x: Increasing x coordinates
+        y: Values at x
+        threshold: Number of points to keep (at least 3)
+
+    Returns:
+        Indices of the kept points, increasing
+
+    Example:
+        >>> x = np.arange(7, dtype=float)
+        >>> lttb_indices(x, np.array([0, 1, 0, 9, 0, 1, 0.0]), 3).tolist()
+        [0, 3, 6]
+    """
+    n = len(x)
+    if threshold >= n:
+        return np.arange(n, dtype=np.intp)
+    if threshold < 3:
+        msg = f"LTTB threshold must be at least 3, got {threshold}"
+        raise ValueError(msg)
+
+    every = (n - 2) / (threshold - 2)
+    # Bucket i spans edges[i]:edges[i + 1]; the last edge excludes the end point
+    edges = (np.floor(np.arange(threshold - 1) * every) + 1).astype(np.intp)
+    edges[-1] = n - 1
+    cum_x = np.concatenate(([0.0], np.cumsum(x)))
+    cum_y = np.concatenate(([0.0], np.cumsum(y)))
+
+    sampled = np.empty(threshold, dtype=np.intp)
+    sampled[0], sampled[-1] = 0, n - 1
+    a = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (the final point for the last bucket)
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < threshold - 1 else n
+        count = next_end - next_start
+        avg_x = (cum_x[next_end] - cum_x[next_start]) / count
+        avg_y = (cum_y[next_end] - cum_y[next_start]) / count
+
+        xs, ys = x[start:end], y[start:end]
+        area = np.abs((x[a] - avg_x) * (ys - y[a]) - (x[a] - xs) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        sampled[i + 1] = a
+    return sampled
+
+
+def read_sensor_columns(
+    source: Path | str,
+    fields: Mapping[str, str],
+    label_fields: Sequence[str] = (),
+) -> TimeSeriesColumns:
+    """Parse a sensor export into columns in bulk.
+
+    Column names are matched case-insensitively through fields; unmapped
+    columns keep their lower-cased name. The ``timestamp`` field becomes
+    the time axis, label_fields stay text, and every other column is
+    numeric if all of its non-empty values parse as numbers (thousands
+    separators allowed) and text otherwise.
+
+    ISO 8601 timestamps are parsed in one vectorized pass, other formats
+    with a slower fallback. Times with an offset are converted to UTC and
+    naive times are taken as UTC; numeric timestamps are Unix seconds.
+
+    Args:
+        source: CSV, JSON (array, or object with a readings/data/samples
+            array) or JSON Lines file
+        fields: Lower-case source column name to field name
+        label_fields: Field names to keep as text
+
+    Returns:
+        Parsed columns in file order
+
+    Raises:
+        ValueError: If the file format is not supported or the JSON is
+            malformed
+    """
+    from spreadsheet_dl.streaming import iter_json_array, iter_json_lines
+
+    path = Path(source)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        frame = pd.read_csv(path, encoding="utf-8", encoding_errors="replace")
+    elif suffix in (".json", ".jsonl"):
+        with path.open("r", encoding="utf-8") as f:
+            records = (
+                iter_json_lines(f)
+                if suffix == ".jsonl"
+                else iter_json_array(f, _JSON_ARRAY_KEYS)
+            )
+            try:
+                frame = pd.DataFrame.from_records(list(records))
+            except json.JSONDecodeError as e:
+                msg = f"JSON parse error: {e}"
+                raise ValueError(msg) from e
+    else:
+        msg = f"Unsupported format: {suffix}"
+        raise ValueError(msg)
+
+    timestamps: npt.NDArray[np.datetime64] | None = None
+    values: dict[str, npt.NDArray[np.float64]] = {}
+    labels: dict[str, npt.NDArray[np.object_]] = {}
+    for column in frame.columns:
+        name = fields.get(str(column).lower(), str(column).lower())
+        if name == "timestamp":
+            if timestamps is None:
+                timestamps = _parse_timestamps(frame[column])
+            continue
+        if name in values or name in labels:
+            continue  # First column mapped to a field wins
+        numeric = None if name in label_fields else _parse_numbers(frame[column])
+        if numeric is not None:
+            values[name] = numeric
+        else:
+            labels[name] = frame[column].fillna("").astype(str).to_numpy(dtype=object)
+
+    if timestamps is None:
+        timestamps = np.full(
+            len(frame), np.datetime64("NaT", "ns"), dtype="datetime64[ns]"
+        )
+    return TimeSeriesColumns(timestamps, values, labels)
+
+
+def _parse_timestamps(column: pd.Series[Any]) -> npt.NDArray[np.datetime64]:
+    """Vectorized timestamp parsing to naive UTC datetime64[ns]."""
+    if pd.api.types.is_numeric_dtype(column):
+        parsed = pd.to_datetime(column, unit="s", errors="coerce", utc=True)
+    else:
+        text = column.astype("string").str.strip()
+        parsed = pd.to_datetime(text, format="ISO8601", errors="coerce", utc=True)
+        retry = parsed.isna() & text.notna() & (text != "")
+        if retry.any():
+            parsed[retry] = pd.to_datetime(
+                text[retry], format="mixed", errors="coerce", utc=True
+            )
+    return parsed.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+
+
+def _parse_numbers(column: pd.Series[Any]) -> npt.NDArray[np.float64] | None:
+    """Column as float64, or None if any non-empty value is not a number."""
+    if pd.api.types.is_bool_dtype(column):
+        return None
+    if pd.api.types.is_numeric_dtype(column):
+        return column.to_numpy(dtype=np.float64, na_value=np.nan)
+    text = column.astype("string").str.strip().str.replace(",", "", regex=False)
+    present = text.notna() & (text != "")
+    numbers = pd.to_numeric(text.where(present), errors="coerce")
+    if not present.any() or numbers[present].isna().any():
+        return None
+    return numbers.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _aggregate(
+    column: npt.NDArray[np.float64],
+    finite: npt.NDArray[np.bool_],
+    counts: npt.NDArray[np.int64],
+    starts: npt.NDArray[np.intp],
+    agg: str,
+) -> npt.NDArray[np.float64]:
+    """One aggregation of a group-sorted column over the group starts."""
+    if not starts.size:
+        return np.zeros(0, dtype=np.float64)
+    if agg == "count":
+        return counts.astype(np.float64)
+    if agg == "mean":
+        sums = np.add.reduceat(np.where(finite, column, 0.0), starts)
+        means: npt.NDArray[np.float64] = np.full(len(sums), np.nan)
+        np.divide(sums, counts, out=means, where=counts > 0)
+        return means
+    reducer = np.fmin if agg == "min" else np.fmax
+    result: npt.NDArray[np.float64] = reducer.reduceat(column, starts)
+    return result
+
+
+def _isoformat(value: np.datetime64) -> str:
+    """ISO 8601 text for a datetime64 value."""
+    return pd.Timestamp(value).isoformat()
+
+
+__all__ = [
+    "AGGREGATIONS",
+    "MAX_SHEET_ROWS",
+    "TimeSeriesColumns",
+    "lttb_indices",
+    "read_sensor_columns",
+]
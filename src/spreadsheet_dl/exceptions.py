@@ -868,6 +868,27 @@ def __init__(self, field: str, **kwargs: Any) -> None:
         )
 
 
+class InvalidQueryError(ValidationError):
+    """Raised when a sheet query cannot be parsed or planned."""
+
+    error_code = "FT-VAL-406"
+
+    def __init__(self, query: str, reason: str, **kwargs: Any) -> None:
+        """Initialize the instance."""
+        self.query = query
+        self.reason = reason
+        super().__init__(
+            f"Invalid query: {reason}",
+            context=ErrorContext(value=query),
+            suggestion=(
+                "Use SELECT <columns|aggregates> [WHERE ...] [GROUP BY ...] "
+                "[ORDER BY ... ASC|DESC] [LIMIT n [OFFSET m]]; quote column "
+                'names containing spaces as "Column Name".'
+            ),
+            **kwargs,
+        )
+
+
 # =============================================================================
 # Configuration Errors (FT-CFG-500 to FT-CFG-599)
 # =============================================================================
@@ -29,15 +29,22 @@
 
 import contextlib
 from dataclasses import dataclass, field
+from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from spreadsheet_dl.exceptions import SpreadsheetDLError
 
 if TYPE_CHECKING:
-    from decimal import Decimal
     from pathlib import Path
 
+    import numpy as np
+    from numpy.typing import NDArray
+
+    from spreadsheet_dl.schema.conditional import (
+        ConditionalFormat as SchemaConditionalFormat,
+    )
+
 
 class InteractiveError(SpreadsheetDLError):
     """Base exception for interactive feature errors."""
@@ -516,6 +523,61 @@ class DashboardSection:
     size: tuple[int, int] = (5, 4)
 
 
+def _as_number(value: Any) -> float | None:
+    """Coerce a cell value or rule operand to float the way comparisons do.
+
+    Numbers (including bool and Decimal) and numeric strings convert;
+    anything else returns None.
+    """
+    if isinstance(value, (int, float, Decimal)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass
+class _RangeValues:
+    """Cell elements and values of a conditional-format range.
+
+    Extracted once per range so rules can be evaluated as array masks.
+
+    Attributes:
+        cells: Row-major cell elements (None where the cell is missing)
+        values: Cell values as returned by _get_cell_value
+        exists: Mask of positions with a cell element
+        present: Mask of cells with a non-None value
+        numbers: Numeric cell values (NaN where not numeric)
+        is_number: Mask of cells whose value converts to a number
+    """
+
+    cells: list[list[Any]]
+    values: NDArray[np.object_]
+    exists: NDArray[np.bool_]
+    present: NDArray[np.bool_]
+    numbers: NDArray[np.float64]
+    is_number: NDArray[np.bool_]
+    _texts: NDArray[np.str_] | None = field(default=None, repr=False)
+
+    @property
+    def texts(self) -> NDArray[np.str_]:
+        """String form of each value ("" where missing), built on first use."""
+        if self._texts is None:
+            import numpy as np
+
+            self._texts = np.array(
+                [
+                    str(value) if value is not None else ""
+                    for value in self.values.ravel()
+                ],
+                dtype=str,
+            ).reshape(self.values.shape)
+        return self._texts
+
+
 class InteractiveOdsBuilder:
     """Builder for interactive ODS features.
 
@@ -689,7 +751,7 @@ def _apply_conditional_format(
         self,
         doc: Any,
         cell_range: str,
-        format_config: ConditionalFormat,
+        format_config: ConditionalFormat | SchemaConditionalFormat,
     ) -> None:
         """Apply conditional formatting to cells.
 
@@ -701,6 +763,10 @@ def _apply_conditional_format(
         - Color scales, data bars, and icon sets are rendered as static styles
         - Formula-based conditions require cell values to be present at render time
 
+        The range is extracted once into a _RangeValues grid and every rule
+        is evaluated as a NumPy mask over it, so cost is linear in the
+        number of cells rather than re-scanning the table per cell.
+
         This implementation provides a foundation for conditional formatting that:
         - Works for static data (values known at export time)
         - Applies correct styles based on rules
@@ -739,25 +805,210 @@ def _apply_conditional_format(
                 raise InteractiveError("No table found in document")
             table_elem = tables[0]
 
-            # Process each cell in the range
-            for row_idx in range(start_row, end_row + 1):
-                for col_idx in range(start_col, end_col + 1):
-                    cell = self._get_cell(table_elem, row_idx, col_idx)
-                    if cell is None:
-                        continue
-
-                    # Apply each rule in priority order
-                    for rule in sorted(format_config.rules, key=lambda r: r.priority):
-                        if self._evaluate_rule(cell, rule):
-                            self._apply_rule_style(doc, cell, rule)
-                            if rule.stop_if_true:
-                                break
+            grid = self._extract_range(
+                table_elem, start_row, end_row, start_col, end_col
+            )
+            rules = sorted(format_config.rules, key=lambda r: r.priority)
+            self._apply_range_styles(doc, grid, rules, self._match_rules(grid, rules))
 
         except Exception as e:
             raise InteractiveError(
                 f"Failed to apply conditional formatting to range {cell_range}: {e}"
             ) from e
 
+    def _extract_range(
+        self,
+        table_elem: Any,
+        start_row: int,
+        end_row: int,
+        start_col: int,
+        end_col: int,
+    ) -> _RangeValues:
+        """Extract cell elements and values of a range in one pass.
+
+        Uses the same row/cell indexing as _get_cell; positions beyond the
+        table are marked as missing.
+        """
+        import numpy as np
+        from odf.table import TableCell, TableRow
+
+        shape = (end_row - start_row + 1, end_col - start_col + 1)
+        cells: list[list[Any]] = [[None] * shape[1] for _ in range(shape[0])]
+        values = np.full(shape, None, dtype=object)
+        exists = np.zeros(shape, dtype=bool)
+        numbers = np.full(shape, np.nan)
+        is_number = np.zeros(shape, dtype=bool)
+
+        rows = table_elem.getElementsByType(TableRow)[start_row : end_row + 1]
+        for r, row in enumerate(rows):
+            row_cells = row.getElementsByType(TableCell)[start_col : end_col + 1]
+            for c, cell in enumerate(row_cells):
+                value = self._get_cell_value(cell)
+                cells[r][c] = cell
+                values[r, c] = value
+                exists[r, c] = True
+                number = _as_number(value)
+                if number is not None:
+                    numbers[r, c] = number
+                    is_number[r, c] = True
+
+        return _RangeValues(
+            cells=cells,
+            values=values,
+            exists=exists,
+            present=exists & (values != None),  # noqa: E711 - elementwise
+            numbers=numbers,
+            is_number=is_number,
+        )
+
+    def _match_rules(self, grid: _RangeValues, rules: list[Any]) -> NDArray[np.intp]:
+        """Resolve which rule styles each cell of a range.
+
+        Rules are evaluated in priority order. A later matching rule
+        overrides an earlier style, and a matching rule with
+        ``stop_if_true`` removes the cell from further evaluation.
+
+        Returns:
+            Array of indices into ``rules`` (-1 where no style applies)
+        """
+        import numpy as np
+
+        styled = np.full(grid.exists.shape, -1, dtype=np.intp)
+        active = grid.exists.copy()
+        for index, rule in enumerate(rules):
+            if not active.any():
+                break
+            mask = self._rule_mask(grid, rule) & active
+            if rule.style is not None:
+                styled[mask] = index
+            if rule.stop_if_true:
+                active &= ~mask
+        return styled
+
+    def _rule_mask(self, grid: _RangeValues, rule: Any) -> NDArray[np.bool_]:
+        """Evaluate a conditional rule over a whole range (see _evaluate_rule)."""
+        import numpy as np
+
+        from spreadsheet_dl.schema.conditional import ConditionalRuleType
+
+        if rule.type == ConditionalRuleType.CELL_VALUE:
+            return self._cell_value_mask(grid, rule)
+        if rule.type == ConditionalRuleType.TEXT:
+            return self._text_mask(grid, rule)
+        if rule.type in (
+            ConditionalRuleType.COLOR_SCALE,
+            ConditionalRuleType.DATA_BAR,
+            ConditionalRuleType.ICON_SET,
+        ):
+            return grid.exists.copy()
+        return np.zeros(grid.exists.shape, dtype=bool)
+
+    def _cell_value_mask(self, grid: _RangeValues, rule: Any) -> NDArray[np.bool_]:
+        """Vectorized _evaluate_cell_value_rule.
+
+        Numeric cells compared against a numeric operand are evaluated with
+        NumPy; any other combination falls back to the scalar evaluator for
+        those cells only, so mixed-type semantics are unchanged.
+        """
+        import numpy as np
+
+        from spreadsheet_dl.schema.conditional import RuleOperator
+
+        comparisons = {
+            RuleOperator.EQUAL: np.equal,
+            RuleOperator.NOT_EQUAL: np.not_equal,
+            RuleOperator.GREATER_THAN: np.greater,
+            RuleOperator.GREATER_THAN_OR_EQUAL: np.greater_equal,
+            RuleOperator.LESS_THAN: np.less,
+            RuleOperator.LESS_THAN_OR_EQUAL: np.less_equal,
+        }
+
+        mask = np.zeros(grid.exists.shape, dtype=bool)
+        if rule.operator is None:
+            return mask
+
+        compare = _as_number(rule.value)
+        upper = (
+            None
+            if isinstance(rule.value2, str)
+            else _as_number(rule.value2)  # value2 is never coerced from text
+        )
+        fallback = grid.present
+        if compare is not None:
+            x = grid.numbers
+            if rule.operator in comparisons:
+                mask = comparisons[rule.operator](x, compare)
+            elif (
+                rule.operator in (RuleOperator.BETWEEN, RuleOperator.NOT_BETWEEN)
+                and upper is not None
+            ):
+                inside = (compare <= x) & (x <= upper)
+                mask = inside if rule.operator == RuleOperator.BETWEEN else ~inside
+            else:
+                mask = self._scalar_mask(grid, rule, grid.present)
+            mask &= grid.is_number
+            fallback = grid.present & ~grid.is_number
+
+        return mask | self._scalar_mask(grid, rule, fallback)
+
+    def _scalar_mask(
+        self, grid: _RangeValues, rule: Any, where: NDArray[np.bool_]
+    ) -> NDArray[np.bool_]:
+        """Evaluate a cell value rule cell-by-cell on the selected positions."""
+        import numpy as np
+
+        mask = np.zeros(grid.exists.shape, dtype=bool)
+        for r, c in zip(*np.nonzero(where), strict=True):
+            mask[r, c] = self._evaluate_cell_value_rule(grid.values[r, c], rule)
+        return mask
+
+    def _text_mask(self, grid: _RangeValues, rule: Any) -> NDArray[np.bool_]:
+        """Vectorized _evaluate_text_rule."""
+        import numpy as np
+
+        from spreadsheet_dl.schema.conditional import RuleOperator
+
+        if rule.text is None:
+            return np.zeros(grid.exists.shape, dtype=bool)
+
+        texts = grid.texts
+        search = str(rule.text)
+        if rule.operator == RuleOperator.CONTAINS_TEXT:
+            mask = np.char.find(texts, search) >= 0
+        elif rule.operator == RuleOperator.NOT_CONTAINS_TEXT:
+            mask = np.char.find(texts, search) < 0
+        elif rule.operator == RuleOperator.BEGINS_WITH:
+            mask = np.char.startswith(texts, search)
+        elif rule.operator == RuleOperator.ENDS_WITH:
+            mask = np.char.endswith(texts, search)
+        else:
+            return np.zeros(grid.exists.shape, dtype=bool)
+        return mask & grid.present
+
+    def _apply_range_styles(
+        self,
+        doc: Any,
+        grid: _RangeValues,
+        rules: list[Any],
+        styled: NDArray[np.intp],
+    ) -> None:
+        """Set the resolved rule styles on the range's cells in one pass.
+
+        Each matching rule's style is looked up or created once, not once
+        per cell.
+        """
+        import numpy as np
+        from odf.namespaces import TABLENS
+
+        style_names = {
+            int(index): self._rule_style(doc, rules[index]).getAttribute("name")
+            for index in np.unique(styled[styled >= 0])
+        }
+        for r, c in zip(*np.nonzero(styled >= 0), strict=True):
+            grid.cells[r][c].attributes[(TABLENS, "style-name")] = style_names[
+                styled[r, c]
+            ]
+
     def _parse_range(self, cell_range: str) -> tuple[str, str]:
         """Parse cell range like 'A1:B10' into (start_cell, end_cell)."""
         if ":" not in cell_range:
@@ -808,23 +1059,27 @@ def _get_cell_value(self, cell: Any) -> Any:
         if cell is None:
             return None
 
-        # Check for office:value attribute
-        if cell.hasAttribute("value"):
-            value_type = cell.getAttribute("valuetype")
+        from odf.namespaces import OFFICENS
+
+        # Check for office:value attribute (read by qualified name; odfpy's
+        # getAttribute() resolves names linearly and dominates large ranges)
+        attrs = cell.attributes
+        if attrs.get((OFFICENS, "value")) is not None:
+            value_type = attrs.get((OFFICENS, "value-type"))
             if (
                 value_type == "float"
                 or value_type == "percentage"
                 or value_type == "currency"
             ):
-                return float(cell.getAttribute("value"))
+                return float(attrs[(OFFICENS, "value")])
             elif value_type == "date":
-                return cell.getAttribute("datevalue")
+                return attrs.get((OFFICENS, "date-value"))
             elif value_type == "time":
-                return cell.getAttribute("timevalue")
+                return attrs.get((OFFICENS, "time-value"))
             elif value_type == "boolean":
-                return cell.getAttribute("booleanvalue") == "true"
+                return attrs.get((OFFICENS, "boolean-value")) == "true"
             elif value_type == "string":
-                return cell.getAttribute("stringvalue")
+                return attrs.get((OFFICENS, "string-value"))
 
         # Fall back to text content
         from odf.text import P
@@ -936,18 +1191,18 @@ def _apply_rule_style(self, doc: Any, cell: Any, rule: Any) -> None:
         if rule.style is None:
             return
 
-        # Get or create the style
-        if isinstance(rule.style, str):
-            # Style name reference - look it up or create default
-            style_name = rule.style
-            style = self._get_or_create_named_style(doc, style_name)
-        else:
-            # CellStyle object
-            style = self._convert_cell_style_to_odf(doc, rule.style)
-
         # Apply style to cell
+        style = self._rule_style(doc, rule)
         cell.setAttribute("stylename", style.getAttribute("name"))
 
+    def _rule_style(self, doc: Any, rule: Any) -> Any:
+        """Get or create the ODF style for a conditional rule."""
+        if isinstance(rule.style, str):
+            # Style name reference - look it up or create default
+            return self._get_or_create_named_style(doc, rule.style)
+        # CellStyle object
+        return self._convert_cell_style_to_odf(doc, rule.style)
+
     def _get_or_create_named_style(self, doc: Any, style_name: str) -> Any:
         """Get existing named style or create a default one."""
         from odf.style import Style, TableCellProperties, TextProperties
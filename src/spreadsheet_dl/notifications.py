@@ -8,7 +8,10 @@
 
 import json
 import smtplib
+import threading
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from email.mime.multipart import MIMEMultipart
@@ -18,6 +21,7 @@
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
     from decimal import Decimal
 
 
@@ -112,12 +116,17 @@ class EmailConfig:
 class EmailChannel:
     """Send notifications via email.
 
-    Supports SMTP with TLS for secure email delivery.
+    Supports SMTP with TLS for secure email delivery. Inside ``session()``
+    or ``send_many()`` one SMTP connection is opened, secured and
+    authenticated once and reused for every message.
     """
 
     def __init__(self, config: EmailConfig) -> None:
         """Initialize email channel."""
         self.config = config
+        self._server: smtplib.SMTP | None = None
+        self._session_depth = 0
+        self._lock = threading.RLock()
 
     def is_configured(self) -> bool:
         """Check if email is configured."""
@@ -134,18 +143,11 @@ def send(self, notification: Notification) -> bool:
             return False
 
         try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = self._format_subject(notification)
-            msg["From"] = self.config.from_address or self.config.username
-            msg["To"] = self.config.to_address
+            msg = self._build_message(notification)
 
-            # Plain text version
-            text_body = self._format_text_body(notification)
-            msg.attach(MIMEText(text_body, "plain"))
-
-            # HTML version
-            html_body = self._format_html_body(notification)
-            msg.attach(MIMEText(html_body, "html"))
+            with self._lock:
+                if self._session_depth:
+                    return self._send_pooled(msg)
 
             # Send
             with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port) as server:
@@ -161,6 +163,92 @@ def send(self, notification: Notification) -> bool:
             # Intentionally suppress for graceful degradation - notifications are non-critical
             return False
 
+    def send_many(self, notifications: Sequence[Notification]) -> list[bool]:
+        """Send several notifications over one SMTP connection.
+
+        Args:
+            notifications: Notifications to send, in order.
+
+        Returns:
+            Success flag for each notification.
+        """
+        if not self.is_configured():
+            return [False] * len(notifications)
+        with self.session():
+            return [self.send(notification) for notification in notifications]
+
+    @contextmanager
+    def session(self) -> Iterator[EmailChannel]:
+        """Reuse one SMTP connection for every send inside the block.
+
+        The connection is opened lazily on the first send, reopened once if
+        the server drops it, and closed when the outermost session exits.
+
+        Yields:
+            This channel.
+        """
+        with self._lock:
+            self._session_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._session_depth -= 1
+                if not self._session_depth:
+                    self._close_server()
+
+    def _send_pooled(self, msg: MIMEMultipart) -> bool:
+        """Send over the session connection, reconnecting once if dropped."""
+        for attempt in range(2):
+            if self._server is None:
+                self._server = self._connect()
+            try:
+                self._server.send_message(msg)
+                return True
+            except smtplib.SMTPServerDisconnected:
+                self._server = None
+                if attempt:
+                    raise
+        return False
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP connection."""
+        server = smtplib.SMTP(self.config.smtp_host, self.config.smtp_port)
+        try:
+            if self.config.use_tls:
+                server.starttls()
+            server.login(self.config.username, self.config.password)
+        except (smtplib.SMTPException, OSError):
+            server.close()
+            raise
+        return server
+
+    def _close_server(self) -> None:
+        """Close the session connection, if any."""
+        server, self._server = self._server, None
+        if server is None:
+            return
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def _build_message(self, notification: Notification) -> MIMEMultipart:
+        """Build the multipart email for a notification."""
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = self._format_subject(notification)
+        msg["From"] = self.config.from_address or self.config.username
+        msg["To"] = self.config.to_address
+
+        # Plain text version
+        text_body = self._format_text_body(notification)
+        msg.attach(MIMEText(text_body, "plain"))
+
+        # HTML version
+        html_body = self._format_html_body(notification)
+        msg.attach(MIMEText(html_body, "html"))
+        return msg
+
     def _format_subject(self, notification: Notification) -> str:
         """Format email subject."""
         priority_prefix = {
@@ -325,9 +413,14 @@ def _get_tags(self, notification: Notification) -> str:
 class NotificationManager:
     """Manage and send notifications through multiple channels.
 
-    Supports email, ntfy.sh, and custom notification channels.
+    Supports email, ntfy.sh, and custom notification channels. Sent
+    notifications are appended to a JSON Lines log, one object per line.
     """
 
+    # The log is compacted back to this many entries once it holds twice
+    # as many lines.
+    LOG_MAX_ENTRIES = 1000
+
     def __init__(
         self,
         email_config: EmailConfig | None = None,
@@ -343,6 +436,7 @@ def __init__(
         """
         self._channels: dict[str, NotificationChannel] = {}
         self._log_path = Path(log_path) if log_path else None
+        self._log_lines: int | None = None
         self._history: list[Notification] = []
 
         if email_config:
@@ -404,7 +498,7 @@ def send(
             notification.sent_at = datetime.now()
 
         self._history.append(notification)
-        self._save_log()
+        self._append_log([notification])
 
         return results
 
@@ -412,6 +506,68 @@ def send_all(self, notification: Notification) -> dict[str, bool]:
         """Send notification through all configured channels."""
         return self.send(notification, list(self._channels.keys()))
 
+    def send_batch(
+        self,
+        notifications: Sequence[Notification],
+        channels: list[str] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> list[dict[str, bool]]:
+        """Send many notifications, fanning out across channels in parallel.
+
+        Each channel receives its share of the batch in order, on its own
+        worker thread. Channels with a ``send_many`` method (such as
+        ``EmailChannel``) deliver the whole share over one connection. The
+        log is appended once for the batch.
+
+        Args:
+            notifications: Notifications to send.
+            channels: Channels to use (defaults to each notification's channels).
+            max_workers: Maximum channels delivering at once (default: all).
+
+        Returns:
+            One dict per notification mapping channel name to success status.
+        """
+        results: list[dict[str, bool]] = [{} for _ in notifications]
+        shares: dict[str, list[int]] = {}
+        for index, notification in enumerate(notifications):
+            for channel_name in channels or notification.channels:
+                shares.setdefault(channel_name, []).append(index)
+
+        def deliver(channel_name: str) -> list[bool]:
+            indexes = shares[channel_name]
+            channel = self._channels.get(channel_name)
+            if channel is None or not channel.is_configured():
+                return [False] * len(indexes)
+            batch = [notifications[index] for index in indexes]
+            send_many = getattr(channel, "send_many", None)
+            if send_many is not None:
+                return list(send_many(batch))
+            return [channel.send(notification) for notification in batch]
+
+        names = list(shares)
+        if len(names) > 1 and max_workers != 1:
+            with ThreadPoolExecutor(
+                max_workers=max_workers or len(names),
+                thread_name_prefix="notify",
+            ) as pool:
+                outcomes = list(pool.map(deliver, names))
+        else:
+            outcomes = [deliver(name) for name in names]
+
+        for channel_name, sent in zip(names, outcomes, strict=True):
+            for index, ok in zip(shares[channel_name], sent, strict=True):
+                results[index][channel_name] = ok
+
+        now = datetime.now()
+        for notification, result in zip(notifications, results, strict=True):
+            if any(result.values()):
+                notification.sent_at = now
+        self._history.extend(notifications)
+        self._append_log(notifications)
+
+        return results
+
     def get_history(
         self,
         limit: int = 100,
@@ -425,20 +581,49 @@ def get_history(
 
         return history[-limit:]
 
-    def _save_log(self) -> None:
-        """Save notification log."""
-        if not self._log_path:
+    def _append_log(self, notifications: Sequence[Notification]) -> None:
+        """Append notifications to the JSON Lines log."""
+        log_path = self._log_path
+        if not log_path or not notifications:
             return
 
-        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._log_lines is None:
+            self._log_lines = self._prepare_log(log_path)
+
+        lines = "".join(json.dumps(n.to_dict()) + "\n" for n in notifications)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+        self._log_lines += len(notifications)
+
+        if self._log_lines > 2 * self.LOG_MAX_ENTRIES:
+            with open(log_path, encoding="utf-8") as f:
+                kept = f.read().splitlines()[-self.LOG_MAX_ENTRIES :]
+            self._write_log_lines(log_path, kept)
+            self._log_lines = len(kept)
+
+    def _prepare_log(self, log_path: Path) -> int:
+        """Count existing log lines, converting a legacy JSON log in place."""
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        if not log_path.exists():
+            return 0
+
+        text = log_path.read_text(encoding="utf-8")
+        if text.startswith("{\n"):
+            # Legacy format: one JSON document rewritten on every send
+            try:
+                entries = json.loads(text).get("notifications", [])
+            except (json.JSONDecodeError, AttributeError):
+                entries = []
+            self._write_log_lines(log_path, [json.dumps(entry) for entry in entries])
+            return len(entries)
+        return text.count("\n")
 
-        log_data = {
-            "notifications": [n.to_dict() for n in self._history[-1000:]],
-            "last_updated": datetime.now().isoformat(),
-        }
-
-        with open(self._log_path, "w") as f:
-            json.dump(log_data, f, indent=2)
+    @staticmethod
+    def _write_log_lines(log_path: Path, lines: list[str]) -> None:
+        """Atomically replace the log with the given lines."""
+        temp_path = log_path.with_name(f".{log_path.name}.tmp")
+        temp_path.write_text("".join(f"{line}\n" for line in lines), encoding="utf-8")
+        temp_path.replace(log_path)
 
 
 # Notification Templates
@@ -18,6 +18,8 @@
 from odf.text import P
 
 from spreadsheet_dl.exceptions import OdsReadError, OdsWriteError, SheetNotFoundError
+from spreadsheet_dl.performance import phase
+from spreadsheet_dl.query import OdfTableScanner, match_rows, run_query
 
 if TYPE_CHECKING:
     from odf.opendocument import OpenDocumentSpreadsheet
@@ -56,7 +58,8 @@ def __init__(self, file_path: Path | str) -> None:
             raise OdsReadError(f"File not found: {self.file_path}", "FILE_NOT_FOUND")
 
         try:
-            self._doc = load(str(self.file_path))
+            with phase("load"):
+                self._doc = load(str(self.file_path))
         except (OSError, ValueError, AttributeError, KeyError) as e:
             # OSError: File I/O, ValueError: malformed XML/ZIP, AttributeError: missing attrs, KeyError: missing elements
             raise OdsReadError(
@@ -254,7 +257,8 @@ def save(self, output_path: Path | str | None = None) -> Path:
         save_path = Path(output_path) if output_path else self.file_path
 
         try:
-            self._doc.save(str(save_path))
+            with phase("save"):
+                self._doc.save(str(save_path))
             return save_path
         except (OSError, ValueError, AttributeError) as e:
             # OSError: File I/O, ValueError: serialization, AttributeError: missing methods
@@ -506,13 +510,23 @@ def get_range_values(self, sheet_name: str, range_ref: str) -> list[list[Any]]:
         sheet = self.get_sheet(sheet_name)
         (start_row, start_col), (end_row, end_col) = self._parse_range(range_ref)
 
+        # Collect rows and cells once rather than per cell via _get_cell
+        rows = sheet.getElementsByType(TableRow)
+        width = end_col - start_col + 1
         result = []
         for row_idx in range(start_row, end_row + 1):
-            row_values = []
-            for col_idx in range(start_col, end_col + 1):
-                cell = self._get_cell(sheet, row_idx, col_idx)
-                row_values.append(self._get_cell_value(cell))
-            result.append(row_values)
+            if row_idx >= len(rows):
+                result.append([None] * width)
+                continue
+            cells = rows[row_idx].getElementsByType(TableCell)
+            result.append(
+                [
+                    self._get_cell_value(
+                        cells[col_idx] if col_idx < len(cells) else None
+                    )
+                    for col_idx in range(start_col, end_col + 1)
+                ]
+            )
 
         return result
 
@@ -1781,93 +1795,42 @@ def break_links(self) -> int:
     def query_data(self, sheet_name: str, query: str) -> list[dict[str, Any]]:
         """Query data with SQL-like syntax.
 
+        Supports ``SELECT`` (columns, ``*``, COUNT/SUM/AVG/MIN/MAX with
+        ``AS`` aliases), ``WHERE``, ``GROUP BY``, ``ORDER BY`` and
+        ``LIMIT``/``OFFSET``; see :mod:`spreadsheet_dl.query`. The first
+        row is the header, and an empty query returns every data row.
+
+        Runs over the in-memory document so unsaved edits are visible;
+        use :func:`spreadsheet_dl.query.query_file` for cached queries
+        against a file on disk.
+
         Args:
             sheet_name: Name of the sheet to query.
             query: SQL-like query string.
 
         Returns:
             List of matching rows as dictionaries.
-        """
-        # Basic implementation - parse simple SELECT WHERE queries
-        sheet = self.get_sheet(sheet_name)
-        rows = sheet.getElementsByType(TableRow)
 
-        if not rows:
-            return []
-
-        # Get headers from first row
-        first_row = rows[0]
-        cells = first_row.getElementsByType(TableCell)
-        headers = [
-            self._get_cell_value(cell) or f"col{i}" for i, cell in enumerate(cells)
-        ]
-
-        # Return all data rows as dictionaries
-        result = []
-        for row in rows[1:]:
-            cells = row.getElementsByType(TableCell)
-            row_dict = {}
-            for i, cell in enumerate(cells):
-                col_name = headers[i] if i < len(headers) else f"col{i}"
-                row_dict[str(col_name)] = self._get_cell_value(cell)
-            result.append(row_dict)
-
-        return result
+        Raises:
+            SheetNotFoundError: If the sheet does not exist.
+            InvalidQueryError: If the query is malformed or names an
+                unknown column.
+        """
+        return run_query(OdfTableScanner(self.get_sheet(sheet_name)), query)
 
     def find_rows(self, sheet_name: str, conditions: dict[str, Any]) -> list[int]:
         """Find rows matching conditions.
 
         Args:
             sheet_name: Name of the sheet.
-            conditions: Dictionary of column: value conditions.
+            conditions: Dictionary of column: value conditions. A value may
+                also be an operator dict such as ``{"$gt": 10}``; see
+                :func:`spreadsheet_dl.query.match_rows`.
 
         Returns:
-            List of matching row indices (0-based).
+            List of matching row indices (0-based, the header is row 0).
         """
-        sheet = self.get_sheet(sheet_name)
-        rows = sheet.getElementsByType(TableRow)
-
-        if not rows:
-            return []
-
-        # Get headers
-        first_row = rows[0]
-        cells = first_row.getElementsByType(TableCell)
-        headers = [
-            self._get_cell_value(cell) or f"col{i}" for i, cell in enumerate(cells)
-        ]
-
-        # Find header indices for conditions
-        col_indices: dict[str, int] = {}
-        for col_name in conditions:
-            if col_name in headers:
-                col_indices[col_name] = headers.index(col_name)
-
-        # Search rows
-        matches = []
-        for row_idx, row in enumerate(rows[1:], start=1):
-            cells = row.getElementsByType(TableCell)
-            match = True
-
-            for col_name, expected_value in conditions.items():
-                if col_name not in col_indices:
-                    match = False
-                    break
-
-                col_idx = col_indices[col_name]
-                if col_idx < len(cells):
-                    cell_value = self._get_cell_value(cells[col_idx])
-                    if cell_value != expected_value:
-                        match = False
-                        break
-                else:
-                    match = False
-                    break
-
-            if match:
-                matches.append(row_idx)
-
-        return matches
+        return match_rows(OdfTableScanner(self.get_sheet(sheet_name)), conditions)
 
 
 def append_expense_to_file(
@@ -0,0 +1,588 @@
+"""Zip packaging layer for ODS output.
+
+odfpy writes every ODS member with zipfile's default deflate level. This
+module takes over the zip step so callers can trade file size for
+throughput:
+
+    - Configurable deflate level (0 stores everything, 9 for archives)
+    - Images and already-compressed members are stored, not re-deflated
+    - Large members (typically content.xml) are deflated in parallel blocks
+    - Existing ODS files can be repacked by raw-copying their members
+
+Example:
+    >>> options = PackageOptions.from_preset("fast")
+    >>> options.compression_level
+    1
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import struct
+import tempfile
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, BinaryIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from odf.opendocument import OpenDocument
+
+
+# Named compression presets accepted by PackageOptions.from_preset()
+COMPRESSION_PRESETS: dict[str, int] = {
+    "store": 0,
+    "fast": 1,
+    "default": 6,
+    "archive": 9,
+}
+
+# Members with these suffixes are already compressed; deflating them again
+# costs CPU for little or no size gain.
+PRECOMPRESSED_SUFFIXES = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".tif",
+        ".tiff",
+        ".zip",
+        ".gz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".ods",
+        ".odt",
+        ".odg",
+        ".xlsx",
+        ".docx",
+        ".mp3",
+        ".mp4",
+    }
+)
+
+MIMETYPE_MEMBER = "mimetype"
+MANIFEST_MEMBER = "META-INF/manifest.xml"
+
+# Permissions odfpy gives package members (-rw-r--r--)
+_MEMBER_ATTR = 0o100644 << 16
+_XML_PROLOGUE = "<?xml version='1.0' encoding='UTF-8'?>\n"
+
+# Zip local file header layout (APPNOTE 4.3.7)
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+# Central directory header and end of central directory record (4.3.12, 4.3.16)
+_CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_CENTRAL_HEADER_SIGNATURE = b"PK\x01\x02"
+_END_RECORD = struct.Struct("<4s4H2LH")
+_END_RECORD_SIGNATURE = b"PK\x05\x06"
+
+# Version needed to extract deflated members, general purpose UTF-8 name flag
+_ZIP_VERSION = 20
+_UTF8_FLAG = 0x800
+_ZIP32_LIMIT = 0xFFFFFFFF
+
+# Bytes copied at a time from spooled member payloads
+_COPY_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class PackageOptions:
+    """Compression settings for writing ODS zip packages.
+
+    Attributes:
+        compression_level: Deflate level 0-9. 0 stores every member
+            uncompressed (fastest), 9 gives the smallest files.
+        store_precompressed: Store images and other already-compressed
+            members without deflating them again.
+        parallel_threshold: Members at least this many bytes are deflated
+            in parallel blocks.
+        block_size: Size of each parallel deflate block in bytes.
+        max_workers: Thread count for parallel deflate (None for CPU count).
+    """
+
+    compression_level: int = 6
+    store_precompressed: bool = True
+    parallel_threshold: int = 4 * 1024 * 1024
+    block_size: int = 1024 * 1024
+    max_workers: int | None = None
+
+    def __post_init__(self) -> None:
+        """Validate option values."""
+        if not 0 <= self.compression_level <= 9:
+            raise ValueError(
+                f"compression_level must be between 0 and 9, got "
+                f"{self.compression_level}. "
+                "Fix: Use 0 for speed, 6 for the default or 9 for archives."
+            )
+        if self.block_size < 1:
+            raise ValueError(f"block_size must be >= 1, got {self.block_size}")
+        if self.max_workers is not None and self.max_workers < 1:
+            raise ValueError(f"max_workers must be >= 1, got {self.max_workers}")
+
+    @classmethod
+    def from_preset(cls, preset: str | int, **kwargs: Any) -> PackageOptions:
+        """Create options from a preset name or a bare compression level.
+
+        Args:
+            preset: One of COMPRESSION_PRESETS, or an integer level 0-9
+            **kwargs: Additional PackageOptions fields
+
+        Returns:
+            PackageOptions instance
+
+        Raises:
+            ValueError: If the preset is unknown
+        """
+        if isinstance(preset, int):
+            return cls(compression_level=preset, **kwargs)
+        key = preset.strip().lower()
+        if key.isdigit():
+            return cls(compression_level=int(key), **kwargs)
+        if key not in COMPRESSION_PRESETS:
+            available = ", ".join(COMPRESSION_PRESETS)
+            raise ValueError(
+                f"Unknown compression preset: {preset!r}. Available: {available}"
+            )
+        return cls(compression_level=COMPRESSION_PRESETS[key], **kwargs)
+
+    @property
+    def workers(self) -> int:
+        """Effective thread count for parallel deflate."""
+        return self.max_workers or os.cpu_count() or 1
+
+
+def deflate_parallel(
+    data: bytes,
+    level: int = 6,
+    block_size: int = 1024 * 1024,
+    max_workers: int | None = None,
+) -> bytes:
+    """Deflate data as independently compressed blocks in parallel.
+
+    Each block is compressed on its own thread (zlib releases the GIL) and
+    ends on a sync flush, so the concatenated output is a single valid raw
+    deflate stream, as produced by pigz.
+
+    Args:
+        data: Bytes to compress
+        level: Deflate level 1-9
+        block_size: Bytes per block
+        max_workers: Thread count (None for CPU count)
+
+    Returns:
+        Raw deflate stream (no zlib header), suitable for a zip member
+    """
+    blocks = [data[i : i + block_size] for i in range(0, len(data), block_size)]
+    if not blocks:
+        blocks = [b""]
+    last = len(blocks) - 1
+
+    def compress_block(index: int) -> bytes:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        flush_mode = zlib.Z_FINISH if index == last else zlib.Z_SYNC_FLUSH
+        return compressor.compress(blocks[index]) + compressor.flush(flush_mode)
+
+    if len(blocks) == 1:
+        return compress_block(0)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return b"".join(executor.map(compress_block, range(len(blocks))))
+
+
+def _is_precompressed(name: str) -> bool:
+    """Check whether a member name looks already compressed."""
+    return Path(name).suffix.lower() in PRECOMPRESSED_SUFFIXES
+
+
+class _PackageWriter:
+    """Minimal zip writer for members whose CRC and sizes are known up front.
+
+    zipfile has no public API for adding an already deflated payload, so
+    packages are written directly. Every local header carries the final
+    CRC and sizes (general purpose bit 3 is never set, so no data
+    descriptors follow), which also lets the output be a non-seekable
+    stream.
+    """
+
+    def __init__(self, fp: IO[bytes]) -> None:
+        self._fp = fp
+        self._offset = 0
+        self._central: list[bytes] = []
+
+    def add(
+        self,
+        zinfo: zipfile.ZipInfo,
+        payload: bytes | IO[bytes],
+        compress_type: int,
+        crc: int,
+        size: int,
+    ) -> None:
+        """Write one member.
+
+        Args:
+            zinfo: Member name, timestamp and attributes
+            payload: Member data as stored in the archive, or a seekable
+                file holding it, which is copied from the start
+            compress_type: ZIP_STORED or ZIP_DEFLATED
+            crc: CRC-32 of the uncompressed data
+            size: Uncompressed size
+        """
+        if isinstance(payload, bytes):
+            payload_size = len(payload)
+        else:
+            payload_size = payload.seek(0, os.SEEK_END)
+            payload.seek(0)
+        if max(payload_size, size, self._offset) > _ZIP32_LIMIT:
+            raise zipfile.LargeZipFile(
+                f"Member {zinfo.filename} does not fit a zip package without "
+                "Zip64 extensions, which ODS packages do not use"
+            )
+        name = zinfo.filename.encode("utf-8")
+        flags = 0 if zinfo.filename.isascii() else _UTF8_FLAG
+        dos_time, dos_date = _dos_timestamp(zinfo.date_time)
+        self._central.append(
+            _CENTRAL_HEADER.pack(
+                _CENTRAL_HEADER_SIGNATURE,
+                _ZIP_VERSION,
+                zinfo.create_system,
+                _ZIP_VERSION,
+                0,
+                flags,
+                compress_type,
+                dos_time,
+                dos_date,
+                crc,
+                payload_size,
+                size,
+                len(name),
+                0,
+                0,
+                0,
+                zinfo.internal_attr,
+                zinfo.external_attr,
+                self._offset,
+            )
+            + name
+        )
+        header = _LOCAL_HEADER.pack(
+            _LOCAL_HEADER_SIGNATURE,
+            _ZIP_VERSION,
+            0,
+            flags,
+            compress_type,
+            dos_time,
+            dos_date,
+            crc,
+            payload_size,
+            size,
+            len(name),
+            0,
+        )
+        self._write(header + name)
+        if isinstance(payload, bytes):
+            self._write(payload)
+        else:
+            while block := payload.read(_COPY_BLOCK_SIZE):
+                self._write(block)
+
+    def close(self) -> None:
+        """Write the central directory and end record."""
+        start = self._offset
+        for entry in self._central:
+            self._write(entry)
+        count = len(self._central)
+        if count > 0xFFFF or self._offset > _ZIP32_LIMIT:
+            raise zipfile.LargeZipFile("Too many members for a zip package")
+        self._write(
+            _END_RECORD.pack(
+                _END_RECORD_SIGNATURE,
+                0,
+                0,
+                count,
+                count,
+                self._offset - start,
+                start,
+                0,
+            )
+        )
+
+    def _write(self, data: bytes) -> None:
+        self._fp.write(data)
+        self._offset += len(data)
+
+
+def _dos_timestamp(date_time: tuple[int, int, int, int, int, int]) -> tuple[int, int]:
+    """Pack a ZipInfo date_time into MS-DOS (time, date) fields."""
+    year, month, day, hour, minute, second = date_time
+    if year < 1980:
+        year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+    return (
+        hour << 11 | minute << 5 | second // 2,
+        (year - 1980) << 9 | month << 5 | day,
+    )
+
+
+def write_package(
+    members: Iterable[tuple[zipfile.ZipInfo | str, bytes]],
+    output: Path | str | BinaryIO,
+    options: PackageOptions | None = None,
+    *,
+    raw_members: Iterable[tuple[zipfile.ZipInfo, bytes]] = (),
+    streamed_members: Iterable[tuple[zipfile.ZipInfo | str, Iterable[bytes]]] = (),
+) -> None:
+    """Write ODS members to a zip package using the given options.
+
+    The mimetype member is always written first and stored, as required
+    by the OpenDocument packaging specification.
+
+    Args:
+        members: (ZipInfo or member name, data) pairs
+        output: Output path or binary file object
+        options: Packaging options (defaults to PackageOptions())
+        raw_members: (ZipInfo, raw deflate payload) pairs copied verbatim
+            from another zip; their ZipInfo must carry CRC and sizes. Only
+            the name, timestamp and attributes are reused, so source flags
+            such as data descriptors do not carry over.
+        streamed_members: (ZipInfo or member name, chunks) pairs for
+            members too large to hold in memory. Chunks are deflated
+            serially into a temporary file, then copied into the package.
+    """
+    options = options or PackageOptions()
+    level = options.compression_level
+
+    entries = [
+        (
+            zipfile.ZipInfo(info, date_time=(1980, 1, 1, 0, 0, 0))
+            if isinstance(info, str)
+            else info,
+            data,
+        )
+        for info, data in members
+    ]
+    entries.sort(key=lambda entry: entry[0].filename != MIMETYPE_MEMBER)
+
+    with contextlib.ExitStack() as stack:
+        if isinstance(output, str | Path):
+            output = stack.enter_context(open(output, "wb"))
+        writer = _PackageWriter(output)
+        for zinfo, data in entries:
+            store = (
+                level == 0
+                or zinfo.filename == MIMETYPE_MEMBER
+                or (options.store_precompressed and _is_precompressed(zinfo.filename))
+            )
+            crc = zlib.crc32(data)
+            if store:
+                writer.add(zinfo, data, zipfile.ZIP_STORED, crc, len(data))
+                continue
+            if len(data) >= options.parallel_threshold and options.workers > 1:
+                compressed = deflate_parallel(
+                    data, level, options.block_size, options.workers
+                )
+            else:
+                compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+                compressed = compressor.compress(data) + compressor.flush()
+            writer.add(zinfo, compressed, zipfile.ZIP_DEFLATED, crc, len(data))
+        for info, chunks in streamed_members:
+            if isinstance(info, str):
+                info = zipfile.ZipInfo(info, date_time=(1980, 1, 1, 0, 0, 0))
+            deflate = level > 0 and not (
+                options.store_precompressed and _is_precompressed(info.filename)
+            )
+            with tempfile.TemporaryFile() as spool:
+                crc, size = _spool_member(chunks, spool, level if deflate else None)
+                compress_type = zipfile.ZIP_DEFLATED if deflate else zipfile.ZIP_STORED
+                writer.add(info, spool, compress_type, crc, size)
+        for zinfo, payload in raw_members:
+            writer.add(zinfo, payload, zipfile.ZIP_DEFLATED, zinfo.CRC, zinfo.file_size)
+        writer.close()
+
+
+def _spool_member(
+    chunks: Iterable[bytes], spool: IO[bytes], level: int | None
+) -> tuple[int, int]:
+    """Write chunks to spool, deflated unless level is None.
+
+    Returns:
+        Tuple of (CRC-32, uncompressed size)
+    """
+    crc = size = 0
+    compressor = (
+        None
+        if level is None
+        else zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    )
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+        spool.write(chunk if compressor is None else compressor.compress(chunk))
+    if compressor is not None:
+        spool.write(compressor.flush())
+    return crc, size
+
+
+def document_members(doc: OpenDocument) -> list[tuple[zipfile.ZipInfo, bytes]]:
+    """Serialize an odfpy document into package members.
+
+    Only odfpy's public part serializers (contentxml(), stylesxml(), ...)
+    are used; the manifest is built here with the same layout odfpy's own
+    save() writes. Opaque extra parts that odf.opendocument.load() keeps
+    from foreign packages are not carried over.
+
+    Args:
+        doc: odfpy document (e.g. OpenDocumentSpreadsheet)
+
+    Returns:
+        (ZipInfo, data) pairs, mimetype first and manifest last
+    """
+    from odf import manifest
+    from odf.opendocument import IS_FILENAME
+
+    now = time.localtime()[:6]
+    entries = manifest.Manifest()
+    members: list[tuple[zipfile.ZipInfo, bytes]] = []
+
+    def add(name: str, data: bytes | str, media_type: str | None) -> None:
+        if media_type is not None:
+            entries.addElement(manifest.FileEntry(fullpath=name, mediatype=media_type))
+        zinfo = zipfile.ZipInfo(name, now)
+        zinfo.external_attr = _MEMBER_ATTR
+        members.append((zinfo, data.encode("utf-8") if isinstance(data, str) else data))
+
+    def add_parts(obj: OpenDocument, folder: str) -> None:
+        entries.addElement(
+            manifest.FileEntry(fullpath=folder or "/", mediatype=obj.mimetype)
+        )
+        add(f"{folder}styles.xml", obj.stylesxml(), "text/xml")
+        add(f"{folder}content.xml", obj.contentxml(), "text/xml")
+        if obj.settings.hasChildNodes():
+            add(f"{folder}settings.xml", obj.settingsxml(), "text/xml")
+        if obj is doc:
+            add("meta.xml", obj.metaxml(), "text/xml")
+        for number, child in enumerate(obj.childobjects, start=1):
+            add_parts(child, f"{folder}Object {number}/")
+
+    def add_pictures(obj: OpenDocument, folder: str) -> None:
+        for name, (kind, source, media_type) in obj.Pictures.items():
+            data = Path(source).read_bytes() if kind == IS_FILENAME else source
+            add(f"{folder}{name}", data, media_type)
+        for number, child in enumerate(obj.childobjects, start=1):
+            add_pictures(child, f"{folder}Object {number}/")
+
+    add(MIMETYPE_MEMBER, doc.mimetype, None)
+    add_parts(doc, "")
+    add_pictures(doc, "")
+    if doc.thumbnail is not None:
+        entries.addElement(manifest.FileEntry(fullpath="Thumbnails/", mediatype=""))
+        add("Thumbnails/thumbnail.png", doc.thumbnail, "")
+
+    xml = io.StringIO()
+    xml.write(_XML_PROLOGUE)
+    entries.toXml(0, xml)
+    add(MANIFEST_MEMBER, xml.getvalue(), None)
+    return members
+
+
+def save_document(
+    doc: OpenDocument,
+    output: Path | str | BinaryIO,
+    options: PackageOptions | None = None,
+) -> None:
+    """Save an odfpy document through the packaging layer.
+
+    Args:
+        doc: odfpy document (e.g. OpenDocumentSpreadsheet)
+        output: Output file path or writable binary stream; streams need
+            not be seekable
+        options: Packaging options (defaults to PackageOptions())
+    """
+    write_package(document_members(doc), output, options)
+
+
+def _read_raw_member(fp: IO[bytes], zinfo: zipfile.ZipInfo) -> bytes:
+    """Read a member's compressed payload without decompressing it."""
+    fp.seek(zinfo.header_offset)
+    header = fp.read(_LOCAL_HEADER.size)
+    fields = _LOCAL_HEADER.unpack(header)
+    if fields[0] != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header for member {zinfo.filename}")
+    name_length, extra_length = fields[-2], fields[-1]
+    fp.seek(name_length + extra_length, os.SEEK_CUR)
+    return fp.read(zinfo.compress_size)
+
+
+def repack_ods(
+    source: Path | str,
+    output_path: Path | str | None = None,
+    options: PackageOptions | None = None,
+    *,
+    recompress: bool = True,
+) -> Path:
+    """Rewrite an existing ODS (or any zip) file with new packaging options.
+
+    Args:
+        source: Existing ODS file
+        output_path: Destination path (defaults to rewriting source in place)
+        options: Packaging options (defaults to PackageOptions())
+        recompress: If False, members that are already deflated and would
+            be deflated again are raw-copied without decompressing. Only
+            the store/deflate decision (mimetype, images) is re-applied.
+
+    Returns:
+        Path to the written file
+    """
+    source = Path(source)
+    output_path = Path(output_path) if output_path else source
+    options = options or PackageOptions()
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(source) as zf:
+        if recompress or options.compression_level == 0:
+            write_package(
+                [(info, zf.read(info)) for info in zf.infolist()], buffer, options
+            )
+        else:
+            raw_members: list[tuple[zipfile.ZipInfo, bytes]] = []
+            members: list[tuple[zipfile.ZipInfo, bytes]] = []
+            for info in zf.infolist():
+                keep_raw = (
+                    info.compress_type == zipfile.ZIP_DEFLATED
+                    and info.filename != MIMETYPE_MEMBER
+                    and not (
+                        options.store_precompressed and _is_precompressed(info.filename)
+                    )
+                )
+                if keep_raw:
+                    assert zf.fp is not None
+                    raw_members.append((info, _read_raw_member(zf.fp, info)))
+                else:
+                    members.append((info, zf.read(info)))
+            write_package(members, buffer, options, raw_members=raw_members)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_bytes(buffer.getvalue())
+    return output_path
+
+
+def is_zip_container(file_path: Path | str) -> bool:
+    """Check whether a file is a zip container (ODS, XLSX, ...).
+
+    Args:
+        file_path: File to check
+
+    Returns:
+        True if the file starts with a zip local file header
+    """
+    with open(file_path, "rb") as f:
+        return f.read(4) == b"PK\x03\x04"
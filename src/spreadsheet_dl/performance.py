@@ -5,6 +5,8 @@
     - Lazy loading for expensive operations
     - Batch processing for bulk operations
     - Performance benchmarking utilities
+    - Phase timing (load/save split) for instrumented callers
+    - Compiled on-disk cache for objects built from source files
 """
 
 from __future__ import annotations
@@ -12,17 +14,21 @@
 import functools
 import hashlib
 import json
+import os
+import pickle
 import threading
 import time
 import weakref
 from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterator
+    from collections.abc import Callable, Iterator, Sequence
 
 T = TypeVar("T")
 K = TypeVar("K")
@@ -641,6 +647,74 @@ def wrapper(*args: Any, **kwargs: Any) -> T:
     return wrapper
 
 
+# =============================================================================
+# Phase Timing
+# =============================================================================
+
+_PHASES: ContextVar[dict[str, float] | None] = ContextVar(
+    "spreadsheet_dl_phases", default=None
+)
+
+
+class _PhaseRecording:
+    """Context manager returned by record_phases()."""
+
+    __slots__ = ("_token", "totals")
+
+    def __init__(self) -> None:
+        self.totals: dict[str, float] = {}
+        self._token: Token[dict[str, float] | None] | None = None
+
+    def __enter__(self) -> dict[str, float]:
+        self._token = _PHASES.set(self.totals)
+        return self.totals
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._token is not None:
+            _PHASES.reset(self._token)
+
+
+def record_phases() -> _PhaseRecording:
+    """Collect the time spent in phase() blocks while the context is active.
+
+    Used by the MCP server to split a tool call into file load, operation
+    and save time without threading a timer through every handler. A plain
+    class rather than a generator keeps the per-call cost low.
+
+    Returns:
+        Context manager yielding a mapping of phase name to accumulated
+        seconds, filled in as the phases complete.
+
+    Example:
+        >>> with record_phases() as phases:
+        ...     with phase("load"):
+        ...         pass
+        >>> list(phases)
+        ['load']
+    """
+    return _PhaseRecording()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Attribute the enclosed block to a named phase (e.g. ``load``, ``save``).
+
+    A no-op unless a record_phases() context is active.
+
+    Args:
+        name: Phase name.
+    """
+    totals = _PHASES.get()
+    if totals is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        totals[name] = totals.get(name, 0.0) + time.perf_counter() - start
+
+
 # =============================================================================
 # File-based Caching
 # =============================================================================
@@ -742,6 +816,170 @@ def cleanup_expired(self) -> int:
         return count
 
 
+# Environment variable naming the compiled cache directory
+CACHE_DIR_ENV = "SPREADSHEET_DL_CACHE_DIR"
+
+# Bumped whenever the compiled entry layout changes
+_COMPILED_FORMAT = 1
+
+
+class CompiledCache:
+    """On-disk cache of objects compiled from source files.
+
+    Stores pickled results of expensive parse/validate/resolve steps (e.g.
+    themes and templates loaded from YAML) so that new processes can skip
+    them. Each entry records the files it was built from; it is used
+    while every file keeps its size and modification time, or, if only
+    the modification time changed, its SHA-256 content hash.
+
+    Entries are unpickled, so the namespace directory is created with
+    mode 0o700, and on POSIX systems a directory or entry that is not
+    owned by the current user, or is writable by group or others, is
+    ignored: reads miss and nothing is written.
+
+    Example:
+        cache = CompiledCache("~/.cache/spreadsheet-dl", "themes")
+        theme = cache.get("corporate")
+        if theme is None:
+            theme = parse(path)
+            cache.set("corporate", theme, [path])
+    """
+
+    def __init__(self, cache_dir: Path | str, namespace: str) -> None:
+        """Initialize compiled cache.
+
+        Args:
+            cache_dir: Root cache directory
+            namespace: Subdirectory separating kinds of compiled objects
+        """
+        from spreadsheet_dl._version import __version__
+
+        self._dir = Path(cache_dir).expanduser() / namespace
+        self._version = __version__
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the compiled value for key if its sources are unchanged.
+
+        Args:
+            key: Cache key (e.g. the resolved source path)
+            default: Returned when there is no valid entry
+
+        Returns:
+            Cached value, or default
+        """
+        path = self._get_path(key)
+        try:
+            if not _is_private(os.stat(self._dir)):
+                return default
+            with path.open("rb") as f:
+                if not _is_private(os.fstat(f.fileno())):
+                    return default
+                entry = pickle.load(f)
+            fmt, version, stored_key, sources, value = entry
+        except Exception:
+            # Missing, truncated or written by an incompatible version
+            return default
+        if (fmt, version, stored_key) != (_COMPILED_FORMAT, self._version, key):
+            return default
+
+        refreshed = []
+        for source, mtime_ns, size, digest in sources:
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return default
+            if (stat.st_mtime_ns, stat.st_size) != (mtime_ns, size) and (
+                stat.st_size != size or _file_digest(Path(source)) != digest
+            ):
+                return default
+            refreshed.append((source, stat.st_mtime_ns, stat.st_size, digest))
+
+        if refreshed != sources:
+            # Touched but unchanged: record the new times to skip hashing
+            self._write(path, (fmt, version, key, refreshed, value))
+        return value
+
+    def set(self, key: str, value: Any, sources: Sequence[Path | str]) -> None:
+        """Store a compiled value built from the given source files.
+
+        Failures (unpicklable values, read-only directory) are ignored;
+        the value is simply not cached.
+
+        Args:
+            key: Cache key
+            value: Compiled object
+            sources: Files the value was built from
+        """
+        records = []
+        for source in sources:
+            try:
+                stat = os.stat(source)
+                digest = _file_digest(Path(source))
+            except OSError:
+                return
+            records.append((str(source), stat.st_mtime_ns, stat.st_size, digest))
+        entry = (_COMPILED_FORMAT, self._version, key, records, value)
+        self._write(self._get_path(key), entry)
+
+    def clear(self) -> int:
+        """Clear all compiled entries. Returns count of deleted entries."""
+        count = 0
+        for path in self._dir.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+            count += 1
+        return count
+
+    def _get_path(self, key: str) -> Path:
+        """Get entry file path for key."""
+        key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self._dir / f"{key_hash}.pickle"
+
+    def _write(self, path: Path, entry: tuple[Any, ...]) -> None:
+        """Atomically replace an entry file."""
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not _is_private(os.stat(path.parent)):
+                return
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+
+
+def get_compiled_cache(
+    namespace: str, cache_dir: Path | str | None = None
+) -> CompiledCache | None:
+    """Get a compiled cache, or None when no cache directory is configured.
+
+    Args:
+        namespace: Kind of compiled objects (e.g. "themes")
+        cache_dir: Cache directory; defaults to $SPREADSHEET_DL_CACHE_DIR
+
+    Returns:
+        CompiledCache, or None if caching is disabled
+    """
+    cache_dir = cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    return CompiledCache(cache_dir, namespace)
+
+
+def _is_private(stat: os.stat_result) -> bool:
+    """Whether a cache file or directory can only be changed by this user."""
+    if os.name != "posix":
+        return True
+    return stat.st_uid == os.getuid() and not stat.st_mode & 0o022
+
+
+def _file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 # =============================================================================
 # Global Cache Instance
 # =============================================================================
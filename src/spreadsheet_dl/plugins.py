@@ -8,18 +8,28 @@
     - PluginHook: Event-based hook system for callbacks
     - PluginLoader: Discovery and loading of plugins from directories
     - PluginManager: Lifecycle management (register, enable, disable, list)
+
+Discovery is backed by a per-directory manifest index (``.plugin-index.json``)
+keyed by file mtime, size and SHA-256. Plugin modules are only executed when
+a file is new or has changed, or when a plugin is enabled.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
 import importlib.util
+import json
+import os
 import sys
 from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from types import ModuleType
 
 
 class PluginInterface(ABC):
@@ -180,33 +190,54 @@ def discover_plugins(plugin_dir: Path) -> list[type[PluginInterface]]:
         if not plugin_dir.exists():
             return plugins
 
-        for py_file in plugin_dir.glob("*.py"):
-            if py_file.stem.startswith("_"):
-                continue  # Skip private modules
-
+        for py_file in PluginLoader._plugin_files(plugin_dir):
             try:
-                # Load module
-                spec = importlib.util.spec_from_file_location(py_file.stem, py_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[py_file.stem] = module
-                    spec.loader.exec_module(module)
-
-                    # Find plugin classes
-                    for name in dir(module):
-                        obj = getattr(module, name)
-                        if (
-                            isinstance(obj, type)
-                            and issubclass(obj, PluginInterface)
-                            and obj is not PluginInterface
-                        ):
-                            plugins.append(obj)
+                module = PluginLoader._load_module(py_file)
+                plugins.extend(PluginLoader._plugin_classes(module))
             except Exception as e:
                 # Intentionally broad: plugin modules can have any import/execution errors
                 print(f"Failed to load plugin {py_file}: {e}", file=sys.stderr)
 
         return plugins
 
+    @staticmethod
+    def _plugin_files(plugin_dir: Path) -> list[Path]:
+        """List candidate plugin files, skipping private modules."""
+        return sorted(
+            py_file
+            for py_file in plugin_dir.glob("*.py")
+            if not py_file.stem.startswith("_")
+        )
+
+    @staticmethod
+    def _load_module(py_file: Path) -> ModuleType:
+        """Execute a plugin file and register it in ``sys.modules``.
+
+        Raises:
+            ImportError: If no module spec can be created for the file
+        """
+        spec = importlib.util.spec_from_file_location(py_file.stem, py_file)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load module from {py_file}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[py_file.stem] = module
+        spec.loader.exec_module(module)
+        return module
+
+    @staticmethod
+    def _plugin_classes(module: ModuleType) -> list[type[PluginInterface]]:
+        """Find PluginInterface subclasses defined in or imported by a module."""
+        classes: list[type[PluginInterface]] = []
+        for name in dir(module):
+            obj = getattr(module, name)
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, PluginInterface)
+                and obj is not PluginInterface
+            ):
+                classes.append(obj)
+        return classes
+
     @staticmethod
     def load_plugin(
         plugin_class: type[PluginInterface], config: dict[str, Any] | None = None
@@ -227,12 +258,197 @@ def load_plugin(
         return plugin
 
 
+@dataclass(frozen=True)
+class PluginManifestEntry:
+    """Plugin metadata recorded in a manifest index.
+
+    Holds everything needed to list a plugin without importing it. The
+    ``entry_point`` (``"module:Class"``) is resolved only when the plugin
+    is loaded.
+
+    Attributes:
+        name: Plugin name
+        version: Plugin version
+        description: Plugin description
+        author: Plugin author
+        entry_point: ``"module:Class"`` reference within the plugin file
+        path: Plugin source file
+    """
+
+    name: str
+    version: str
+    description: str
+    author: str
+    entry_point: str
+    path: Path
+
+    def load(self) -> type[PluginInterface]:
+        """Import the plugin module and return the plugin class.
+
+        Reuses the module already in ``sys.modules`` when it was executed
+        from the same file (e.g. during an index refresh in this process).
+
+        Returns:
+            Plugin class referenced by the entry point
+
+        Raises:
+            ImportError: If the module cannot be loaded or the class is
+                missing or does not implement PluginInterface
+        """
+        module_name, _, class_name = self.entry_point.partition(":")
+        module = sys.modules.get(module_name)
+        module_file = getattr(module, "__file__", None)
+        if module is None or module_file is None or Path(module_file) != self.path:
+            module = PluginLoader._load_module(self.path)
+
+        plugin_class = getattr(module, class_name, None)
+        if not (
+            isinstance(plugin_class, type) and issubclass(plugin_class, PluginInterface)
+        ):
+            raise ImportError(
+                f"Entry point {self.entry_point} in {self.path} is not a plugin class"
+            )
+        return plugin_class
+
+
+class PluginIndex:
+    """Manifest index of the plugins in one directory.
+
+    The index is stored as ``.plugin-index.json`` inside the plugin
+    directory and records, per file, its mtime, size and SHA-256 together
+    with the metadata of the plugins it defines. Refreshing the index only
+    stats unchanged files; a file is hashed when its stat changes and
+    executed only when its content changes.
+
+    Examples:
+        >>> import tempfile
+        >>> with tempfile.TemporaryDirectory() as tmp:
+        ...     PluginIndex(Path(tmp)).entries()
+        []
+    """
+
+    INDEX_FILENAME = ".plugin-index.json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, plugin_dir: Path, index_path: Path | None = None) -> None:
+        """Initialize the index.
+
+        Args:
+            plugin_dir: Directory containing plugin files
+            index_path: Location of the index file. Defaults to
+                ``.plugin-index.json`` inside ``plugin_dir``.
+        """
+        self.plugin_dir = plugin_dir
+        self.index_path = index_path or plugin_dir / self.INDEX_FILENAME
+
+    def entries(self) -> list[PluginManifestEntry]:
+        """Return manifest entries for all plugins, refreshing stale files.
+
+        Files that fail to import are reported on stderr and left out of
+        the index so they are retried on the next refresh. The index file
+        is rewritten only when something changed; an unwritable directory
+        simply disables caching.
+
+        Returns:
+            Manifest entries ordered by file name
+        """
+        if not self.plugin_dir.is_dir():
+            return []
+
+        cached = self._read()
+        files: dict[str, dict[str, Any]] = {}
+        for py_file in PluginLoader._plugin_files(self.plugin_dir):
+            try:
+                record = self._refresh(py_file, cached.get(py_file.name))
+            except Exception as e:
+                # Intentionally broad: plugin modules can have any import/execution errors
+                print(f"Failed to load plugin {py_file}: {e}", file=sys.stderr)
+                continue
+            files[py_file.name] = record
+
+        if files != cached:
+            self._write(files)
+
+        return [
+            PluginManifestEntry(path=self.plugin_dir / filename, **plugin)
+            for filename, record in files.items()
+            for plugin in record["plugins"]
+        ]
+
+    def _refresh(self, py_file: Path, record: dict[str, Any] | None) -> dict[str, Any]:
+        """Return an up-to-date index record for a single file."""
+        stat = py_file.stat()
+        if (
+            record is not None
+            and record.get("mtime_ns") == stat.st_mtime_ns
+            and record.get("size") == stat.st_size
+        ):
+            return record
+
+        digest = hashlib.sha256(py_file.read_bytes()).hexdigest()
+        if record is not None and record.get("sha256") == digest:
+            plugins = record["plugins"]
+        else:
+            plugins = self._scan(py_file)
+        return {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "plugins": plugins,
+        }
+
+    @staticmethod
+    def _scan(py_file: Path) -> list[dict[str, str]]:
+        """Execute a plugin file and collect metadata for its plugins."""
+        module = PluginLoader._load_module(py_file)
+        plugins = []
+        for plugin_class in PluginLoader._plugin_classes(module):
+            plugin = plugin_class()
+            entry = PluginManifestEntry(
+                name=plugin.name,
+                version=plugin.version,
+                description=plugin.description,
+                author=plugin.author,
+                entry_point=f"{py_file.stem}:{plugin_class.__name__}",
+                path=py_file,
+            )
+            metadata = asdict(entry)
+            del metadata["path"]
+            plugins.append(metadata)
+        return plugins
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        """Load cached file records, ignoring missing or incompatible indexes."""
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.FORMAT_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def _write(self, files: dict[str, dict[str, Any]]) -> None:
+        """Atomically persist file records; failures leave caching disabled."""
+        payload = {"version": self.FORMAT_VERSION, "files": files}
+        temp_path = self.index_path.with_name(f"{self.index_path.name}.tmp")
+        try:
+            temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                temp_path.unlink(missing_ok=True)
+
+
 class PluginManager:
     """Manages plugin lifecycle (register, enable, disable, list).
 
     Central manager for plugin operations. Discovers plugins from configured
     directories, tracks enabled/disabled state, and provides access to the
     hook system.
+
+    Discovery only reads each directory's PluginIndex; plugin modules are
+    imported the first time a plugin is enabled or requested.
     """
 
     def __init__(self, plugin_dirs: list[Path] | None = None) -> None:
@@ -243,6 +459,7 @@ def __init__(self, plugin_dirs: list[Path] | None = None) -> None:
                 If None, uses default directories.
         """
         self._plugins: dict[str, PluginInterface] = {}
+        self._manifest: dict[str, PluginManifestEntry] = {}
         self._enabled: set[str] = set()
         self._hooks = PluginHook()
 
@@ -257,32 +474,32 @@ def __init__(self, plugin_dirs: list[Path] | None = None) -> None:
     def discover(self) -> None:
         """Discover all available plugins.
 
-        Scans plugin directories and registers discovered plugins.
-        Does not enable plugins automatically.
+        Reads the manifest index of each plugin directory and registers
+        the plugins it lists without importing them. Does not enable
+        plugins automatically.
         """
         for plugin_dir in self._plugin_dirs:
-            plugin_classes = PluginLoader.discover_plugins(plugin_dir)
-            for plugin_class in plugin_classes:
-                plugin = plugin_class()
-                self._plugins[plugin.name] = plugin
+            for entry in PluginIndex(plugin_dir).entries():
+                self._manifest[entry.name] = entry
 
     def enable(self, name: str, config: dict[str, Any] | None = None) -> None:
         """Enable a plugin.
 
-        Initializes and enables a previously discovered plugin.
+        Initializes and enables a previously discovered plugin, importing
+        its module first if it has not been loaded yet.
 
         Args:
             name: Plugin name
             config: Plugin configuration dictionary
 
         Raises:
-            ValueError: If plugin not found
+            ValueError: If plugin not found or cannot be loaded
         """
-        if name not in self._plugins:
+        plugin = self.get_plugin(name)
+        if plugin is None:
             raise ValueError(f"Plugin not found: {name}")
 
         if name not in self._enabled:
-            plugin = self._plugins[name]
             plugin.initialize(config)
             self._enabled.add(name)
 
@@ -309,15 +526,18 @@ def list_plugins(self, enabled_only: bool = False) -> list[dict[str, Any]]:
             List of plugin metadata dictionaries
         """
         result = []
-        for name, plugin in self._plugins.items():
+        for name in {**self._manifest, **self._plugins}:
             if enabled_only and name not in self._enabled:
                 continue
+            info: PluginInterface | PluginManifestEntry = (
+                self._plugins.get(name) or self._manifest[name]
+            )
             result.append(
                 {
                     "name": name,
-                    "version": plugin.version,
-                    "description": plugin.description,
-                    "author": plugin.author,
+                    "version": info.version,
+                    "description": info.description,
+                    "author": info.author,
                     "enabled": name in self._enabled,
                 }
             )
@@ -326,13 +546,34 @@ def list_plugins(self, enabled_only: bool = False) -> list[dict[str, Any]]:
     def get_plugin(self, name: str) -> PluginInterface | None:
         """Get plugin instance by name.
 
+        Discovered plugins are imported and instantiated on first access.
+
         Args:
             name: Plugin name
 
         Returns:
             Plugin instance or None if not found
+
+        Raises:
+            ValueError: If a discovered plugin cannot be loaded
         """
-        return self._plugins.get(name)
+        plugin = self._plugins.get(name)
+        if plugin is None and name in self._manifest:
+            plugin = self._load(self._manifest[name])
+        return plugin
+
+    def _load(self, entry: PluginManifestEntry) -> PluginInterface:
+        """Import and instantiate a plugin from its manifest entry."""
+        try:
+            plugin = entry.load()()
+        except Exception as e:
+            # Intentionally broad: plugin modules can have any import/execution errors
+            raise ValueError(
+                f"Failed to load plugin {entry.name} from {entry.path}: {e}. "
+                "Fix: Run 'spreadsheet-dl plugin list' to refresh the plugin index."
+            ) from e
+        self._plugins[entry.name] = plugin
+        return plugin
 
     @property
     def hooks(self) -> PluginHook:
@@ -0,0 +1,1581 @@
+"""SQL-like queries over spreadsheet sheets.
+
+Backs ``OdsEditor.query_data``, ``OdsEditor.find_rows`` and the MCP
+``query_select``/``query_find`` tools. The first row of a sheet is the
+header; columns are referenced by header name (quote names containing
+spaces) or by column letter::
+
+    SELECT Category, SUM(Amount) AS total
+    WHERE Amount > 10 AND Status IN ('open', 'done')
+    GROUP BY Category
+    ORDER BY total DESC
+    LIMIT 5
+
+Queries are parsed once and their WHERE clause is compiled to a NumPy
+mask function. A sheet is scanned in a single streaming pass that only
+expands the columns the query references; the predicate runs over
+columnar batches and the remaining projected cells are decoded only for
+rows that matched. :func:`query_file` caches results per file
+modification time.
+"""
+
+from __future__ import annotations
+
+import functools
+import itertools
+import operator
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+from spreadsheet_dl.exceptions import (
+    InvalidQueryError,
+    OdsReadError,
+    SheetNotFoundError,
+)
+from spreadsheet_dl.performance import LRUCache
+from spreadsheet_dl.streaming import ODF_NS, check_zip_bomb
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+
+    from odf.table import Table
+
+# Rows evaluated per predicate batch
+_BATCH_SIZE = 4096
+
+# content.xml bytes fed to the pull parser per read
+_CHUNK_SIZE = 1 << 16
+
+# Upper bound on header width when expanding repeated header cells
+_MAX_COLUMNS = 16384
+
+_AGGREGATES = frozenset({"COUNT", "SUM", "AVG", "MIN", "MAX"})
+
+_KEYWORDS = frozenset(
+    {
+        "SELECT",
+        "FROM",
+        "WHERE",
+        "GROUP",
+        "BY",
+        "ORDER",
+        "ASC",
+        "DESC",
+        "LIMIT",
+        "OFFSET",
+        "AND",
+        "OR",
+        "NOT",
+        "IN",
+        "LIKE",
+        "IS",
+        "NULL",
+        "BETWEEN",
+        "AS",
+        "TRUE",
+        "FALSE",
+    }
+)
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_CRITERIA_OPERATORS = {
+    "$eq": "=",
+    "$ne": "!=",
+    "$lt": "<",
+    "$lte": "<=",
+    "$gt": ">",
+    "$gte": ">=",
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<string>'(?:[^']|'')*')
+      | (?P<quoted>"(?:[^"]|"")*"|`[^`]*`|\[[^\]]*\])
+      | (?P<op><=|>=|<>|!=|==|=|<|>|,|\(|\)|\*|-)
+      | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    )
+    """,
+    re.VERBOSE,
+)
+
+_COLUMN_LETTERS_RE = re.compile(r"[A-Z]{1,3}")
+
+# Start of the root element; anything before it is the XML prolog
+_ROOT_TAG_RE = re.compile(rb"<[A-Za-z_]")
+
+_TABLE_NS = ODF_NS["table"]
+_OFFICE_NS = ODF_NS["office"]
+_TEXT_NS = ODF_NS["text"]
+
+_ET_TABLE = f"{{{_TABLE_NS}}}table"
+_ET_TABLE_NAME = f"{{{_TABLE_NS}}}name"
+_ET_ROW = f"{{{_TABLE_NS}}}table-row"
+_ET_ROWS_REPEATED = f"{{{_TABLE_NS}}}number-rows-repeated"
+_ET_COLUMNS_REPEATED = f"{{{_TABLE_NS}}}number-columns-repeated"
+_ET_VALUE_TYPE = f"{{{_OFFICE_NS}}}value-type"
+_ET_VALUE = f"{{{_OFFICE_NS}}}value"
+_ET_DATE_VALUE = f"{{{_OFFICE_NS}}}date-value"
+_ET_BOOLEAN_VALUE = f"{{{_OFFICE_NS}}}boolean-value"
+_ET_STRING_VALUE = f"{{{_OFFICE_NS}}}string-value"
+_ET_P = f"{{{_TEXT_NS}}}p"
+
+_ODF_CELLS = frozenset({(_TABLE_NS, "table-cell"), (_TABLE_NS, "covered-table-cell")})
+_ODF_ROWS_REPEATED = (_TABLE_NS, "number-rows-repeated")
+_ODF_COLUMNS_REPEATED = (_TABLE_NS, "number-columns-repeated")
+_ODF_VALUE_TYPE = (_OFFICE_NS, "value-type")
+_ODF_VALUE = (_OFFICE_NS, "value")
+_ODF_DATE_VALUE = (_OFFICE_NS, "date-value")
+_ODF_BOOLEAN_VALUE = (_OFFICE_NS, "boolean-value")
+_ODF_STRING_VALUE = (_OFFICE_NS, "string-value")
+_ODF_P = (_TEXT_NS, "p")
+
+_NUMERIC_TYPES = frozenset({"float", "currency", "percentage"})
+
+_NAN = float("nan")
+
+
+# =============================================================================
+# Query model
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class SelectItem:
+    """One entry of a SELECT list.
+
+    Attributes:
+        column: Column reference, or ``"*"`` for all columns / ``COUNT(*)``.
+        func: Aggregate function name (COUNT, SUM, AVG, MIN, MAX) or None.
+        alias: Output name given with ``AS``.
+    """
+
+    column: str
+    func: str | None = None
+    alias: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Key used for this item in result rows."""
+        if self.alias:
+            return self.alias
+        return f"{self.func}({self.column})" if self.func else self.column
+
+
+@dataclass(frozen=True)
+class OrderItem:
+    """One ORDER BY key: a column, select label or alias."""
+
+    name: str
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class _ColumnRef:
+    name: str
+
+
+@dataclass(frozen=True)
+class _Literal:
+    value: Any
+
+
+@dataclass(frozen=True)
+class _Compare:
+    left: _ColumnRef | _Literal
+    op: str
+    right: _ColumnRef | _Literal
+
+
+@dataclass(frozen=True)
+class _In:
+    column: _ColumnRef
+    values: tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class _Like:
+    column: _ColumnRef
+    pattern: str
+
+
+@dataclass(frozen=True)
+class _IsNull:
+    column: _ColumnRef
+
+
+@dataclass(frozen=True)
+class _Not:
+    operand: _Node
+
+
+@dataclass(frozen=True)
+class _And:
+    left: _Node
+    right: _Node
+
+
+@dataclass(frozen=True)
+class _Or:
+    left: _Node
+    right: _Node
+
+
+type _Node = _Compare | _In | _Like | _IsNull | _Not | _And | _Or
+
+
+@dataclass(frozen=True)
+class Query:
+    """A parsed sheet query.
+
+    Attributes:
+        text: Original query text.
+        select: Items of the SELECT list (``*`` when omitted).
+        where: Parsed WHERE clause, or None.
+        group_by: GROUP BY column references.
+        order_by: ORDER BY keys.
+        limit: Maximum number of result rows, or None.
+        offset: Result rows to skip before applying the limit.
+    """
+
+    text: str
+    select: tuple[SelectItem, ...] = (SelectItem("*"),)
+    where: _Node | None = None
+    group_by: tuple[str, ...] = ()
+    order_by: tuple[OrderItem, ...] = ()
+    limit: int | None = None
+    offset: int = 0
+
+    @property
+    def is_aggregate(self) -> bool:
+        """Whether the query produces one row per group."""
+        return bool(self.group_by) or any(item.func for item in self.select)
+
+
+# =============================================================================
+# Parser
+# =============================================================================
+
+
+def _tokenize(text: str) -> list[tuple[str, str]]:
+    """Split query text into ``(kind, value)`` tokens."""
+    tokens: list[tuple[str, str]] = []
+    pos = 0
+    end = len(text.rstrip())
+    while pos < end:
+        match = _TOKEN_RE.match(text, pos)
+        if match is None or match.lastgroup is None:
+            raise InvalidQueryError(
+                text, f"unexpected character {text[pos:].strip()[:1]!r}"
+            )
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for the query grammar."""
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def error(self, reason: str) -> InvalidQueryError:
+        return InvalidQueryError(self.text, reason)
+
+    def peek(self, offset: int = 0) -> tuple[str, str] | None:
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else None
+
+    def describe_next(self) -> str:
+        token = self.peek()
+        return "end of query" if token is None else repr(token[1])
+
+    def keyword(self, *words: str) -> str | None:
+        token = self.peek()
+        if token is not None and token[0] == "word" and token[1].upper() in words:
+            self.pos += 1
+            return token[1].upper()
+        return None
+
+    def expect_keyword(self, word: str) -> None:
+        if self.keyword(word) is None:
+            raise self.error(f"expected {word} but found {self.describe_next()}")
+
+    def op(self, *ops: str) -> str | None:
+        token = self.peek()
+        if token is not None and token[0] == "op" and token[1] in ops:
+            self.pos += 1
+            return token[1]
+        return None
+
+    def expect_op(self, op: str) -> None:
+        if self.op(op) is None:
+            raise self.error(f"expected '{op}' but found {self.describe_next()}")
+
+    def parse(self) -> Query:
+        select: tuple[SelectItem, ...] = (SelectItem("*"),)
+        if self.keyword("SELECT"):
+            select = self.select_list()
+        if self.keyword("FROM"):
+            # The sheet is chosen by the caller; FROM is accepted for familiarity
+            self.identifier()
+        where = self.expression() if self.keyword("WHERE") else None
+        group_by: tuple[str, ...] = ()
+        if self.keyword("GROUP"):
+            self.expect_keyword("BY")
+            group_by = self.identifier_list()
+        order_by: tuple[OrderItem, ...] = ()
+        if self.keyword("ORDER"):
+            self.expect_keyword("BY")
+            order_by = self.order_list()
+        limit = self.integer() if self.keyword("LIMIT") else None
+        offset = self.integer() if self.keyword("OFFSET") else 0
+        if self.peek() is not None:
+            raise self.error(f"unexpected {self.describe_next()}")
+        return Query(
+            text=self.text.strip(),
+            select=select,
+            where=where,
+            group_by=group_by,
+            order_by=order_by,
+            limit=limit,
+            offset=offset,
+        )
+
+    def select_list(self) -> tuple[SelectItem, ...]:
+        items = [self.select_item()]
+        while self.op(","):
+            items.append(self.select_item())
+        return tuple(items)
+
+    def select_item(self) -> SelectItem:
+        if self.op("*"):
+            return SelectItem("*")
+        token = self.peek()
+        following = self.peek(1)
+        func: str | None = None
+        if (
+            token is not None
+            and token[0] == "word"
+            and token[1].upper() in _AGGREGATES
+            and following == ("op", "(")
+        ):
+            func = token[1].upper()
+            self.pos += 2
+            column = "*" if self.op("*") else self.identifier()
+            if column == "*" and func != "COUNT":
+                raise self.error(f"{func}(*) is not supported; name a column")
+            self.expect_op(")")
+        else:
+            column = self.identifier()
+        alias: str | None = None
+        if self.keyword("AS") or self.at_identifier():
+            alias = self.identifier()
+        return SelectItem(column, func, alias)
+
+    def at_identifier(self) -> bool:
+        token = self.peek()
+        if token is None:
+            return False
+        return token[0] == "quoted" or (
+            token[0] == "word" and token[1].upper() not in _KEYWORDS
+        )
+
+    def identifier(self) -> str:
+        token = self.peek()
+        if not self.at_identifier() or token is None:
+            raise self.error(f"expected a column name but found {self.describe_next()}")
+        self.pos += 1
+        kind, value = token
+        if kind == "quoted":
+            if value[0] == '"':
+                return value[1:-1].replace('""', '"')
+            return value[1:-1]
+        return value
+
+    def identifier_list(self) -> tuple[str, ...]:
+        names = [self.identifier()]
+        while self.op(","):
+            names.append(self.identifier())
+        return tuple(names)
+
+    def order_list(self) -> tuple[OrderItem, ...]:
+        items = []
+        while True:
+            token = self.peek()
+            if (
+                token is not None
+                and token[0] == "word"
+                and token[1].upper() in _AGGREGATES
+                and self.peek(1) == ("op", "(")
+            ):
+                # ORDER BY SUM(Amount) refers to the select item's label
+                item = self.select_item()
+                name = SelectItem(item.column, item.func).label
+            else:
+                name = self.identifier()
+            descending = self.keyword("ASC", "DESC") == "DESC"
+            items.append(OrderItem(name, descending))
+            if not self.op(","):
+                return tuple(items)
+
+    def integer(self) -> int:
+        token = self.peek()
+        if token is None or token[0] != "number" or not token[1].isdigit():
+            raise self.error(
+                f"expected a non-negative integer but found {self.describe_next()}"
+            )
+        self.pos += 1
+        return int(token[1])
+
+    def expression(self) -> _Node:
+        node = self.conjunction()
+        while self.keyword("OR"):
+            node = _Or(node, self.conjunction())
+        return node
+
+    def conjunction(self) -> _Node:
+        node = self.negation()
+        while self.keyword("AND"):
+            node = _And(node, self.negation())
+        return node
+
+    def negation(self) -> _Node:
+        if self.keyword("NOT"):
+            return _Not(self.negation())
+        return self.predicate()
+
+    def predicate(self) -> _Node:
+        if self.op("("):
+            grouped = self.expression()
+            self.expect_op(")")
+            return grouped
+
+        left = self.operand()
+        negate = self.keyword("NOT") is not None
+        if self.keyword("IN"):
+            column = self.column_operand(left, "IN")
+            self.expect_op("(")
+            values = [self.literal()]
+            while self.op(","):
+                values.append(self.literal())
+            self.expect_op(")")
+            node: _Node = _In(column, tuple(values))
+        elif self.keyword("LIKE"):
+            column = self.column_operand(left, "LIKE")
+            pattern = self.literal()
+            if not isinstance(pattern, str):
+                raise self.error("LIKE needs a quoted pattern such as 'Food%'")
+            node = _Like(column, pattern)
+        elif self.keyword("BETWEEN"):
+            column = self.column_operand(left, "BETWEEN")
+            low = _Literal(self.literal())
+            self.expect_keyword("AND")
+            high = _Literal(self.literal())
+            node = _And(_Compare(column, ">=", low), _Compare(column, "<=", high))
+        elif not negate and self.keyword("IS"):
+            column = self.column_operand(left, "IS NULL")
+            is_not = self.keyword("NOT") is not None
+            self.expect_keyword("NULL")
+            node = _Not(_IsNull(column)) if is_not else _IsNull(column)
+        else:
+            if negate:
+                raise self.error(
+                    f"expected IN, LIKE or BETWEEN after NOT but found "
+                    f"{self.describe_next()}"
+                )
+            op = self.op(*_COMPARISONS)
+            if op is None:
+                raise self.error(
+                    f"expected a comparison operator but found {self.describe_next()}"
+                )
+            right = self.operand()
+            if isinstance(left, _Literal) and isinstance(right, _Literal):
+                raise self.error("a comparison needs at least one column")
+            if isinstance(right, _Literal) and right.value is None:
+                raise self.error("compare with NULL using IS NULL or IS NOT NULL")
+            node = _Compare(left, op, right)
+        return _Not(node) if negate else node
+
+    def column_operand(self, operand: _ColumnRef | _Literal, what: str) -> _ColumnRef:
+        if not isinstance(operand, _ColumnRef):
+            raise self.error(f"{what} must follow a column name")
+        return operand
+
+    def operand(self) -> _ColumnRef | _Literal:
+        if self.at_identifier():
+            return _ColumnRef(self.identifier())
+        return _Literal(self.literal())
+
+    def literal(self) -> Any:
+        sign = -1.0 if self.op("-") else 1.0
+        token = self.peek()
+        if token is not None and token[0] == "number":
+            self.pos += 1
+            return sign * float(token[1])
+        if sign < 0:
+            raise self.error(f"expected a number but found {self.describe_next()}")
+        if token is not None and token[0] == "string":
+            self.pos += 1
+            return token[1][1:-1].replace("''", "'")
+        word = self.keyword("TRUE", "FALSE", "NULL")
+        if word is not None:
+            return None if word == "NULL" else word == "TRUE"
+        raise self.error(f"expected a value but found {self.describe_next()}")
+
+
+@functools.lru_cache(maxsize=256)
+def parse_query(text: str) -> Query:
+    """Parse query text into a :class:`Query`.
+
+    Text without a SELECT clause (including the empty string) selects
+    every column, so ``"WHERE Amount > 10"`` is a valid query.
+
+    Args:
+        text: Query text.
+
+    Returns:
+        Parsed query. Results are memoized per query text.
+
+    Raises:
+        InvalidQueryError: If the text does not match the grammar.
+
+    Examples:
+        >>> q = parse_query("SELECT Category, SUM(Amount) AS total GROUP BY Category")
+        >>> [item.label for item in q.select]
+        ['Category', 'total']
+        >>> q.is_aggregate
+        True
+    """
+    return _Parser(text).parse()
+
+
+# =============================================================================
+# Columnar evaluation
+# =============================================================================
+
+
+def _to_float(value: Any) -> float:
+    """Numeric view of a cell value; NaN for non-numeric cells."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return float(value)
+        except ValueError:
+            return _NAN
+    return _NAN
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or value == ""
+
+
+@dataclass
+class _Values:
+    """Columnar view of decoded cell values.
+
+    ``nums`` holds the numeric reading of every value (NaN where the cell
+    is not numeric); text is only materialized when a comparison needs it.
+    Literals are stored as 0-d arrays and broadcast against columns.
+    """
+
+    raw: np.ndarray
+    nums: np.ndarray
+    is_num: np.ndarray
+    is_null: np.ndarray
+
+    @classmethod
+    def from_raw(cls, values: Sequence[Any]) -> _Values:
+        size = len(values)
+        raw = np.empty(size, dtype=object)
+        raw[:] = values
+        nums = np.fromiter(map(_to_float, values), dtype=np.float64, count=size)
+        is_null = np.fromiter(map(_is_null, values), dtype=bool, count=size)
+        return cls(raw, nums, ~np.isnan(nums), is_null)
+
+    @classmethod
+    def literal(cls, value: Any) -> _Values:
+        number = _to_float(value)
+        raw = np.empty((), dtype=object)
+        raw[()] = value
+        return cls(
+            raw,
+            np.asarray(number),
+            np.asarray(number == number),
+            np.asarray(_is_null(value)),
+        )
+
+    @functools.cached_property
+    def texts(self) -> np.ndarray:
+        if self.raw.ndim == 0:
+            value = self.raw[()]
+            return np.asarray("" if value is None else str(value))
+        return np.array(
+            ["" if value is None else str(value) for value in self.raw], dtype=str
+        )
+
+
+def _compare(left: _Values, op: str, right: _Values) -> np.ndarray:
+    """Compare two operands, numerically where both sides are numbers."""
+    compare = _COMPARISONS[op]
+    with np.errstate(invalid="ignore"):
+        result = np.asarray(compare(left.nums, right.nums)) & left.is_num & right.is_num
+    textual = ~(left.is_num | right.is_num)
+    if np.any(textual):
+        result = result | (textual & compare(left.texts, right.texts))
+    if op in ("!=", "<>"):
+        # A number never equals a string
+        result = result | (left.is_num ^ right.is_num)
+    return np.asarray(result & ~(left.is_null | right.is_null), dtype=bool)
+
+
+def _like_regex(pattern: str) -> re.Pattern[str]:
+    """Translate a SQL LIKE pattern (``%``, ``_``) to a regex."""
+    parts = []
+    for char in pattern:
+        if char == "%":
+            parts.append(".*")
+        elif char == "_":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return re.compile("".join(parts), re.IGNORECASE | re.DOTALL)
+
+
+class _Batch:
+    """Rows of raw cells whose columns are decoded on first use."""
+
+    def __init__(self, cells: Sequence[Sequence[Any]], decode: Callable[[Any], Any]):
+        self.cells = cells
+        self.decode = decode
+        self.decoded: dict[int, list[Any]] = {}
+        self._columns: dict[int, _Values] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def raw(self, index: int) -> list[Any]:
+        values = self.decoded.get(index)
+        if values is None:
+            decode = self.decode
+            values = [
+                decode(row[index]) if index < len(row) else None for row in self.cells
+            ]
+            self.decoded[index] = values
+        return values
+
+    def column(self, index: int) -> _Values:
+        column = self._columns.get(index)
+        if column is None:
+            column = _Values.from_raw(self.raw(index))
+            self._columns[index] = column
+        return column
+
+
+type _Mask = Callable[[_Batch], np.ndarray]
+type _Truth = Callable[[_Batch], tuple[np.ndarray, np.ndarray]]
+
+
+class _Resolver:
+    """Map column references to sheet column indices."""
+
+    def __init__(self, query_text: str, headers: Sequence[str]) -> None:
+        self.query_text = query_text
+        self.headers = headers
+        self._exact: dict[str, int] = {}
+        self._folded: dict[str, int] = {}
+        for index, name in enumerate(headers):
+            self._exact.setdefault(name, index)
+            self._folded.setdefault(name.casefold(), index)
+
+    def find(self, name: str) -> int | None:
+        """Resolve by header name, then case-insensitively, then column letter."""
+        index = self._exact.get(name)
+        if index is None:
+            index = self._folded.get(name.casefold())
+        if index is None and _COLUMN_LETTERS_RE.fullmatch(name):
+            index = 0
+            for char in name:
+                index = index * 26 + ord(char) - ord("A") + 1
+            index -= 1
+        return index
+
+    def __call__(self, name: str) -> int:
+        index = self.find(name)
+        if index is None:
+            available = ", ".join(self.headers) or "none"
+            raise InvalidQueryError(
+                self.query_text,
+                f"unknown column '{name}' (available: {available})",
+            )
+        return index
+
+
+def _compile(node: _Node, resolve: _Resolver) -> _Mask:
+    """Compile a WHERE node into a function from a batch to a bool mask."""
+    truth = _compile_truth(node, resolve)
+    return lambda batch: truth(batch)[0]
+
+
+def _compile_truth(node: _Node, resolve: _Resolver) -> _Truth:
+    """Compile a WHERE node into (true, false) masks.
+
+    Follows SQL three-valued logic: comparisons involving an empty cell
+    are UNKNOWN (neither mask set), so ``NOT Amount > 15`` does not match
+    rows whose Amount is empty.
+    """
+    if isinstance(node, _And):
+        left = _compile_truth(node.left, resolve)
+        right = _compile_truth(node.right, resolve)
+
+        def both(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+            (left_true, left_false), (right_true, right_false) = (
+                left(batch),
+                right(batch),
+            )
+            return left_true & right_true, left_false | right_false
+
+        return both
+    if isinstance(node, _Or):
+        left = _compile_truth(node.left, resolve)
+        right = _compile_truth(node.right, resolve)
+
+        def either(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+            (left_true, left_false), (right_true, right_false) = (
+                left(batch),
+                right(batch),
+            )
+            return left_true | right_true, left_false & right_false
+
+        return either
+    if isinstance(node, _Not):
+        inner = _compile_truth(node.operand, resolve)
+
+        def negate(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+            true, false = inner(batch)
+            return false, true
+
+        return negate
+    if isinstance(node, _IsNull):
+        index = resolve(node.column.name)
+
+        def is_null(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+            null = batch.column(index).is_null
+            return null, ~null
+
+        return is_null
+    if isinstance(node, _Like):
+        index = resolve(node.column.name)
+        regex = _like_regex(node.pattern)
+
+        def like(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+            column = batch.column(index)
+            matches = np.fromiter(
+                (regex.fullmatch(text) is not None for text in column.texts.tolist()),
+                dtype=bool,
+                count=len(batch),
+            )
+            known = ~column.is_null
+            return matches & known, ~matches & known
+
+        return like
+    if isinstance(node, _In):
+        options = [
+            _compile_truth(_Compare(node.column, "=", _Literal(value)), resolve)
+            for value in node.values
+            if value is not None
+        ]
+
+        def within(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+            true = np.zeros(len(batch), dtype=bool)
+            false = np.ones(len(batch), dtype=bool)
+            for option in options:
+                option_true, option_false = option(batch)
+                true |= option_true
+                false &= option_false
+            return true, false
+
+        return within
+
+    left_operand = _compile_operand(node.left, resolve)
+    right_operand = _compile_operand(node.right, resolve)
+    op = node.op
+
+    def compare(batch: _Batch) -> tuple[np.ndarray, np.ndarray]:
+        left_values, right_values = left_operand(batch), right_operand(batch)
+        true = _compare(left_values, op, right_values)
+        unknown = left_values.is_null | right_values.is_null
+        return true, ~(true | unknown)
+
+    return compare
+
+
+def _compile_operand(
+    operand: _ColumnRef | _Literal, resolve: _Resolver
+) -> Callable[[_Batch], _Values]:
+    if isinstance(operand, _Literal):
+        constant = _Values.literal(operand.value)
+        return lambda batch: constant
+    index = resolve(operand.name)
+    return lambda batch: batch.column(index)
+
+
+def _where_columns(node: _Node | None) -> list[str]:
+    """Column names referenced by a WHERE clause."""
+    if node is None:
+        return []
+    if isinstance(node, (_And, _Or)):
+        return _where_columns(node.left) + _where_columns(node.right)
+    if isinstance(node, _Not):
+        return _where_columns(node.operand)
+    if isinstance(node, _Compare):
+        return [
+            side.name
+            for side in (node.left, node.right)
+            if isinstance(side, _ColumnRef)
+        ]
+    return [node.column.name]
+
+
+# =============================================================================
+# Sheet scanners
+# =============================================================================
+
+
+class SheetScanner(ABC):
+    """Single-pass row source for the query engine.
+
+    Scanners yield raw cell objects so the engine decides which cells to
+    decode; only the first ``width`` cells of each row are expanded.
+    """
+
+    @abstractmethod
+    def header(self) -> list[str]:
+        """Return the column names from the first row of the sheet."""
+
+    @abstractmethod
+    def rows(self, width: int) -> Iterator[tuple[int, Sequence[Any]]]:
+        """Yield ``(row_index, cells)`` for every non-blank data row.
+
+        Args:
+            width: Number of leading cells the caller needs.
+
+        Yields:
+            0-based sheet row index (the header is row 0) and the row's
+            first ``width`` raw cells (fewer if the row is shorter).
+        """
+
+    @abstractmethod
+    def value(self, cell: Any) -> Any:
+        """Decode a raw cell into a Python value."""
+
+    def close(self) -> None:  # noqa: B027 - optional hook
+        """Release any open resources."""
+
+
+def _header_names(runs: Sequence[tuple[Any, int]]) -> list[str]:
+    """Expand ``(value, repeat)`` runs into header names."""
+    trimmed = list(runs)
+    while trimmed and _is_null(trimmed[-1][0]):
+        trimmed.pop()
+    names: list[str] = []
+    for value, repeat in trimmed:
+        for _ in range(min(repeat, _MAX_COLUMNS - len(names))):
+            names.append(f"col{len(names)}" if _is_null(value) else str(value))
+    return names
+
+
+def _et_cell_value(cell: ET.Element) -> Any:
+    """Decode a content.xml cell.
+
+    Follows ``OdsEditor._get_cell_value``, except that ``percentage`` cells
+    are numeric, as in ``InteractiveOdsBuilder._get_cell_value``.
+    """
+    value_type = cell.get(_ET_VALUE_TYPE)
+    if value_type in _NUMERIC_TYPES:
+        value = cell.get(_ET_VALUE)
+        if value:
+            return float(value)
+    elif value_type == "date":
+        return cell.get(_ET_DATE_VALUE)
+    elif value_type == "boolean":
+        value = cell.get(_ET_BOOLEAN_VALUE)
+        return value == "true" if value else None
+    elif value_type == "string":
+        value = cell.get(_ET_STRING_VALUE)
+        if value:
+            return value
+    texts = ["".join(child.itertext()) for child in cell if child.tag == _ET_P]
+    texts = [text for text in texts if text]
+    return " ".join(texts) if texts else None
+
+
+def _et_has_content(cell: ET.Element) -> bool:
+    return cell.get(_ET_VALUE_TYPE) is not None or len(cell) > 0
+
+
+class OdsFileScanner(SheetScanner):
+    """Stream one sheet of an ODS file straight from ``content.xml``.
+
+    The document is never loaded as a whole: rows are pulled from the XML
+    parser one at a time and discarded once processed, and the scan stops
+    at the end of the requested sheet.
+    """
+
+    def __init__(self, file_path: Path | str, sheet_name: str) -> None:
+        """Initialize the scanner.
+
+        Args:
+            file_path: Path to the ODS file.
+            sheet_name: Sheet to scan.
+        """
+        self.file_path = Path(file_path)
+        self.sheet_name = sheet_name
+        self._stream: Iterator[tuple[int, ET.Element]] | None = None
+        self._header: list[str] | None = None
+
+    def header(self) -> list[str]:
+        """Return the column names from the first row of the sheet."""
+        if self._header is None:
+            self._stream = self._table_rows()
+            first = next(self._stream, None)
+            runs: list[tuple[Any, int]] = []
+            if first is not None:
+                for cell in first[1]:
+                    repeat = int(cell.get(_ET_COLUMNS_REPEATED, 1))
+                    runs.append((_et_cell_value(cell), repeat))
+            self._header = _header_names(runs)
+        return self._header
+
+    def rows(self, width: int) -> Iterator[tuple[int, Sequence[Any]]]:
+        """Yield ``(row_index, cells)`` for every non-blank data row."""
+        self.header()
+        assert self._stream is not None
+        row_index = 1
+        for repeat, row in self._stream:
+            cells: list[ET.Element] = []
+            has_content = False
+            for cell in row:
+                has_content = has_content or _et_has_content(cell)
+                if len(cells) < width:
+                    count = cell.get(_ET_COLUMNS_REPEATED)
+                    if count is None:
+                        cells.append(cell)
+                    else:
+                        cells.extend(
+                            itertools.repeat(cell, min(int(count), width - len(cells)))
+                        )
+                elif has_content:
+                    break
+            if has_content:
+                for offset in range(repeat):
+                    yield row_index + offset, cells
+            row_index += repeat
+
+    def value(self, cell: Any) -> Any:
+        """Decode a raw cell into a Python value."""
+        return _et_cell_value(cell)
+
+    def close(self) -> None:
+        """Stop the scan and close the archive."""
+        if self._stream is not None:
+            self._stream.close()  # type: ignore[attr-defined]
+            self._stream = None
+
+    def _table_rows(self) -> Iterator[tuple[int, ET.Element]]:
+        """Yield ``(repeat, row)`` for the rows of the target sheet.
+
+        Only start events are requested, which halves the parser's event
+        traffic: a row is complete once the next row or sheet starts (or
+        the document ends), so each row is handed out one event late.
+        """
+        if not self.file_path.exists():
+            raise OdsReadError(str(self.file_path), "File not found")
+        seen: list[str] = []
+        try:
+            archive = zipfile.ZipFile(self.file_path)
+        except zipfile.BadZipFile as e:
+            raise OdsReadError(str(self.file_path), f"Not an ODS archive: {e}") from e
+        with archive:
+            check_zip_bomb(archive)
+            try:
+                content = archive.open("content.xml")
+            except KeyError as e:
+                raise OdsReadError(str(self.file_path), "Missing content.xml") from e
+            with content:
+                parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(
+                    events=("start",)
+                )
+                in_sheet = False
+                pending: ET.Element | None = None
+                head = True
+                while True:
+                    chunk = content.read(_CHUNK_SIZE)
+                    if head:
+                        self._reject_dtd(chunk)
+                        head = False
+                    try:
+                        if chunk:
+                            parser.feed(chunk)
+                        else:
+                            parser.close()
+                    except ET.ParseError as e:
+                        raise OdsReadError(
+                            str(self.file_path), f"Malformed content.xml: {e}"
+                        ) from e
+                    events = cast(
+                        "Iterator[tuple[str, ET.Element]]", parser.read_events()
+                    )
+                    for _, elem in events:
+                        tag = elem.tag
+                        if tag != _ET_ROW and tag != _ET_TABLE:
+                            continue
+                        if pending is not None:
+                            if in_sheet:
+                                yield int(pending.get(_ET_ROWS_REPEATED, 1)), pending
+                            pending.clear()
+                            pending = None
+                        if tag == _ET_ROW:
+                            pending = elem
+                        elif in_sheet:
+                            return
+                        else:
+                            name = elem.get(_ET_TABLE_NAME, "")
+                            seen.append(name)
+                            in_sheet = name == self.sheet_name
+                    if not chunk:
+                        break
+                if in_sheet:
+                    if pending is not None:
+                        yield int(pending.get(_ET_ROWS_REPEATED, 1)), pending
+                    return
+        raise SheetNotFoundError(self.sheet_name, seen)
+
+    def _reject_dtd(self, head: bytes) -> None:
+        """Refuse documents declaring a DTD (entity expansion attacks)."""
+        root = _ROOT_TAG_RE.search(head)
+        prolog = head if root is None else head[: root.start()]
+        if b"<!DOCTYPE" in prolog or (root is None and b"<!" in head):
+            raise OdsReadError(
+                str(self.file_path), "content.xml declares a DTD, which is not allowed"
+            )
+
+
+def _odf_cell_value(cell: Any) -> Any:
+    """Decode an odfpy cell (same rules as :func:`_et_cell_value`)."""
+    attributes = cell.attributes
+    value_type = attributes.get(_ODF_VALUE_TYPE)
+    if value_type in _NUMERIC_TYPES:
+        value = attributes.get(_ODF_VALUE)
+        if value:
+            return float(value)
+    elif value_type == "date":
+        return attributes.get(_ODF_DATE_VALUE)
+    elif value_type == "boolean":
+        value = attributes.get(_ODF_BOOLEAN_VALUE)
+        return value == "true" if value else None
+    elif value_type == "string":
+        value = attributes.get(_ODF_STRING_VALUE)
+        if value:
+            return value
+    texts = [
+        str(child)
+        for child in cell.childNodes
+        if getattr(child, "qname", None) == _ODF_P
+    ]
+    texts = [text for text in texts if text]
+    return " ".join(texts) if texts else None
+
+
+def _odf_has_content(cell: Any) -> bool:
+    return _ODF_VALUE_TYPE in cell.attributes or bool(cell.childNodes)
+
+
+class OdfTableScanner(SheetScanner):
+    """Scan an in-memory odfpy table, e.g. a sheet of an open ``OdsEditor``."""
+
+    def __init__(self, table: Table) -> None:
+        """Initialize the scanner.
+
+        Args:
+            table: odfpy ``Table`` element to scan.
+        """
+        from odf.table import TableRow
+
+        self._rows = table.getElementsByType(TableRow)
+        self._header: list[str] | None = None
+
+    def header(self) -> list[str]:
+        """Return the column names from the first row of the sheet."""
+        if self._header is None:
+            runs: list[tuple[Any, int]] = []
+            if self._rows:
+                for cell in self._cells(self._rows[0]):
+                    repeat = int(cell.attributes.get(_ODF_COLUMNS_REPEATED, 1))
+                    runs.append((_odf_cell_value(cell), repeat))
+            self._header = _header_names(runs)
+        return self._header
+
+    def rows(self, width: int) -> Iterator[tuple[int, Sequence[Any]]]:
+        """Yield ``(row_index, cells)`` for every non-blank data row."""
+        row_index = 1
+        for row in self._rows[1:]:
+            repeat = int(row.attributes.get(_ODF_ROWS_REPEATED, 1))
+            cells: list[Any] = []
+            has_content = False
+            for cell in self._cells(row):
+                has_content = has_content or _odf_has_content(cell)
+                if len(cells) < width:
+                    count = cell.attributes.get(_ODF_COLUMNS_REPEATED)
+                    if count is None:
+                        cells.append(cell)
+                    else:
+                        cells.extend(
+                            itertools.repeat(cell, min(int(count), width - len(cells)))
+                        )
+                elif has_content:
+                    break
+            if has_content:
+                for offset in range(repeat):
+                    yield row_index + offset, cells
+            row_index += repeat
+
+    def value(self, cell: Any) -> Any:
+        """Decode a raw cell into a Python value."""
+        return _odf_cell_value(cell)
+
+    @staticmethod
+    def _cells(row: Any) -> list[Any]:
+        return [
+            node
+            for node in row.childNodes
+            if getattr(node, "qname", None) in _ODF_CELLS
+        ]
+
+
+# =============================================================================
+# Execution
+# =============================================================================
+
+
+@dataclass
+class _Plan:
+    """A query bound to a sheet's header row."""
+
+    columns: tuple[int, ...]
+    predicate: _Mask | None = None
+    predicate_columns: tuple[int, ...] = ()
+    stop_after: int | None = None
+    positions: dict[int, int] = field(init=False)
+    width: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.positions = {index: pos for pos, index in enumerate(self.columns)}
+        self.width = max((*self.columns, *self.predicate_columns), default=-1) + 1
+
+
+def _scan(scanner: SheetScanner, plan: _Plan) -> list[tuple[int, tuple[Any, ...]]]:
+    """Stream matching rows, decoding only the planned columns.
+
+    Rows are gathered in batches; the predicate decodes the columns it
+    references for the whole batch, and the remaining columns are decoded
+    for matching rows only.
+    """
+    batch_size = _BATCH_SIZE
+    if plan.stop_after is not None:
+        batch_size = max(1, min(_BATCH_SIZE, plan.stop_after))
+
+    matched: list[tuple[int, tuple[Any, ...]]] = []
+    pending: list[tuple[int, Sequence[Any]]] = []
+    for item in scanner.rows(plan.width):
+        pending.append(item)
+        if len(pending) >= batch_size:
+            matched.extend(_filter_batch(scanner, plan, pending))
+            pending = []
+            if plan.stop_after is not None and len(matched) >= plan.stop_after:
+                return matched
+    matched.extend(_filter_batch(scanner, plan, pending))
+    return matched
+
+
+def _filter_batch(
+    scanner: SheetScanner,
+    plan: _Plan,
+    pending: Sequence[tuple[int, Sequence[Any]]],
+) -> list[tuple[int, tuple[Any, ...]]]:
+    if not pending:
+        return []
+    batch = _Batch([cells for _, cells in pending], scanner.value)
+    if plan.predicate is None:
+        keep: Sequence[int] = range(len(pending))
+    else:
+        keep = np.flatnonzero(plan.predicate(batch)).tolist()
+    decode = scanner.value
+    columns = [(index, batch.decoded.get(index)) for index in plan.columns]
+    result = []
+    for i in keep:
+        row_index, cells = pending[i]
+        values = tuple(
+            decoded[i]
+            if decoded is not None
+            else (decode(cells[index]) if index < len(cells) else None)
+            for index, decoded in columns
+        )
+        result.append((row_index, values))
+    return result
+
+
+def _sort_key(value: Any) -> tuple[int, float, str]:
+    """Numbers sort before text; numbers compare numerically."""
+    number = _to_float(value)
+    if number == number:
+        return (0, number, "")
+    return (1, 0.0, str(value))
+
+
+def _sort_order(keys: Sequence[tuple[Sequence[Any], bool]], size: int) -> list[int]:
+    """Stable multi-key sort order; NULLs sort last in either direction."""
+    order = list(range(size))
+    for values, descending in reversed(keys):
+        present = [i for i in order if not _is_null(values[i])]
+        missing = [i for i in order if _is_null(values[i])]
+        present.sort(key=lambda i: _sort_key(values[i]), reverse=descending)
+        order = present + missing
+    return order
+
+
+def _aggregate(func: str, column: _Values | None, rows: np.ndarray) -> Any:
+    """Evaluate one aggregate over the rows of a group."""
+    if column is None:
+        return len(rows)
+    present = ~column.is_null[rows]
+    if func == "COUNT":
+        return int(np.count_nonzero(present))
+    numbers = column.nums[rows][column.is_num[rows]]
+    if func == "SUM":
+        return float(numbers.sum()) if numbers.size else None
+    if func == "AVG":
+        return float(numbers.mean()) if numbers.size else None
+    if numbers.size:
+        return float(numbers.min() if func == "MIN" else numbers.max())
+    # MIN/MAX of text columns, e.g. ISO dates
+    texts = [str(value) for value in column.raw[rows][present]]
+    if not texts:
+        return None
+    return min(texts) if func == "MIN" else max(texts)
+
+
+class _Executor:
+    """Bind a parsed query to a sheet's header and run it."""
+
+    def __init__(self, query: Query, headers: Sequence[str]) -> None:
+        self.query = query
+        self.headers = headers
+        self.resolve = _Resolver(query.text, headers)
+        self.aggregate = query.is_aggregate
+
+        # (label, column index or None for COUNT(*), aggregate function)
+        self.outputs: list[tuple[str, int | None, str | None]] = []
+        for item in query.select:
+            if item.column == "*" and item.func is None:
+                if self.aggregate:
+                    raise InvalidQueryError(
+                        query.text, "SELECT * cannot be combined with GROUP BY"
+                    )
+                self.outputs.extend(
+                    (name, index, None) for index, name in enumerate(headers)
+                )
+            elif item.column == "*":
+                self.outputs.append((item.label, None, item.func))
+            else:
+                self.outputs.append((item.label, self.resolve(item.column), item.func))
+
+        self.group_columns = [self.resolve(name) for name in query.group_by]
+        if self.aggregate:
+            for (_label, index, func), item in zip(
+                self.outputs, query.select, strict=True
+            ):
+                if func is None and index not in self.group_columns:
+                    raise InvalidQueryError(
+                        query.text,
+                        f"column '{item.column}' must appear in GROUP BY or "
+                        f"be used in an aggregate such as SUM({item.column})",
+                    )
+
+        self.order = [
+            (self._order_target(item), item.descending) for item in query.order_by
+        ]
+
+        needed = {index for _, index, _ in self.outputs if index is not None}
+        needed.update(self.group_columns)
+        if not self.aggregate:
+            needed.update(target for target, _ in self.order if isinstance(target, int))
+
+        predicate = None
+        predicate_columns: tuple[int, ...] = ()
+        if query.where is not None:
+            predicate = _compile(query.where, self.resolve)
+            predicate_columns = tuple(
+                self.resolve(name) for name in _where_columns(query.where)
+            )
+
+        stop_after = None
+        if query.limit is not None and not self.aggregate and not self.order:
+            stop_after = query.offset + query.limit
+        self.plan = _Plan(
+            columns=tuple(sorted(needed)),
+            predicate=predicate,
+            predicate_columns=predicate_columns,
+            stop_after=stop_after,
+        )
+
+    def _order_target(self, item: OrderItem) -> int | str:
+        """Resolve an ORDER BY key to a sheet column or an output label."""
+        labels = {label: index for label, index, _ in self.outputs}
+        for label, index, func in self.outputs:
+            if label == item.name or label.casefold() == item.name.casefold():
+                if self.aggregate:
+                    return label
+                assert index is not None and func is None
+                return index
+        index = self.resolve(item.name)
+        if not self.aggregate:
+            return index
+        for label, output_index in labels.items():
+            if output_index == index:
+                return label
+        raise InvalidQueryError(
+            self.query.text,
+            f"ORDER BY '{item.name}' must name a selected column or alias "
+            "in a grouped query",
+        )
+
+    def run(self, scanner: SheetScanner) -> list[dict[str, Any]]:
+        try:
+            rows = _scan(scanner, self.plan)
+        finally:
+            scanner.close()
+        if self.aggregate:
+            return self._grouped(rows)
+        return self._plain(rows)
+
+    def _slice(self, records: list[Any]) -> list[Any]:
+        start = self.query.offset
+        stop = None if self.query.limit is None else start + self.query.limit
+        return records[start:stop]
+
+    def _plain(self, rows: list[tuple[int, tuple[Any, ...]]]) -> list[dict[str, Any]]:
+        positions = self.plan.positions
+        if self.order:
+            keys = [
+                ([values[positions[int(target)]] for _, values in rows], descending)
+                for target, descending in self.order
+            ]
+            rows = [rows[i] for i in _sort_order(keys, len(rows))]
+        outputs = [
+            (label, positions[index])
+            for label, index, _ in self.outputs
+            if index is not None
+        ]
+        return [
+            {label: values[pos] for label, pos in outputs}
+            for _, values in self._slice(rows)
+        ]
+
+    def _grouped(self, rows: list[tuple[int, tuple[Any, ...]]]) -> list[dict[str, Any]]:
+        positions = self.plan.positions
+        key_positions = [positions[index] for index in self.group_columns]
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for i, (_, values) in enumerate(rows):
+            key = tuple(values[pos] for pos in key_positions)
+            groups.setdefault(key, []).append(i)
+        if not self.group_columns and not groups:
+            # Aggregates over no rows still produce one row (COUNT = 0)
+            groups[()] = []
+
+        columns: dict[int, _Values] = {}
+
+        def column(index: int) -> _Values:
+            if index not in columns:
+                pos = positions[index]
+                columns[index] = _Values.from_raw([values[pos] for _, values in rows])
+            return columns[index]
+
+        records: list[dict[str, Any]] = []
+        for key, members in groups.items():
+            indices = np.asarray(members, dtype=np.intp)
+            record: dict[str, Any] = {}
+            for label, index, func in self.outputs:
+                if func is None:
+                    assert index is not None
+                    record[label] = key[self.group_columns.index(index)]
+                else:
+                    source = None if index is None else column(index)
+                    record[label] = _aggregate(func, source, indices)
+            records.append(record)
+
+        if self.order:
+            keys = [
+                ([record[str(target)] for record in records], descending)
+                for target, descending in self.order
+            ]
+            records = [records[i] for i in _sort_order(keys, len(records))]
+        return self._slice(records)
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+
+_RESULT_CACHE: LRUCache[tuple[Any, ...], list[dict[str, Any]]] = LRUCache(maxsize=64)
+
+
+def run_query(scanner: SheetScanner, query: Query | str) -> list[dict[str, Any]]:
+    """Run a query over the rows produced by a scanner.
+
+    Args:
+        scanner: Row source for the sheet; it is closed when the scan ends.
+        query: Query text or a parsed :class:`Query`.
+
+    Returns:
+        Result rows as dictionaries keyed by column header, alias or
+        expression text (e.g. ``"SUM(Amount)"``).
+
+    Raises:
+        InvalidQueryError: If the query is malformed or names an unknown column.
+    """
+    parsed = parse_query(query) if isinstance(query, str) else query
+    try:
+        executor = _Executor(parsed, scanner.header())
+    except BaseException:
+        scanner.close()
+        raise
+    return executor.run(scanner)
+
+
+def match_rows(scanner: SheetScanner, conditions: Mapping[str, Any]) -> list[int]:
+    """Find the rows matching column conditions.
+
+    Each condition maps a column to a value it must equal, ``None`` for an
+    empty cell, or an operator dict such as ``{"$gte": 10, "$lt": 100}``
+    (``$eq``, ``$ne``, ``$lt``, ``$lte``, ``$gt``, ``$gte``, ``$in``,
+    ``$like``). All conditions must hold.
+
+    Args:
+        scanner: Row source for the sheet; it is closed when the scan ends.
+        conditions: Column name (or letter) to expected value.
+
+    Returns:
+        Matching 0-based sheet row indices (the header is row 0). Empty if
+        a condition names a column that does not exist.
+
+    Raises:
+        InvalidQueryError: If an operator dict uses an unknown operator.
+    """
+    try:
+        headers = scanner.header()
+        text = repr(dict(conditions))
+        resolve = _Resolver(text, headers)
+        if any(resolve.find(name) is None for name in conditions):
+            return []
+        node: _Node | None = None
+        for name, expected in conditions.items():
+            condition = _criteria_node(text, _ColumnRef(name), expected)
+            node = condition if node is None else _And(node, condition)
+        predicate = None if node is None else _compile(node, resolve)
+        plan = _Plan(
+            columns=(),
+            predicate=predicate,
+            predicate_columns=tuple(resolve(name) for name in conditions),
+        )
+        return [row_index for row_index, _ in _scan(scanner, plan)]
+    finally:
+        scanner.close()
+
+
+def _criteria_node(text: str, column: _ColumnRef, expected: Any) -> _Node:
+    """Translate one ``match_rows`` condition into a WHERE node."""
+    if expected is None:
+        return _IsNull(column)
+    if not isinstance(expected, dict):
+        return _Compare(column, "=", _Literal(expected))
+    nodes: list[_Node] = []
+    for op, operand in expected.items():
+        if op in _CRITERIA_OPERATORS:
+            nodes.append(_Compare(column, _CRITERIA_OPERATORS[op], _Literal(operand)))
+        elif op == "$in" and isinstance(operand, (list, tuple)):
+            nodes.append(_In(column, tuple(operand)))
+        elif op == "$like" and isinstance(operand, str):
+            nodes.append(_Like(column, operand))
+        else:
+            raise InvalidQueryError(
+                text,
+                f"unsupported condition {op!r} for column '{column.name}' "
+                f"(use one of {', '.join([*_CRITERIA_OPERATORS, '$in', '$like'])})",
+            )
+    if not nodes:
+        raise InvalidQueryError(text, f"empty condition for column '{column.name}'")
+    node = nodes[0]
+    for other in nodes[1:]:
+        node = _And(node, other)
+    return node
+
+
+def query_file(
+    file_path: Path | str, sheet_name: str, query: str
+) -> list[dict[str, Any]]:
+    """Query a sheet of an ODS file without loading the whole document.
+
+    Results are cached per (file, modification time, size, sheet, query),
+    so repeated queries against an unchanged file skip the scan.
+
+    Args:
+        file_path: Path to the ODS file.
+        sheet_name: Sheet to query.
+        query: Query text (see :func:`parse_query`).
+
+    Returns:
+        Result rows as dictionaries.
+
+    Raises:
+        OdsReadError: If the file is missing or not a readable ODS archive.
+        SheetNotFoundError: If the sheet does not exist.
+        InvalidQueryError: If the query is malformed or names an unknown column.
+    """
+    path = Path(file_path).resolve()
+    if not path.exists():
+        raise OdsReadError(str(path), "File not found")
+    parsed = parse_query(query)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size, sheet_name, parsed.text)
+    results = _RESULT_CACHE.get(key)
+    if results is None:
+        results = run_query(OdsFileScanner(path, sheet_name), parsed)
+        _RESULT_CACHE.set(key, results)
+    return [dict(row) for row in results]
+
+
+def clear_query_cache() -> None:
+    """Drop all cached :func:`query_file` results."""
+    _RESULT_CACHE.clear()
@@ -9,18 +9,22 @@
     - Chart rendering to ODS
     - Conditional format rendering
     - Data validation rendering
+    - Run-length collapsing of repeated cells and rows
 """
 
 from __future__ import annotations
 
+import io
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 # Chart imports
 from odf import chart as odfchart
 from odf.draw import Frame, Object
+from odf.namespaces import OFFICENS, TABLENS
 from odf.opendocument import OpenDocumentSpreadsheet
 from odf.style import (
     GraphicProperties,
@@ -40,6 +44,8 @@
 from odf.text import P
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from spreadsheet_dl.builder import (
         CellSpec,
         ColumnSpec,
@@ -50,11 +56,226 @@
         NamedRange as NamedRangeSpec,
     )
     from spreadsheet_dl.charts import ChartSpec, ChartType, DataSeries
+    from spreadsheet_dl.ods_packaging import PackageOptions
     from spreadsheet_dl.schema.conditional import ConditionalFormat
     from spreadsheet_dl.schema.data_validation import ValidationConfig
     from spreadsheet_dl.schema.styles import CellStyle, Theme
 
 
+@dataclass
+class RenderStats:
+    """Run-length compression metrics for a single render.
+
+    Logical counts describe the sheet specifications; emitted counts
+    describe the elements actually written to content.xml after
+    identical adjacent cells and rows were collapsed.
+    """
+
+    logical_cells: int = 0
+    emitted_cells: int = 0
+    logical_rows: int = 0
+    emitted_rows: int = 0
+
+    @property
+    def cells_collapsed(self) -> int:
+        """Number of cell elements saved by run-length encoding."""
+        return self.logical_cells - self.emitted_cells
+
+    @property
+    def rows_collapsed(self) -> int:
+        """Number of row elements saved by run-length encoding."""
+        return self.logical_rows - self.emitted_rows
+
+    @property
+    def cell_compression_ratio(self) -> float:
+        """Ratio of logical to emitted cells (1.0 means no compression)."""
+        if self.emitted_cells == 0:
+            return 1.0
+        return self.logical_cells / self.emitted_cells
+
+    @property
+    def row_compression_ratio(self) -> float:
+        """Ratio of logical to emitted rows (1.0 means no compression)."""
+        if self.emitted_rows == 0:
+            return 1.0
+        return self.logical_rows / self.emitted_rows
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "logical_cells": self.logical_cells,
+            "emitted_cells": self.emitted_cells,
+            "logical_rows": self.logical_rows,
+            "emitted_rows": self.emitted_rows,
+            "cells_collapsed": self.cells_collapsed,
+            "rows_collapsed": self.rows_collapsed,
+            "cell_compression_ratio": round(self.cell_compression_ratio, 2),
+            "row_compression_ratio": round(self.row_compression_ratio, 2),
+        }
+
+
+# Qualified ODF attribute names written directly onto table cells
+_QName = tuple[str, str]
+_STYLE_NAME: _QName = (TABLENS, "style-name")
+_FORMULA: _QName = (TABLENS, "formula")
+_COLS_SPANNED: _QName = (TABLENS, "number-columns-spanned")
+_ROWS_SPANNED: _QName = (TABLENS, "number-rows-spanned")
+_COLS_REPEATED: _QName = (TABLENS, "number-columns-repeated")
+_VALUE_TYPE: _QName = (OFFICENS, "value-type")
+_VALUE: _QName = (OFFICENS, "value")
+_DATE_VALUE: _QName = (OFFICENS, "date-value")
+
+# odfpy keyword names produced by OdsRenderer._get_value_attrs()
+_VALUE_ATTR_QNAMES: dict[str, _QName] = {
+    "valuetype": _VALUE_TYPE,
+    "value": _VALUE,
+    "datevalue": _DATE_VALUE,
+}
+
+# Type hint to ODF value type mapping
+_ODF_VALUE_TYPES: dict[str, str] = {
+    "string": "string",
+    "currency": "currency",
+    "date": "date",
+    "percentage": "percentage",
+    "float": "float",
+    "number": "float",
+}
+
+# A planned cell run: (cell attributes, display text, repeat count, colspan)
+_CellRun = tuple[dict[_QName, str], str, int, int]
+
+
+class _CellFormatter:
+    """Value encoder and display formatter for one (type hint, style) pair.
+
+    Built once per column type and style and reused for every cell that
+    shares them, so the per-cell work is a single dispatch on ``type(value)``
+    instead of a type-map rebuild, an isinstance chain and odfpy's generic
+    keyword-attribute resolution. Values of types without a specialised
+    encoder fall back to OdsRenderer's generic helpers.
+    """
+
+    __slots__ = ("_base", "_encoders", "_formula_type", "_renderer", "_type_hint")
+
+    def __init__(
+        self,
+        renderer: OdsRenderer,
+        type_hint: str | None,
+        style: Style | None,
+    ) -> None:
+        self._renderer = renderer
+        self._type_hint = type_hint
+        self._base: dict[_QName, str] = {}
+        if style is not None:
+            self._base[_STYLE_NAME] = style.getAttribute("name")
+        self._formula_type = renderer._get_odf_value_type(type_hint)
+        self._encoders = self._build_encoders(type_hint)
+
+    def _build_encoders(
+        self, type_hint: str | None
+    ) -> dict[type, Callable[[Any], tuple[dict[_QName, str], str]]]:
+        """Select value encoders and display formatters for the type hint."""
+        base = self._base
+        decimal_type = "currency" if type_hint == "currency" else "float"
+        number_type = type_hint if type_hint in ("currency", "percentage") else "float"
+
+        number_text: Callable[[Any], str]
+        int_text: Callable[[int], str]
+        if type_hint == "currency":
+            number_text = "${:,.2f}".format
+            int_text = "${:,}".format
+        elif type_hint == "percentage":
+            number_text = "{:.1%}".format
+            int_text = str
+        else:
+            number_text = str
+            int_text = str
+
+        def encode_datetime(value: datetime) -> tuple[dict[_QName, str], str]:
+            day = value.date()
+            attrs = {**base, _VALUE_TYPE: "date", _DATE_VALUE: day.isoformat()}
+            return attrs, day.strftime("%Y-%m-%d")
+
+        def encode_date(value: date) -> tuple[dict[_QName, str], str]:
+            attrs = {**base, _VALUE_TYPE: "date", _DATE_VALUE: value.isoformat()}
+            return attrs, value.strftime("%Y-%m-%d")
+
+        def encode_decimal(value: Decimal) -> tuple[dict[_QName, str], str]:
+            attrs = {**base, _VALUE_TYPE: decimal_type, _VALUE: str(value)}
+            return attrs, number_text(value)
+
+        def encode_float(value: float) -> tuple[dict[_QName, str], str]:
+            attrs = {**base, _VALUE_TYPE: number_type, _VALUE: str(value)}
+            return attrs, number_text(value)
+
+        def encode_int(value: int) -> tuple[dict[_QName, str], str]:
+            attrs = {**base, _VALUE_TYPE: number_type, _VALUE: str(value)}
+            return attrs, int_text(value)
+
+        def encode_str(value: str) -> tuple[dict[_QName, str], str]:
+            return {**base, _VALUE_TYPE: "string"}, value
+
+        return {
+            datetime: encode_datetime,
+            date: encode_date,
+            Decimal: encode_decimal,
+            float: encode_float,
+            int: encode_int,
+            str: encode_str,
+        }
+
+    def encode(self, value: Any) -> tuple[dict[_QName, str], str]:
+        """Encode a cell value.
+
+        Args:
+            value: Cell value
+
+        Returns:
+            Tuple of (qualified cell attributes, display text)
+        """
+        if value is None:
+            return dict(self._base), ""
+        encoder = self._encoders.get(type(value))
+        if encoder is not None:
+            return encoder(value)
+        attrs = dict(self._base)
+        for name, attr in self._renderer._get_value_attrs(
+            value, self._type_hint
+        ).items():
+            attrs[_VALUE_ATTR_QNAMES[name]] = str(attr)
+        return attrs, self._renderer._get_display_text(value, self._type_hint)
+
+    def encode_formula(self, formula: str, value: Any) -> tuple[dict[_QName, str], str]:
+        """Encode a formula cell.
+
+        Args:
+            formula: Formula text
+            value: Cached value, used only for display text
+
+        Returns:
+            Tuple of (qualified cell attributes, display text)
+        """
+        attrs = {**self._base, _FORMULA: formula, _VALUE_TYPE: self._formula_type}
+        if value is None:
+            return attrs, ""
+        return attrs, self.encode(value)[1]
+
+
+def _release(node: Any) -> None:
+    """Unlink a detached odfpy element tree so it is freed immediately.
+
+    odfpy nodes point at their parent and both siblings, so a dropped row
+    would otherwise linger until the cyclic garbage collector runs.
+    """
+    children = getattr(node, "childNodes", None)
+    if children:
+        for child in children:
+            _release(child)
+        node.childNodes = []
+    node.parentNode = node.nextSibling = node.previousSibling = None
+
+
 class OdsRenderer:
     """Render sheet specifications to ODS files.
 
@@ -67,15 +288,33 @@ class OdsRenderer:
     - Chart embedding
     - Conditional formatting
     - Data validation
+    - Run-length collapsing of identical adjacent cells and rows
     """
 
-    def __init__(self, theme: Theme | None = None) -> None:
+    def __init__(
+        self,
+        theme: Theme | None = None,
+        *,
+        collapse_repeats: bool = False,
+        package: PackageOptions | None = None,
+    ) -> None:
         """Initialize renderer with optional theme.
 
         Args:
             theme: Theme for styling (None for default styles)
+            collapse_repeats: Collapse identical adjacent cells and rows into
+                single elements using table:number-columns-repeated and
+                table:number-rows-repeated. Greatly reduces content.xml size
+                for blank entry templates, but readers that index cells
+                positionally without expanding repeats will see fewer cells.
+            package: Zip packaging options (compression level, parallel
+                deflate). None keeps odfpy's default packaging.
         """
         self._theme = theme
+        self._collapse_repeats = collapse_repeats
+        self._package = package
+        self._stats = RenderStats()
+        self._formatters: dict[tuple[str | None, str | None], _CellFormatter] = {}
         self._doc: OpenDocumentSpreadsheet | None = None
         self._styles: dict[str, Style] = {}
         self._style_counter = 0
@@ -86,6 +325,11 @@ def __init__(self, theme: Theme | None = None) -> None:
         self._tables: dict[str, Table] = {}  # Track tables by sheet name for charts
         self._charts: list[dict[str, Any]] = []  # Track charts for embedding
 
+    @property
+    def stats(self) -> RenderStats:
+        """Compression metrics for the most recent render() call."""
+        return self._stats
+
     def render(
         self,
         sheets: list[SheetSpec],
@@ -111,19 +355,59 @@ def render(
         Returns:
             Path to created file
         """
-        self._doc = OpenDocumentSpreadsheet()
-        self._styles.clear()
-        self._style_counter = 0
-        self._chart_counter = 0
-        self._tables.clear()
-        self._charts.clear()
+        doc = self._build_document(
+            sheets, named_ranges, charts, conditional_formats, validations
+        )
 
-        # Create default styles
-        self._create_default_styles()
+        # Save document
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if self._package is not None:
+            from spreadsheet_dl.ods_packaging import save_document
 
-        # Create theme-based styles if theme provided
-        if self._theme:
-            self._create_theme_styles()
+            save_document(doc, output_path, self._package)
+        else:
+            doc.save(str(output_path))
+        return output_path
+
+    def render_stream(
+        self,
+        sheets: list[SheetSpec],
+        stream: BinaryIO,
+        named_ranges: list[NamedRangeSpec] | None = None,
+        charts: list[ChartSpec] | None = None,
+        conditional_formats: list[ConditionalFormat] | None = None,
+        validations: list[ValidationConfig] | None = None,
+    ) -> None:
+        """Render sheets to ODS and write the package to a binary stream.
+
+        The stream does not need to be seekable, so pipes and encrypting
+        writers work as targets.
+
+        Args:
+            sheets: List of sheet specifications
+            stream: Writable binary stream
+            named_ranges: List of named ranges to export (optional)
+            charts: List of chart specifications to render (optional)
+            conditional_formats: List of conditional formats (optional)
+            validations: List of data validations (optional)
+        """
+        from spreadsheet_dl.ods_packaging import save_document
+
+        doc = self._build_document(
+            sheets, named_ranges, charts, conditional_formats, validations
+        )
+        save_document(doc, stream, self._package)
+
+    def _build_document(
+        self,
+        sheets: list[SheetSpec],
+        named_ranges: list[NamedRangeSpec] | None,
+        charts: list[ChartSpec] | None,
+        conditional_formats: list[ConditionalFormat] | None,
+        validations: list[ValidationConfig] | None,
+    ) -> OpenDocumentSpreadsheet:
+        """Build a fresh document from sheet specifications."""
+        doc = self.begin_document()
 
         # Render each sheet
         for sheet_spec in sheets:
@@ -145,10 +429,102 @@ def render(
         if validations:
             self._add_data_validations(validations)
 
-        # Save document
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        self._doc.save(str(output_path))
-        return output_path
+        return doc
+
+    def begin_document(self) -> OpenDocumentSpreadsheet:
+        """Start a fresh document holding only the default and theme styles.
+
+        render() calls this itself. Writers that produce a sheet in batches
+        call it once, then render_rows_xml() per batch and
+        add_rows_placeholder() per sheet.
+
+        Returns:
+            The new document
+        """
+        doc = self._doc = OpenDocumentSpreadsheet()
+        self._styles.clear()
+        self._formatters.clear()
+        self._style_counter = 0
+        self._chart_counter = 0
+        self._tables.clear()
+        self._charts.clear()
+        self._stats = RenderStats()
+
+        # Create default styles
+        self._create_default_styles()
+
+        # Create theme-based styles if theme provided
+        if self._theme:
+            self._create_theme_styles()
+        return doc
+
+    def render_rows_xml(
+        self,
+        rows: Iterable[RowSpec],
+        columns: list[ColumnSpec],
+        first_row: int,
+        style_names: set[str],
+    ) -> str:
+        """Render one batch of a sheet's rows as table-row XML text.
+
+        The rows are not added to the document, so a sheet of any length
+        can be rendered batch by batch and spilled to disk. Repeated rows
+        are only collapsed within a batch.
+
+        Args:
+            rows: Row specifications
+            columns: Column specifications for type info
+            first_row: Index of the first row in the sheet (0 starts a new
+                sheet and forgets merges from the previous one)
+            style_names: Style names used by the rows are added here; pass
+                the set to add_rows_placeholder() for the sheet
+
+        Returns:
+            Serialized table:table-row elements
+        """
+        if first_row == 0:
+            self._merged_regions.clear()
+        xml = io.StringIO()
+        for row in self._render_rows(rows, columns, first_row):
+            name = row.attributes.get(_STYLE_NAME)
+            if name is not None:
+                style_names.add(name)
+            for cell in row.childNodes:
+                name = cell.attributes.get(_STYLE_NAME)
+                if name is not None:
+                    style_names.add(name)
+            row.toXml(1, xml)
+            _release(row)
+        return xml.getvalue()
+
+    def add_rows_placeholder(
+        self, sheet_spec: SheetSpec, style_names: Iterable[str]
+    ) -> str:
+        """Add a sheet whose rows are supplied later as XML text.
+
+        The sheet is rendered as usual and ends with a placeholder row
+        that references style_names, so content.xml keeps those automatic
+        styles. Replace the placeholder in content.xml with the output of
+        render_rows_xml().
+
+        Args:
+            sheet_spec: Sheet specification (usually without rows)
+            style_names: Styles used by the rows rendered separately
+
+        Returns:
+            Serialized placeholder, exactly as it appears in content.xml
+        """
+        if self._doc is None:
+            raise ValueError("Document not initialized")
+        self._render_sheet(sheet_spec)
+        marker = f"__rows_{len(self._doc.spreadsheet.childNodes)}__"
+        placeholder = TableRow(stylename=marker)
+        for name in sorted(style_names):
+            placeholder.addElement(TableCell(stylename=name))
+        self._tables[sheet_spec.name].addElement(placeholder)
+        xml = io.StringIO()
+        placeholder.toXml(1, xml)
+        return xml.getvalue()
 
     def _create_default_styles(self) -> None:
         """Create default cell styles."""
@@ -336,9 +712,7 @@ def _render_sheet(self, sheet_spec: SheetSpec) -> None:
                 col.setAttribute("visibility", "collapse")
             table.addElement(col)
 
-        # Add rows
-        for row_idx, row_spec in enumerate(sheet_spec.rows):
-            row = self._render_row(row_spec, sheet_spec.columns, row_idx)
+        for row in self._render_rows(sheet_spec.rows, sheet_spec.columns, 0):
             table.addElement(row)
 
         # Store table reference for chart embedding
@@ -535,12 +909,41 @@ def _create_row_style(self, height: str) -> Style:
         self._doc.automaticstyles.addElement(row_style)
         return row_style
 
-    def _render_row(
+    def _render_rows(
+        self, rows: Iterable[RowSpec], columns: list[ColumnSpec], first_row: int
+    ) -> list[TableRow]:
+        """Render rows, collapsing identical adjacent rows when enabled.
+
+        Args:
+            rows: Row specifications
+            columns: Column specifications for type info
+            first_row: Sheet index of the first row (0-based)
+
+        Returns:
+            ODF TableRows in order
+        """
+        rendered: list[TableRow] = []
+        prev_key: tuple[Any, ...] | None = None
+        repeat = 1
+        for row_idx, row_spec in enumerate(rows, start=first_row):
+            runs, row_key = self._plan_row(row_spec, columns, row_idx)
+            self._stats.logical_rows += 1
+            if row_key is not None and row_key == prev_key and rendered:
+                repeat += 1
+                rendered[-1].setAttribute("numberrowsrepeated", repeat)
+                continue
+            rendered.append(self._render_row(row_spec, runs))
+            prev_key, repeat = row_key, 1
+        return rendered
+
+    def _plan_row(
         self, row_spec: RowSpec, columns: list[ColumnSpec], row_idx: int
-    ) -> TableRow:
-        """Render a single row.
+    ) -> tuple[list[_CellRun], tuple[Any, ...] | None]:
+        """Resolve cell attributes for a row and group identical neighbours.
 
-        Handles cell merge rendering with covered cells.
+        Tracks merged regions so covered cells are skipped. When repeat
+        collapsing is enabled, adjacent cells with identical attributes and
+        display text are merged into a single run.
 
         Args:
             row_spec: Row specification
@@ -548,50 +951,112 @@ def _render_row(
             row_idx: Current row index (0-based)
 
         Returns:
-            ODF TableRow
+            Tuple of (cell runs, row key). The row key identifies rows that
+            can be collapsed into a repeated row; it is None when the row
+            must be emitted on its own (collapsing disabled, or the row
+            takes part in a merge).
         """
-        # Create row with optional height style
-        if row_spec.height:
-            row_style = self._create_row_style(row_spec.height)
-            row = TableRow(stylename=row_style)
-        else:
-            row = TableRow()
+        runs: list[_CellRun] = []
+        collapsible = self._collapse_repeats
+        prev_key: tuple[Any, ...] | None = None
 
         for col_idx, cell_spec in enumerate(row_spec.cells):
             # Check if this cell is covered by a previous merge
             if (row_idx, col_idx) in self._merged_regions:
-                # This cell is covered, skip it (covered cells added by parent)
+                # This cell is covered, skip it (covered cells added by parent).
+                # Covered cells are not counted on either side of the stats.
+                collapsible = False
+                prev_key = None
                 continue
 
+            self._stats.logical_cells += 1
+
             col_spec = columns[col_idx] if col_idx < len(columns) else None
-            cell = self._render_cell(
-                cell_spec, row_spec.style, col_spec, row_idx, col_idx
+            attrs, display_text = self._get_cell_attrs(
+                cell_spec, row_spec.style, col_spec
             )
-            row.addElement(cell)
 
-            # If cell has colspan/rowspan, add covered cells and track regions
+            # If cell has colspan/rowspan, track the regions it covers
             if cell_spec.colspan > 1 or cell_spec.rowspan > 1:
-                # Mark covered regions
                 for r in range(row_idx, row_idx + cell_spec.rowspan):
                     for c in range(col_idx, col_idx + cell_spec.colspan):
                         if r != row_idx or c != col_idx:  # Skip the origin cell
                             self._merged_regions.add((r, c))
+                runs.append((attrs, display_text, 1, cell_spec.colspan))
+                collapsible = False
+                prev_key = None
+                continue
+
+            if self._collapse_repeats:
+                key = (tuple(attrs.items()), display_text)
+                if key == prev_key:
+                    run_attrs, text, count, colspan = runs[-1]
+                    runs[-1] = (run_attrs, text, count + 1, colspan)
+                    continue
+                prev_key = key
+
+            runs.append((attrs, display_text, 1, 1))
+
+        if not collapsible:
+            return runs, None
+
+        row_key = (
+            row_spec.height,
+            tuple(
+                (tuple(run_attrs.items()), text, count)
+                for run_attrs, text, count, _ in runs
+            ),
+        )
+        return runs, row_key
+
+    def _render_row(self, row_spec: RowSpec, runs: list[_CellRun]) -> TableRow:
+        """Render a single row from its planned cell runs.
+
+        Handles cell merge rendering with covered cells.
+
+        Args:
+            row_spec: Row specification
+            runs: Cell runs produced by _plan_row()
+
+        Returns:
+            ODF TableRow
+        """
+        # Create row with optional height style
+        if row_spec.height:
+            row_style = self._create_row_style(row_spec.height)
+            row = TableRow(stylename=row_style)
+        else:
+            row = TableRow()
+        self._stats.emitted_rows += 1
+
+        for attrs, display_text, count, colspan in runs:
+            # Attributes are pre-resolved to qualified names and string values,
+            # so bypass odfpy's per-keyword lookup and conversion.
+            cell = TableCell(check_grammar=False)
+            cell.attributes.update(attrs)
+            if _FORMULA in attrs:
+                # Formulas go through odfpy so their namespace prefix is declared
+                cell.setAttrNS(*_FORMULA, attrs[_FORMULA])
+            if count > 1:
+                cell.attributes[_COLS_REPEATED] = str(count)
+            if display_text:
+                cell.addElement(P(text=display_text))
+            row.addElement(cell)
+            self._stats.emitted_cells += 1
 
-                # Add covered cells for remaining columns in this row
-                for _c in range(col_idx + 1, col_idx + cell_spec.colspan):
-                    row.addElement(CoveredTableCell())
+            # Add covered cells for remaining columns in this row
+            for _c in range(1, colspan):
+                row.addElement(CoveredTableCell())
 
         return row
 
-    def _render_cell(
+    def _get_cell_attrs(
         self,
         cell_spec: CellSpec,
         row_style: str | None,
         col_spec: ColumnSpec | None,
-        row_idx: int,
-        col_idx: int,
-    ) -> TableCell:
-        """Render a single cell.
+    ) -> tuple[dict[_QName, str], str]:
+        """Resolve ODF attributes and display text for a single cell.
 
         Handles cell merge rendering with colspan/rowspan.
 
@@ -599,63 +1064,59 @@ def _render_cell(
             cell_spec: Cell specification
             row_style: Default row style
             col_spec: Column specification for type info
-            row_idx: Row index (for merge tracking)
-            col_idx: Column index (for merge tracking)
 
         Returns:
-            ODF TableCell
+            Tuple of (qualified TableCell attributes, display text)
         """
-        # Determine style
+        # Determine style and value type
         style_name = cell_spec.style or row_style
-        if style_name and style_name in self._styles:
-            style = self._styles[style_name]
-        else:
-            style = self._styles.get("default")
-
-        # Determine value type
         value_type = cell_spec.value_type
         if not value_type and col_spec:
             value_type = col_spec.type
 
-        # Create cell with appropriate type
-        cell_kwargs: dict[str, Any] = {}
+        formatter = self._get_formatter(value_type, style_name)
 
-        if style:
-            cell_kwargs["stylename"] = style
+        if cell_spec.formula:
+            attrs, display_text = formatter.encode_formula(
+                cell_spec.formula, cell_spec.value
+            )
+        else:
+            attrs, display_text = formatter.encode(cell_spec.value)
 
         # Add colspan/rowspan attributes if merging
         if cell_spec.colspan > 1:
-            cell_kwargs["numbercolumnsspanned"] = cell_spec.colspan
+            attrs[_COLS_SPANNED] = str(cell_spec.colspan)
         if cell_spec.rowspan > 1:
-            cell_kwargs["numberrowsspanned"] = cell_spec.rowspan
-
-        if cell_spec.formula:
-            cell_kwargs["formula"] = cell_spec.formula
-            cell_kwargs["valuetype"] = self._get_odf_value_type(value_type)
+            attrs[_ROWS_SPANNED] = str(cell_spec.rowspan)
 
-        elif cell_spec.value is not None:
-            cell_kwargs.update(self._get_value_attrs(cell_spec.value, value_type))
+        return attrs, display_text
 
-        cell = TableCell(**cell_kwargs)
+    def _get_formatter(
+        self, value_type: str | None, style_name: str | None
+    ) -> _CellFormatter:
+        """Get the cell formatter specialised for a type hint and style.
 
-        # Add display text
-        display_text = self._get_display_text(cell_spec.value, value_type)
-        if display_text:
-            cell.addElement(P(text=display_text))
+        Args:
+            value_type: Column or cell type hint
+            style_name: Cell or row style name
 
-        return cell
+        Returns:
+            Cached formatter for the pair
+        """
+        key = (value_type, style_name)
+        formatter = self._formatters.get(key)
+        if formatter is None:
+            if style_name and style_name in self._styles:
+                style = self._styles[style_name]
+            else:
+                style = self._styles.get("default")
+            formatter = _CellFormatter(self, value_type, style)
+            self._formatters[key] = formatter
+        return formatter
 
     def _get_odf_value_type(self, type_hint: str | None) -> str:
         """Map type hint to ODF value type."""
-        type_map = {
-            "string": "string",
-            "currency": "currency",
-            "date": "date",
-            "percentage": "percentage",
-            "float": "float",
-            "number": "float",
-        }
-        return type_map.get(type_hint or "", "string")
+        return _ODF_VALUE_TYPES.get(type_hint or "", "string")
 
     def _get_value_attrs(
         self,
@@ -1566,6 +2027,9 @@ def render_sheets(
     charts: list[ChartSpec] | None = None,
     conditional_formats: list[ConditionalFormat] | None = None,
     validations: list[ValidationConfig] | None = None,
+    *,
+    collapse_repeats: bool = False,
+    package: PackageOptions | None = None,
 ) -> Path:
     """Convenience function to render sheets to ODS.
 
@@ -1579,11 +2043,13 @@ def render_sheets(
         charts: Optional chart specifications
         conditional_formats: Optional conditional formats
         validations: Optional data validations
+        collapse_repeats: Collapse identical adjacent cells and rows
+        package: Optional zip packaging options
 
     Returns:
         Path to created file
     """
-    renderer = OdsRenderer(theme)
+    renderer = OdsRenderer(theme, collapse_repeats=collapse_repeats, package=package)
     return renderer.render(
         sheets,
         Path(output_path),
@@ -10,6 +10,7 @@
 from pathlib import Path
 from typing import Any
 
+from spreadsheet_dl.performance import get_compiled_cache
 from spreadsheet_dl.schema.styles import (
     Border,
     BorderStyle,
@@ -41,6 +42,8 @@
 try:
     import yaml
 
+    # libyaml-backed loader when PyYAML was built with it
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     YAML_AVAILABLE = True
 except ImportError:
     YAML_AVAILABLE = False
@@ -54,18 +57,26 @@ class ThemeLoader:
     - Theme inheritance (extends)
     - Color reference resolution
     - Style inheritance resolution
-    - Theme caching
+    - Theme caching, in memory and optionally compiled on disk
     """
 
     # Default theme directory (relative to this file)
     DEFAULT_THEME_DIR = Path(__file__).parent.parent / "themes"
 
-    def __init__(self, theme_dir: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        theme_dir: Path | str | None = None,
+        cache_dir: Path | str | None = None,
+    ) -> None:
         """Initialize theme loader.
 
         Args:
             theme_dir: Directory containing theme YAML files.
                       Defaults to package themes/ directory.
+            cache_dir: Directory for compiled (parsed and resolved) themes,
+                      reused across processes until a source file changes.
+                      Defaults to $SPREADSHEET_DL_CACHE_DIR; disabled when
+                      neither is set.
         """
         if theme_dir is None:
             self.theme_dir = self.DEFAULT_THEME_DIR
@@ -73,6 +84,9 @@ def __init__(self, theme_dir: Path | str | None = None) -> None:
             self.theme_dir = Path(theme_dir)
 
         self._cache: dict[str, Theme] = {}
+        # Files each cached theme was built from, including its parents
+        self._sources: dict[str, list[str]] = {}
+        self._compiled = get_compiled_cache("themes", cache_dir)
 
     def load(self, name: str) -> Theme:
         """Load theme by name.
@@ -107,9 +121,16 @@ def load(self, name: str) -> Theme:
                     f"Theme not found: {name} (looked in {self.theme_dir})"
                 )
 
+        key = str(theme_path.resolve())
+        if self._compiled is not None:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                self._cache[name], self._sources[name] = compiled
+                return self._cache[name]
+
         # Load and parse
         with open(theme_path, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         if data is None:
             raise SchemaValidationError(f"Theme file is empty: {theme_path}")
@@ -121,14 +142,30 @@ def load(self, name: str) -> Theme:
         theme = self._parse_theme(data)
 
         # Handle inheritance from parent theme
-        if theme.meta.extends:
-            parent = self.load(theme.meta.extends)
+        sources = [key]
+        extends = theme.meta.extends
+        if extends:
+            parent = self.load(extends)
             theme = self._merge_themes(parent, theme)
+            sources += self._sources[extends]
 
         # Cache and return
         self._cache[name] = theme
+        self._sources[name] = sources
+        if self._compiled is not None:
+            self._compiled.set(key, (theme, sources), sources)
         return theme
 
+    def load_all(self) -> dict[str, Theme]:
+        """Load every available theme.
+
+        Shared parent themes are parsed once for the whole batch.
+
+        Returns:
+            Dictionary mapping theme names to loaded Themes
+        """
+        return {name: self.load(name) for name in self.list_themes()}
+
     def load_from_string(self, yaml_content: str) -> Theme:
         """Load theme from YAML string.
 
@@ -141,7 +178,7 @@ def load_from_string(self, yaml_content: str) -> Theme:
         if not YAML_AVAILABLE:
             raise ImportError("PyYAML is required for theme loading")
 
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_YamlLoader)
         if data is None:
             raise SchemaValidationError("Theme content is empty")
 
@@ -181,8 +218,13 @@ def list_themes(self) -> list[str]:
         return sorted(themes)
 
     def clear_cache(self) -> None:
-        """Clear the theme cache."""
+        """Clear the in-memory theme cache.
+
+        Compiled themes on disk are kept; they are invalidated by changes
+        to their source files.
+        """
         self._cache.clear()
+        self._sources.clear()
 
     def _parse_theme(self, data: dict[str, Any]) -> Theme:
         """Parse theme from YAML data.
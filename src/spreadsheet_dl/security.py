@@ -16,17 +16,20 @@
 import base64
 import hashlib
 import hmac
+import io
 import json
 import os
 import secrets
-import tempfile
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from spreadsheet_dl.exceptions import (
+    CredentialError,
     DecryptionError,
     EncryptionError,
     FileError,
@@ -34,10 +37,14 @@
     SpreadsheetDLError,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Buffer, Iterator
+
 __all__ = [
     "AuditLogEntry",
     "CredentialStore",
     "DecryptionError",
+    "EncryptingWriter",
     "EncryptionAlgorithm",
     "EncryptionError",
     "EncryptionMetadata",
@@ -71,6 +78,12 @@ class KeyDerivationFunction(Enum):
 SALT_SIZE = 32  # 256 bits
 NONCE_SIZE = 12  # 96 bits for GCM
 TAG_SIZE = 16  # 128 bits for GCM authentication tag
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # Plaintext bytes per streaming frame
+
+# Streaming frame flags: data frames carry plaintext, the final frame carries
+# the SHA-256 of the whole plaintext and marks the end of the stream.
+_FRAME_DATA = 0
+_FRAME_FINAL = 1
 
 
 @dataclass
@@ -86,6 +99,7 @@ class EncryptionMetadata:
     created_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
     original_filename: str = ""
     content_hash: str = ""  # SHA-256 of original content
+    chunk_size: int = 0  # Plaintext bytes per frame (0 = single-shot format)
 
     def to_json(self) -> str:
         """Serialize metadata to JSON."""
@@ -100,6 +114,7 @@ def to_json(self) -> str:
                 "created_at": self.created_at,
                 "original_filename": self.original_filename,
                 "content_hash": self.content_hash,
+                "chunk_size": self.chunk_size,
             }
         )
 
@@ -117,6 +132,7 @@ def from_json(cls, json_str: str) -> EncryptionMetadata:
             created_at=data.get("created_at", ""),
             original_filename=data.get("original_filename", ""),
             content_hash=data.get("content_hash", ""),
+            chunk_size=data.get("chunk_size", 0),
         )
 
 
@@ -260,6 +276,12 @@ def _derive_key_pbkdf2(
     )
 
 
+def _zeroize(buffer: bytearray) -> None:
+    """Overwrite a key buffer with zeros."""
+    for i in range(len(buffer)):
+        buffer[i] = 0
+
+
 def _encrypt_aes_gcm(
     plaintext: bytes,
     key: bytes,
@@ -335,21 +357,148 @@ def _xor_encrypt(data: bytes, key: bytes, nonce: bytes) -> bytes:
     Returns:
         XORed data
     """
-    result = bytearray(len(data))
+    if not data:
+        return b""
+
     block_size = 32  # SHA-256 output size
+    prefix = key + nonce
+    blocks = (len(data) + block_size - 1) // block_size
+
+    # Generate the keystream block by block, then XOR it in one big-int
+    # operation instead of byte by byte.
+    keystream = b"".join(
+        hashlib.sha256(prefix + counter.to_bytes(8, "big")).digest()
+        for counter in range(blocks)
+    )[: len(data)]
+    mixed = int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")
+    return mixed.to_bytes(len(data), "big")
+
+
+def _frame_nonce(base_nonce: bytes, index: int, flag: int) -> bytes:
+    """Derive the nonce of a streaming frame.
+
+    The first 7 bytes of the file nonce are followed by the 32-bit frame
+    index and the frame flag, so every frame gets a unique nonce and a
+    reordered, duplicated or relabelled frame fails authentication.
+
+    Args:
+        base_nonce: Random per-file nonce from the metadata
+        index: Zero-based frame index
+        flag: Frame flag (data or final)
+
+    Returns:
+        12-byte frame nonce
+    """
+    return base_nonce[:7] + index.to_bytes(4, "big") + flag.to_bytes(1, "big")
+
+
+class EncryptingWriter(io.RawIOBase):
+    """Writable binary stream that encrypts into the chunked format.
+
+    Buffers at most one chunk of plaintext, so memory use is constant no
+    matter how much is written. The stream is not seekable, which makes it
+    usable as a pipe target and as the output of zip writers.
+
+    Obtain instances via FileEncryptor.open_writer(). Leaving a ``with``
+    block through an exception calls abort() instead of close(), so a
+    failed write never produces a stream that decrypts as complete.
+    """
+
+    def __init__(
+        self,
+        sink: BinaryIO,
+        key: bytes,
+        metadata: EncryptionMetadata,
+    ) -> None:
+        """Initialize the writer and emit the file header.
+
+        Args:
+            sink: Binary stream receiving the encrypted bytes
+            key: 32-byte key derived from the password
+            metadata: Metadata written to the header
+        """
+        super().__init__()
+        self._sink = sink
+        self._key = key
+        self.metadata = metadata
+        self._buffer = bytearray()
+        self._hasher = hashlib.sha256()
+        self._index = 0
+        self._written = 0
+        FileEncryptor._write_header(sink, FileEncryptor.FORMAT_VERSION, metadata)
+
+    def writable(self) -> bool:
+        """Return True; the stream only supports writing."""
+        return True
+
+    def tell(self) -> int:
+        """Return the number of plaintext bytes written so far."""
+        return self._written
+
+    def write(self, data: Buffer) -> int:
+        """Buffer plaintext and emit full frames.
 
-    for i in range(0, len(data), block_size):
-        # Generate keystream block
-        counter = i // block_size
-        block_input = key + nonce + counter.to_bytes(8, "big")
-        keystream = hashlib.sha256(block_input).digest()
+        Args:
+            data: Plaintext bytes
 
-        # XOR with data
-        chunk = data[i : i + block_size]
-        for j, byte in enumerate(chunk):
-            result[i + j] = byte ^ keystream[j]
+        Returns:
+            Number of bytes accepted
+        """
+        if self.closed:
+            raise ValueError("write to closed EncryptingWriter")
+        view = memoryview(data).cast("B")
+        self._buffer += view
+        self._hasher.update(view)
+        self._written += len(view)
+
+        chunk_size = self.metadata.chunk_size
+        while len(self._buffer) >= chunk_size:
+            self._emit(_FRAME_DATA, bytes(self._buffer[:chunk_size]))
+            del self._buffer[:chunk_size]
+        return len(view)
+
+    def close(self) -> None:
+        """Emit the last data frame and the final frame."""
+        if self.closed:
+            return
+        try:
+            if self._buffer:
+                self._emit(_FRAME_DATA, bytes(self._buffer))
+                self._buffer.clear()
+            digest = self._hasher.digest()
+            self.metadata.content_hash = digest.hex()
+            self._emit(_FRAME_FINAL, digest)
+            self._sink.flush()
+        finally:
+            super().close()
 
-    return bytes(result)
+    def abort(self) -> None:
+        """Close without the final frame, leaving the stream undecryptable.
+
+        Use when the plaintext could not be written in full; data frames
+        already emitted stay in the sink but fail decryption as truncated.
+        """
+        if self.closed:
+            return
+        self._buffer.clear()
+        super().close()
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Close on success, abort if an exception is propagating."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _emit(self, flag: int, plaintext: bytes) -> None:
+        """Encrypt one frame and write it to the sink."""
+        nonce = _frame_nonce(self.metadata.nonce, self._index, flag)
+        ciphertext, tag = _encrypt_aes_gcm(plaintext, self._key, nonce)
+        self._sink.write(flag.to_bytes(1, "big"))
+        self._sink.write(len(ciphertext).to_bytes(4, "big"))
+        self._sink.write(tag)
+        self._sink.write(ciphertext)
+        self._index += 1
 
 
 class FileEncryptor:
@@ -358,6 +507,13 @@ class FileEncryptor:
     Provides password-based encryption for ODS files using AES-256-GCM
     with PBKDF2-SHA256 key derivation.
 
+    Files are written in a chunked format (version 2): after the header
+    come authenticated frames of at most ``chunk_size`` plaintext bytes,
+    each with a nonce derived from its index, followed by a final frame
+    holding the SHA-256 of the plaintext. Encryption and decryption run in
+    constant memory and work on pipes. Single-shot version 1 files are
+    still readable.
+
     Example:
         >>> encryptor = FileEncryptor()  # doctest: +SKIP
         >>> encryptor.encrypt_file("budget.ods", "budget.ods.enc", "my-password")  # doctest: +SKIP
@@ -365,7 +521,8 @@ class FileEncryptor:
     """
 
     MAGIC_BYTES = b"SDLENC"  # SpreadsheetDL Encrypted
-    FORMAT_VERSION = 1
+    FORMAT_VERSION = 2
+    LEGACY_FORMAT_VERSION = 1
 
     def __init__(self, audit_log: SecurityAuditLog | None = None) -> None:
         """Initialize file encryptor.
@@ -382,6 +539,7 @@ def encrypt_file(
         password: str,
         *,
         delete_original: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> EncryptionMetadata:
         """Encrypt a file with password.
 
@@ -390,6 +548,7 @@ def encrypt_file(
             output_path: Path for encrypted output
             password: Encryption password
             delete_original: Whether to securely delete original
+            chunk_size: Plaintext bytes per encrypted frame
 
         Returns:
             Encryption metadata
@@ -405,33 +564,15 @@ def encrypt_file(
             raise FileError(f"File not found: {input_path}")
 
         try:
-            # Read original file
-            with open(input_path, "rb") as f:
-                plaintext = f.read()
-
-            # Generate random salt and nonce
-            salt = secrets.token_bytes(SALT_SIZE)
-            nonce = secrets.token_bytes(NONCE_SIZE)
-
-            # Derive key from password
-            key = _derive_key_pbkdf2(password, salt, DEFAULT_ITERATIONS)
-
-            # Calculate content hash for integrity
-            content_hash = hashlib.sha256(plaintext).hexdigest()
-
-            # Encrypt
-            ciphertext, tag = _encrypt_aes_gcm(plaintext, key, nonce)
-
-            # Create metadata
-            metadata = EncryptionMetadata(
-                salt=salt,
-                nonce=nonce,
-                original_filename=input_path.name,
-                content_hash=content_hash,
-            )
-
-            # Write encrypted file
-            self._write_encrypted_file(output_path, ciphertext, tag, metadata)
+            try:
+                with open(input_path, "rb") as src, open(output_path, "wb") as dst:
+                    metadata = self._encrypt_stream(
+                        src, dst, password, chunk_size, input_path.name
+                    )
+            except BaseException:
+                # Never leave a truncated ciphertext behind
+                output_path.unlink(missing_ok=True)
+                raise
 
             # Securely delete original if requested
             if delete_original:
@@ -464,6 +605,113 @@ def encrypt_file(
             )
             raise EncryptionError(f"Failed to encrypt file: {e}") from e
 
+    def encrypt_stream(
+        self,
+        source: BinaryIO,
+        sink: BinaryIO,
+        password: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        original_filename: str = "",
+    ) -> EncryptionMetadata:
+        """Encrypt a binary stream into another stream in constant memory.
+
+        Args:
+            source: Readable binary stream (file, pipe, socket)
+            sink: Writable binary stream
+            password: Encryption password
+            chunk_size: Plaintext bytes per encrypted frame
+            original_filename: Filename recorded in the metadata
+
+        Returns:
+            Encryption metadata, including the plaintext SHA-256
+
+        Raises:
+            EncryptionError: If reading or writing fails
+        """
+        try:
+            metadata = self._encrypt_stream(
+                source, sink, password, chunk_size, original_filename
+            )
+        except OSError as e:
+            self.audit_log.log_action(
+                "encrypt", "<stream>", success=False, details={"error": str(e)}
+            )
+            raise EncryptionError(f"Failed to encrypt stream: {e}") from e
+
+        self.audit_log.log_action(
+            "encrypt",
+            "<stream>",
+            success=True,
+            details={"algorithm": metadata.algorithm},
+        )
+        return metadata
+
+    def open_writer(
+        self,
+        sink: BinaryIO,
+        password: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        original_filename: str = "",
+    ) -> EncryptingWriter:
+        """Open a writable stream that encrypts everything written to it.
+
+        Closing the writer emits the final frame; the sink itself is left
+        open. If the ``with`` block raises, or abort() is called, the final
+        frame is omitted and the output fails to decrypt.
+
+        Args:
+            sink: Writable binary stream receiving the encrypted bytes
+            password: Encryption password
+            chunk_size: Plaintext bytes per encrypted frame
+            original_filename: Filename recorded in the metadata
+
+        Returns:
+            EncryptingWriter to be used as a context manager
+
+        Raises:
+            ValueError: If chunk_size is not positive
+
+        Example:
+            >>> with open("export.ods.enc", "wb") as raw:  # doctest: +SKIP
+            ...     with encryptor.open_writer(raw, "pw") as out:
+            ...         out.write(data)
+        """
+        if chunk_size <= 0:
+            raise ValueError(
+                f"chunk_size must be positive, got {chunk_size}. "
+                "Fix: Use a frame size such as 1048576 (1 MiB)."
+            )
+        salt = secrets.token_bytes(SALT_SIZE)
+        metadata = EncryptionMetadata(
+            salt=salt,
+            nonce=secrets.token_bytes(NONCE_SIZE),
+            original_filename=original_filename,
+            chunk_size=chunk_size,
+        )
+        key = _derive_key_pbkdf2(password, salt, metadata.iterations)
+        return EncryptingWriter(sink, key, metadata)
+
+    def _encrypt_stream(
+        self,
+        source: BinaryIO,
+        sink: BinaryIO,
+        password: str,
+        chunk_size: int,
+        original_filename: str,
+    ) -> EncryptionMetadata:
+        """Pump source through an EncryptingWriter into sink."""
+        with self.open_writer(
+            sink,
+            password,
+            chunk_size=chunk_size,
+            original_filename=original_filename,
+        ) as writer:
+            while block := source.read(chunk_size):
+                writer.write(block)
+        return writer.metadata
+
     def decrypt_file(
         self,
         input_path: str | Path,
@@ -494,27 +742,16 @@ def decrypt_file(
         if not input_path.exists():
             raise FileError(f"File not found: {input_path}")
 
+        # Decrypt next to the output and move into place only once every
+        # frame has been authenticated.
+        temp_path = output_path.with_name(f".{output_path.name}.decrypt")
         try:
-            # Read encrypted file
-            ciphertext, tag, metadata = self._read_encrypted_file(input_path)
-
-            # Derive key from password
-            key = _derive_key_pbkdf2(password, metadata.salt, metadata.iterations)
-
-            # Decrypt
-            plaintext = _decrypt_aes_gcm(ciphertext, key, metadata.nonce, tag)
-
-            # Verify content hash
-            if verify_hash and metadata.content_hash:
-                actual_hash = hashlib.sha256(plaintext).hexdigest()
-                if actual_hash != metadata.content_hash:
-                    raise IntegrityError(
-                        "Content hash mismatch - file may be corrupted"
-                    )
-
-            # Write decrypted file
-            with open(output_path, "wb") as f:
-                f.write(plaintext)
+            try:
+                with open(input_path, "rb") as src, open(temp_path, "wb") as dst:
+                    metadata = self._decrypt_stream(src, dst, password, verify_hash)
+                os.replace(temp_path, output_path)
+            finally:
+                temp_path.unlink(missing_ok=True)
 
             # Log action
             self.audit_log.log_action(
@@ -551,6 +788,142 @@ def decrypt_file(
             )
             raise DecryptionError(f"Failed to decrypt file: {e}", reason=str(e)) from e
 
+    def decrypt_stream(
+        self,
+        source: BinaryIO,
+        sink: BinaryIO,
+        password: str,
+        *,
+        verify_hash: bool = True,
+    ) -> EncryptionMetadata:
+        """Decrypt a binary stream into another stream.
+
+        Chunked (version 2) input is decrypted frame by frame in constant
+        memory; each frame is authenticated before it is written. Legacy
+        (version 1) input is decrypted in one piece.
+
+        Args:
+            source: Readable binary stream with encrypted data
+            sink: Writable binary stream for the plaintext
+            password: Decryption password
+            verify_hash: Whether to verify the plaintext SHA-256
+
+        Returns:
+            Encryption metadata
+
+        Raises:
+            DecryptionError: If the stream is not a valid encrypted stream
+            IntegrityError: If authentication or the hash check fails
+        """
+        try:
+            return self._decrypt_stream(source, sink, password, verify_hash)
+        except OSError as e:
+            raise DecryptionError(
+                f"Failed to decrypt stream: {e}", reason=str(e)
+            ) from e
+
+    def _decrypt_stream(
+        self,
+        source: BinaryIO,
+        sink: BinaryIO,
+        password: str,
+        verify_hash: bool,
+    ) -> EncryptionMetadata:
+        """Decrypt either file format from source into sink."""
+        version, metadata = self._read_header(source)
+        key = _derive_key_pbkdf2(password, metadata.salt, metadata.iterations)
+        self._decrypt_body(source, sink, version, metadata, key, verify_hash)
+        return metadata
+
+    def _decrypt_body(
+        self,
+        source: BinaryIO,
+        sink: BinaryIO,
+        version: int,
+        metadata: EncryptionMetadata,
+        key: bytes,
+        verify_hash: bool,
+    ) -> None:
+        """Decrypt the data following a header with an already derived key."""
+        if version == self.LEGACY_FORMAT_VERSION:
+            tag = source.read(TAG_SIZE)
+            plaintext = _decrypt_aes_gcm(source.read(), key, metadata.nonce, tag)
+            if verify_hash and metadata.content_hash:
+                actual_hash = hashlib.sha256(plaintext).hexdigest()
+                if actual_hash != metadata.content_hash:
+                    raise IntegrityError(
+                        "Content hash mismatch - file may be corrupted"
+                    )
+            sink.write(plaintext)
+            return
+
+        hasher = hashlib.sha256()
+        index = 0
+        while True:
+            header = source.read(5)
+            if len(header) < 5:
+                raise IntegrityError("Encrypted stream is truncated")
+            flag = header[0]
+            length = int.from_bytes(header[1:], "big")
+            if flag not in (_FRAME_DATA, _FRAME_FINAL) or length > max(
+                metadata.chunk_size, 32
+            ):
+                raise IntegrityError(f"Invalid frame header at frame {index}")
+            tag = source.read(TAG_SIZE)
+            ciphertext = source.read(length)
+            if len(tag) < TAG_SIZE or len(ciphertext) < length:
+                raise IntegrityError("Encrypted stream is truncated")
+
+            nonce = _frame_nonce(metadata.nonce, index, flag)
+            plaintext = _decrypt_aes_gcm(ciphertext, key, nonce, tag)
+            index += 1
+
+            if flag == _FRAME_FINAL:
+                break
+            hasher.update(plaintext)
+            sink.write(plaintext)
+
+        if source.read(1):
+            raise IntegrityError("Unexpected data after final frame")
+
+        metadata.content_hash = plaintext.hex()
+        if verify_hash and not hmac.compare_digest(plaintext, hasher.digest()):
+            raise IntegrityError("Content hash mismatch - file may be corrupted")
+
+    @classmethod
+    def _write_header(
+        cls, sink: BinaryIO, version: int, metadata: EncryptionMetadata
+    ) -> None:
+        """Write magic bytes, format version and metadata."""
+        metadata_json = metadata.to_json().encode("utf-8")
+        sink.write(cls.MAGIC_BYTES)
+        sink.write(version.to_bytes(2, "big"))
+        sink.write(len(metadata_json).to_bytes(4, "big"))
+        sink.write(metadata_json)
+
+    def _read_header(self, source: BinaryIO) -> tuple[int, EncryptionMetadata]:
+        """Read and validate the header of an encrypted stream."""
+        magic = source.read(len(self.MAGIC_BYTES))
+        if magic != self.MAGIC_BYTES:
+            raise DecryptionError(
+                "Invalid file format - not an encrypted SpreadsheetDL file"
+            )
+
+        version = int.from_bytes(source.read(2), "big")
+        if version not in (self.LEGACY_FORMAT_VERSION, self.FORMAT_VERSION):
+            raise DecryptionError(f"Unsupported encryption format version: {version}")
+
+        metadata_len = int.from_bytes(source.read(4), "big")
+        try:
+            metadata_json = source.read(metadata_len).decode("utf-8")
+            metadata = EncryptionMetadata.from_json(metadata_json)
+        except (UnicodeDecodeError, ValueError, KeyError) as e:
+            raise DecryptionError("Corrupted file - unable to read metadata") from e
+
+        if version == self.FORMAT_VERSION and metadata.chunk_size <= 0:
+            raise DecryptionError("Corrupted file - invalid chunk size in metadata")
+        return version, metadata
+
     def _write_encrypted_file(
         self,
         path: Path,
@@ -558,52 +931,14 @@ def _write_encrypted_file(
         tag: bytes,
         metadata: EncryptionMetadata,
     ) -> None:
-        """Write encrypted file with header."""
-        metadata_json = metadata.to_json().encode("utf-8")
-        metadata_len = len(metadata_json)
-
+        """Write a single-shot (version 1) encrypted file."""
         with open(path, "wb") as f:
-            # Write header
-            f.write(self.MAGIC_BYTES)
-            f.write(self.FORMAT_VERSION.to_bytes(2, "big"))
-            f.write(metadata_len.to_bytes(4, "big"))
-            f.write(metadata_json)
+            self._write_header(f, self.LEGACY_FORMAT_VERSION, metadata)
 
             # Write authentication tag and ciphertext
             f.write(tag)
             f.write(ciphertext)
 
-    def _read_encrypted_file(
-        self, path: Path
-    ) -> tuple[bytes, bytes, EncryptionMetadata]:
-        """Read encrypted file and extract components."""
-        with open(path, "rb") as f:
-            # Read and verify header
-            magic = f.read(len(self.MAGIC_BYTES))
-            if magic != self.MAGIC_BYTES:
-                raise DecryptionError(
-                    "Invalid file format - not an encrypted SpreadsheetDL file"
-                )
-
-            version = int.from_bytes(f.read(2), "big")
-            if version > self.FORMAT_VERSION:
-                raise DecryptionError(
-                    f"Unsupported encryption format version: {version}"
-                )
-
-            metadata_len = int.from_bytes(f.read(4), "big")
-            try:
-                metadata_json = f.read(metadata_len).decode("utf-8")
-                metadata = EncryptionMetadata.from_json(metadata_json)
-            except (UnicodeDecodeError, ValueError, KeyError) as e:
-                raise DecryptionError("Corrupted file - unable to read metadata") from e
-
-            # Read tag and ciphertext
-            tag = f.read(TAG_SIZE)
-            ciphertext = f.read()
-
-        return ciphertext, tag, metadata
-
     def _secure_delete(self, path: Path) -> None:
         """Securely delete a file by overwriting with random data.
 
@@ -631,8 +966,22 @@ class CredentialStore:
 
     Stores credentials encrypted with a master password.
     Credentials are stored in the user's config directory.
+
+    Every call that takes a master password derives the key again
+    (600k PBKDF2 iterations). Long-running processes should unlock the
+    store once instead: the key is derived a single time and the
+    decrypted credentials are held in memory until lock() or the session
+    TTL expires. Reads and writes never touch temporary files.
+
+    Example:
+        >>> store = CredentialStore()  # doctest: +SKIP
+        >>> with store.session("MyStr0ng!Pass24"):  # doctest: +SKIP
+        ...     token = store.get_credential("plaid_token")
+        ...     secret = store.get_credential("plaid_secret")
     """
 
+    DEFAULT_SESSION_TTL = 300.0  # Seconds an unlocked session stays valid
+
     def __init__(self, store_path: Path | None = None) -> None:
         """Initialize credential store.
 
@@ -646,11 +995,120 @@ def __init__(self, store_path: Path | None = None) -> None:
         self.store_path = store_path
         self._encryptor = FileEncryptor()
 
+        # Unlocked session state
+        self._session_key: bytearray | None = None
+        self._session_salt = b""
+        self._session_iterations = DEFAULT_ITERATIONS
+        self._session_credentials: dict[str, str] = {}
+        self._session_expires: float | None = None
+
+    @property
+    def is_unlocked(self) -> bool:
+        """Whether an unlocked session is active (expired ones are locked)."""
+        if self._session_key is None:
+            return False
+        if self._session_expires is not None and time.monotonic() >= (
+            self._session_expires
+        ):
+            self.lock()
+            return False
+        return True
+
+    def unlock(
+        self,
+        master_password: str,
+        *,
+        ttl: float | None = DEFAULT_SESSION_TTL,
+        enforce_password_strength: bool = True,
+    ) -> None:
+        """Derive the key once and cache the decrypted credentials.
+
+        Args:
+            master_password: Master password for the store
+            ttl: Seconds until the session locks itself (None = never)
+            enforce_password_strength: Check password strength when the
+                store does not exist yet and will be created by this session
+
+        Raises:
+            IntegrityError: If the master password is wrong
+            ValueError: If a new store's master password is too weak
+        """
+        self.lock()
+
+        if self.store_path.exists():
+            with open(self.store_path, "rb") as f:
+                version, metadata = self._encryptor._read_header(f)
+                key = bytearray(
+                    _derive_key_pbkdf2(
+                        master_password, metadata.salt, metadata.iterations
+                    )
+                )
+                try:
+                    plaintext = io.BytesIO()
+                    self._encryptor._decrypt_body(
+                        f, plaintext, version, metadata, bytes(key), True
+                    )
+                    credentials = self._parse_credentials(plaintext)
+                except BaseException:
+                    # Wrong password or corrupt store: don't leave the key behind
+                    _zeroize(key)
+                    raise
+            salt, iterations = metadata.salt, metadata.iterations
+        else:
+            if enforce_password_strength:
+                self._check_master_password(master_password)
+            salt = secrets.token_bytes(SALT_SIZE)
+            iterations = DEFAULT_ITERATIONS
+            key = bytearray(_derive_key_pbkdf2(master_password, salt, iterations))
+            credentials = {}
+
+        self._session_key = key
+        self._session_salt = salt
+        self._session_iterations = iterations
+        self._session_credentials = credentials
+        self._session_expires = None if ttl is None else time.monotonic() + ttl
+
+    def lock(self) -> None:
+        """End the session, zeroing the cached key and dropping credentials.
+
+        Note:
+            Python strings cannot be overwritten in place, so zeroization
+            is best effort: the key buffer is cleared and all references to
+            the decrypted values are dropped.
+        """
+        if self._session_key is not None:
+            _zeroize(self._session_key)
+        self._session_key = None
+        self._session_credentials.clear()
+        self._session_expires = None
+
+    @contextmanager
+    def session(
+        self,
+        master_password: str,
+        *,
+        ttl: float | None = DEFAULT_SESSION_TTL,
+    ) -> Iterator[CredentialStore]:
+        """Unlock the store for the duration of a with-block.
+
+        Args:
+            master_password: Master password for the store
+            ttl: Seconds until the session locks itself (None = never)
+
+        Yields:
+            This store, unlocked
+        """
+        self.unlock(master_password, ttl=ttl)
+        try:
+            yield self
+        finally:
+            self.lock()
+
     def store_credential(
         self,
         key: str,
         value: str,
-        master_password: str,
+        master_password: str | None = None,
         *,
         enforce_password_strength: bool = True,
     ) -> None:
@@ -659,11 +1117,13 @@ def store_credential(
         Args:
             key: Credential identifier (e.g., "nextcloud_password")
             value: Credential value
-            master_password: Master password for encryption
+            master_password: Master password for encryption. None uses the
+                unlocked session.
             enforce_password_strength: Whether to enforce password strength (default: True)
 
         Raises:
             ValueError: If master password is too weak (when enforce_password_strength=True)
+            CredentialError: If no password is given and the store is locked
 
         Security:
             By default, enforces strong password requirements to prevent brute force attacks.
@@ -677,45 +1137,46 @@ def store_credential(
             >>> # Disable enforcement for testing
             >>> store.store_credential("test", "value", "weak", enforce_password_strength=False)
         """
-        # Enforce password strength by default (security best practice)
-        if enforce_password_strength:
-            strength = check_password_strength(master_password)
-            if strength["level"] not in ["strong", "very_strong"]:
-                feedback_msg = "; ".join(strength["feedback"])
-                raise ValueError(
-                    f"Master password too weak (level: {strength['level']}). {feedback_msg}\n"
-                    f"Security requirement: Use 12+ characters with mixed case, numbers, and symbols.\n"
-                    f"Generate a strong password with:\n"
-                    f"  from spreadsheet_dl.security import generate_password\n"
-                    f"  password = generate_password(length=24, include_symbols=True)"
-                )
+        if master_password is not None and enforce_password_strength:
+            # Enforce password strength by default (security best practice)
+            self._check_master_password(master_password)
 
         credentials = self._load_credentials(master_password)
         credentials[key] = value
         self._save_credentials(credentials, master_password)
 
-    def get_credential(self, key: str, master_password: str) -> str | None:
+    def get_credential(
+        self, key: str, master_password: str | None = None
+    ) -> str | None:
         """Retrieve a credential.
 
         Args:
             key: Credential identifier
-            master_password: Master password for decryption
+            master_password: Master password for decryption. None uses the
+                unlocked session.
 
         Returns:
             Credential value or None if not found
+
+        Raises:
+            CredentialError: If no password is given and the store is locked
         """
         credentials = self._load_credentials(master_password)
         return credentials.get(key)
 
-    def delete_credential(self, key: str, master_password: str) -> bool:
+    def delete_credential(self, key: str, master_password: str | None = None) -> bool:
         """Delete a credential.
 
         Args:
             key: Credential identifier
-            master_password: Master password for decryption
+            master_password: Master password for decryption. None uses the
+                unlocked session.
 
         Returns:
             True if credential was deleted, False if not found
+
+        Raises:
+            CredentialError: If no password is given and the store is locked
         """
         credentials = self._load_credentials(master_password)
         if key in credentials:
@@ -724,57 +1185,107 @@ def delete_credential(self, key: str, master_password: str) -> bool:
             return True
         return False
 
-    def list_credentials(self, master_password: str) -> list[str]:
+    def list_credentials(self, master_password: str | None = None) -> list[str]:
         """List all stored credential keys.
 
         Args:
-            master_password: Master password for decryption
+            master_password: Master password for decryption. None uses the
+                unlocked session.
 
         Returns:
             List of credential keys (values are not returned)
+
+        Raises:
+            CredentialError: If no password is given and the store is locked
         """
         credentials = self._load_credentials(master_password)
         return list(credentials.keys())
 
-    def _load_credentials(self, master_password: str) -> dict[str, str]:
-        """Load and decrypt credentials from store."""
+    def _check_master_password(self, master_password: str) -> None:
+        """Raise ValueError if the master password is not strong enough."""
+        strength = check_password_strength(master_password)
+        if strength["level"] not in ["strong", "very_strong"]:
+            feedback_msg = "; ".join(strength["feedback"])
+            raise ValueError(
+                f"Master password too weak (level: {strength['level']}). {feedback_msg}\n"
+                f"Security requirement: Use 12+ characters with mixed case, numbers, and symbols.\n"
+                f"Generate a strong password with:\n"
+                f"  from spreadsheet_dl.security import generate_password\n"
+                f"  password = generate_password(length=24, include_symbols=True)"
+            )
+
+    def _load_credentials(self, master_password: str | None) -> dict[str, str]:
+        """Load and decrypt credentials from the session or the store."""
+        if master_password is None:
+            if not self.is_unlocked:
+                raise CredentialError(
+                    "Credential store is locked. Call unlock() or pass the "
+                    "master password."
+                )
+            return dict(self._session_credentials)
+
         if not self.store_path.exists():
             return {}
 
-        # Decrypt to temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-
+        # Decrypt in memory
+        plaintext = io.BytesIO()
         try:
-            self._encryptor.decrypt_file(
-                self.store_path, tmp_path, master_password, verify_hash=True
-            )
-            with open(tmp_path) as f:
-                loaded_data = json.load(f)
-                # Ensure we return a dict[str, str]
-                if isinstance(loaded_data, dict):
-                    return {str(k): str(v) for k, v in loaded_data.items()}
-                return {}
-        except (DecryptionError, json.JSONDecodeError):
+            with open(self.store_path, "rb") as f:
+                self._encryptor.decrypt_stream(
+                    f, plaintext, master_password, verify_hash=True
+                )
+            return self._parse_credentials(plaintext)
+        except DecryptionError:
             return {}
-        finally:
-            tmp_path.unlink(missing_ok=True)
 
     def _save_credentials(
-        self, credentials: dict[str, str], master_password: str
+        self, credentials: dict[str, str], master_password: str | None
     ) -> None:
         """Encrypt and save credentials to store."""
-        # Write to temporary file first
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as tmp:
-            json.dump(credentials, tmp)
-            tmp_path = Path(tmp.name)
-
-        try:
-            self._encryptor.encrypt_file(
-                tmp_path, self.store_path, master_password, delete_original=True
+        data = json.dumps(credentials).encode("utf-8")
+        encrypted = io.BytesIO()
+        if master_password is None and self._session_key is not None:
+            # Reuse the session key; only the nonce changes
+            metadata = EncryptionMetadata(
+                iterations=self._session_iterations,
+                salt=self._session_salt,
+                nonce=secrets.token_bytes(NONCE_SIZE),
+                chunk_size=DEFAULT_CHUNK_SIZE,
             )
+            with EncryptingWriter(
+                encrypted, bytes(self._session_key), metadata
+            ) as writer:
+                writer.write(data)
+        elif master_password is not None:
+            self._encryptor.encrypt_stream(io.BytesIO(data), encrypted, master_password)
+        else:
+            raise CredentialError("Credential store is locked")
+
+        # Replace the store atomically
+        temp_path = self.store_path.with_name(f".{self.store_path.name}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(encrypted.getbuffer())
+        os.replace(temp_path, self.store_path)
+
+        # Keep an active session in step with what is on disk
+        if self.is_unlocked:
+            self._session_credentials = dict(credentials)
+
+    @staticmethod
+    def _parse_credentials(plaintext: io.BytesIO) -> dict[str, str]:
+        """Parse the decrypted JSON credential map and wipe the buffer."""
+        view = plaintext.getbuffer()
+        try:
+            loaded_data = json.loads(view.tobytes())
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {}
         finally:
-            tmp_path.unlink(missing_ok=True)
+            view[:] = bytes(len(view))
+            view.release()
+        # Ensure we return a dict[str, str]
+        if isinstance(loaded_data, dict):
+            return {str(k): str(v) for k, v in loaded_data.items()}
+        return {}
 
 
 def generate_password(length: int = 20, *, include_symbols: bool = True) -> str:
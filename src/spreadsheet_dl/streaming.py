@@ -1,15 +1,18 @@
 """Streaming I/O for large spreadsheet files.
 
 Provides row-by-row reading and chunk-by-chunk writing to handle
-spreadsheets with 100k+ rows without excessive memory usage.
+spreadsheets with 100k+ rows without excessive memory usage, plus
+incremental readers for large JSON and JSON Lines imports.
 """
 
 from __future__ import annotations
 
+import json
+import tempfile
 import zipfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 # Use defusedxml if available for security (protects against XXE/Billion Laughs)
 # Falls back to standard library if defusedxml not installed
@@ -26,10 +29,17 @@
         stacklevel=2,
     )
 
-from spreadsheet_dl.progress import BatchProgress
-
 if TYPE_CHECKING:
     from collections.abc import Iterator
+    from typing import IO, BinaryIO, TextIO
+
+    from odf.opendocument import OpenDocumentSpreadsheet
+
+    from spreadsheet_dl.ods_packaging import PackageOptions
+    from spreadsheet_dl.renderer import OdsRenderer
+
+# Bytes read at a time when copying spilled rows into content.xml
+_SPILL_BLOCK_SIZE = 1024 * 1024
 
 # ODF Namespaces
 ODF_NS = {
@@ -41,6 +51,57 @@
 }
 
 
+def check_zip_bomb(archive: zipfile.ZipFile) -> None:
+    """Check an opened ODS archive for ZIP bomb attacks.
+
+    Validates:
+    - Total uncompressed size < 100MB
+    - Compression ratio < 100:1 for any file
+    - File count < 10000
+
+    Args:
+        archive: Open ZIP archive to validate
+
+    Raises:
+        ValueError: If ZIP file appears to be a ZIP bomb
+    """
+    # Security limits
+    MAX_UNCOMPRESSED_SIZE = 100 * 1024 * 1024  # 100MB
+    MAX_COMPRESSION_RATIO = 100  # 100:1
+    MAX_FILE_COUNT = 10000
+
+    total_size = 0
+
+    for file_count, info in enumerate(archive.infolist(), start=1):
+        total_size += info.file_size
+
+        # Check total uncompressed size
+        if total_size > MAX_UNCOMPRESSED_SIZE:
+            msg = (
+                f"ZIP file too large: {total_size} bytes uncompressed "
+                f"(max {MAX_UNCOMPRESSED_SIZE}). Possible ZIP bomb attack."
+            )
+            raise ValueError(msg)
+
+        # Check compression ratio (ZIP bomb detection)
+        if info.compress_size > 0:
+            ratio = info.file_size / info.compress_size
+            if ratio > MAX_COMPRESSION_RATIO:
+                msg = (
+                    f"Suspicious compression ratio for {info.filename}: {ratio:.1f}:1 "
+                    f"(max {MAX_COMPRESSION_RATIO}:1). Possible ZIP bomb attack."
+                )
+                raise ValueError(msg)
+
+        # Check file count (nested ZIP bomb)
+        if file_count > MAX_FILE_COUNT:
+            msg = (
+                f"Too many files in ZIP: {file_count} "
+                f"(max {MAX_FILE_COUNT}). Possible nested ZIP bomb."
+            )
+            raise ValueError(msg)
+
+
 @dataclass
 class StreamingCell:
     """Lightweight cell representation for streaming.
@@ -151,52 +212,11 @@ def open(self) -> None:
     def _check_zip_bomb(self) -> None:
         """Check for ZIP bomb attack.
 
-        Validates:
-        - Total uncompressed size < 100MB
-        - Compression ratio < 100:1 for any file
-        - File count < 10000
-
         Raises:
             ValueError: If ZIP file appears to be a ZIP bomb
         """
-        if not self._zipfile:
-            return
-
-        # Security limits
-        MAX_UNCOMPRESSED_SIZE = 100 * 1024 * 1024  # 100MB
-        MAX_COMPRESSION_RATIO = 100  # 100:1
-        MAX_FILE_COUNT = 10000
-
-        total_size = 0
-
-        for file_count, info in enumerate(self._zipfile.infolist(), start=1):
-            total_size += info.file_size
-
-            # Check total uncompressed size
-            if total_size > MAX_UNCOMPRESSED_SIZE:
-                msg = (
-                    f"ZIP file too large: {total_size} bytes uncompressed "
-                    f"(max {MAX_UNCOMPRESSED_SIZE}). Possible ZIP bomb attack."
-                )
-                raise ValueError(msg)
-
-            # Check compression ratio (ZIP bomb detection)
-            if info.compress_size > 0:
-                ratio = info.file_size / info.compress_size
-                if ratio > MAX_COMPRESSION_RATIO:
-                    msg = (
-                        f"Suspicious compression ratio for {info.filename}: {ratio:.1f}:1 "
-                        f"(max {MAX_COMPRESSION_RATIO}:1). Possible ZIP bomb attack."
-                    )
-                    raise ValueError(msg)
-
-            # Check file count (nested ZIP bomb)
-            if file_count > MAX_FILE_COUNT:
-                msg = (
-                    f"Too many files in ZIP: {file_count} "
-                    f"(max {MAX_FILE_COUNT}). Possible nested ZIP bomb."
-                )
-                raise ValueError(msg)
+        if self._zipfile:
+            check_zip_bomb(self._zipfile)
 
     def close(self) -> None:
         """Close the ODS file."""
@@ -366,7 +386,9 @@ class StreamingWriter:
     """Stream-based ODS file writer for large files.
 
     Writes ODS files chunk-by-chunk without holding the entire spreadsheet
-    in memory. Supports generating files with 100k+ rows efficiently.
+    in memory: every chunk of rows is rendered to XML and spilled to a
+    temporary file, and close() streams the spilled rows into the package.
+    Memory use is bounded by chunk_size, not by the number of rows.
 
     Examples:
         # Write rows in chunks
@@ -394,19 +416,34 @@ def __init__(
         self,
         file_path: Path | str,
         chunk_size: int = CHUNK_SIZE,
+        *,
+        package: PackageOptions | None = None,
+        password: str | None = None,
     ) -> None:
         """Initialize streaming writer.
 
         Args:
             file_path: Path for output ODS file
             chunk_size: Number of rows to buffer before flushing
+            package: Zip packaging options (compression level, parallel
+                deflate). None keeps odfpy's default packaging.
+            password: If given, the package is encrypted with
+                FileEncryptor's chunked format as it is written, so no
+                plaintext copy reaches the disk.
         """
         self._file_path = Path(file_path)
         self._chunk_size = chunk_size
+        self._package = package
+        self._password = password
         self._buffer: list[StreamingRow] = []
         self._current_sheet: str | None = None
         self._sheets: list[dict[str, Any]] = []
         self._row_count = 0
+        # Finished batches are rendered to XML and spilled to a temp file
+        self._renderer: OdsRenderer | None = None
+        self._document: OpenDocumentSpreadsheet | None = None
+        self._spill: IO[bytes] | None = None
+        self._closed = False
 
     def __enter__(self) -> StreamingWriter:
         """Context manager entry."""
@@ -437,11 +474,18 @@ def start_sheet(
         self._buffer = []
         self._row_count = 0
 
-        # Store sheet metadata
+        # Store sheet metadata; rows are spilled as rendered XML
+        from spreadsheet_dl.builder import ColumnSpec
+
+        _, spill = self._open_spill()
+        offset = spill.tell()
         sheet_data: dict[str, Any] = {
             "name": name,
-            "columns": columns or [],
-            "rows": [],
+            "columns": [ColumnSpec(name=col) for col in columns or []],
+            "rows": 0,
+            "start": offset,
+            "end": offset,
+            "styles": set(),
         }
         self._sheets.append(sheet_data)
 
@@ -508,20 +552,57 @@ def write_rows(self, rows: list[StreamingRow] | list[list[Any]]) -> StreamingWri
         return self
 
     def _flush_buffer(self) -> None:
-        """Flush buffered rows to current sheet data."""
+        """Render buffered rows of the current sheet and spill them to disk."""
         if not self._buffer or not self._sheets:
             return
-
-        current_sheet = self._sheets[-1]
-        current_sheet["rows"].extend(self._buffer)
+        from spreadsheet_dl.builder import CellSpec, RowSpec
+
+        renderer, spill = self._open_spill()
+        sheet = self._sheets[-1]
+        rows = [
+            RowSpec(
+                cells=[
+                    CellSpec(
+                        value=cell.value,
+                        value_type=cell.value_type,
+                        formula=cell.formula,
+                        style=cell.style,
+                    )
+                    for cell in streaming_row.cells
+                ],
+                style=streaming_row.style,
+            )
+            for streaming_row in self._buffer
+        ]
+        xml = renderer.render_rows_xml(
+            rows, sheet["columns"], sheet["rows"], sheet["styles"]
+        )
+        spill.write(xml.encode("utf-8"))
+        sheet["rows"] += len(rows)
+        sheet["end"] = spill.tell()
         self._buffer = []
 
+    def _open_spill(self) -> tuple[OdsRenderer, IO[bytes]]:
+        """Get the renderer and spill file, creating them on first use."""
+        if self._renderer is None or self._spill is None:
+            from spreadsheet_dl.renderer import OdsRenderer
+
+            self._renderer = OdsRenderer(package=self._package)
+            self._document = self._renderer.begin_document()
+            # Closed by _generate_ods() once the rows are packaged
+            self._spill = tempfile.TemporaryFile()  # noqa: SIM115
+        return self._renderer, self._spill
+
     def close(self) -> Path:
         """Finalize and save the ODS file.
 
         Returns:
             Path to the created file
         """
+        if self._closed:
+            return self._file_path
+        self._closed = True
+
         # End any active sheet
         if self._current_sheet is not None:
             self.end_sheet()
@@ -531,69 +612,76 @@ def close(self) -> Path:
         return self._file_path
 
     def _generate_ods(self) -> None:
-        """Generate the ODS file from accumulated data."""
-        from spreadsheet_dl.builder import (
-            CellSpec,
-            ColumnSpec,
-            RowSpec,
-            SheetSpec,
+        """Package the spilled rows into the ODS file."""
+        from spreadsheet_dl.builder import SheetSpec
+        from spreadsheet_dl.ods_packaging import (
+            PackageOptions,
+            document_members,
+            write_package,
         )
-        from spreadsheet_dl.renderer import render_sheets
-
-        # Convert accumulated data to SheetSpecs
-        sheets = []
-
-        # Count total rows for progress
-        total_rows = sum(len(sheet_data["rows"]) for sheet_data in self._sheets)
-        use_progress = total_rows > 100
-
-        if use_progress:
-            with BatchProgress(total_rows, "Generating ODS file") as progress:
-                for sheet_data in self._sheets:
-                    columns = [ColumnSpec(name=col) for col in sheet_data["columns"]]
-
-                    rows = []
-                    for streaming_row in sheet_data["rows"]:
-                        cells = []
-                        for cell in streaming_row.cells:
-                            cells.append(
-                                CellSpec(
-                                    value=cell.value,
-                                    value_type=cell.value_type,
-                                    formula=cell.formula,
-                                    style=cell.style,
-                                )
-                            )
-                        rows.append(RowSpec(cells=cells, style=streaming_row.style))
-                        progress.update()
-
-                    sheets.append(
-                        SheetSpec(name=sheet_data["name"], columns=columns, rows=rows)
-                    )
-        else:
-            for sheet_data in self._sheets:
-                columns = [ColumnSpec(name=col) for col in sheet_data["columns"]]
-
-                rows = []
-                for streaming_row in sheet_data["rows"]:
-                    cells = []
-                    for cell in streaming_row.cells:
-                        cells.append(
-                            CellSpec(
-                                value=cell.value,
-                                value_type=cell.value_type,
-                                formula=cell.formula,
-                                style=cell.style,
-                            )
-                        )
-                    rows.append(RowSpec(cells=cells, style=streaming_row.style))
-
-                sheets.append(
-                    SheetSpec(name=sheet_data["name"], columns=columns, rows=rows)
-                )
 
-        # Render to file
-        render_sheets(sheets, self._file_path)
+        renderer, spill = self._open_spill()
+        placeholders = [
+            renderer.add_rows_placeholder(
+                SheetSpec(name=sheet["name"], columns=sheet["columns"]),
+                sheet["styles"],
+            ).encode("utf-8")
+            for sheet in self._sheets
+        ]
+        members = document_members(self._document)
+        index = next(
+            i for i, (info, _) in enumerate(members) if info.filename == "content.xml"
+        )
+        content_info, content = members.pop(index)
+
+        # Cut content.xml at each sheet's placeholder; the rows go in between
+        pieces = []
+        for placeholder in placeholders:
+            head, found, content = content.partition(placeholder)
+            if not found:
+                raise RuntimeError("Sheet placeholder missing from content.xml")
+            pieces.append(head)
+        pieces.append(content)
+
+        def content_chunks() -> Iterator[bytes]:
+            for head, sheet in zip(pieces, self._sheets, strict=False):
+                yield head
+                spill.seek(sheet["start"])
+                remaining = sheet["end"] - sheet["start"]
+                while remaining > 0:
+                    block = spill.read(min(remaining, _SPILL_BLOCK_SIZE))
+                    remaining -= len(block)
+                    yield block
+            yield pieces[-1]
+
+        options = self._package or PackageOptions()
+        streamed = [(content_info, content_chunks())]
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(self._file_path, "wb") as raw:
+                if self._password is None:
+                    write_package(members, raw, options, streamed_members=streamed)
+                    return
+
+                from spreadsheet_dl.security import FileEncryptor
+
+                # A failed write aborts the writer, so no final frame is sealed
+                with FileEncryptor().open_writer(
+                    raw,
+                    self._password,
+                    original_filename=self._file_path.name.removesuffix(".enc"),
+                ) as sink:
+                    write_package(
+                        members,
+                        cast("BinaryIO", sink),
+                        options,
+                        streamed_members=streamed,
+                    )
+        except BaseException:
+            self._file_path.unlink(missing_ok=True)
+            raise
+        finally:
+            spill.close()
 
 
 def stream_read(file_path: Path | str) -> StreamingReader:
@@ -610,7 +698,13 @@ def stream_read(file_path: Path | str) -> StreamingReader:
     return StreamingReader(file_path)
 
 
-def stream_write(file_path: Path | str, chunk_size: int = 1000) -> StreamingWriter:
+def stream_write(
+    file_path: Path | str,
+    chunk_size: int = 1000,
+    *,
+    package: PackageOptions | None = None,
+    password: str | None = None,
+) -> StreamingWriter:
     """Create a streaming writer for an ODS file.
 
     Convenience function for StreamingWriter.
@@ -618,8 +712,212 @@ def stream_write(file_path: Path | str, chunk_size: int = 1000) -> StreamingWrit
     Args:
         file_path: Path for output file
         chunk_size: Rows to buffer before flush
+        package: Optional zip packaging options
+        password: Optional password to encrypt the output with
 
     Returns:
         StreamingWriter instance
     """
-    return StreamingWriter(file_path, chunk_size)
+    return StreamingWriter(file_path, chunk_size, package=package, password=password)
+
+
+# Characters read per refill by the incremental JSON reader
+JSON_CHUNK_SIZE = 1 << 16
+
+
+class _JSONScanner:
+    """Decode JSON values one at a time from a text stream."""
+
+    def __init__(self, fp: TextIO, chunk_size: int) -> None:
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read another chunk, dropping consumed text. False at end of file."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of file."""
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in " \t\r\n":
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of file"
+            msg = f"Expected one of {chars!r} but found {found}"
+            raise json.JSONDecodeError(msg, self._buf, self._pos)
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number may continue in the next chunk
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        """Yield the elements of the array whose "[" was just consumed."""
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+    def end(self) -> None:
+        """Check that only whitespace remains after the top-level value."""
+        if self.peek():
+            raise json.JSONDecodeError("Extra data", self._buf, self._pos)
+
+
+def iter_json_array(
+    fp: TextIO,
+    keys: tuple[str, ...] = (),
+    *,
+    whole_object: bool = False,
+    chunk_size: int = JSON_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Yield the elements of a JSON array without loading the whole document.
+
+    Elements are decoded one at a time from fixed-size chunks, so memory
+    stays bounded by the largest element rather than the file size. An
+    array under a lower-priority key that precedes a higher-priority one in
+    the document has to be held in memory until the choice is known.
+
+    Args:
+        fp: Text stream positioned at the start of the document
+        keys: For a top-level object, member names that may hold the
+            array, in priority order. The first one holding a non-empty
+            array is used, like ``obj.get(a) or obj.get(b)``.
+        whole_object: For a top-level object with none of the keys, yield
+            the object itself instead of nothing
+        chunk_size: Characters read per refill
+
+    Yields:
+        Array elements in document order
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed or has trailing
+            data
+        ValueError: If the top-level value is neither an array nor an object
+
+    Example:
+        >>> import io
+        >>> list(iter_json_array(io.StringIO('{"meta": 1, "data": [1, 2]}'), ("data",)))
+        [1, 2]
+    """
+    scanner = _JSONScanner(fp, chunk_size)
+    start = scanner.peek()
+    if start == "[":
+        scanner.expect("[")
+        yield from scanner.array()
+        scanner.end()
+        return
+    if start != "{":
+        msg = "Invalid JSON structure: expected an array or an object"
+        raise ValueError(msg)
+
+    scanner.expect("{")
+    members: dict[str, Any] = {}
+    seen: set[str] = set()
+    # Keys known not to hold a non-empty array
+    ruled_out: set[str] = set()
+    # Non-empty arrays read before every higher-priority key was ruled out
+    pending: dict[str, list[Any]] = {}
+    found = False
+    if scanner.peek() == "}":
+        scanner.expect("}")
+    else:
+        while True:
+            key = scanner.value()
+            scanner.expect(":")
+            if found or key not in keys:
+                value = scanner.value()
+                if whole_object and not seen:
+                    members[key] = value
+                if scanner.expect(",}") == "}":
+                    break
+                continue
+            seen.add(key)
+            if scanner.peek() != "[":
+                scanner.value()
+                ruled_out.add(key)
+            elif ruled_out.issuperset(keys[: keys.index(key)]):
+                scanner.expect("[")
+                for item in scanner.array():
+                    found = True
+                    yield item
+                ruled_out.add(key)
+            else:
+                scanner.expect("[")
+                items = list(scanner.array())
+                if items:
+                    pending[key] = items
+                else:
+                    ruled_out.add(key)
+            if scanner.expect(",}") == "}":
+                break
+    scanner.end()
+    if found:
+        return
+    for key in keys:
+        if key in pending:
+            yield from pending[key]
+            return
+    if whole_object and not seen:
+        yield members
+
+
+def iter_json_lines(fp: TextIO) -> Iterator[Any]:
+    """Yield one decoded value per non-blank line of a JSON Lines stream.
+
+    Args:
+        fp: Text stream of JSON Lines
+
+    Yields:
+        Decoded values in file order
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON (the message
+            includes the line number)
+    """
+    for line_num, line in enumerate(fp, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            msg = f"Line {line_num}: {e.msg}"
+            raise json.JSONDecodeError(msg, e.doc, e.pos) from e
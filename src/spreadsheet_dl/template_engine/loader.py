@@ -9,6 +9,7 @@
 from pathlib import Path
 from typing import Any
 
+from spreadsheet_dl.performance import get_compiled_cache
 from spreadsheet_dl.template_engine.schema import (
     CellTemplate,
     ColumnTemplate,
@@ -34,16 +35,24 @@ class TemplateLoader:
     # Default template directory
     DEFAULT_TEMPLATE_DIR = Path(__file__).parent.parent / "templates" / "yaml"
 
-    def __init__(self, template_dir: Path | str | None = None) -> None:
+    def __init__(
+        self,
+        template_dir: Path | str | None = None,
+        cache_dir: Path | str | None = None,
+    ) -> None:
         """Initialize loader.
 
         Args:
             template_dir: Directory containing template files
+            cache_dir: Directory for compiled templates, reused across
+                processes until the source file changes. Defaults to
+                $SPREADSHEET_DL_CACHE_DIR; disabled when neither is set.
         """
         self._template_dir = (
             Path(template_dir) if template_dir else self.DEFAULT_TEMPLATE_DIR
         )
         self._cache: dict[str, SpreadsheetTemplate] = {}
+        self._compiled = get_compiled_cache("templates", cache_dir)
 
     def load(self, name: str) -> SpreadsheetTemplate:
         """Load template by name from template directory.
@@ -84,6 +93,11 @@ def load_from_file(self, path: Path | str) -> SpreadsheetTemplate:
             SpreadsheetTemplate object
         """
         path = Path(path)
+        key = str(path.resolve())
+        if self._compiled is not None:
+            compiled = self._compiled.get(key)
+            if compiled is not None:
+                return compiled  # type: ignore[no-any-return]
 
         try:
             import yaml
@@ -94,9 +108,12 @@ def load_from_file(self, path: Path | str) -> SpreadsheetTemplate:
             ) from exc
 
         with open(path) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
 
-        return self._parse_template(data)
+        template = self._parse_template(data)
+        if self._compiled is not None:
+            self._compiled.set(key, template, [key])
+        return template
 
     def load_from_string(self, yaml_content: str) -> SpreadsheetTemplate:
         """Load template from YAML string.
@@ -112,7 +129,9 @@ def load_from_string(self, yaml_content: str) -> SpreadsheetTemplate:
         except ImportError as exc:
             raise ImportError("PyYAML is required for template loading") from exc
 
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(
+            yaml_content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        )
         return self._parse_template(data)
 
     def list_templates(self) -> list[dict[str, str]]:
@@ -5,15 +5,31 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_OC_NS = "http://owncloud.org/ns"
+_PROPFIND_BODY = (
+    '<?xml version="1.0"?>'
+    f'<d:propfind xmlns:d="DAV:" xmlns:oc="{_OC_NS}"><d:prop>'
+    "<d:getetag/><d:getcontentlength/><oc:checksums/>"
+    "</d:prop></d:propfind>"
+)
+
 
 @dataclass
 class NextcloudConfig:
@@ -58,13 +74,75 @@ def from_env(cls) -> NextcloudConfig:
         )
 
 
+@dataclass
+class RemoteFileInfo:
+    """Remote file properties used to detect unchanged uploads.
+
+    Attributes:
+        etag: Entity tag reported by the server, without quotes.
+        size: Content length in bytes.
+        checksums: Stored checksums such as ``"SHA1:<hex>"``.
+    """
+
+    etag: str | None
+    size: int | None
+    checksums: tuple[str, ...] = ()
+
+
+@dataclass
+class UploadResult:
+    """Outcome of uploading one file.
+
+    Attributes:
+        local_path: Local file that was uploaded.
+        remote_path: Remote path of the file.
+        url: Full WebDAV URL of the file.
+        skipped: The remote copy already matched, so nothing was sent.
+        chunked: The file was sent with chunked upload.
+        error: Error message if the upload failed.
+    """
+
+    local_path: Path
+    remote_path: str
+    url: str
+    skipped: bool = False
+    chunked: bool = False
+    error: str | None = None
+
+
+def _strip_etag(etag: str | None) -> str | None:
+    """Normalize an entity tag for comparison."""
+    if not etag:
+        return None
+    return etag.removeprefix("W/").strip('"')
+
+
+def _file_checksum(path: Path) -> str:
+    """Checksum in Nextcloud's ``OC-Checksum`` notation."""
+    digest = hashlib.sha1(usedforsecurity=False)
+    with open(path, "rb") as f:
+        while block := f.read(1024 * 1024):
+            digest.update(block)
+    return f"SHA1:{digest.hexdigest()}"
+
+
 class WebDAVClient:
     """WebDAV client for Nextcloud file operations.
 
     Supports uploading, listing, and managing files on Nextcloud
     via the WebDAV protocol.
+
+    Directories known to exist are cached for the client's lifetime, so
+    repeated uploads into the same folders skip the ``PROPFIND``/``MKCOL``
+    probes. Files larger than ``CHUNK_SIZE`` use Nextcloud chunked upload,
+    which resumes from the chunks already on the server if interrupted.
     """
 
+    # Files above this size are uploaded in chunks of this size
+    CHUNK_SIZE = 10 * 1024 * 1024
+    # Concurrent PUTs used by upload_many()
+    DEFAULT_WORKERS = 4
+
     def __init__(self, config: NextcloudConfig) -> None:
         """Initialize WebDAV client.
 
@@ -79,6 +157,12 @@ def __init__(self, config: NextcloudConfig) -> None:
                 "User-Agent": "spreadsheet-dl/0.1.0",
             }
         )
+        adapter = HTTPAdapter(pool_maxsize=max(10, 2 * self.DEFAULT_WORKERS))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._known_dirs: set[str] = set()
+        self._uploaded: dict[str, tuple[str, str]] = {}
+        self._lock = threading.Lock()
 
     @property
     def webdav_url(self) -> str:
@@ -100,6 +184,9 @@ def upload_file(
         local_path: Path | str,
         remote_path: str | None = None,
         create_dirs: bool = True,
+        *,
+        skip_unchanged: bool = False,
+        chunk_size: int | None = None,
     ) -> str:
         """Upload a file to Nextcloud.
 
@@ -107,6 +194,9 @@ def upload_file(
             local_path: Path to local file.
             remote_path: Remote path (defaults to config.remote_path + filename).
             create_dirs: Create parent directories if they don't exist.
+            skip_unchanged: Skip the upload when the remote file already
+                matches by ETag or by size and checksum.
+            chunk_size: Chunk size for large files (defaults to CHUNK_SIZE).
 
         Returns:
             Remote URL of uploaded file.
@@ -116,15 +206,115 @@ def upload_file(
             PermissionError: If upload fails due to permissions.
             ConnectionError: If connection to server fails.
         """
-        local_path = Path(local_path)
+        result = self._upload(
+            Path(local_path),
+            remote_path,
+            create_dirs=create_dirs,
+            skip_unchanged=skip_unchanged,
+            chunk_size=chunk_size or self.CHUNK_SIZE,
+        )
+        return result.url
+
+    def upload_many(
+        self,
+        files: Iterable[Path | str | tuple[Path | str, str]],
+        *,
+        max_workers: int | None = None,
+        create_dirs: bool = True,
+        skip_unchanged: bool = False,
+        chunk_size: int | None = None,
+    ) -> list[UploadResult]:
+        """Upload several files concurrently over the shared session.
+
+        Parent directories are created once up front; the PUTs then run on
+        a thread pool. A failed file, or a directory that could not be
+        created, is reported in the results of the files it affects rather
+        than aborting the others.
+
+        Args:
+            files: Local paths, or ``(local_path, remote_path)`` pairs.
+            max_workers: Concurrent uploads (defaults to DEFAULT_WORKERS).
+            create_dirs: Create parent directories if they don't exist.
+            skip_unchanged: Skip the upload when the remote file already
+                matches by ETag or by size and checksum.
+            chunk_size: Chunk size for large files (defaults to CHUNK_SIZE).
+
+        Returns:
+            One UploadResult per file, in input order.
+        """
+        jobs: list[tuple[Path, str]] = []
+        for item in files:
+            local, remote = item if isinstance(item, tuple) else (item, None)
+            local = Path(local)
+            jobs.append((local, self._resolve_remote_path(local, remote)))
+
+        dir_errors: dict[str, str] = {}
+        if create_dirs:
+            parents = {remote.rsplit("/", 1)[0] for _, remote in jobs}
+            for parent in sorted(p for p in parents if p):
+                try:
+                    self._ensure_directory(parent)
+                except (OSError, requests.RequestException) as e:
+                    dir_errors[parent] = str(e)
+
+        def run(job: tuple[Path, str]) -> UploadResult:
+            local, remote = job
+            error = dir_errors.get(remote.rsplit("/", 1)[0])
+            if error is None:
+                try:
+                    return self._upload(
+                        local,
+                        remote,
+                        create_dirs=False,
+                        skip_unchanged=skip_unchanged,
+                        chunk_size=chunk_size or self.CHUNK_SIZE,
+                    )
+                except (OSError, requests.RequestException) as e:
+                    error = str(e)
+            return UploadResult(
+                local_path=local,
+                remote_path=remote,
+                url=self._build_url(remote),
+                error=error,
+            )
+
+        workers = max_workers or self.DEFAULT_WORKERS
+        if workers == 1 or len(jobs) < 2:
+            return [run(job) for job in jobs]
+        with ThreadPoolExecutor(
+            max_workers=min(workers, len(jobs)), thread_name_prefix="webdav"
+        ) as pool:
+            return list(pool.map(run, jobs))
+
+    def clear_cache(self) -> None:
+        """Forget cached directories and upload ETags."""
+        with self._lock:
+            self._known_dirs.clear()
+            self._uploaded.clear()
+
+    def _resolve_remote_path(self, local_path: Path, remote_path: str | None) -> str:
+        """Default and anchor a remote path under config.remote_path."""
+        if remote_path is None:
+            return f"{self.config.remote_path}/{local_path.name}"
+        if not remote_path.startswith("/"):
+            return f"{self.config.remote_path}/{remote_path}"
+        return remote_path
+
+    def _upload(
+        self,
+        local_path: Path,
+        remote_path: str | None,
+        *,
+        create_dirs: bool,
+        skip_unchanged: bool,
+        chunk_size: int,
+    ) -> UploadResult:
+        """Upload one file, returning what was done."""
         if not local_path.exists():
             raise FileNotFoundError(f"Local file not found: {local_path}")
 
         # Build remote path
-        if remote_path is None:
-            remote_path = f"{self.config.remote_path}/{local_path.name}"
-        elif not remote_path.startswith("/"):
-            remote_path = f"{self.config.remote_path}/{remote_path}"
+        remote_path = self._resolve_remote_path(local_path, remote_path)
 
         # Create parent directories if needed
         if create_dirs:
@@ -132,11 +322,36 @@ def upload_file(
             if parent_path:
                 self._ensure_directory(parent_path)
 
-        # Upload file
         url = self._build_url(remote_path)
-        with open(local_path, "rb") as f:
-            response = self._session.put(url, data=f)
-
+        result = UploadResult(local_path=local_path, remote_path=remote_path, url=url)
+        size = local_path.stat().st_size
+        checksum = _file_checksum(local_path)
+
+        if skip_unchanged and self._is_unchanged(remote_path, size, checksum):
+            result.skipped = True
+            return result
+
+        headers = {"OC-Checksum": checksum}
+        if size > chunk_size:
+            response = self._put_chunked(local_path, url, size, checksum, chunk_size)
+            result.chunked = True
+        else:
+            with open(local_path, "rb") as f:
+                response = self._session.put(url, data=f, headers=headers)
+        self._check_upload_response(response, remote_path)
+
+        etag = _strip_etag(
+            response.headers.get("OC-ETag") or response.headers.get("ETag")
+        )
+        if etag:
+            with self._lock:
+                self._uploaded[remote_path] = (etag, checksum)
+        return result
+
+    def _check_upload_response(
+        self, response: requests.Response, remote_path: str
+    ) -> None:
+        """Raise for a failed upload response."""
         if response.status_code == 401:
             raise PermissionError("Authentication failed. Check credentials.")
         elif response.status_code == 403:
@@ -148,10 +363,145 @@ def upload_file(
                 f"Upload failed with status {response.status_code}: {response.text}"
             )
 
-        return url
+    def _is_unchanged(self, remote_path: str, size: int, checksum: str) -> bool:
+        """Check whether the remote file already holds this content."""
+        info = self.get_file_info(remote_path)
+        if info is None:
+            return False
+        if info.size == size and checksum.lower() in (
+            c.lower() for c in info.checksums
+        ):
+            return True
+        with self._lock:
+            previous = self._uploaded.get(remote_path)
+        return previous is not None and previous == (info.etag, checksum)
+
+    def get_file_info(self, remote_path: str) -> RemoteFileInfo | None:
+        """Fetch ETag, size and checksums of a remote file.
+
+        Args:
+            remote_path: Path to the remote file.
+
+        Returns:
+            File properties, or None if the file does not exist.
+
+        Raises:
+            ConnectionError: If the server returns an unexpected status.
+        """
+        response = self._session.request(
+            "PROPFIND",
+            self._build_url(remote_path),
+            headers={"Depth": "0", "Content-Type": "application/xml"},
+            data=_PROPFIND_BODY,
+        )
+        if response.status_code == 404:
+            return None
+        if response.status_code != 207:
+            raise ConnectionError(
+                f"Failed to read file properties: {response.status_code}"
+            )
+        try:
+            root = ET.fromstring(response.text)
+        except ET.ParseError:
+            return RemoteFileInfo(etag=None, size=None)
+
+        etag = root.findtext(".//{DAV:}getetag")
+        length = root.findtext(".//{DAV:}getcontentlength")
+        checksums = " ".join(
+            node.text or "" for node in root.iter(f"{{{_OC_NS}}}checksum")
+        )
+        return RemoteFileInfo(
+            etag=_strip_etag(etag),
+            size=int(length) if length and length.isdigit() else None,
+            checksums=tuple(checksums.split()),
+        )
+
+    def _put_chunked(
+        self,
+        local_path: Path,
+        url: str,
+        size: int,
+        checksum: str,
+        chunk_size: int,
+    ) -> requests.Response:
+        """Upload via Nextcloud chunked upload, resuming existing chunks.
+
+        The upload folder name is derived from the target and content, so a
+        retry after an interruption finds and keeps chunks already sent.
+        """
+        base = self.config.server_url.rstrip("/")
+        upload_id = hashlib.sha1(
+            f"{url}\n{size}\n{checksum}".encode(), usedforsecurity=False
+        ).hexdigest()
+        upload_url = (
+            f"{base}/remote.php/dav/uploads/{quote(self.config.username, safe='')}"
+            f"/spreadsheet-dl-{upload_id}"
+        )
+        headers = {"Destination": url}
+
+        present = self._list_chunks(upload_url)
+        if present is None:
+            response = self._session.request("MKCOL", upload_url, headers=headers)
+            if response.status_code not in (201, 405):
+                self._check_upload_response(response, url)
+            present = {}
+
+        with open(local_path, "rb") as f:
+            index = 0
+            while chunk := f.read(chunk_size):
+                index += 1
+                name = f"{index:05d}"
+                if present.get(name) == len(chunk):
+                    continue
+                response = self._session.put(
+                    f"{upload_url}/{name}", data=chunk, headers=headers
+                )
+                self._check_upload_response(response, url)
+
+        return self._session.request(
+            "MOVE",
+            f"{upload_url}/.file",
+            headers={
+                "Destination": url,
+                "OC-Total-Length": str(size),
+                "OC-Checksum": checksum,
+            },
+        )
+
+    def _list_chunks(self, upload_url: str) -> dict[str, int] | None:
+        """Map chunk names to sizes in an upload folder, or None if absent."""
+        response = self._session.request(
+            "PROPFIND",
+            upload_url,
+            headers={"Depth": "1", "Content-Type": "application/xml"},
+            data=_PROPFIND_BODY,
+        )
+        if response.status_code == 404:
+            return None
+        if response.status_code != 207:
+            raise ConnectionError(
+                f"Failed to list upload chunks: {response.status_code}"
+            )
+
+        chunks: dict[str, int] = {}
+        try:
+            root = ET.fromstring(response.text)
+        except ET.ParseError:
+            return chunks
+        for entry in root.iter("{DAV:}response"):
+            href = entry.findtext("{DAV:}href") or ""
+            length = entry.findtext(".//{DAV:}getcontentlength")
+            name = href.rstrip("/").rsplit("/", 1)[-1]
+            if name.isdigit() and length and length.isdigit():
+                chunks[name] = int(length)
+        return chunks
 
     def _ensure_directory(self, remote_path: str) -> None:
-        """Create directory and parents if they don't exist."""
+        """Create directory and parents if they don't exist.
+
+        Directories seen to exist are cached, so later calls for the same
+        tree make no requests.
+        """
         parts = remote_path.strip("/").split("/")
         current_path = ""
 
@@ -159,6 +509,9 @@ def _ensure_directory(self, remote_path: str) -> None:
             if not part:
                 continue
             current_path = f"{current_path}/{part}"
+            with self._lock:
+                if current_path in self._known_dirs:
+                    continue
             url = self._build_url(current_path)
 
             # Check if exists
@@ -168,6 +521,10 @@ def _ensure_directory(self, remote_path: str) -> None:
                 response = self._session.request("MKCOL", url)
                 if response.status_code not in (201, 405):  # 405 = already exists
                     raise ConnectionError(f"Failed to create directory: {current_path}")
+            elif response.status_code != 207:
+                continue
+            with self._lock:
+                self._known_dirs.add(current_path)
 
     def list_files(self, remote_path: str | None = None) -> list[str]:
         """List files in a remote directory.
@@ -227,6 +584,8 @@ def delete_file(self, remote_path: str) -> bool:
         """
         url = self._build_url(remote_path)
         response = self._session.delete(url)
+        with self._lock:
+            self._uploaded.pop(remote_path, None)
         return response.status_code in (200, 204)
 
     def download_file(
@@ -0,0 +1,120 @@
+"""Benchmarks for package import (CLI and MCP startup) time.
+
+Target: <250ms cumulative for ``import spreadsheet_dl`` (from ~1.3s baseline)
+Goal: Lazy PEP 562 exports so startup does not import pandas, odfpy or openpyxl
+
+    - PERF-STARTUP-001: Lazy top-level package import
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytestmark = [pytest.mark.benchmark]
+
+# Cumulative ``-X importtime`` budget for ``import spreadsheet_dl`` (microseconds)
+IMPORT_BUDGET_US = 250_000
+
+HEAVY_MODULES = ("pandas", "odf", "openpyxl", "yaml", "spreadsheet_dl._mcp")
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    """Run code in a fresh interpreter so nothing is already imported."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    """Extract the cumulative import time of a module from ``-X importtime``."""
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+class TestImportTimeBenchmarks:
+    """Benchmark tests for package startup cost."""
+
+    def test_import_time_budget(self) -> None:
+        """
+        Check ``import spreadsheet_dl`` against the startup budget.
+
+        Target: <250ms cumulative import time
+
+        Implements: PERF-STARTUP-001
+        """
+        # Best of several runs to absorb cold filesystem caches
+        timings = [
+            _cumulative_import_us(
+                _run("import spreadsheet_dl", "-X", "importtime").stderr,
+                "spreadsheet_dl",
+            )
+            for _ in range(3)
+        ]
+
+        assert min(timings) < IMPORT_BUDGET_US
+
+    def test_import_skips_heavy_dependencies(self) -> None:
+        """Importing the package must not load heavy optional dependencies."""
+        code = (
+            "import json, sys, spreadsheet_dl; print(json.dumps(sorted(sys.modules)))"
+        )
+        loaded = set(json.loads(_run(code).stdout))
+
+        assert not loaded.intersection(HEAVY_MODULES)
+
+    def test_lazy_export_resolution(self) -> None:
+        """Public names still resolve, and only load their own module."""
+        code = (
+            "import json, sys, spreadsheet_dl; "
+            "from spreadsheet_dl import SpreadsheetDLError, OdsDashboardGenerator; "
+            "from spreadsheet_dl.interactive import DashboardGenerator; "
+            "assert OdsDashboardGenerator is DashboardGenerator; "
+            "assert 'WebDAVClient' in dir(spreadsheet_dl); "
+            "print(json.dumps(sorted(sys.modules)))"
+        )
+        loaded = set(json.loads(_run(code).stdout))
+
+        assert "spreadsheet_dl.exceptions" in loaded
+        assert "spreadsheet_dl.webdav_upload" not in loaded
+
+    def test_all_exports_resolve(self) -> None:
+        """Every name in ``__all__`` resolves through the lazy table."""
+        import spreadsheet_dl
+
+        missing = [
+            name for name in spreadsheet_dl.__all__ if not hasattr(spreadsheet_dl, name)
+        ]
+        assert missing == []
+        assert spreadsheet_dl.mcp_pkg.__name__ == "spreadsheet_dl._mcp"
+
+        with pytest.raises(AttributeError, match="no_such_export"):
+            _ = spreadsheet_dl.no_such_export
+
+    def test_import_subprocess(
+        self,
+        benchmark: BenchmarkFixture,
+    ) -> None:
+        """
+        Benchmark a cold ``import spreadsheet_dl`` in a fresh interpreter.
+
+        Includes interpreter startup, as paid by every CLI invocation and
+        MCP server spawn.
+        """
+        result = benchmark(_run, "import spreadsheet_dl")
+        assert result.returncode == 0
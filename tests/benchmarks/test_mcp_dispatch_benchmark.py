@@ -4,18 +4,24 @@
 Goal: 2x improvement through pre-compiled dispatch and caching
 
     - PERF-MCP-001: Tool dispatch optimization
+    - PERF-MCP-002: Server fast path (frozen dispatch table, serialized
+      tools/list payload, background audit writer)
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from spreadsheet_dl._mcp.models import MCPToolParameter
+from spreadsheet_dl._mcp.config import MCPConfig
+from spreadsheet_dl._mcp.models import MCPToolParameter, MCPToolResult
 from spreadsheet_dl._mcp.registry import MCPToolRegistry
+from spreadsheet_dl._mcp.server import MCPServer
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from pytest_benchmark.fixture import BenchmarkFixture
 
 pytestmark = [pytest.mark.benchmark, pytest.mark.mcp]
@@ -274,3 +280,79 @@ def generic_handler(x: int) -> dict[str, int]:
 
         registry = benchmark(bulk_register)
         assert registry.get_tool_count() == 100
+
+
+@pytest.fixture
+def audited_server(tmp_path: Path) -> MCPServer:
+    """Full MCPServer with file audit logging and a trivial ping tool."""
+    config = MCPConfig(
+        allowed_paths=[tmp_path],
+        rate_limit_per_minute=10**9,
+        audit_log_path=tmp_path / "audit.log",
+    )
+    server = MCPServer(config)
+    server._registry.register(
+        "ping", "Return pong", lambda value="": MCPToolResult.text(f"pong{value}")
+    )
+    return server
+
+
+class TestMCPServerThroughputBenchmarks:
+    """End-to-end handle_message throughput on a fully registered server."""
+
+    def test_handle_message_tools_call(
+        self,
+        benchmark: BenchmarkFixture,
+        audited_server: MCPServer,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Benchmark 1000 tools/call messages with audit logging to a file.
+
+        Includes dispatch, handler invocation, audit entry and response.
+
+        Target: <100ms for 1000 calls
+        Implements: PERF-MCP-002
+        """
+        messages = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "tools/call",
+                "params": {"name": "ping", "arguments": {"value": str(i)}},
+            }
+            for i in range(1000)
+        ]
+
+        def dispatch() -> list[Any]:
+            return [audited_server.handle_message(m) for m in messages]
+
+        responses = benchmark(dispatch)
+        assert responses[-1]["result"]["content"][0]["text"] == "pong999"
+
+        audited_server.flush_audit_log()
+        assert (tmp_path / "audit.log").read_text().count("\n") >= 1000
+
+    def test_handle_message_json_tools_list(
+        self,
+        benchmark: BenchmarkFixture,
+        audited_server: MCPServer,
+    ) -> None:
+        """
+        Benchmark 100 serialized tools/list responses for the full tool set.
+
+        The schema JSON is built once per registration and spliced in.
+
+        Implements: PERF-MCP-002
+        """
+        message = {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}
+
+        def list_tools() -> int:
+            total = 0
+            for _ in range(100):
+                text = audited_server.handle_message_json(message)
+                assert text is not None
+                total += len(text)
+            return total
+
+        assert benchmark(list_tools) > 0
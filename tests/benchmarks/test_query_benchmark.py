@@ -0,0 +1,115 @@
+"""Benchmarks for sheet queries (OdsEditor.query_data, MCP query_select).
+
+Target: cached repeat queries in <5ms; cold queries scan only referenced columns
+Goal: Stream content.xml once instead of loading the document with odfpy
+
+    - PERF-QUERY-001: Columnar query engine with projection push-down
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from spreadsheet_dl.builder import SpreadsheetBuilder
+from spreadsheet_dl.ods_editor import OdsEditor
+from spreadsheet_dl.query import clear_query_cache, query_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
+
+LEDGER_ROWS = 10_000
+
+GROUP_QUERY = (
+    "SELECT Category, COUNT(*) AS n, SUM(Amount) AS total "
+    "WHERE Amount > 100 GROUP BY Category ORDER BY total DESC"
+)
+
+# Budget for a repeat query against an unchanged file (seconds)
+CACHED_QUERY_BUDGET_S = 0.005
+
+
+@pytest.fixture(scope="module")
+def ledger_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """10K-row ledger with eight columns."""
+    builder = SpreadsheetBuilder()
+    builder.sheet("Ledger")
+    builder.row()
+    builder.cells(
+        "Date", "Category", "Description", "Amount", "Account", "Status", "Ref", "Note"
+    )
+    for i in range(LEDGER_ROWS):
+        builder.row()
+        builder.cells(
+            f"2024-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+            f"Category {i % 10}",
+            f"Item {i}",
+            float(i % 500),
+            "Checking",
+            "open" if i % 3 else "done",
+            f"R{i}",
+            "",
+        )
+    return builder.save(tmp_path_factory.mktemp("query") / "ledger.ods")
+
+
+class TestQueryBenchmarks:
+    """Benchmark tests for the sheet query engine."""
+
+    def test_query_file_cold(
+        self,
+        benchmark: BenchmarkFixture,
+        ledger_file: Path,
+    ) -> None:
+        """
+        Benchmark a streaming GROUP BY query with an empty cache.
+
+        Only the Category and Amount columns are decoded.
+
+        Implements: PERF-QUERY-001
+        """
+
+        def run() -> list[dict[str, object]]:
+            clear_query_cache()
+            return query_file(ledger_file, "Ledger", GROUP_QUERY)
+
+        rows = benchmark(run)
+        assert len(rows) == 10
+        assert sum(row["n"] for row in rows) == LEDGER_ROWS * 399 // 500
+
+    def test_query_file_cached(
+        self,
+        benchmark: BenchmarkFixture,
+        ledger_file: Path,
+    ) -> None:
+        """
+        Benchmark repeat queries against an unchanged file.
+
+        Target: <5ms per query (cache keyed by file mtime and query text)
+        """
+        clear_query_cache()
+        query_file(ledger_file, "Ledger", GROUP_QUERY)
+
+        start = time.perf_counter()
+        rows = query_file(ledger_file, "Ledger", GROUP_QUERY)
+        assert time.perf_counter() - start < CACHED_QUERY_BUDGET_S
+        assert len(rows) == 10
+
+        benchmark(query_file, ledger_file, "Ledger", GROUP_QUERY)
+
+    def test_editor_query_data(
+        self,
+        benchmark: BenchmarkFixture,
+        ledger_file: Path,
+    ) -> None:
+        """Benchmark the same query over an already loaded OdsEditor document."""
+        editor = OdsEditor(ledger_file)
+
+        rows = benchmark(editor.query_data, "Ledger", GROUP_QUERY)
+        assert len(rows) == 10
@@ -8,17 +8,23 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
+from odf.opendocument import OpenDocumentSpreadsheet
+from odf.table import TableCell
+from odf.text import P
 
 from spreadsheet_dl.builder import SpreadsheetBuilder
+from spreadsheet_dl.renderer import OdsRenderer, RenderStats
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from pytest_benchmark.fixture import BenchmarkFixture
 
+    from spreadsheet_dl.builder import SheetSpec
+
 
 pytestmark = [pytest.mark.benchmark, pytest.mark.slow]
 
@@ -198,3 +204,87 @@ def render_with_formulas() -> Path:
 
         result = benchmark(render_with_formulas)
         assert result.exists()
+
+
+def _prepare_renderer(
+    large_dataset: list[dict[str, str | int | float]],
+) -> tuple[OdsRenderer, SheetSpec]:
+    """Build the 10K-row sheet and a renderer ready to encode its cells."""
+    builder = SpreadsheetBuilder(theme=None)
+    builder.sheet("LargeData")
+    builder.column("ID", type="number").column("Name").column("Value", type="currency")
+    builder.column("Category").column("Description")
+    for item in large_dataset:
+        builder.row()
+        builder.cells(
+            item["id"],
+            item["name"],
+            item["value"],
+            item["category"],
+            item["description"],
+        )
+
+    renderer = OdsRenderer()
+    renderer._doc = OpenDocumentSpreadsheet()
+    renderer._create_default_styles()
+    return renderer, builder.build()[0]
+
+
+@pytest.mark.benchmark(group="cell-encoding-10k")
+class TestCellEncodingBenchmarks:
+    """Per-cell encoding cost on the 10K-row case.
+
+    Compares the generic per-cell path (type-map lookup, isinstance chain,
+    keyword TableCell construction) with the per-column formatters used by
+    OdsRenderer. Both produce the same cells; compare the two results in
+    the ``cell-encoding-10k`` group.
+
+        - PERF-RENDER-002: Per-column cell formatter specialization
+    """
+
+    def test_encode_10k_rows_generic(
+        self,
+        benchmark: BenchmarkFixture,
+        large_dataset: list[dict[str, str | int | float]],
+    ) -> None:
+        """Benchmark the generic per-cell encoding path."""
+        renderer, sheet = _prepare_renderer(large_dataset)
+        default_style = renderer._styles["default"]
+
+        def encode_generic() -> int:
+            count = 0
+            for row_spec in sheet.rows:
+                for cell_spec, col_spec in zip(
+                    row_spec.cells, sheet.columns, strict=False
+                ):
+                    value_type = cell_spec.value_type or col_spec.type
+                    kwargs: dict[str, Any] = {"stylename": default_style}
+                    kwargs["valuetype"] = renderer._get_odf_value_type(value_type)
+                    kwargs.update(
+                        renderer._get_value_attrs(cell_spec.value, value_type)
+                    )
+                    cell = TableCell(**kwargs)
+                    text = renderer._get_display_text(cell_spec.value, value_type)
+                    if text:
+                        cell.addElement(P(text=text))
+                    count += 1
+            return count
+
+        assert benchmark(encode_generic) == 50000
+
+    def test_encode_10k_rows_specialized(
+        self,
+        benchmark: BenchmarkFixture,
+        large_dataset: list[dict[str, str | int | float]],
+    ) -> None:
+        """Benchmark encoding through per-column cell formatters."""
+        renderer, sheet = _prepare_renderer(large_dataset)
+
+        def encode_specialized() -> int:
+            renderer._stats = RenderStats()
+            for row_idx, row_spec in enumerate(sheet.rows):
+                runs, _ = renderer._plan_row(row_spec, sheet.columns, row_idx)
+                renderer._render_row(row_spec, runs)
+            return renderer.stats.emitted_cells
+
+        assert benchmark(encode_specialized) == 50000
@@ -4,21 +4,49 @@
 Goal: 4x improvement through caching and lazy loading
 
     - PERF-THEME-001: Theme loading optimization
+    - PERF-THEME-002: Compiled on-disk theme cache for cold starts
 """
 
 from __future__ import annotations
 
+import shutil
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 
+from spreadsheet_dl.schema.loader import ThemeLoader
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
     from pytest_benchmark.fixture import BenchmarkFixture
 
 pytestmark = [pytest.mark.benchmark, pytest.mark.requires_yaml]
 
+# Minimum cold-start speedup of compiled themes over parsing YAML
+COMPILED_SPEEDUP = 2.0
+
+
+@pytest.fixture
+def builtin_theme_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Copy of the built-in themes, with no compiled cache configured."""
+    monkeypatch.delenv("SPREADSHEET_DL_CACHE_DIR", raising=False)
+    theme_dir = tmp_path / "themes"
+    shutil.copytree(ThemeLoader.DEFAULT_THEME_DIR, theme_dir)
+    return theme_dir
+
+
+def _best_of(func: Callable[[], object], rounds: int = 5) -> float:
+    """Fastest of several timed calls, in seconds."""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
 
 class TestThemeLoadingBenchmarks:
     """Benchmark tests for theme loading performance."""
@@ -383,3 +411,44 @@ def load_complex() -> int:
 
         result = benchmark(load_complex)
         assert result == 50
+
+    def test_cold_start_parse(
+        self, benchmark: BenchmarkFixture, builtin_theme_dir: Path
+    ) -> None:
+        """
+        Benchmark loading all built-in themes in a fresh loader from YAML.
+
+        Baseline for test_cold_start_compiled: every round parses,
+        validates and resolves inheritance again.
+
+        Implements: PERF-THEME-002
+        """
+        themes = benchmark(lambda: ThemeLoader(builtin_theme_dir).load_all())
+        assert "corporate" in themes
+
+    def test_cold_start_compiled(
+        self,
+        benchmark: BenchmarkFixture,
+        builtin_theme_dir: Path,
+        tmp_path: Path,
+    ) -> None:
+        """
+        Benchmark loading all built-in themes in a fresh loader from a
+        warm compiled cache.
+
+        Target: >=2x faster than parsing (about 5x measured)
+
+        Implements: PERF-THEME-002
+        """
+        cache_dir = tmp_path / "cache"
+        expected = ThemeLoader(builtin_theme_dir, cache_dir).load_all()
+
+        def parse() -> dict[str, object]:
+            return dict(ThemeLoader(builtin_theme_dir).load_all())
+
+        def compiled() -> dict[str, object]:
+            return dict(ThemeLoader(builtin_theme_dir, cache_dir).load_all())
+
+        assert compiled() == expected
+        assert _best_of(parse) > COMPILED_SPEEDUP * _best_of(compiled)
+        benchmark(compiled)
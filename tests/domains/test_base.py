@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +27,7 @@
     PluginStatus,
     TemplateMetadata,
 )
+from spreadsheet_dl.streaming import StreamingReader, StreamingWriter
 
 pytestmark = [pytest.mark.unit, pytest.mark.domain]
 
@@ -190,6 +192,22 @@ def import_data(self, source: Path | str) -> ImportResult[list[dict[str, Any]]]:
         )
 
 
+class LineImporter(SampleImporter):
+    """Importer with one record per line that raises on 'boom' content."""
+
+    def import_data(self, source: Path | str) -> ImportResult[list[dict[str, Any]]]:
+        """Import one record per non-empty line."""
+        if not self.validate_source(source):
+            return ImportResult(success=False, data=[], errors=["Invalid source file"])
+        lines = Path(source).read_text().split()
+        if "boom" in lines:
+            raise RuntimeError("boom")
+        if "crash" in lines:
+            os._exit(1)
+        data = [{"line": line} for line in lines]
+        return ImportResult(success=True, data=data, records_imported=len(data))
+
+
 # ============================================================================
 # Plugin Metadata Tests
 # ============================================================================
@@ -433,6 +451,61 @@ def test_formula_validation_too_many_args() -> None:
         formula.validate_arguments((1, 2, 3, 4))
 
 
+def test_formula_metadata_cached_per_class() -> None:
+    """Test metadata is built once per class and shared by instances."""
+    calls = 0
+
+    class CountingFormula(SampleFormula):
+        @property
+        def metadata(self) -> FormulaMetadata:
+            nonlocal calls
+            calls += 1
+            return FormulaMetadata(name="COUNT", category="test", description="")
+
+        def build(self, *args: Any, **kwargs: Any) -> str:
+            return "COUNT()"
+
+    first = CountingFormula()
+    assert first.metadata is CountingFormula().metadata
+    assert calls == 1
+    assert first.metadata.name == "COUNT"
+    # Subclass without its own metadata keeps the parent's definition
+    assert SampleFormula().metadata.name == "TESTFUNC"
+
+
+def test_formula_arity() -> None:
+    """Test required/total argument counts."""
+    assert SampleFormula().arity == (2, 3)
+
+
+def test_formula_build_many() -> None:
+    """Test building a column of formulas in one call."""
+    formula = SampleFormula()
+
+    result = formula.build_many([(1, 2), ("A1", "B1", "C1")])
+
+    assert result == ["TESTFUNC(1;2)", "TESTFUNC(A1;B1;C1)"]
+    assert formula.build_many([]) == []
+
+
+def test_formula_build_many_reports_row() -> None:
+    """Test build_many reports the offending row index."""
+    formula = SampleFormula()
+
+    with pytest.raises(ValueError, match=r"Row 1: TESTFUNC requires at least 2"):
+        formula.build_many([(1, 2), (1,)])
+
+
+def test_domain_formula_metadata_cached() -> None:
+    """Test a dataclass domain formula shares cached metadata and arity."""
+    from spreadsheet_dl.domains.finance.formulas.time_value import PresentValue
+
+    formula = PresentValue()
+    assert formula.metadata is PresentValue().metadata
+    assert formula.arity == (3, 5)
+    assert formula.build_many([("A2", "B2", "C2")]) == [formula.build("A2", "B2", "C2")]
+
+
 def test_formula_argument_metadata() -> None:
     """Test formula argument metadata."""
     arg = FormulaArgument(
@@ -539,6 +612,141 @@ def callback(current: int, total: int) -> None:
     assert progress_calls[0] == (5, 10)
 
 
+def test_importer_import_many_parallel(tmp_path: Path) -> None:
+    """Test parallel batch import merges results in input order."""
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"part{i}.csv"
+        path.write_text("\n".join(f"r{i}-{n}" for n in range(i + 1)))
+        paths.append(path)
+    importer = LineImporter()
+    progress: list[tuple[int, int]] = []
+    importer.set_progress_callback(lambda done, total: progress.append((done, total)))
+
+    result = importer.import_many(paths, max_workers=2)
+
+    assert result.success
+    assert result.records_imported == 10
+    assert [len(part) for part in result.data] == [1, 2, 3, 4]
+    assert result.data[3][0] == {"line": "r3-0"}
+    assert progress[-1] == (4, 4)
+    assert len(progress) == 4
+
+
+def test_importer_import_many_isolates_errors(tmp_path: Path) -> None:
+    """Test that failing files do not affect the rest of the batch."""
+    good = tmp_path / "good.csv"
+    good.write_text("a\nb")
+    boom = tmp_path / "boom.csv"
+    boom.write_text("boom")
+
+    result = LineImporter().import_many(
+        [good, boom, tmp_path / "missing.csv"], max_workers=3
+    )
+
+    assert not result.success
+    assert result.data == [[{"line": "a"}, {"line": "b"}]]
+    assert result.errors == [
+        f"{boom}: Import failed: boom",
+        f"{tmp_path / 'missing.csv'}: Invalid source file",
+    ]
+    assert [f["success"] for f in result.metadata["files"]] == [True, False, False]
+
+
+def test_importer_import_many_isolates_crashes(tmp_path: Path) -> None:
+    """Test a worker process dying only fails the file that killed it."""
+    paths = []
+    for i in range(7):
+        path = tmp_path / f"part{i}.csv"
+        path.write_text("crash" if i == 3 else f"r{i}")
+        paths.append(path)
+    importer = LineImporter()
+    progress: list[tuple[int, int]] = []
+    importer.set_progress_callback(lambda done, total: progress.append((done, total)))
+
+    result = importer.import_many(paths, max_workers=3)
+
+    assert result.records_imported == 6
+    assert result.errors == [f"{paths[3]}: Worker process crashed"]
+    assert [f["success"] for f in result.metadata["files"]] == [
+        True,
+        True,
+        True,
+        False,
+        True,
+        True,
+        True,
+    ]
+    assert progress[-1] == (7, 7)
+    assert len(progress) == 7
+
+
+def test_importer_import_many_skips_seen_content(tmp_path: Path) -> None:
+    """Test content-hash based skipping of already imported files."""
+    first = tmp_path / "first.csv"
+    first.write_text("x")
+    copy = tmp_path / "copy.csv"
+    copy.write_text("x")
+    seen: set[str] = set()
+    importer = LineImporter()
+
+    result = importer.import_many([first, copy], max_workers=1, seen_hashes=seen)
+    assert result.records_imported == 1
+    assert result.metadata["skipped"] == [str(copy)]
+    assert len(seen) == 1
+
+    (tmp_path / "new.csv").write_text("y")
+    result = importer.import_directory(tmp_path, seen_hashes=seen)
+    assert result.data == [[{"line": "y"}]]
+    assert len(result.metadata["skipped"]) == 2
+    assert len(seen) == 2
+
+
+def test_importer_import_directory(tmp_path: Path) -> None:
+    """Test directory import filters by supported formats or pattern."""
+    (tmp_path / "a.csv").write_text("1")
+    (tmp_path / "b.txt").write_text("2")
+    (tmp_path / "c.json").write_text("3")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "d.csv").write_text("4")
+    importer = LineImporter()
+
+    result = importer.import_directory(tmp_path, max_workers=1)
+    assert result.data == [[{"line": "1"}], [{"line": "2"}]]
+
+    result = importer.import_directory(tmp_path, "*.csv", recursive=True)
+    assert [f["path"] for f in result.metadata["files"]] == [
+        str(tmp_path / "a.csv"),
+        str(tmp_path / "sub" / "d.csv"),
+    ]
+
+
+def test_importer_iter_records_default(tmp_path: Path) -> None:
+    """Test the default iter_records() built on import_data()."""
+    importer = SampleImporter()
+    path = tmp_path / "data.csv"
+    path.write_text("x")
+
+    assert [r["id"] for r in importer.iter_records(path)] == [1, 2]
+    with pytest.raises(ValueError, match="Invalid source file"):
+        list(importer.iter_records(tmp_path / "data.json"))
+
+
+def test_importer_write_records(tmp_path: Path) -> None:
+    """Test streaming records into a StreamingWriter sheet."""
+    path = tmp_path / "lines.csv"
+    path.write_text("a\nb\nc")
+    output = tmp_path / "out.ods"
+
+    with StreamingWriter(output) as writer:
+        count = LineImporter().write_records(path, writer, "Lines")
+
+    assert count == 3
+    with StreamingReader(output) as reader:
+        rows = [[c.value for c in row.cells] for row in reader.rows("Lines")]
+    assert rows == [["line"], ["a"], ["b"], ["c"]]
+
+
 def test_import_result_creation() -> None:
     """Test import result creation."""
     result = ImportResult(
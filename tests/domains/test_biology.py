@@ -9,6 +9,7 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from spreadsheet_dl.domains.biology import (
@@ -29,12 +30,16 @@
     SimpsonIndexFormula,
     SpeciesRichnessFormula,
 )
+from spreadsheet_dl.domains.biology.importers import fasta as fasta_module
 from spreadsheet_dl.domains.biology.utils import (
     calculate_dilution,
     calculate_gc_content,
+    calculate_gc_content_array,
     calculate_melting_temp,
     calculate_od_to_concentration,
+    complement_dna,
     format_scientific_notation,
+    reverse_complement,
 )
 
 pytestmark = [pytest.mark.unit, pytest.mark.domain, pytest.mark.science]
@@ -352,6 +357,26 @@ def test_calculate_gc_content() -> None:
     assert abs(gc - 0.0) < 0.1
 
 
+def test_calculate_gc_content_array() -> None:
+    """Test vectorized GC content against calculate_gc_content."""
+    sequences = ["ATGC", "ggcc", "AATT", "", "ATGCNNGC"]
+    expected = [calculate_gc_content(seq) for seq in sequences]
+    assert calculate_gc_content_array(sequences).tolist() == expected
+
+
+def test_calculate_gc_content_array_empty() -> None:
+    """Test empty input returns an empty array of the same shape."""
+    assert calculate_gc_content_array([]).shape == (0,)
+    assert calculate_gc_content_array(np.empty((0, 3), dtype=str)).shape == (0, 3)
+
+
+def test_reverse_complement() -> None:
+    """Test complements map unknown bases to N, including non-ASCII input."""
+    assert complement_dna("ATXg n") == "TANCN"
+    assert reverse_complement("ATXg n") == "NCNAT"
+    assert reverse_complement("acé") == "NGT"
+
+
 def test_calculate_melting_temp() -> None:
     """Test melting temperature calculation."""
     # Short sequence: Tm = 4(G+C) + 2(A+T)
@@ -466,6 +491,69 @@ def test_fasta_importer_with_multiline_sequences() -> None:
         fasta_path.unlink()
 
 
+def test_fasta_iter_records(tmp_path: Path) -> None:
+    """Test streaming FASTA records one sequence at a time."""
+    path = tmp_path / "reads.fasta"
+    path.write_text(">r1 first\nATGC\nGG\n;comment\n>r2\nAAAA\n")
+    importer = FASTAImporter()
+
+    records = importer.iter_records(path)
+    first = next(records)
+    assert (first["id"], first["sequence"]) == ("r1", "ATGCGG")
+    assert [r["id"] for r in records] == ["r2"]
+    assert [r["id"] for r in importer.import_data(path).data] == ["r1", "r2"]
+
+    with pytest.raises(ValueError, match="Invalid FASTA"):
+        list(importer.iter_records(tmp_path / "missing.fasta"))
+
+
+def test_fasta_bytes_parsing(tmp_path: Path) -> None:
+    """Test line endings, comments and sequence typing in the bytes parser."""
+    path = tmp_path / "mixed.fa"
+    path.write_bytes(
+        b">dna sample one\r\natgc\r\nGG N\r\n"
+        b"  >rna\nACGU\n;note > here\nUU\n"
+        b">\nMKLVWQ\n"
+        b">odd\nAC>X\n"
+        b">utf\nacgt\xc3\xa9\n"
+    )
+
+    records = FASTAImporter().import_data(path).data
+
+    assert [r["id"] for r in records] == ["dna", "rna", "seq_8", "odd", "utf"]
+    assert records[0]["description"] == "sample one"
+    assert [r["sequence"] for r in records] == [
+        "ATGCGGN",
+        "ACGUUU",
+        "MKLVWQ",
+        "AC>X",
+        "ACGT\u00c9",
+    ]
+    assert [r["type"] for r in records] == [
+        "DNA",
+        "RNA",
+        "protein",
+        "unknown",
+        "protein",
+    ]
+    assert records[0]["gc_content"] == pytest.approx(400 / 7)
+    assert records[2]["gc_content"] is None
+
+
+def test_fasta_parallel_import(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test large files are parsed across worker processes in record order."""
+    path = tmp_path / "many.fasta"
+    path.write_text("".join(f">s{i}\n{'ACGT' * i}\nGC\n" for i in range(40)))
+    monkeypatch.setattr(fasta_module, "PARALLEL_MIN_BYTES", 0)
+
+    parallel = FASTAImporter(max_workers=2).import_data(path)
+    sequential = FASTAImporter(max_workers=1).import_data(path)
+
+    assert parallel.success
+    assert parallel.data == sequential.data
+    assert [r["id"] for r in parallel.data] == [f"s{i}" for i in range(40)]
+
+
 def test_plate_reader_with_empty_wells() -> None:
     """Test plate reader importer with empty wells."""
     importer = PlateReaderImporter()
@@ -9,6 +9,7 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from spreadsheet_dl.domains.civil_engineering import (
@@ -43,6 +44,7 @@
     bearing_capacity_factors,
     calculate_cement_content,
     consolidation_settlement,
+    consolidation_settlement_array,
     design_concrete_mix,
     ft_to_m,
     get_load_combinations,
@@ -478,6 +480,20 @@ def test_consolidation_settlement() -> None:
     assert settlement < 1000  # Less than 1m seems reasonable
 
 
+def test_consolidation_settlement_array() -> None:
+    """Test vectorized settlement broadcasting a soil profile over loads."""
+    delta_p = np.array([25.0, 50.0, 100.0])
+    result = consolidation_settlement_array(5000, 0.3, [[0.8], [1.1]], 100, delta_p)
+
+    assert result.shape == (2, 3)
+    assert result[0, 1] == pytest.approx(
+        consolidation_settlement(5000, 0.3, 0.8, 100, 50)
+    )
+    assert result[1, 2] == pytest.approx(
+        consolidation_settlement(5000, 0.3, 1.1, 100, 100)
+    )
+
+
 def test_calculate_cement_content() -> None:
     """Test cement content calculation."""
     cement = calculate_cement_content(25.0, 0.5)
@@ -8,6 +8,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from spreadsheet_dl.domains.electrical_engineering import (
@@ -31,6 +32,7 @@
 )
 from spreadsheet_dl.domains.electrical_engineering.utils import (
     calculate_parallel_resistance,
+    calculate_parallel_resistance_array,
     calculate_power_dissipation,
     calculate_propagation_delay,
     calculate_series_resistance,
@@ -426,6 +428,22 @@ def test_calculate_parallel_resistance_util() -> None:
         calculate_parallel_resistance([100, -50])
 
 
+def test_calculate_parallel_resistance_array() -> None:
+    """Test vectorized parallel resistance over rows and columns."""
+    networks = [[100, 100, 200], [90, 90, 90]]
+    expected = [calculate_parallel_resistance(row) for row in networks]
+    np.testing.assert_allclose(calculate_parallel_resistance_array(networks), expected)
+    r1, r2, r3 = np.transpose(networks)
+    np.testing.assert_allclose(
+        calculate_parallel_resistance_array([r1, r2, r3], axis=0), expected
+    )
+
+    with pytest.raises(ValueError, match="At least one resistance"):
+        calculate_parallel_resistance_array(np.empty((3, 0)))
+    with pytest.raises(ValueError, match="must be positive"):
+        calculate_parallel_resistance_array([[100, 100], [100, 0]])
+
+
 def test_calculate_series_resistance_util() -> None:
     """Test series resistance calculation utility."""
     assert calculate_series_resistance([100, 100]) == 200
@@ -9,6 +9,7 @@
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from spreadsheet_dl.domains.environmental import (
@@ -31,12 +32,15 @@
 )
 from spreadsheet_dl.domains.environmental.utils import (
     calculate_aqi,
+    calculate_aqi_array,
     calculate_bod,
     calculate_carbon_equivalent,
     calculate_ecological_footprint,
     calculate_shannon_diversity,
+    calculate_shannon_diversity_array,
     calculate_simpson_index,
     calculate_wqi,
+    calculate_wqi_array,
     format_concentration,
     ppm_to_ugm3,
     ugm3_to_ppm,
@@ -398,6 +402,44 @@ def test_sensor_network_importer_invalid_file() -> None:
     assert len(result.errors) > 0
 
 
+def test_sensor_network_iter_records(tmp_path: Path) -> None:
+    """Test streaming sensor network readings with range warnings."""
+    csv_path = tmp_path / "readings.csv"
+    csv_path.write_text("Timestamp,Sensor_ID,Temp,PM25\n2024-01-01,S1,75,12\n")
+    warnings: list[str] = []
+
+    records = list(SensorNetworkImporter().iter_records(csv_path, warnings=warnings))
+
+    assert records == [
+        {
+            "timestamp": "2024-01-01",
+            "sensor_id": "S1",
+            "temperature": "75",
+            "pm25": "12",
+        }
+    ]
+    assert warnings == ["Row 2: Unusual temperature 75.0C"]
+
+
+def test_sensor_network_json_lines(tmp_path: Path) -> None:
+    """Test JSON Lines and single-object JSON imports."""
+    importer = SensorNetworkImporter()
+    jsonl_path = tmp_path / "readings.jsonl"
+    jsonl_path.write_text('{"Device_ID": "S1", "RH": 40}\n{"Device_ID": "S2"}\n')
+    result = importer.import_data(jsonl_path)
+    assert result.records_imported == 2
+    assert result.data[0] == {"sensor_id": "S1", "humidity": 40}
+
+    json_path = tmp_path / "single.json"
+    json_path.write_text('{"sensor_id": "S3", "co2": 410}')
+    assert importer.import_data(json_path).data == [{"sensor_id": "S3", "co2": 410}]
+
+    json_path.write_text('{"site": "x", "readings": []}')
+    result = importer.import_data(json_path)
+    assert result.success is True
+    assert result.records_imported == 0
+
+
 def test_lab_results_importer_csv() -> None:
     """Test lab results CSV importer."""
     importer = LabResultsImporter()
@@ -523,6 +565,14 @@ def test_calculate_aqi() -> None:
     assert calculate_aqi(600.0) == 500
 
 
+def test_calculate_aqi_array_matches_scalar() -> None:
+    """Test vectorized AQI against calculate_aqi, including range gaps."""
+    pm25 = np.array([[-1.0, 0.0, 10.0, 12.05], [35.5, 150.45, 500.4, np.nan]])
+    expected = [[calculate_aqi(v) for v in row] for row in pm25]
+    assert calculate_aqi_array(pm25).tolist() == expected
+    assert calculate_aqi_array(600.0) == 500
+
+
 def test_calculate_wqi() -> None:
     """Test Water Quality Index calculation."""
     # Good water quality
@@ -534,6 +584,14 @@ def test_calculate_wqi() -> None:
     assert 70 < wqi < 95
 
 
+def test_calculate_wqi_array_broadcasts() -> None:
+    """Test vectorized WQI broadcasting scalars against columns."""
+    result = calculate_wqi_array([95, 90, 40], [2, 3, 12], 7.2, [0, 5, 0])
+    expected = [calculate_wqi(95, 2, 7.2), calculate_wqi(90, 3, 7.2, 5)]
+    np.testing.assert_allclose(result[:2], expected)
+    assert result[2] == pytest.approx((40 + 0 + 97) / 3)
+
+
 def test_calculate_bod() -> None:
     """Test BOD calculation."""
     bod = calculate_bod(8.5, 3.2, 30)
@@ -554,6 +612,16 @@ def test_calculate_shannon_diversity() -> None:
     assert calculate_shannon_diversity([]) == 0.0
 
 
+def test_calculate_shannon_diversity_array() -> None:
+    """Test vectorized Shannon diversity per sample row and column."""
+    counts = [[10, 10, 10, 10], [100, 0, 0, 0], [0, 0, 0, 0], [3, 1, 4, 1]]
+    expected = [calculate_shannon_diversity(row) for row in counts]
+    np.testing.assert_allclose(calculate_shannon_diversity_array(counts), expected)
+    np.testing.assert_allclose(
+        calculate_shannon_diversity_array(np.transpose(counts), axis=0), expected
+    )
+
+
 def test_calculate_simpson_index() -> None:
     """Test Simpson's diversity index calculation."""
     # Equal distribution
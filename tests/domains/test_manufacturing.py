@@ -360,6 +360,73 @@ def test_sensor_data_validation_warnings() -> None:
         csv_path.unlink()
 
 
+def test_sensor_data_iter_records_json(tmp_path: Path) -> None:
+    """Test streaming sensor readings from JSON and JSON Lines files."""
+    importer = SensorDataImporter()
+    json_path = tmp_path / "readings.json"
+    json_path.write_text(
+        '{"site": "A", "readings": [{"timestamp": "2024-01-01T08:00:00", '
+        '"sensor_id": "S1", "temp": "71.5"}, 5, {"sensor_id": "S2"}]}'
+    )
+
+    errors: list[str] = []
+    records = list(importer.iter_records(json_path, errors=errors))
+    assert [r["sensor_id"] for r in records] == ["S1", "S2"]
+    assert records[0]["temperature"] == 71.5
+    assert len(errors) == 1
+    assert errors[0].startswith("Record 2:")
+
+    jsonl_path = tmp_path / "readings.jsonl"
+    jsonl_path.write_text('{"sensor_id": "S1", "rpm": 1200}\n{"sensor_id": "S2"}\n')
+    result = importer.import_data(jsonl_path)
+    assert result.success is True
+    assert result.records_imported == 2
+    assert result.metadata["format"] == "jsonl"
+    assert result.data[0]["rpm"] == 1200.0
+
+
+def test_sensor_data_json_key_precedence(tmp_path: Path) -> None:
+    """Test readings/data/samples precedence and byte-based progress."""
+    importer = SensorDataImporter()
+    progress: list[tuple[int, int]] = []
+    importer.set_progress_callback(lambda done, total: progress.append((done, total)))
+    path = tmp_path / "readings.json"
+    path.write_text(
+        '{"samples": [{"sensor_id": "X"}], "readings": [], '
+        '"data": [{"sensor_id": "S1"}, {"sensor_id": "S2"}]}'
+    )
+
+    result = importer.import_data(path)
+
+    assert [r["sensor_id"] for r in result.data] == ["S1", "S2"]
+    size = path.stat().st_size
+    assert len(progress) == 2
+    assert all(total == size for _, total in progress)
+    assert progress[-1][0] == size
+
+
+def test_sensor_data_json_invalid_utf8(tmp_path: Path) -> None:
+    """Test that undecodable JSON is reported rather than replaced."""
+    path = tmp_path / "readings.json"
+    path.write_bytes(b'[{"sensor_id": "S\xff1"}]')
+
+    result = SensorDataImporter().import_data(path)
+
+    assert result.success is False
+    assert "utf-8" in result.errors[0]
+
+
+def test_sensor_data_malformed_json(tmp_path: Path) -> None:
+    """Test that truncated JSON fails the import."""
+    path = tmp_path / "broken.json"
+    path.write_text('[{"sensor_id": "S1"}, {"sensor_id"')
+
+    result = SensorDataImporter().import_data(path)
+
+    assert result.success is False
+    assert result.errors[0].startswith("JSON parse error")
+
+
 # ============================================================================
 # Utility Function Tests
 # ============================================================================
@@ -0,0 +1,223 @@
+"""
+Tests for columnar sensor ingestion, resampling and LTTB downsampling.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from spreadsheet_dl.domains.environmental import SensorNetworkImporter
+from spreadsheet_dl.domains.manufacturing import SensorDataImporter
+from spreadsheet_dl.domains.timeseries import (
+    MAX_SHEET_ROWS,
+    TimeSeriesColumns,
+    lttb_indices,
+    read_sensor_columns,
+)
+from spreadsheet_dl.streaming import StreamingReader, StreamingWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = [pytest.mark.unit, pytest.mark.domain]
+
+
+def _series(
+    minutes: list[int], temps: list[float], sensors: list[str]
+) -> TimeSeriesColumns:
+    base = np.datetime64("2024-01-01T00:00", "ns")
+    return TimeSeriesColumns(
+        base + np.array(minutes, dtype="timedelta64[m]"),
+        {"temperature": np.array(temps)},
+        {"sensor_id": np.array(sensors, dtype=object)},
+    )
+
+
+class TestReadSensorColumns:
+    """Tests for read_sensor_columns."""
+
+    def test_csv_columns(self, tmp_path: Path) -> None:
+        path = tmp_path / "plant.csv"
+        path.write_text(
+            "Time,Device_ID,Temp,Load,Note\n"
+            '2024-01-01T08:00:00Z,7,71.5,"1,200",ok\n'
+            "2024-01-01 09:00:00+01:00,7,,900,\n"
+            "01/02/2024 10:00,8,70,1000,late\n"
+            ",8,69.5,1100,\n"
+        )
+
+        series = read_sensor_columns(
+            path,
+            {"time": "timestamp", "device_id": "sensor_id", "temp": "temperature"},
+            label_fields=("sensor_id",),
+        )
+
+        assert series.columns == [
+            "timestamp",
+            "sensor_id",
+            "note",
+            "temperature",
+            "load",
+        ]
+        assert series.labels["sensor_id"].tolist() == ["7", "7", "8", "8"]
+        assert series.labels["note"].tolist() == ["ok", "", "late", ""]
+        np.testing.assert_array_equal(
+            series.values["temperature"], [71.5, np.nan, 70.0, 69.5]
+        )
+        assert series.values["load"].tolist() == [1200.0, 900.0, 1000.0, 1100.0]
+        assert series.timestamps[:3].astype(str).tolist() == [
+            "2024-01-01T08:00:00.000000000",
+            "2024-01-01T08:00:00.000000000",
+            "2024-01-02T10:00:00.000000000",
+        ]
+        assert np.isnat(series.timestamps[3])
+        assert series.time_range() == {
+            "start": "2024-01-01T08:00:00",
+            "end": "2024-01-02T10:00:00",
+        }
+
+    def test_json_unix_timestamps(self, tmp_path: Path) -> None:
+        path = tmp_path / "plant.json"
+        path.write_text('{"readings": [{"time": 0, "v": 1}, {"time": 60, "v": 2}]}')
+
+        series = read_sensor_columns(path, {"time": "timestamp"})
+
+        assert series.time_range() == {
+            "start": "1970-01-01T00:00:00",
+            "end": "1970-01-01T00:01:00",
+        }
+        assert series.values["v"].tolist() == [1.0, 2.0]
+
+    def test_unsupported_format(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="Unsupported format"):
+            read_sensor_columns(tmp_path / "plant.xml", {})
+
+
+class TestResample:
+    """Tests for TimeSeriesColumns.resample."""
+
+    def test_aggregations_per_sensor(self) -> None:
+        series = _series(
+            [0, 10, 70, 5, 65, 66],
+            [10.0, 20.0, 30.0, 1.0, np.nan, 3.0],
+            ["a", "a", "a", "b", "b", "b"],
+        )
+
+        hourly = series.resample("1h", ("mean", "min", "max", "count"), by="sensor_id")
+
+        assert hourly.labels["sensor_id"].tolist() == ["a", "a", "b", "b"]
+        assert hourly.timestamps.astype("datetime64[h]").astype(str).tolist() == [
+            "2024-01-01T00",
+            "2024-01-01T01",
+            "2024-01-01T00",
+            "2024-01-01T01",
+        ]
+        assert hourly.values["temperature_mean"].tolist() == [15.0, 30.0, 1.0, 3.0]
+        assert hourly.values["temperature_min"].tolist() == [10.0, 30.0, 1.0, 3.0]
+        assert hourly.values["temperature_max"].tolist() == [20.0, 30.0, 1.0, 3.0]
+        assert hourly.values["temperature_count"].tolist() == [2.0, 1.0, 1.0, 1.0]
+
+    def test_all_nan_interval_and_missing_timestamps(self) -> None:
+        series = _series([0, 1], [np.nan, np.nan], ["a", "a"])
+        series.timestamps[1] = np.datetime64("NaT", "ns")
+
+        result = series.resample("15min")
+
+        assert len(result) == 1
+        assert np.isnan(result.values["temperature_mean"][0])
+
+    def test_empty_series(self) -> None:
+        assert len(TimeSeriesColumns.empty().resample("1h")) == 0
+
+    @pytest.mark.parametrize(
+        ("interval", "how"), [("0s", ("mean",)), ("1h", ("median",)), ("1h", ())]
+    )
+    def test_invalid_arguments(self, interval: str, how: tuple[str, ...]) -> None:
+        with pytest.raises(ValueError):
+            _series([0], [1.0], ["a"]).resample(interval, how)
+
+
+class TestLTTB:
+    """Tests for LTTB downsampling."""
+
+    def test_keeps_endpoints_and_peaks(self) -> None:
+        x = np.arange(1000, dtype=float)
+        y = np.sin(x / 50)
+        y[500] = 10.0
+
+        kept = lttb_indices(x, y, 50)
+
+        assert len(kept) == 50
+        assert kept[0] == 0
+        assert kept[-1] == 999
+        assert 500 in kept
+        assert np.all(np.diff(kept) > 0)
+
+    def test_small_inputs(self) -> None:
+        x = np.arange(5, dtype=float)
+        assert lttb_indices(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+        with pytest.raises(ValueError, match="at least 3"):
+            lttb_indices(x, x, 2)
+
+    def test_downsample_per_sensor(self) -> None:
+        minutes = list(range(100)) * 2
+        temps = [float(m % 7) for m in range(100)] * 2
+        temps[150] = np.nan
+        series = _series(minutes, temps, ["a"] * 100 + ["b"] * 100)
+
+        result = series.downsample(10, "temperature", by="sensor_id")
+
+        assert len(result) == 20
+        assert result.labels["sensor_id"].tolist() == ["a"] * 10 + ["b"] * 10
+        assert not np.isnan(result.values["temperature"]).any()
+
+
+class TestSheetOutput:
+    """Tests for writing series to sheets and the importer integration."""
+
+    def test_write_sheet(self, tmp_path: Path) -> None:
+        series = _series([0, 1], [20.5, np.nan], ["a", "b"])
+        output = tmp_path / "series.ods"
+
+        with StreamingWriter(output) as writer:
+            assert series.write_sheet(writer, "Readings") == 2
+
+        with StreamingReader(output) as reader:
+            rows = [[c.value for c in row.cells] for row in reader.rows("Readings")]
+        assert rows[0] == ["timestamp", "sensor_id", "temperature"]
+        assert rows[1] == ["2024-01-01T00:00:00", "a", 20.5]
+        assert rows[2][:2] == ["2024-01-01T00:01:00", "b"]
+
+    def test_write_sheet_limit(self) -> None:
+        series = TimeSeriesColumns(np.zeros(MAX_SHEET_ROWS, dtype="datetime64[ns]"))
+        with pytest.raises(ValueError, match="resample or downsample"):
+            series.write_sheet(StreamingWriter("unused.ods"), "Readings")
+
+    def test_sensor_data_import_columns(self, tmp_path: Path) -> None:
+        path = tmp_path / "line.csv"
+        path.write_text(
+            "Timestamp,Machine,Speed,Vibration\n"
+            "2024-01-01T08:00:00,M1,1200,0.05\n"
+            "2024-01-01T08:00:30,M1,1210,0.07\n"
+        )
+
+        result = SensorDataImporter().import_columns(path)
+
+        assert result.success
+        assert result.records_imported == 2
+        assert result.data.labels["equipment"].tolist() == ["M1", "M1"]
+        assert result.data.values["rpm"].tolist() == [1200.0, 1210.0]
+        assert result.metadata["time_range"]["end"] == "2024-01-01T08:00:30"
+
+    def test_sensor_network_import_columns(self, tmp_path: Path) -> None:
+        path = tmp_path / "net.jsonl"
+        path.write_text('{"Device_ID": "S1", "PM2_5": 12}\n{"Device_ID": "S2"}\n')
+
+        result = SensorNetworkImporter().import_columns(path)
+
+        assert result.success
+        np.testing.assert_array_equal(result.data.values["pm25"], [12.0, np.nan])
+        assert not SensorNetworkImporter().import_columns(tmp_path / "x.csv").success
@@ -417,6 +417,22 @@ def h() -> MCPToolResult:
         assert all("name" in s for s in schemas)
         assert all("description" in s for s in schemas)
 
+    def test_list_tools_cached_until_registration(self) -> None:
+        """Test schemas are reused until another tool is registered."""
+        registry = MCPToolRegistry()
+
+        def h() -> MCPToolResult:
+            return MCPToolResult.text("x")
+
+        registry.register("tool1", "Tool 1", h)
+        generation = registry.generation
+        first = registry.list_tools()
+        assert registry.list_tools()[0] is first[0]
+
+        registry.register("tool2", "Tool 2", h)
+        assert registry.generation > generation
+        assert [s["name"] for s in registry.list_tools()] == ["tool1", "tool2"]
+
     def test_get_nonexistent_tool(self) -> None:
         """Test getting non-existent tool returns None."""
         registry = MCPToolRegistry()
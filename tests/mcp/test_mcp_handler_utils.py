@@ -17,7 +17,7 @@
 
 from spreadsheet_dl._mcp.config import MCPConfig
 from spreadsheet_dl._mcp.exceptions import MCPSecurityError
-from spreadsheet_dl._mcp.handlers import HandlerUtils
+from spreadsheet_dl._mcp.handlers import BufferedAuditWriter, HandlerUtils
 from spreadsheet_dl._mcp.models import MCPToolResult
 from spreadsheet_dl.exceptions import FileError
 
@@ -263,3 +263,35 @@ def test_log_audit_multiple_params(
         assert log_data["params"]["int_param"] == "42"
         assert log_data["params"]["bool_param"] == "True"
         assert "/tmp/test" in log_data["params"]["path_param"]
+
+
+class TestBufferedAuditWriter:
+    """Tests for BufferedAuditWriter."""
+
+    def test_no_thread_until_first_write(self, tmp_path: Path) -> None:
+        """Test an idle writer starts no thread and creates no file."""
+        writer = BufferedAuditWriter(tmp_path / "audit.log")
+        writer.flush()
+        writer.close()
+        assert writer._thread is None
+        assert not (tmp_path / "audit.log").exists()
+
+    def test_close_writes_pending_lines(self, tmp_path: Path) -> None:
+        """Test close drains the queue before stopping."""
+        writer = BufferedAuditWriter(tmp_path / "audit.log", max_batch=3)
+        for i in range(10):
+            writer.write(json.dumps({"n": i}))
+        writer.close()
+
+        lines = (tmp_path / "audit.log").read_text().splitlines()
+        assert [json.loads(line)["n"] for line in lines] == list(range(10))
+        assert writer._thread is None
+
+    def test_write_error_is_logged(self, tmp_path: Path) -> None:
+        """Test an unwritable log path warns instead of raising."""
+        writer = BufferedAuditWriter(tmp_path / "missing" / "audit.log")
+        with patch.object(writer._logger, "warning") as mock_warning:
+            writer.write("{}")
+            writer.flush()
+        writer.close()
+        mock_warning.assert_called_once()
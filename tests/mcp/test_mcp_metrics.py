@@ -0,0 +1,209 @@
+"""
+Tests for MCP server metrics, the server_metrics tool and slow-call profiling.
+"""
+
+from __future__ import annotations
+
+import json
+import pstats
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from spreadsheet_dl._mcp.config import MCPConfig
+from spreadsheet_dl._mcp.metrics import MetricsCollector, SlowCallProfiler
+from spreadsheet_dl._mcp.models import MCPToolResult
+from spreadsheet_dl._mcp.server import MCPServer
+from spreadsheet_dl.builder import SpreadsheetBuilder
+
+pytestmark = [pytest.mark.unit, pytest.mark.mcp]
+
+
+def _call(server: MCPServer, name: str, **arguments: Any) -> dict[str, Any]:
+    response = server.handle_message(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {"name": name, "arguments": arguments},
+        }
+    )
+    assert response is not None
+    return response
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector."""
+
+    def test_percentiles(self) -> None:
+        metrics = MetricsCollector()
+        for ms in range(1, 101):
+            metrics.record("t", ms / 1000)
+
+        latency = metrics.snapshot()["tools"]["t"]["latency_ms"]
+        assert latency["p50"] == 50.0
+        assert latency["p95"] == 95.0
+        assert latency["p99"] == 99.0
+        assert latency["max"] == 100.0
+
+    def test_time_split_and_bytes(self) -> None:
+        metrics = MetricsCollector()
+        metrics.record(
+            "cell_set",
+            0.5,
+            bytes_in=10,
+            bytes_out=20,
+            is_error=True,
+            phases={"load": 0.2, "save": 0.1},
+        )
+
+        tool = metrics.snapshot("cell_set")["tools"]["cell_set"]
+        assert tool["errors"] == 1
+        assert (tool["bytes_in"], tool["bytes_out"]) == (10, 20)
+        assert tool["time_split_ms"] == {
+            "load": 200.0,
+            "save": 100.0,
+            "operation": 200.0,
+        }
+
+    def test_snapshot_filter_and_reset(self) -> None:
+        metrics = MetricsCollector()
+        metrics.record("a", 0.001)
+        metrics.record("b", 0.001)
+        assert list(metrics.snapshot("b")["tools"]) == ["b"]
+
+        metrics.reset()
+        assert metrics.snapshot()["total_calls"] == 0
+
+    def test_prometheus_histogram(self, tmp_path: Path) -> None:
+        metrics = MetricsCollector()
+        metrics.record("cell_get", 0.003)
+        metrics.record("cell_get", 0.2)
+        metrics.record('odd"name', 20.0)
+
+        path = tmp_path / "mcp.prom"
+        metrics.write_prometheus(path)
+        text = path.read_text()
+
+        assert 'spreadsheet_dl_mcp_tool_calls_total{tool="cell_get"} 2' in text
+        bucket = "spreadsheet_dl_mcp_tool_duration_seconds_bucket"
+        assert f'{bucket}{{tool="cell_get",le="0.005"}} 1' in text
+        assert f'{bucket}{{tool="cell_get",le="0.25"}} 2' in text
+        assert f'{bucket}{{tool="odd\\"name",le="10.0"}} 0' in text
+        assert f'{bucket}{{tool="odd\\"name",le="+Inf"}} 1' in text
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestSlowCallProfiler:
+    """Tests for SlowCallProfiler."""
+
+    def test_keeps_slowest_profiles(self, tmp_path: Path) -> None:
+        profiler = SlowCallProfiler(tmp_path, keep=2)
+        for delay in (0.001, 0.02, 0.005, 0.03):
+            assert profiler.call("tool/x", lambda d=delay: time.sleep(d) or d) == delay
+
+        kept = profiler.profiles()
+        assert len(kept) == 2
+        assert sorted(tmp_path.iterdir()) == sorted(kept)
+        assert all(p.name.startswith("tool_x-") for p in kept)
+        slowest_ms = int(kept[0].name.split("-")[1].removesuffix("ms"))
+        assert slowest_ms >= 30
+        pstats.Stats(str(kept[0]))
+
+    def test_sample_rate_zero_disables(self, tmp_path: Path) -> None:
+        profiler = SlowCallProfiler(tmp_path / "prof", keep=5, sample_rate=0.0)
+        assert profiler.call("t", lambda: 1) == 1
+        assert profiler.profiles() == []
+        assert not (tmp_path / "prof").exists()
+
+    def test_unwritable_directory_does_not_fail_call(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        blocker = tmp_path / "file"
+        blocker.write_text("x")
+        profiler = SlowCallProfiler(blocker / "prof", keep=2)
+        with caplog.at_level("WARNING", logger="spreadsheet-dl-mcp"):
+            assert profiler.call("t", lambda: 7) == 7
+        assert profiler.profiles() == []
+        assert "Failed to write profile" in caplog.text
+
+
+class TestServerMetrics:
+    """Tests for server instrumentation and the server_metrics tool."""
+
+    @pytest.fixture
+    def workbook(self, tmp_path: Path) -> Path:
+        builder = SpreadsheetBuilder()
+        builder.sheet("Sheet1")
+        builder.row()
+        builder.cells("Name", "Value")
+        return builder.save(tmp_path / "book.ods")
+
+    def test_server_metrics_tool(self, tmp_path: Path, workbook: Path) -> None:
+        server = MCPServer(MCPConfig(allowed_paths=[tmp_path]))
+        _call(server, "cell_get", file_path=str(workbook), sheet="Sheet1", cell="A1")
+        _call(
+            server,
+            "cell_set",
+            file_path=str(workbook),
+            sheet="Sheet1",
+            cell="B2",
+            value="7",
+        )
+        _call(
+            server,
+            "cell_get",
+            file_path=str(tmp_path / "missing.ods"),
+            sheet="Sheet1",
+            cell="A1",
+        )
+
+        response = _call(server, "server_metrics")
+        data = json.loads(response["result"]["content"][0]["text"])
+        cell_get = data["tools"]["cell_get"]
+        assert cell_get["calls"] == 2
+        assert cell_get["errors"] == 1
+        assert cell_get["bytes_out"] > 0
+        assert cell_get["time_split_ms"]["load"] > 0
+        assert data["tools"]["cell_set"]["time_split_ms"]["save"] > 0
+
+        response = _call(server, "server_metrics", tool="cell_set", reset=True)
+        data = json.loads(response["result"]["content"][0]["text"])
+        assert list(data["tools"]) == ["cell_set"]
+        # Only the resetting call itself has been recorded since
+        assert list(server.metrics.snapshot()["tools"]) == ["server_metrics"]
+
+    def test_metrics_file_and_profiles(self, tmp_path: Path) -> None:
+        config = MCPConfig(
+            allowed_paths=[tmp_path],
+            metrics_path=tmp_path / "mcp.prom",
+            metrics_interval_seconds=0,
+            profile_dir=tmp_path / "profiles",
+            profile_slowest=1,
+        )
+        server = MCPServer(config)
+        server._registry.register(
+            "sleepy",
+            "Sleep briefly",
+            lambda: time.sleep(0.01) or MCPToolResult.text(""),
+        )
+        _call(server, "sleepy")
+
+        assert 'tool="sleepy"' in (tmp_path / "mcp.prom").read_text()
+        assert len(list((tmp_path / "profiles").iterdir())) == 1
+        data = json.loads(
+            _call(server, "server_metrics")["result"]["content"][0]["text"]
+        )
+        assert len(data["profiles"]) == 1
+
+    def test_audit_entry_has_duration(self, tmp_path: Path) -> None:
+        config = MCPConfig(allowed_paths=[tmp_path], audit_log_path=tmp_path / "a.log")
+        server = MCPServer(config)
+        _call(server, "server_metrics")
+        server.flush_audit_log()
+
+        entry = json.loads((tmp_path / "a.log").read_text())
+        assert entry["tool"] == "server_metrics"
+        assert entry["duration_ms"] >= 0
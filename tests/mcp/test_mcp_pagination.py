@@ -0,0 +1,263 @@
+"""
+Tests for cursor-based pagination of large MCP tool results.
+
+Covers the ResultPager cache, the compact row-array encoding, and the
+paginated query_select, query_find and cell_batch_get tools.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from spreadsheet_dl._mcp.config import MCPConfig
+from spreadsheet_dl._mcp.exceptions import MCPToolError
+from spreadsheet_dl._mcp.pagination import (
+    MAX_PAGE_SIZE,
+    RESULT_PAGER,
+    ResultPage,
+    ResultPager,
+    encode_page,
+)
+from spreadsheet_dl._mcp.server import MCPServer
+from spreadsheet_dl.builder import SpreadsheetBuilder
+
+pytestmark = [pytest.mark.unit, pytest.mark.mcp]
+
+ROWS = 25
+
+
+@pytest.fixture
+def server(tmp_path: Path) -> MCPServer:
+    """Create a test MCP server."""
+    return MCPServer(MCPConfig(allowed_paths=[tmp_path]))
+
+
+@pytest.fixture
+def ledger(tmp_path: Path) -> Path:
+    """Ledger sheet with a header and 25 data rows."""
+    builder = SpreadsheetBuilder()
+    builder.sheet("Ledger")
+    builder.row()
+    builder.cells("Item", "Amount", "Status")
+    for i in range(ROWS):
+        builder.row()
+        builder.cells(f"Item {i}", float(i), "open" if i % 2 else "done")
+    return builder.save(tmp_path / "ledger.ods")
+
+
+@pytest.fixture(autouse=True)
+def _clear_pager() -> None:
+    RESULT_PAGER.clear()
+
+
+def _payload(result: Any) -> dict[str, Any]:
+    assert not result.is_error, result.content[0]["text"]
+    return json.loads(result.content[0]["text"])  # type: ignore[no-any-return]
+
+
+class TestResultPager:
+    """Tests for ResultPager."""
+
+    def test_unpaged_returns_everything(self) -> None:
+        page = ResultPager().page(("t",), lambda: (["n"], [[1], [2]]))
+        assert page.rows == [[1], [2]]
+        assert page.next_cursor is None
+        assert page.page_info() == {}
+
+    def test_walks_pages_computing_once(self) -> None:
+        pager = ResultPager()
+        calls = []
+
+        def compute() -> tuple[list[str], list[list[Any]]]:
+            calls.append(1)
+            return ["n"], [[i] for i in range(5)]
+
+        page = pager.page(("t",), compute, page_size=2)
+        seen = list(page.rows)
+        while page.next_cursor:
+            page = pager.page(("t",), compute, cursor=page.next_cursor)
+            seen.extend(page.rows)
+        assert seen == [[i] for i in range(5)]
+        assert page.page_info() == {"offset": 4, "total": 5, "next_cursor": None}
+        assert len(calls) == 1
+
+    def test_single_page_result_is_not_stored(self) -> None:
+        pager = ResultPager()
+        page = pager.page(("t",), lambda: (["n"], [[1]]), page_size=10)
+        assert page.next_cursor is None
+        assert pager._results.stats["size"] == 0
+
+    def test_cursor_bound_to_request(self) -> None:
+        pager = ResultPager()
+        page = pager.page(("a",), lambda: (["n"], [[1], [2]]), page_size=1)
+        with pytest.raises(MCPToolError, match="different request"):
+            pager.page(("b",), lambda: ([], []), cursor=page.next_cursor)
+
+    def test_expired_cursor(self) -> None:
+        pager = ResultPager(ttl=0)
+        page = pager.page(("a",), lambda: (["n"], [[1], [2]]), page_size=1)
+        with pytest.raises(MCPToolError, match="expired"):
+            pager.page(("a",), lambda: ([], []), cursor=page.next_cursor)
+
+    @pytest.mark.parametrize("cursor", ["nodot", "abc.x", ".5"])
+    def test_malformed_cursor(self, cursor: str) -> None:
+        with pytest.raises(MCPToolError, match="Invalid cursor"):
+            ResultPager().page(("a",), lambda: ([], []), cursor=cursor)
+
+    @pytest.mark.parametrize("size", [0, MAX_PAGE_SIZE + 1])
+    def test_page_size_bounds(self, size: int) -> None:
+        with pytest.raises(MCPToolError, match="page_size"):
+            ResultPager().page(("a",), lambda: ([], []), page_size=size)
+
+    def test_unknown_format(self) -> None:
+        page = ResultPage(["a"], [[1]], 0, 1, None, paginated=False)
+        with pytest.raises(MCPToolError, match="Unknown result format"):
+            encode_page(page, "csv", "results")
+
+
+class TestPaginatedTools:
+    """Tests for the paginated MCP tools."""
+
+    def test_query_select_unpaged_unchanged(
+        self, server: MCPServer, ledger: Path
+    ) -> None:
+        data = _payload(
+            server._handle_query_select(
+                file_path=str(ledger), sheet="Ledger", query="SELECT Item, Amount"
+            )
+        )
+        assert len(data["results"]) == ROWS
+        assert data["results"][0] == {"Item": "Item 0", "Amount": 0.0}
+        assert "next_cursor" not in data
+
+    def test_query_select_pages(self, server: MCPServer, ledger: Path) -> None:
+        args = {
+            "file_path": str(ledger),
+            "sheet": "Ledger",
+            "query": "SELECT Item ORDER BY Amount DESC",
+            "page_size": 10,
+        }
+        data = _payload(server._handle_query_select(**args))
+        items = [row["Item"] for row in data["results"]]
+        assert data["total"] == ROWS
+        while data["next_cursor"]:
+            data = _payload(
+                server._handle_query_select(**args, cursor=data["next_cursor"])
+            )
+            items.extend(row["Item"] for row in data["results"])
+        assert items == [f"Item {i}" for i in reversed(range(ROWS))]
+
+    def test_query_select_rows_format(self, server: MCPServer, ledger: Path) -> None:
+        result = server._handle_query_select(
+            file_path=str(ledger),
+            sheet="Ledger",
+            query="SELECT Item, Status WHERE Amount < 2",
+            format="rows",
+        )
+        text = result.content[0]["text"]
+        assert "\n" not in text
+        data = json.loads(text)
+        assert data["columns"] == ["Item", "Status"]
+        assert data["rows"] == [["Item 0", "done"], ["Item 1", "open"]]
+
+    def test_query_select_unknown_format_skips_query(
+        self, server: MCPServer, ledger: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(*args: Any) -> Any:
+            raise AssertionError("query ran")
+
+        monkeypatch.setattr("spreadsheet_dl.query.query_file", fail)
+        result = server._handle_query_select(
+            file_path=str(ledger), sheet="Ledger", query="SELECT Item", format="csv"
+        )
+        assert result.is_error
+        assert "Unknown result format" in result.content[0]["text"]
+
+    def test_query_find_pages(self, server: MCPServer, ledger: Path) -> None:
+        args = {
+            "file_path": str(ledger),
+            "sheet": "Ledger",
+            "criteria": json.dumps({"Status": "open"}),
+            "page_size": 5,
+        }
+        first = _payload(server._handle_query_find(**args))
+        second = _payload(
+            server._handle_query_find(**args, cursor=first["next_cursor"])
+        )
+        assert first["matches"] == [2, 4, 6, 8, 10]
+        assert second["matches"] == [12, 14, 16, 18, 20]
+        assert second["total"] == 12
+
+    def test_cursor_rejected_for_other_query(
+        self, server: MCPServer, ledger: Path
+    ) -> None:
+        first = _payload(
+            server._handle_query_select(
+                file_path=str(ledger), sheet="Ledger", query="SELECT *", page_size=5
+            )
+        )
+        result = server._handle_query_select(
+            file_path=str(ledger),
+            sheet="Ledger",
+            query="SELECT Item",
+            cursor=first["next_cursor"],
+        )
+        assert result.is_error
+        assert "different request" in result.content[0]["text"]
+
+    def test_cell_batch_get_range_pages(self, server: MCPServer, ledger: Path) -> None:
+        args = {
+            "file_path": str(ledger),
+            "sheet": "Ledger",
+            "cells": "A2:B7",
+            "page_size": 4,
+        }
+        first = _payload(server._handle_cell_batch_get(**args))
+        assert list(first["values"]) == [
+            f"{col}{row}" for row in range(2, 6) for col in "AB"
+        ]
+        assert first["values"]["B5"] == 3.0
+        second = _payload(
+            server._handle_cell_batch_get(**args, cursor=first["next_cursor"])
+        )
+        assert second["values"] == {
+            "A6": "Item 4",
+            "B6": 4.0,
+            "A7": "Item 5",
+            "B7": 5.0,
+        }
+        assert second["next_cursor"] is None
+
+    def test_cell_batch_get_rows_format(self, server: MCPServer, ledger: Path) -> None:
+        data = _payload(
+            server._handle_cell_batch_get(
+                file_path=str(ledger), sheet="Ledger", cells="A1:C2", format="rows"
+            )
+        )
+        assert data["columns"] == ["row", "A", "B", "C"]
+        assert data["rows"] == [
+            [1, "Item", "Amount", "Status"],
+            [2, "Item 0", 0.0, "done"],
+        ]
+
+    def test_cell_batch_get_list_rows_format(
+        self, server: MCPServer, ledger: Path
+    ) -> None:
+        data = _payload(
+            server._handle_cell_batch_get(
+                file_path=str(ledger), sheet="Ledger", cells="A1, C3", format="rows"
+            )
+        )
+        assert data["columns"] == ["cell", "value"]
+        assert data["rows"] == [["A1", "Item"], ["C3", "open"]]
+
+    def test_schema_lists_pagination_parameters(self, server: MCPServer) -> None:
+        schema = server._tools["query_select"].to_schema()["inputSchema"]
+        assert {"page_size", "cursor", "format"} <= set(schema["properties"])
+        assert "cursor" not in schema["required"]
+        find = server._tools["query_find"].to_schema()["inputSchema"]
+        assert "format" not in find["properties"]
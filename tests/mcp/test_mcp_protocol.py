@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
@@ -74,6 +75,43 @@ def test_missing_id(self, server: MCPServer) -> None:
         # May return None or response depending on implementation
         assert response is None or isinstance(response, dict)
 
+    def test_handle_message_json_tools_list(self, server: MCPServer) -> None:
+        """Test the pre-serialized tools/list payload matches handle_message."""
+        message = {"jsonrpc": "2.0", "id": 7, "method": "tools/list"}
+
+        text = server.handle_message_json(message)
+        assert text is not None
+        assert json.loads(text) == server.handle_message(message)
+
+    def test_handle_message_json_notification(self, server: MCPServer) -> None:
+        """Test notifications produce no serialized response."""
+        message = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+        assert server.handle_message_json(message) is None
+
+    def test_dispatch_refreshed_after_registration(self, server: MCPServer) -> None:
+        """Test tools registered after startup are callable and listed."""
+        server.handle_message({"jsonrpc": "2.0", "id": 1, "method": "tools/list"})
+        server._registry.register(
+            "late_tool", "Late tool", lambda: MCPToolResult.text("late")
+        )
+
+        listed = server.handle_message_json(
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+        )
+        assert listed is not None
+        assert "late_tool" in {t["name"] for t in json.loads(listed)["result"]["tools"]}
+
+        response = server.handle_message(
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "tools/call",
+                "params": {"name": "late_tool", "arguments": {}},
+            }
+        )
+        assert response is not None
+        assert response["result"]["content"][0]["text"] == "late"
+
     def test_tools_call_with_arguments(self, server: MCPServer) -> None:
         """Test tools/call with arguments."""
         message = {
@@ -181,6 +219,7 @@ def test_audit_logging_writes_to_file(
         params = {"tool": "test"}
 
         server_with_audit._log_audit("test_tool", params, result)
+        server_with_audit.flush_audit_log()
 
         log_path = tmp_path / "audit.log"
         assert log_path.exists()
@@ -188,6 +227,21 @@ def test_audit_logging_writes_to_file(
         assert "test_tool" in log_content
         assert "test" in log_content
 
+    def test_audit_log_buffered_across_calls(
+        self, server_with_audit: MCPServer, tmp_path: Path
+    ) -> None:
+        """Test audit entries from many calls all reach the file in order."""
+        for i in range(50):
+            server_with_audit._log_audit(
+                "test_tool", {"i": i}, MCPToolResult.text("ok")
+            )
+        server_with_audit.flush_audit_log()
+
+        lines = (tmp_path / "audit.log").read_text().splitlines()
+        assert [json.loads(line)["params"]["i"] for line in lines] == [
+            str(i) for i in range(50)
+        ]
+
     def test_audit_logging_disabled(self, tmp_path: Path) -> None:
         """Test audit logging when disabled."""
         config = MCPConfig(
@@ -4,7 +4,7 @@
 
 from datetime import date, datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
@@ -497,6 +497,133 @@ def test_render_with_colspan_and_rowspan(self, tmp_path: Path) -> None:
         assert path.exists()
 
 
+class TestOdsRendererRepeatCollapsing:
+    """Tests for run-length collapsing of repeated cells and rows."""
+
+    @staticmethod
+    def _table_rows(path: Path) -> list[Any]:
+        from odf.opendocument import load
+        from odf.table import Table, TableRow
+
+        doc = load(str(path))
+        table = doc.spreadsheet.getElementsByType(Table)[0]
+        return list(table.getElementsByType(TableRow))
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test that rows and cells are emitted one-for-one by default."""
+        builder = SpreadsheetBuilder(theme=None)
+        builder.sheet("Log").column("A").column("B").header_row().data_rows(5)
+
+        renderer = OdsRenderer()
+        path = renderer.render(builder.build(), tmp_path / "plain.ods")
+
+        assert len(self._table_rows(path)) == 6
+        assert renderer.stats.rows_collapsed == 0
+        assert renderer.stats.cells_collapsed == 0
+
+    def test_blank_rows_collapse(self, tmp_path: Path) -> None:
+        """Test that blank entry rows collapse into one repeated row."""
+        builder = SpreadsheetBuilder(theme=None)
+        builder.sheet("Log").column("A").column("B").column("C").header_row()
+        builder.data_rows(1000)
+
+        renderer = OdsRenderer(collapse_repeats=True)
+        path = renderer.render(builder.build(), tmp_path / "compact.ods")
+
+        rows = self._table_rows(path)
+        assert len(rows) == 2
+        assert rows[1].getAttribute("numberrowsrepeated") == "1000"
+        assert renderer.stats.logical_rows == 1001
+        assert renderer.stats.emitted_rows == 2
+        assert renderer.stats.row_compression_ratio == pytest.approx(500.5)
+
+    def test_identical_cells_collapse(self, tmp_path: Path) -> None:
+        """Test that identical adjacent cells share one repeated element."""
+        from odf.table import TableCell
+
+        sheets = [
+            SheetSpec(
+                name="Test",
+                rows=[
+                    RowSpec(
+                        cells=[
+                            CellSpec(value="x"),
+                            CellSpec(),
+                            CellSpec(),
+                            CellSpec(),
+                            CellSpec(value="y"),
+                        ]
+                    ),
+                ],
+            ),
+        ]
+
+        renderer = OdsRenderer(collapse_repeats=True)
+        path = renderer.render(sheets, tmp_path / "cells.ods")
+
+        cells = self._table_rows(path)[0].getElementsByType(TableCell)
+        assert len(cells) == 3
+        assert cells[1].getAttribute("numbercolumnsrepeated") == "3"
+        assert renderer.stats.logical_cells == 5
+        assert renderer.stats.emitted_cells == 3
+
+    def test_distinct_rows_not_collapsed(self, tmp_path: Path) -> None:
+        """Test that rows with different values stay separate."""
+        sheets = [
+            SheetSpec(
+                name="Test",
+                rows=[
+                    RowSpec(cells=[CellSpec(value=1), CellSpec(value=2)]),
+                    RowSpec(cells=[CellSpec(value=1), CellSpec(value=3)]),
+                    RowSpec(cells=[CellSpec(value=1), CellSpec(value=3)]),
+                ],
+            ),
+        ]
+
+        renderer = OdsRenderer(collapse_repeats=True)
+        path = renderer.render(sheets, tmp_path / "distinct.ods")
+
+        rows = self._table_rows(path)
+        assert len(rows) == 2
+        assert rows[1].getAttribute("numberrowsrepeated") == "2"
+
+    def test_merged_rows_not_collapsed(self, tmp_path: Path) -> None:
+        """Test that rows taking part in merges are never collapsed."""
+        sheets = [
+            SheetSpec(
+                name="Test",
+                rows=[
+                    RowSpec(cells=[CellSpec(value="M", rowspan=2), CellSpec()]),
+                    RowSpec(cells=[CellSpec(), CellSpec()]),
+                    RowSpec(cells=[CellSpec(), CellSpec()]),
+                ],
+            ),
+        ]
+
+        renderer = OdsRenderer(collapse_repeats=True)
+        path = renderer.render(sheets, tmp_path / "merged.ods")
+
+        assert len(self._table_rows(path)) == 3
+        # The covered cell is neither a logical nor an emitted cell
+        assert renderer.stats.logical_cells == 5
+        assert renderer.stats.emitted_cells == 4
+
+    def test_collapsed_output_reads_back(self, tmp_path: Path) -> None:
+        """Test that collapsed output expands to the same logical grid."""
+        import pandas as pd
+
+        builder = SpreadsheetBuilder(theme=None)
+        builder.sheet("Log").column("A").column("B", type="currency")
+        builder.header_row().data_rows(50)
+        builder.row().cell("Total").cell(42)
+
+        path = builder.save(tmp_path / "roundtrip.ods", collapse_repeats=True)
+
+        df = pd.read_excel(path, engine="odf", header=None)
+        assert df.shape == (52, 2)
+        assert df.iloc[51, 0] == "Total"
+
+
 class TestOdsRendererNamedRanges:
     """Tests for named range rendering."""
 
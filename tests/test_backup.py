@@ -8,7 +8,9 @@
 from __future__ import annotations
 
 import gzip
+import os
 import tempfile
+import zipfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -20,6 +22,7 @@
 
 from spreadsheet_dl.backup import (
     BackupCompression,
+    BackupCorruptError,
     BackupManager,
     BackupMetadata,
     BackupNotFoundError,
@@ -135,6 +138,26 @@ def test_create_backup_with_gzip(
             content = f.read()
         assert content == sample_file.read_bytes()
 
+    def test_create_backup_stores_zip_containers(
+        self, backup_manager: BackupManager, temp_dir: Path
+    ) -> None:
+        """Test that ODS zip files are not gzipped a second time."""
+        import zipfile
+
+        ods_file = temp_dir / "real.ods"
+        with zipfile.ZipFile(ods_file, "w") as zf:
+            zf.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet")
+            zf.writestr("content.xml", "<office:document-content/>")
+
+        backup_info = backup_manager.create_backup(ods_file, BackupReason.MANUAL)
+
+        assert backup_info.backup_path.suffix != ".gz"
+        assert backup_info.metadata.compression == BackupCompression.NONE.value
+        assert backup_info.backup_path.read_bytes() == ods_file.read_bytes()
+
+        restored = backup_manager.restore_backup(backup_info, temp_dir / "restored.ods")
+        assert restored.read_bytes() == ods_file.read_bytes()
+
     def test_create_backup_without_compression(
         self, temp_dir: Path, sample_file: Path
     ) -> None:
@@ -409,6 +432,150 @@ def test_get_backup_stats(
         assert stats["by_reason"]["auto_before_edit"] == 1
 
 
+class TestDedupBackupStore:
+    """Tests for the content-addressed dedup backup mode."""
+
+    @pytest.fixture
+    def dedup_manager(self, temp_dir: Path) -> BackupManager:
+        """Create a BackupManager using the dedup store with small chunks."""
+        return BackupManager(
+            backup_dir=temp_dir / "backups",
+            compression=BackupCompression.DEDUP,
+            chunk_size=4096,
+        )
+
+    @staticmethod
+    def _write_ods(
+        path: Path,
+        content: str,
+        styles: bytes,
+        date_time: tuple[int, int, int, int, int, int] = (2024, 1, 1, 12, 0, 0),
+    ) -> None:
+        """Write a minimal zip container with a large static member.
+
+        Every member is stamped with date_time, as odfpy stamps members
+        with the save time.
+        """
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(
+                zipfile.ZipInfo("mimetype", date_time),
+                "application/vnd.oasis.opendocument.spreadsheet",
+                compress_type=zipfile.ZIP_STORED,
+            )
+            zf.writestr(zipfile.ZipInfo("styles.xml", date_time), styles)
+            zf.writestr(zipfile.ZipInfo("content.xml", date_time), content)
+
+    def test_roundtrip(
+        self, dedup_manager: BackupManager, sample_file: Path, temp_dir: Path
+    ) -> None:
+        """Test a dedup backup restores byte-for-byte."""
+        backup_info = dedup_manager.create_backup(sample_file)
+
+        assert backup_info.backup_path.suffix == ".chunks"
+        assert backup_info.metadata.compression == "dedup"
+
+        restored = dedup_manager.restore_backup(
+            backup_info.backup_path, temp_dir / "restored.ods"
+        )
+        assert restored.read_bytes() == sample_file.read_bytes()
+        assert dedup_manager.verify_backup(backup_info)["valid"]
+
+    def test_large_file_is_chunked(
+        self, dedup_manager: BackupManager, temp_dir: Path
+    ) -> None:
+        """Test files larger than chunk_size span several blobs."""
+        source = temp_dir / "big.csv"
+        source.write_bytes(os.urandom(10000))
+
+        backup_info = dedup_manager.create_backup(source)
+        stats = dedup_manager.get_backup_stats()
+
+        assert stats["unique_chunks"] == 3
+        restored = dedup_manager.restore_backup(backup_info, temp_dir / "out.csv")
+        assert restored.read_bytes() == source.read_bytes()
+
+    def test_unchanged_members_are_shared(
+        self, dedup_manager: BackupManager, temp_dir: Path
+    ) -> None:
+        """Test re-saving with one edited member shares the other payloads."""
+        source = temp_dir / "ledger.ods"
+        # Smaller than chunk_size, like most members of a real workbook
+        styles = os.urandom(4000)
+        self._write_ods(source, "<rows>1</rows>", styles, (2024, 1, 1, 12, 0, 0))
+        first = dedup_manager.create_backup(source)
+        blobs_after_first = dedup_manager.get_backup_stats()["unique_chunks"]
+
+        # A later save restamps every member header
+        self._write_ods(source, "<rows>2</rows>", styles, (2024, 1, 1, 12, 0, 4))
+        second = dedup_manager.create_backup(source)
+
+        stats = dedup_manager.get_backup_stats()
+        # New: three member headers, content.xml and the central directory
+        assert stats["unique_chunks"] - blobs_after_first <= 5
+        assert stats["referenced_chunks"] > stats["unique_chunks"]
+        assert stats["dedup_ratio"] > 1.5
+        assert stats["logical_size_bytes"] == 2 * source.stat().st_size
+
+        restored = dedup_manager.restore_backup(second, temp_dir / "second.ods")
+        assert restored.read_bytes() == source.read_bytes()
+        assert dedup_manager.verify_backup(first)["valid"]
+
+    def test_identical_backups_store_no_new_blobs(
+        self, dedup_manager: BackupManager, sample_file: Path
+    ) -> None:
+        """Test repeat backups of an unchanged file add no blobs."""
+        dedup_manager.create_backup(sample_file)
+        dedup_manager.create_backup(sample_file)
+
+        stats = dedup_manager.get_backup_stats()
+        assert stats["referenced_chunks"] == 2
+        assert stats["unique_chunks"] == 1
+        assert stats["chunk_dedup_ratio"] == 2.0
+
+    def test_missing_blob_detected(
+        self, dedup_manager: BackupManager, sample_file: Path, temp_dir: Path
+    ) -> None:
+        """Test a deleted blob fails verification and restore."""
+        backup_info = dedup_manager.create_backup(sample_file)
+        for blob in (dedup_manager.backup_dir / "blobs").glob("*/*"):
+            blob.unlink()
+
+        result = dedup_manager.verify_backup(backup_info)
+        assert not result["valid"]
+        assert "Missing chunk blob" in result["issues"][0]
+
+        target = temp_dir / "restored.ods"
+        with pytest.raises(BackupCorruptError):
+            dedup_manager.restore_backup(backup_info, target)
+        assert not target.exists()
+
+    def test_cleanup_prunes_unreferenced_blobs(
+        self, dedup_manager: BackupManager, temp_dir: Path
+    ) -> None:
+        """Test cleanup removes blobs only used by expired backups."""
+        old_file = temp_dir / "old.csv"
+        old_file.write_bytes(b"old content")
+        new_file = temp_dir / "new.csv"
+        new_file.write_bytes(b"new content")
+
+        old_backup = dedup_manager.create_backup(old_file)
+        old_backup.metadata.backup_time = (
+            datetime.now() - timedelta(days=60)
+        ).isoformat()
+        old_backup.metadata_path.write_text(old_backup.metadata.to_json())
+        new_backup = dedup_manager.create_backup(new_file)
+
+        dedup_manager.cleanup_old_backups()
+
+        assert dedup_manager.get_backup_stats()["unique_chunks"] == 1
+        assert dedup_manager.verify_backup(new_backup)["valid"]
+
+    def test_invalid_chunk_size(self, temp_dir: Path) -> None:
+        """Test non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            BackupManager(backup_dir=temp_dir, chunk_size=0)
+
+
 class TestAutoBackup:
     """Tests for auto_backup function."""
 
@@ -477,3 +644,4 @@ def test_compression_options(self) -> None:
         """Test available compression options."""
         assert BackupCompression.NONE.value == "none"
         assert BackupCompression.GZIP.value == "gzip"
+        assert BackupCompression.DEDUP.value == "dedup"
@@ -0,0 +1,232 @@
+"""Tests for cash flow projection."""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+
+from spreadsheet_dl import (
+    BillReminder,
+    BillReminderManager,
+    CashFlowProjector,
+    Debt,
+    DebtPayoffMethod,
+    DebtPayoffPlan,
+    ExpenseCategory,
+    GoalManager,
+    RecurrenceFrequency,
+    RecurringExpense,
+    RecurringExpenseManager,
+    ReminderFrequency,
+    SavingsGoal,
+)
+from spreadsheet_dl.builder import SpreadsheetBuilder
+
+pytestmark = [pytest.mark.unit, pytest.mark.finance]
+
+
+def _expense(
+    frequency: RecurrenceFrequency,
+    start: date,
+    amount: str = "10",
+    name: str = "",
+    **kwargs: object,
+) -> RecurringExpense:
+    return RecurringExpense(
+        name=name or f"{frequency.value}-{start}",
+        category=ExpenseCategory.MISCELLANEOUS,
+        amount=Decimal(amount),
+        frequency=frequency,
+        start_date=start,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _bill(frequency: ReminderFrequency, due: date, amount: str = "10") -> BillReminder:
+    return BillReminder.create(
+        name=f"{frequency.value}-{due}",
+        amount=amount,
+        due_date=due,
+        frequency=frequency,
+    )
+
+
+class TestScheduleExpansion:
+    """Bulk expansion matches the iterative schedules."""
+
+    def test_recurring_matches_generate(self) -> None:
+        """Test expanded recurring dates equal the manager's occurrences."""
+        rng = random.Random(7)
+        manager = RecurringExpenseManager()
+        expenses = []
+        for index in range(300):
+            start = date(2024, 1, 1) + timedelta(days=rng.randrange(800))
+            end_date = rng.choice([None, start + timedelta(days=rng.randrange(700))])
+            expenses.append(
+                _expense(
+                    rng.choice(list(RecurrenceFrequency)),
+                    start,
+                    name=f"item-{index}",
+                    day_of_month=rng.choice([None, 1, 15, 29, 30, 31]),
+                    day_of_week=rng.choice([None, 0, 4, 6]),
+                    end_date=end_date,
+                )
+            )
+        horizon = (date(2024, 6, 10), date(2026, 9, 20))
+        projector = CashFlowProjector(recurring=expenses)
+        events = projector.events(*horizon)
+
+        for expense in expenses:
+            expected = manager._get_occurrences(expense, *horizon)
+            got = events.loc[events["name"] == expense.name, "date"].dt.date
+            assert got.tolist() == expected, expense
+
+    def test_bills_match_advance_date(self) -> None:
+        """Test expanded bill dates follow BillReminder._advance_date."""
+        start, end = date(2025, 1, 1), date(2027, 12, 31)
+        bills = [
+            _bill(frequency, due)
+            for frequency in ReminderFrequency
+            for due in (date(2024, 1, 31), date(2024, 2, 29), date(2025, 3, 15))
+        ]
+        events = CashFlowProjector(bills=bills).events(start, end)
+
+        for bill in bills:
+            expected = []
+            current = bill.due_date
+            while current <= end:
+                if current >= start:
+                    expected.append(current)
+                if bill.frequency == ReminderFrequency.ONE_TIME:
+                    break
+                current = bill._advance_date(current)
+            got = events.loc[events["name"] == bill.name, "date"].dt.date
+            assert got.tolist() == expected, bill
+
+    def test_skips_disabled_items(self) -> None:
+        """Test disabled expenses and inactive bills are not projected."""
+        expense = _expense(RecurrenceFrequency.DAILY, date(2025, 1, 1))
+        expense.enabled = False
+        bill = _bill(ReminderFrequency.WEEKLY, date(2025, 1, 1))
+        bill.is_active = False
+        projector = CashFlowProjector(recurring=[expense], bills=[bill])
+
+        assert projector.events(date(2025, 1, 1), date(2025, 2, 1)).empty
+
+
+class TestProjection:
+    """Tests for aggregated projections."""
+
+    def test_monthly_frame(self) -> None:
+        """Test monthly totals per source and running balance."""
+        projector = CashFlowProjector(
+            recurring=[
+                _expense(
+                    RecurrenceFrequency.MONTHLY,
+                    date(2025, 1, 1),
+                    "1000",
+                    day_of_month=1,
+                )
+            ],
+            bills=[_bill(ReminderFrequency.QUARTERLY, date(2025, 1, 20), "300")],
+            goals=[
+                SavingsGoal.create("Trip", "500", monthly_contribution=Decimal("200"))
+            ],
+            opening_balance=Decimal("10000"),
+        )
+        frame = projector.project(date(2025, 1, 1), date(2025, 4, 30))
+
+        assert frame["recurring"].tolist() == [1000.0] * 4
+        assert frame["bills"].tolist() == [300.0, 0.0, 0.0, 300.0]
+        assert frame["goals"].tolist() == [200.0, 200.0, 100.0, 0.0]
+        assert frame["outflow"].tolist() == [1500.0, 1200.0, 1100.0, 1300.0]
+        assert frame["balance"].iloc[-1] == 10000 - 5100
+
+    def test_daily_frame(self) -> None:
+        """Test daily rows cover every day of the horizon."""
+        projector = CashFlowProjector(
+            recurring=[_expense(RecurrenceFrequency.WEEKLY, date(2025, 1, 1))]
+        )
+        frame = projector.project(date(2025, 1, 1), date(2025, 1, 31), period="daily")
+
+        assert len(frame) == 31
+        assert frame["recurring"].sum() == 40.0
+        assert frame.loc["2025-01-06", "recurring"] == 10.0
+
+    def test_debt_payments_follow_plan(self) -> None:
+        """Test debt payments match the payoff schedule month by month."""
+        plan = DebtPayoffPlan(
+            method=DebtPayoffMethod.AVALANCHE,
+            debts=[
+                Debt.create("Card", "2000", "0.2", "100"),
+                Debt.create("Loan", "1000", "0.05", "50"),
+            ],
+            extra_payment=Decimal("100"),
+        )
+        schedule = plan.calculate_payoff_schedule()
+        frame = CashFlowProjector(debt_plan=plan).project(
+            date(2025, 1, 1), date(2027, 12, 31)
+        )
+
+        expected = [float(sum(month["payments"].values())) for month in schedule]
+        got = frame["debt"].tolist()
+        assert got[: len(expected)] == pytest.approx(expected, abs=0.02)
+        assert not any(got[len(expected) :])
+
+    def test_from_managers(self) -> None:
+        """Test a projector built from the finance managers."""
+        recurring = RecurringExpenseManager()
+        recurring.add(_expense(RecurrenceFrequency.MONTHLY, date(2025, 1, 1)))
+        reminders = BillReminderManager()
+        reminders.add_bill(_bill(ReminderFrequency.MONTHLY, date(2025, 1, 5)))
+        goals = GoalManager()
+        goals.add_goal(
+            SavingsGoal.create("Fund", "1000", monthly_contribution=Decimal("50"))
+        )
+
+        projector = CashFlowProjector.from_managers(
+            recurring, reminders, goals, opening_balance="100"
+        )
+        frame = projector.project(date(2025, 1, 1), date(2025, 1, 31))
+
+        assert frame.iloc[0][["recurring", "bills", "goals"]].tolist() == [
+            10.0,
+            10.0,
+            50.0,
+        ]
+        assert frame["balance"].iloc[0] == 30.0
+
+    def test_rejects_bad_arguments(self) -> None:
+        """Test invalid horizons and periods are rejected."""
+        projector = CashFlowProjector()
+        with pytest.raises(ValueError, match="before start"):
+            projector.project(date(2025, 2, 1), date(2025, 1, 1))
+        with pytest.raises(ValueError, match="Unknown cash flow period"):
+            projector.project(date(2025, 1, 1), date(2025, 2, 1), period="weekly")
+
+
+class TestWriteSheet:
+    """Tests for writing projections into a builder."""
+
+    def test_write_sheet(self, tmp_path) -> None:  # type: ignore[no-untyped-def]
+        """Test the projection is written as a sheet with a total row."""
+        projector = CashFlowProjector(
+            recurring=[
+                _expense(RecurrenceFrequency.MONTHLY, date(2025, 1, 1), day_of_month=1)
+            ]
+        )
+        builder = SpreadsheetBuilder()
+        result = projector.write_sheet(builder, date(2025, 1, 1), date(2025, 6, 30))
+
+        assert result is builder
+        (sheet,) = builder.build()
+        assert sheet.name == "Cash Flow"
+        assert [col.name for col in sheet.columns][:2] == ["Date", "Recurring"]
+        assert len(sheet.rows) == 1 + 6 + 1
+        assert sheet.rows[1].cells[0].value == date(2025, 1, 1)
+        assert sheet.rows[1].cells[1].value == Decimal("10.00")
+        assert sheet.rows[-1].cells[1].formula == "of:=SUM([.B2:.B7])"
+        assert builder.save(tmp_path / "cashflow.ods").exists()
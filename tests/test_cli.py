@@ -88,6 +88,32 @@ def test_generate_with_month_year(self, tmp_path: Path) -> None:
         # Check correct filename
         assert (tmp_path / "budget_2025_06.ods").exists()
 
+    def test_generate_with_compression(self, tmp_path: Path) -> None:
+        """Test generate --compression store writes uncompressed members."""
+        import zipfile
+
+        result = run_cli(
+            "generate",
+            "-o",
+            str(tmp_path),
+            "-m",
+            "6",
+            "-y",
+            "2025",
+            "--compression",
+            "store",
+        )
+        assert result.returncode == 0
+
+        with zipfile.ZipFile(tmp_path / "budget_2025_06.ods") as zf:
+            assert zf.infolist()[0].filename == "mimetype"
+            assert all(i.compress_type == zipfile.ZIP_STORED for i in zf.infolist())
+
+    def test_generate_rejects_unknown_compression(self, tmp_path: Path) -> None:
+        """Test generate rejects an unknown compression preset."""
+        result = run_cli("generate", "-o", str(tmp_path), "--compression", "max")
+        assert result.returncode != 0
+
 
 class TestTemplatesCommand:
     """Tests for templates command (deprecated)."""
@@ -731,3 +731,176 @@ def test_rule_to_dict_with_icon_set(self) -> None:
 
         assert data["type"] == "iconSet"
         assert "iconSet" in data
+
+
+def _table_doc(rows: list[list[object]]) -> OpenDocumentSpreadsheet:
+    """Build a one-table document; floats become float cells, str text cells."""
+    from odf.table import Table, TableCell, TableRow
+    from odf.text import P
+
+    doc = OpenDocumentSpreadsheet()
+    table = Table(name="Sheet1")
+    for values in rows:
+        row = TableRow()
+        for value in values:
+            if isinstance(value, float):
+                cell = TableCell(valuetype="float", value=str(value))
+                cell.addElement(P(text=str(value)))
+            elif value is None:
+                cell = TableCell()
+            else:
+                cell = TableCell(valuetype="string")
+                cell.addElement(P(text=str(value)))
+            row.addElement(cell)
+        table.addElement(row)
+    doc.spreadsheet.addElement(table)
+    return doc
+
+
+def _style_names(doc: OpenDocumentSpreadsheet) -> list[list[str | None]]:
+    from odf.table import TableCell, TableRow
+
+    return [
+        [cell.getAttribute("stylename") for cell in row.getElementsByType(TableCell)]
+        for row in doc.spreadsheet.getElementsByType(TableRow)
+    ]
+
+
+class TestRangeEvaluation:
+    """Test vectorized evaluation of conditional formats over a range."""
+
+    def test_later_rule_overrides_without_stop(self) -> None:
+        doc = _table_doc([[-5.0], [5.0], [20.0]])
+        fmt = ConditionalFormat(
+            range="A1:A3",
+            rules=[
+                ConditionalRule.cell_value(
+                    RuleOperator.LESS_THAN, 10, style="warning", priority=2
+                ),
+                ConditionalRule.cell_value(RuleOperator.LESS_THAN, 0, style="danger"),
+            ],
+        )
+
+        InteractiveOdsBuilder()._apply_conditional_format(doc, "A1:A3", fmt)
+
+        assert _style_names(doc) == [["warning"], ["warning"], [None]]
+
+    def test_stop_if_true(self) -> None:
+        doc = _table_doc([[-5.0], [5.0], [20.0]])
+        danger = ConditionalRule.cell_value(RuleOperator.LESS_THAN, 0, style="danger")
+        danger.stop_if_true = True
+        fmt = ConditionalFormat(
+            range="A1:A3",
+            rules=[
+                danger,
+                ConditionalRule.cell_value(
+                    RuleOperator.LESS_THAN, 10, style="warning", priority=2
+                ),
+            ],
+        )
+
+        InteractiveOdsBuilder()._apply_conditional_format(doc, "A1:A3", fmt)
+
+        assert _style_names(doc) == [["danger"], ["warning"], [None]]
+
+    def test_ragged_rows_and_missing_cells(self) -> None:
+        doc = _table_doc([[1.0, 2.0, 3.0], [4.0], [None, 6.0]])
+        fmt = ConditionalFormat(
+            range="A1:D5",
+            rules=[
+                ConditionalRule.cell_value(
+                    RuleOperator.GREATER_THAN, 1, style="success"
+                )
+            ],
+        )
+
+        InteractiveOdsBuilder()._apply_conditional_format(doc, "A1:D5", fmt)
+
+        assert _style_names(doc) == [
+            [None, "success", "success"],
+            ["success"],
+            [None, "success"],
+        ]
+
+    def test_text_and_mixed_values(self) -> None:
+        doc = _table_doc([["Food", "Over budget", 12.0, "12", None]])
+        fmt = ConditionalFormat(
+            range="A1:E1",
+            rules=[
+                ConditionalRule(
+                    type=ConditionalRuleType.CELL_VALUE,
+                    operator=RuleOperator.NOT_EQUAL,
+                    value=12,
+                    style="warning",
+                ),
+                ConditionalRule(
+                    type=ConditionalRuleType.TEXT,
+                    operator=RuleOperator.CONTAINS_TEXT,
+                    text="budget",
+                    style="danger",
+                    priority=2,
+                ),
+            ],
+        )
+
+        InteractiveOdsBuilder()._apply_conditional_format(doc, "A1:E1", fmt)
+
+        assert _style_names(doc) == [["warning", "danger", None, None, None]]
+
+    def test_cell_style_created_once(self) -> None:
+        doc = _table_doc([[float(i)] for i in range(10)])
+        fmt = ConditionalFormat(
+            range="A1:A10",
+            rules=[
+                ConditionalRule.cell_value(
+                    RuleOperator.GREATER_THAN_OR_EQUAL,
+                    0,
+                    style=CellStyle(name="highlight", background_color=Color("#FF0")),
+                )
+            ],
+        )
+
+        InteractiveOdsBuilder()._apply_conditional_format(doc, "A1:A10", fmt)
+
+        names = [style.getAttribute("name") for style in doc.automaticstyles.childNodes]
+        assert names.count("highlight") == 1
+        assert _style_names(doc) == [["highlight"]] * 10
+
+    @pytest.mark.parametrize(
+        ("operator", "value", "value2"),
+        [
+            (RuleOperator.EQUAL, "5", None),
+            (RuleOperator.GREATER_THAN, 2.5, None),
+            (RuleOperator.LESS_THAN_OR_EQUAL, "abc", None),
+            (RuleOperator.BETWEEN, 0, 10),
+            (RuleOperator.BETWEEN, 0, "10"),
+            (RuleOperator.NOT_BETWEEN, "1", 6),
+            (RuleOperator.NOT_EQUAL, None, None),
+        ],
+    )
+    def test_matches_per_cell_evaluation(
+        self, operator: RuleOperator, value: object, value2: object
+    ) -> None:
+        values: list[object] = [-1.0, 0.0, 5.0, 12.0, "5", "abc", None, "7.5"]
+        rule = ConditionalRule(
+            type=ConditionalRuleType.CELL_VALUE,
+            operator=operator,
+            value=value,
+            value2=value2,
+            style="match",
+        )
+        doc = _table_doc([values])
+        builder = InteractiveOdsBuilder()
+
+        builder._apply_conditional_format(
+            doc, "A1:H1", ConditionalFormat(range="A1:H1", rules=[rule])
+        )
+
+        reference = _table_doc([values])
+        from odf.table import TableCell
+
+        expected = [
+            "match" if builder._evaluate_rule(cell, rule) else None
+            for cell in reference.spreadsheet.getElementsByType(TableCell)
+        ]
+        assert _style_names(doc) == [expected]
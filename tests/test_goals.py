@@ -254,6 +254,24 @@ def test_payoff_schedule(self) -> None:
         assert schedule[0]["month"] == 1
         assert schedule[-1]["total_balance"] == Decimal("0")
 
+    def test_monthly_payment_totals(self) -> None:
+        """Test per-month payment totals match the payoff schedule."""
+        plan = DebtPayoffPlan(
+            method=DebtPayoffMethod.AVALANCHE,
+            extra_payment=Decimal("100"),
+            debts=[
+                Debt.create("Card", 2000, 0.18, 50),
+                Debt.create("Loan", 1000, 0.05, 40),
+            ],
+        )
+
+        totals = plan.monthly_payment_totals()
+        schedule = plan.calculate_payoff_schedule()
+
+        assert len(totals) == plan.months_to_payoff == len(schedule)
+        for total, month in zip(totals, schedule, strict=True):
+            assert abs(total - float(sum(month["payments"].values()))) < 0.02
+
     def test_interest_comparison(self) -> None:
         """Test interest saved calculation."""
         plan = DebtPayoffPlan(
@@ -267,6 +285,60 @@ def test_interest_comparison(self) -> None:
         saved = plan.interest_saved_vs_minimum()
         assert saved > 0  # Should save money with extra payment
 
+    def test_simulation_cached_until_debts_change(self) -> None:
+        """Test repeated queries reuse one simulation until debts change."""
+        debt = Debt.create("Card", 5000, 0.18, 150)
+        plan = DebtPayoffPlan(
+            method=DebtPayoffMethod.AVALANCHE,
+            extra_payment=Decimal("100"),
+            debts=[debt],
+        )
+
+        months = plan.months_to_payoff
+        assert plan.total_interest_paid > 0
+        plan.calculate_payoff_schedule()
+        assert len(plan._runs) == 1
+
+        debt.make_payment(1000)
+        assert plan.months_to_payoff < months
+        assert len(plan._runs) == 2
+
+    def test_empty_plan(self) -> None:
+        """Test a plan without debts has an empty schedule."""
+        plan = DebtPayoffPlan(method=DebtPayoffMethod.SNOWBALL)
+
+        assert plan.calculate_payoff_schedule() == []
+        assert plan.months_to_payoff == 0
+        assert plan.total_interest_paid == Decimal("0")
+
+    def test_simulate_scenarios_matches_single_plans(self) -> None:
+        """Test batched scenarios equal individually simulated plans."""
+        debts = [
+            {"name": "Card", "balance": 4000, "rate": 0.22, "minimum": 90},
+            {"name": "Car", "balance": 12000, "rate": 0.05, "minimum": 250},
+            {"name": "Store", "balance": 800, "rate": 0.27, "minimum": 30},
+        ]
+        plan = create_debt_payoff_plan(debts)
+
+        results = plan.simulate_scenarios(
+            [0, 150, 600], [DebtPayoffMethod.SNOWBALL, DebtPayoffMethod.AVALANCHE]
+        )
+
+        assert len(results) == 6
+        for result in results:
+            single = create_debt_payoff_plan(
+                debts,
+                DebtPayoffMethod(result["method"]),
+                result["extra_payment"],
+            )
+            assert result["months"] == single.months_to_payoff
+            assert result["total_interest"] == single.total_interest_paid
+            assert result["interest_saved"] == single.interest_saved_vs_minimum()
+
+        # Paying more never takes longer
+        snowball_months = [r["months"] for r in results[:3]]
+        assert snowball_months == sorted(snowball_months, reverse=True)
+
 
 class TestGoalManager:
     """Tests for GoalManager."""
@@ -6,10 +6,15 @@
 
 from __future__ import annotations
 
+import json
+import socketserver
 import tempfile
+import threading
+import time
 from datetime import date, timedelta
 from decimal import Decimal
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -27,9 +32,101 @@
     load_notification_config,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 pytestmark = [pytest.mark.unit, pytest.mark.finance]
 
 
+class _DebugSMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal SMTP stand-in that accepts AUTH PLAIN and counts traffic."""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        stats = self.server.stats  # type: ignore[attr-defined]
+        stats["connections"] += 1
+        self._reply("220 localhost debug SMTP")
+        while line := self.rfile.readline():
+            command = line.decode().strip().upper()
+            if command.startswith("EHLO"):
+                self._reply("250-localhost")
+                self._reply("250 AUTH PLAIN")
+            elif command.startswith("AUTH"):
+                stats["logins"] += 1
+                self._reply("235 Authentication successful")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                stats["messages"] += 1
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server() -> Iterator[tuple[int, dict[str, int]]]:
+    """Run a local debug SMTP server, yielding its port and counters."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _DebugSMTPHandler)
+    server.daemon_threads = True
+    server.stats = {"connections": 0, "logins": 0, "messages": 0}  # type: ignore[attr-defined]
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield server.server_address[1], server.stats  # type: ignore[attr-defined]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _local_email(port: int) -> EmailConfig:
+    return EmailConfig(
+        smtp_host="127.0.0.1",
+        smtp_port=port,
+        username="sender@example.com",
+        password="secret",
+        to_address="recipient@example.com",
+        use_tls=False,
+    )
+
+
+def _alerts(count: int) -> list[Notification]:
+    return [
+        Notification(
+            type=NotificationType.BUDGET_WARNING,
+            title=f"Alert {index}",
+            message="Budget nearly spent",
+            channels=["email", "push"],
+        )
+        for index in range(count)
+    ]
+
+
+class _SlowChannel:
+    """Channel without send_many that records delivery threads."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.sent: list[str] = []
+        self.threads: set[str] = set()
+
+    def is_configured(self) -> bool:
+        return True
+
+    def send(self, notification: Notification) -> bool:
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.sent.append(notification.title)
+        return True
+
+
 class TestNotification:
     """Tests for Notification dataclass."""
 
@@ -473,3 +570,127 @@ def test_load_config_with_ntfy(self) -> None:
             assert email is None
             assert ntfy is not None
             assert ntfy.topic == "my-bills"
+
+
+class TestEmailSession:
+    """Tests for SMTP connection reuse against a local debug server."""
+
+    def test_send_opens_connection_per_message(
+        self, smtp_server: tuple[int, dict[str, int]]
+    ) -> None:
+        """Test plain sends keep their one-connection-per-message behavior."""
+        port, stats = smtp_server
+        channel = EmailChannel(_local_email(port))
+
+        assert all(channel.send(n) for n in _alerts(3))
+        assert stats == {"connections": 3, "logins": 3, "messages": 3}
+
+    def test_send_many_reuses_one_connection(
+        self, smtp_server: tuple[int, dict[str, int]]
+    ) -> None:
+        """Test a batch logs in once and sends every message."""
+        port, stats = smtp_server
+        channel = EmailChannel(_local_email(port))
+
+        assert channel.send_many(_alerts(25)) == [True] * 25
+        assert stats == {"connections": 1, "logins": 1, "messages": 25}
+        assert channel._server is None
+
+    def test_session_reconnects_after_disconnect(
+        self, smtp_server: tuple[int, dict[str, int]]
+    ) -> None:
+        """Test a dropped session connection is reopened once."""
+        port, stats = smtp_server
+        channel = EmailChannel(_local_email(port))
+        first, second = _alerts(2)
+
+        with channel.session():
+            assert channel.send(first)
+            assert channel._server is not None
+            channel._server.close()
+            assert channel.send(second)
+
+        assert stats["connections"] == 2
+        assert stats["messages"] == 2
+
+    def test_send_many_unreachable_server(self) -> None:
+        """Test an unreachable server reports failures instead of raising."""
+        channel = EmailChannel(_local_email(1))
+
+        assert channel.send_many(_alerts(2)) == [False, False]
+
+
+class TestBatchedDelivery:
+    """Tests for NotificationManager.send_batch and the append-only log."""
+
+    def test_send_batch_fans_out_channels(
+        self, smtp_server: tuple[int, dict[str, int]], tmp_path: Path
+    ) -> None:
+        """Test each channel gets its share on its own worker."""
+        port, stats = smtp_server
+        push = _SlowChannel(delay=0.001)
+        manager = NotificationManager(
+            email_config=_local_email(port), log_path=tmp_path / "log.jsonl"
+        )
+        manager.add_channel("push", push)
+        alerts = _alerts(40)
+
+        results = manager.send_batch(alerts)
+
+        assert results == [{"email": True, "push": True}] * 40
+        assert stats == {"connections": 1, "logins": 1, "messages": 40}
+        assert push.sent == [n.title for n in alerts]
+        assert push.threads != {threading.current_thread().name}
+        assert all(n.sent_at is not None for n in alerts)
+        assert len(manager.get_history()) == 40
+
+    def test_send_batch_unknown_channel(self) -> None:
+        """Test unknown channels fail without blocking the others."""
+        manager = NotificationManager()
+        push = _SlowChannel()
+        manager.add_channel("push", push)
+        (alert,) = _alerts(1)
+
+        results = manager.send_batch([alert], channels=["push", "missing"])
+
+        assert results == [{"push": True, "missing": False}]
+
+    def test_log_is_append_only(self, tmp_path: Path) -> None:
+        """Test sends append JSON lines rather than rewriting the log."""
+        log_path = tmp_path / "notifications.log"
+        manager = NotificationManager(log_path=log_path)
+        manager.add_channel("push", _SlowChannel())
+
+        manager.send(_alerts(1)[0], channels=["push"])
+        manager.send_batch(_alerts(3), channels=["push"])
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 4
+        assert json.loads(lines[-1])["title"] == "Alert 2"
+
+    def test_log_compaction(self, tmp_path: Path) -> None:
+        """Test the log is trimmed once it doubles past the entry cap."""
+        log_path = tmp_path / "notifications.log"
+        manager = NotificationManager(log_path=log_path)
+        manager.LOG_MAX_ENTRIES = 5
+        manager.add_channel("push", _SlowChannel())
+
+        manager.send_batch(_alerts(11), channels=["push"])
+
+        lines = log_path.read_text().splitlines()
+        assert [json.loads(line)["title"] for line in lines] == [
+            f"Alert {index}" for index in range(6, 11)
+        ]
+
+    def test_legacy_log_converted(self, tmp_path: Path) -> None:
+        """Test an existing whole-document log is converted to JSON lines."""
+        log_path = tmp_path / "notifications.json"
+        legacy = {"notifications": [n.to_dict() for n in _alerts(2)]}
+        log_path.write_text(json.dumps(legacy, indent=2))
+        manager = NotificationManager(log_path=log_path)
+
+        manager.send(_alerts(1)[0], channels=[])
+
+        lines = log_path.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["title"] == "Alert 0"
@@ -0,0 +1,280 @@
+"""Tests for the ODS zip packaging layer."""
+
+from __future__ import annotations
+
+import io
+import struct
+import zipfile
+import zlib
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from spreadsheet_dl.builder import CellSpec, RowSpec, SheetSpec
+from spreadsheet_dl.ods_packaging import (
+    COMPRESSION_PRESETS,
+    PackageOptions,
+    deflate_parallel,
+    is_zip_container,
+    repack_ods,
+    save_document,
+    write_package,
+)
+from spreadsheet_dl.renderer import OdsRenderer
+from spreadsheet_dl.streaming import StreamingWriter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.rendering]
+
+
+def _sheets(rows: int = 50) -> list[SheetSpec]:
+    return [
+        SheetSpec(
+            name="Data",
+            rows=[
+                RowSpec(cells=[CellSpec(value=f"Item {i}"), CellSpec(value=i * 1.5)])
+                for i in range(rows)
+            ],
+        )
+    ]
+
+
+class TestPackageOptions:
+    """Tests for PackageOptions."""
+
+    def test_defaults(self) -> None:
+        """Test default options match zlib's default level."""
+        options = PackageOptions()
+        assert options.compression_level == 6
+        assert options.store_precompressed is True
+
+    @pytest.mark.parametrize("preset", list(COMPRESSION_PRESETS))
+    def test_from_preset_name(self, preset: str) -> None:
+        """Test presets map to their compression levels."""
+        options = PackageOptions.from_preset(preset)
+        assert options.compression_level == COMPRESSION_PRESETS[preset]
+
+    def test_from_preset_numeric(self) -> None:
+        """Test numeric strings and ints are accepted as levels."""
+        assert PackageOptions.from_preset("3").compression_level == 3
+        assert PackageOptions.from_preset(9).compression_level == 9
+
+    def test_from_preset_unknown(self) -> None:
+        """Test unknown presets are rejected."""
+        with pytest.raises(ValueError, match="Unknown compression preset"):
+            PackageOptions.from_preset("maximum")
+
+    @pytest.mark.parametrize("level", [-1, 10])
+    def test_invalid_level(self, level: int) -> None:
+        """Test out-of-range levels are rejected."""
+        with pytest.raises(ValueError, match="compression_level"):
+            PackageOptions(compression_level=level)
+
+
+class TestDeflateParallel:
+    """Tests for parallel block deflate."""
+
+    def test_roundtrip_multiple_blocks(self) -> None:
+        """Test concatenated blocks form one valid deflate stream."""
+        data = b"".join(f"<row>{i}</row>".encode() for i in range(50000))
+        compressed = deflate_parallel(data, level=6, block_size=4096, max_workers=4)
+        assert zlib.decompress(compressed, -zlib.MAX_WBITS) == data
+
+    def test_empty_input(self) -> None:
+        """Test empty input still produces a valid stream."""
+        assert zlib.decompress(deflate_parallel(b""), -zlib.MAX_WBITS) == b""
+
+
+class TestWritePackage:
+    """Tests for write_package."""
+
+    def test_mimetype_first_and_stored(self, tmp_path: Path) -> None:
+        """Test mimetype is written first without compression."""
+        output = tmp_path / "out.ods"
+        write_package(
+            [
+                ("content.xml", b"<content/>" * 100),
+                ("mimetype", b"application/vnd.oasis.opendocument.spreadsheet"),
+            ],
+            output,
+        )
+
+        with zipfile.ZipFile(output) as zf:
+            first = zf.infolist()[0]
+            assert first.filename == "mimetype"
+            assert first.compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("content.xml").compress_type == zipfile.ZIP_DEFLATED
+
+    def test_images_stored(self, tmp_path: Path) -> None:
+        """Test already-compressed members are stored."""
+        output = tmp_path / "out.ods"
+        write_package([("Pictures/chart.png", b"\x89PNG" + b"\x00" * 1000)], output)
+
+        with zipfile.ZipFile(output) as zf:
+            info = zf.getinfo("Pictures/chart.png")
+            assert info.compress_type == zipfile.ZIP_STORED
+
+    def test_level_zero_stores_everything(self, tmp_path: Path) -> None:
+        """Test level 0 stores every member."""
+        output = tmp_path / "out.ods"
+        write_package(
+            [("content.xml", b"<x/>" * 1000)],
+            output,
+            PackageOptions(compression_level=0),
+        )
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.getinfo("content.xml").compress_type == zipfile.ZIP_STORED
+
+    def test_parallel_member_is_valid(self, tmp_path: Path) -> None:
+        """Test members deflated in parallel pass zip CRC checks."""
+        data = b"".join(f"<cell>{i}</cell>".encode() for i in range(20000))
+        output = tmp_path / "out.ods"
+        options = PackageOptions(
+            parallel_threshold=1024, block_size=8192, max_workers=4
+        )
+        write_package([("mimetype", b"x"), ("content.xml", data)], output, options)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.read("content.xml") == data
+
+
+class TestOdsWriters:
+    """Tests for packaging options on ODS writers."""
+
+    @pytest.mark.parametrize("level", [0, 1, 9])
+    def test_renderer_with_package(self, tmp_path: Path, level: int) -> None:
+        """Test OdsRenderer writes readable files at every level."""
+        import pandas as pd
+
+        output = tmp_path / f"level{level}.ods"
+        renderer = OdsRenderer(package=PackageOptions(compression_level=level))
+        renderer.render(_sheets(), output)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            assert zf.infolist()[0].filename == "mimetype"
+        assert pd.read_excel(output, engine="odf", header=None).shape == (50, 2)
+
+    def test_higher_level_is_smaller(self, tmp_path: Path) -> None:
+        """Test level 0 output is larger than level 9 output."""
+        store = OdsRenderer(package=PackageOptions(compression_level=0)).render(
+            _sheets(500), tmp_path / "store.ods"
+        )
+        archive = OdsRenderer(package=PackageOptions(compression_level=9)).render(
+            _sheets(500), tmp_path / "archive.ods"
+        )
+        assert store.stat().st_size > archive.stat().st_size
+
+    def test_streaming_writer_with_package(self, tmp_path: Path) -> None:
+        """Test StreamingWriter passes packaging options to the renderer."""
+        output = tmp_path / "stream.ods"
+        with StreamingWriter(
+            output, package=PackageOptions.from_preset("store")
+        ) as writer:
+            writer.start_sheet("Data", columns=["A", "B"])
+            writer.write_rows([[i, i * 2] for i in range(10)])
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.getinfo("content.xml").compress_type == zipfile.ZIP_STORED
+
+
+class TestSaveDocument:
+    """Tests for serializing odfpy documents."""
+
+    def test_matches_odfpy_save(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test members match odfpy's save() without its private writer."""
+        from odf.opendocument import OpenDocument, OpenDocumentChart
+
+        renderer = OdsRenderer()
+        doc = renderer._build_document(_sheets(5), None, None, None, None)
+        doc.addObject(OpenDocumentChart())
+        doc.addPictureFromString(b"\x89PNG fake", "image/png")
+        expected = io.BytesIO()
+        doc.save(expected)
+
+        monkeypatch.delattr(OpenDocument, "_OpenDocument__zipwrite")
+        output = tmp_path / "doc.ods"
+        save_document(doc, output)
+
+        with zipfile.ZipFile(expected) as want, zipfile.ZipFile(output) as got:
+            assert got.namelist() == want.namelist()
+            for name in want.namelist():
+                assert got.read(name) == want.read(name), name
+
+
+class TestRepack:
+    """Tests for repack_ods."""
+
+    def test_repack_changes_level(self, tmp_path: Path) -> None:
+        """Test repacking a default ODS with level 0."""
+        source = OdsRenderer().render(_sheets(), tmp_path / "source.ods")
+        output = repack_ods(
+            source, tmp_path / "repacked.ods", PackageOptions(compression_level=0)
+        )
+
+        with zipfile.ZipFile(output) as zf, zipfile.ZipFile(source) as original:
+            assert zf.testzip() is None
+            assert zf.getinfo("content.xml").compress_type == zipfile.ZIP_STORED
+            assert zf.read("content.xml") == original.read("content.xml")
+
+    def test_repack_raw_copy(self, tmp_path: Path) -> None:
+        """Test raw-copy repacking keeps deflated payloads byte-for-byte."""
+        source = OdsRenderer().render(_sheets(), tmp_path / "source.ods")
+        output = repack_ods(source, tmp_path / "raw.ods", recompress=False)
+
+        with zipfile.ZipFile(output) as zf, zipfile.ZipFile(source) as original:
+            assert zf.testzip() is None
+            info = zf.getinfo("content.xml")
+            original_info = original.getinfo("content.xml")
+            assert info.compress_size == original_info.compress_size
+            assert zf.read("content.xml") == original.read("content.xml")
+
+    def test_repack_raw_copy_of_streamed_zip(self, tmp_path: Path) -> None:
+        """Test raw copies of data-descriptor members get full local headers."""
+
+        class Unseekable(io.RawIOBase):
+            def __init__(self) -> None:
+                self.data = bytearray()
+
+            def writable(self) -> bool:
+                return True
+
+            def write(self, b: Any) -> int:
+                self.data += b
+                return len(b)
+
+        stream = Unseekable()
+        with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("mimetype", "application/vnd.oasis.opendocument.spreadsheet")
+            zf.writestr("content.xml", b"<office:document-content/>" * 100)
+        source = tmp_path / "streamed.ods"
+        source.write_bytes(bytes(stream.data))
+        with zipfile.ZipFile(source) as zf:
+            assert zf.getinfo("content.xml").flag_bits & 0x08
+
+        output = repack_ods(source, tmp_path / "raw.ods", recompress=False)
+
+        with zipfile.ZipFile(output) as zf:
+            assert zf.testzip() is None
+            info = zf.getinfo("content.xml")
+            assert not info.flag_bits & 0x08
+            header = output.read_bytes()[info.header_offset :][:30]
+            fields = struct.unpack("<4s2B4HL2L2H", header)
+            assert fields[7:10] == (info.CRC, info.compress_size, info.file_size)
+
+
+def test_is_zip_container(tmp_path: Path) -> None:
+    """Test zip container detection."""
+    ods = OdsRenderer().render(_sheets(1), tmp_path / "file.ods")
+    text = tmp_path / "file.txt"
+    text.write_text("not a zip")
+
+    assert is_zip_container(ods)
+    assert not is_zip_container(text)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import time
 from typing import TYPE_CHECKING
 
@@ -10,6 +11,7 @@
 from spreadsheet_dl.performance import (
     BatchProcessor,
     Benchmark,
+    CompiledCache,
     FileCache,
     Lazy,
     LazyProperty,
@@ -18,6 +20,9 @@
     cached,
     clear_cache,
     get_cache,
+    get_compiled_cache,
+    phase,
+    record_phases,
     timed,
 )
 
@@ -485,6 +490,29 @@ def my_func() -> int:
         assert "ms" in captured.out
 
 
+class TestPhaseTiming:
+    """Tests for record_phases and phase."""
+
+    def test_phase_outside_recording_is_noop(self) -> None:
+        """Test phase works without an active recording."""
+        with phase("load"):
+            pass
+
+    def test_phases_accumulate(self) -> None:
+        """Test repeated phases add up and nested recordings are isolated."""
+        with record_phases() as outer:
+            with phase("load"):
+                time.sleep(0.002)
+            with record_phases() as inner, phase("save"):
+                pass
+            with phase("load"):
+                pass
+
+        assert set(outer) == {"load"}
+        assert outer["load"] >= 0.002
+        assert set(inner) == {"save"}
+
+
 # =============================================================================
 # FileCache Tests
 # =============================================================================
@@ -550,6 +578,92 @@ def test_cleanup_expired(self, tmp_path: Path) -> None:
         assert deleted == 2
 
 
+class TestCompiledCache:
+    """Tests for CompiledCache."""
+
+    def test_hit_until_source_changes(self, tmp_path: Path) -> None:
+        """Test entries are valid while their sources are unchanged."""
+        source = tmp_path / "theme.yaml"
+        source.write_text("a: 1")
+        cache = CompiledCache(tmp_path / "cache", "themes")
+
+        cache.set("theme", {"a": 1}, [source])
+        assert CompiledCache(tmp_path / "cache", "themes").get("theme") == {"a": 1}
+        assert CompiledCache(tmp_path / "cache", "other").get("theme") is None
+
+        source.write_text("a: 22")
+        assert cache.get("theme", default="stale") == "stale"
+
+    def test_touched_source_is_rehashed(self, tmp_path: Path) -> None:
+        """Test a changed mtime with identical content keeps the entry."""
+        source = tmp_path / "theme.yaml"
+        source.write_text("a: 1")
+        cache = CompiledCache(tmp_path, "themes")
+        cache.set("theme", "compiled", [source])
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert cache.get("theme") == "compiled"
+
+        source.write_text("a: 2")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert cache.get("theme") is None
+
+    def test_missing_source_and_corrupt_entry(self, tmp_path: Path) -> None:
+        """Test deleted sources and unreadable entries are misses."""
+        source = tmp_path / "theme.yaml"
+        source.write_text("a: 1")
+        cache = CompiledCache(tmp_path / "cache", "themes")
+
+        cache.set("gone", 1, [source])
+        cache.set("corrupt", 2, [source])
+        cache._get_path("corrupt").write_bytes(b"not a pickle")
+        source.unlink()
+
+        assert cache.get("gone") is None
+        assert cache.get("corrupt") is None
+        assert cache.clear() == 2
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+    def test_untrusted_entries_are_ignored(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test foreign or group/world-writable entries are never unpickled."""
+        source = tmp_path / "theme.yaml"
+        source.write_text("a: 1")
+        cache = CompiledCache(tmp_path / "cache", "themes")
+        cache.set("theme", "compiled", [source])
+
+        namespace = tmp_path / "cache" / "themes"
+        assert namespace.stat().st_mode & 0o777 == 0o700
+        entry = cache._get_path("theme")
+        assert entry.stat().st_mode & 0o777 == 0o600
+
+        entry.chmod(0o666)
+        assert cache.get("theme") is None
+        entry.chmod(0o600)
+        namespace.chmod(0o777)
+        assert cache.get("theme") is None
+        cache.set("other", "compiled", [source])
+        assert not cache._get_path("other").exists()
+        namespace.chmod(0o700)
+        assert cache.get("theme") == "compiled"
+
+        monkeypatch.setattr(os, "getuid", lambda: os.stat(entry).st_uid + 1)
+        assert cache.get("theme") is None
+
+    def test_get_compiled_cache_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the cache is only enabled with a directory or env var."""
+        monkeypatch.delenv("SPREADSHEET_DL_CACHE_DIR", raising=False)
+        assert get_compiled_cache("themes") is None
+        assert isinstance(get_compiled_cache("themes", tmp_path), CompiledCache)
+
+        monkeypatch.setenv("SPREADSHEET_DL_CACHE_DIR", str(tmp_path))
+        assert isinstance(get_compiled_cache("themes"), CompiledCache)
+
+
 # =============================================================================
 # Global Cache Tests
 # =============================================================================
@@ -6,8 +6,12 @@
 
 from __future__ import annotations
 
+import json
+import threading
+import time
 from datetime import date, datetime, timedelta
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -16,6 +20,7 @@
     LinkStatus,
     LinkToken,
     PlaidAccount,
+    PlaidAPIError,
     PlaidAuthError,
     PlaidClient,
     PlaidConfig,
@@ -23,12 +28,16 @@
     PlaidEnvironment,
     PlaidInstitution,
     PlaidProduct,
+    PlaidRateLimitError,
     PlaidSyncManager,
     PlaidTransaction,
     SyncResult,
     SyncStatus,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 pytestmark = [pytest.mark.integration, pytest.mark.finance]
 
 
@@ -316,6 +325,130 @@ def test_convert_to_expenses(self, manager: PlaidSyncManager) -> None:
         assert "plaid_transaction_id" in expenses[0]
 
 
+class TestConcurrentSync:
+    """Tests for concurrent multi-item sync against the sandbox client."""
+
+    @pytest.fixture
+    def manager(self, tmp_path) -> PlaidSyncManager:  # type: ignore[no-untyped-def]
+        """Create a sync manager with eight sandbox connections."""
+        config = PlaidConfig(client_id="test", secret="test")
+        manager = PlaidSyncManager(config, data_dir=tmp_path)
+        manager.BACKOFF_BASE_SECONDS = 0.001
+        for index in range(8):
+            manager.add_connection(
+                AccessToken(
+                    access_token=f"access-{index}",
+                    item_id=f"item-{index}",
+                    institution=PlaidInstitution(
+                        institution_id=f"ins_{index}", name=f"Bank {index}"
+                    ),
+                )
+            )
+        return manager
+
+    @staticmethod
+    def _inject(
+        manager: PlaidSyncManager,
+        respond: Callable[[str, str | None], SyncResult],
+        latency: float = 0.0,
+    ) -> dict[str, int]:
+        """Route sandbox syncs through respond() with simulated latency."""
+        stats = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def sync(
+            access_token: str, cursor: str | None = None, count: int = 100
+        ) -> SyncResult:
+            with lock:
+                stats["active"] += 1
+                stats["peak"] = max(stats["peak"], stats["active"])
+            try:
+                time.sleep(latency)
+                return respond(access_token, cursor)
+            finally:
+                with lock:
+                    stats["active"] -= 1
+
+        manager.client.sync_transactions = sync  # type: ignore[method-assign]
+        return stats
+
+    def test_bounded_concurrency(self, manager: PlaidSyncManager) -> None:
+        """Test items sync in parallel without exceeding max_workers."""
+        stats = self._inject(
+            manager,
+            lambda token, cursor: manager.client._simulate_transactions(cursor, 100),
+            latency=0.05,
+        )
+
+        results = manager.sync_all(max_workers=3)
+
+        assert list(results) == [f"item-{index}" for index in range(8)]
+        assert all(r.status == SyncStatus.COMPLETED for r in results.values())
+        assert 1 < stats["peak"] <= 3
+
+    def test_pages_per_item_cursor(self, manager: PlaidSyncManager) -> None:
+        """Test each item pages to its final cursor, which is persisted."""
+
+        def respond(token: str, cursor: str | None) -> SyncResult:
+            page = 0 if cursor is None else int(cursor.rsplit(":", 1)[1])
+            return SyncResult(
+                status=SyncStatus.COMPLETED,
+                added=1,
+                next_cursor=f"{token}:{page + 1}",
+                has_more=page < 2,
+            )
+
+        self._inject(manager, respond)
+        results = manager.sync_all(max_workers=4)
+
+        assert {r.added for r in results.values()} == {3}
+        state = json.loads((manager.data_dir / "sync_state.json").read_text())
+        assert state["cursors"]["item-5"] == "access-5:3"
+
+    def test_rate_limit_backoff(self, manager: PlaidSyncManager) -> None:
+        """Test rate-limited requests are retried after backing off."""
+        calls: dict[str, int] = {}
+
+        def respond(token: str, cursor: str | None) -> SyncResult:
+            calls[token] = calls.get(token, 0) + 1
+            if calls[token] <= 2:
+                raise PlaidRateLimitError()
+            return SyncResult(status=SyncStatus.COMPLETED, next_cursor="c1")
+
+        self._inject(manager, respond)
+        results = manager.sync_all(max_workers=4)
+
+        assert all(r.status == SyncStatus.COMPLETED for r in results.values())
+        assert set(calls.values()) == {3}
+
+    def test_failures_keep_finished_items(self, manager: PlaidSyncManager) -> None:
+        """Test a failing item does not lose cursors of finished items."""
+        manager.RATE_LIMIT_RETRIES = 1
+
+        def respond(token: str, cursor: str | None) -> SyncResult:
+            if token == "access-1":
+                raise PlaidAPIError("item broken")
+            if token == "access-2":
+                raise PlaidRateLimitError(retry_after=None)
+            return SyncResult(status=SyncStatus.COMPLETED, next_cursor=f"{token}:1")
+
+        self._inject(manager, respond)
+        results = manager.sync_all(max_workers=4)
+
+        assert results["item-1"].status == SyncStatus.FAILED
+        assert results["item-2"].status == SyncStatus.FAILED
+        assert manager._connections["item-1"].status == LinkStatus.ERROR
+        state = json.loads((manager.data_dir / "sync_state.json").read_text())
+        assert sorted(state["cursors"]) == [
+            f"item-{index}" for index in (0, 3, 4, 5, 6, 7)
+        ]
+
+    def test_rejects_invalid_worker_count(self, manager: PlaidSyncManager) -> None:
+        """Test max_workers must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            manager.sync_all(max_workers=0)
+
+
 class TestPlaidErrors:
     """Tests for Plaid error handling."""
 
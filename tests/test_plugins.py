@@ -6,6 +6,9 @@
 
 from __future__ import annotations
 
+import json
+import os
+import sys
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -14,6 +17,7 @@
 
 from spreadsheet_dl.plugins import (
     PluginHook,
+    PluginIndex,
     PluginInterface,
     PluginLoader,
     PluginManager,
@@ -405,8 +409,11 @@ def initialize(self, config=None):
             manager = PluginManager(plugin_dirs=[plugin_dir])
             manager.discover()
 
-            assert "discoverable" in manager._plugins
-            assert manager._plugins["discoverable"].version == "2.0.0"
+            assert "discoverable" in manager._manifest
+            assert manager._manifest["discoverable"].version == "2.0.0"
+            plugin = manager.get_plugin("discoverable")
+            assert plugin is not None
+            assert plugin.version == "2.0.0"
 
     def test_enable_plugin(self) -> None:
         """Test enabling a plugin."""
@@ -514,6 +521,141 @@ def test_hooks_property(self) -> None:
         assert isinstance(manager.hooks, PluginHook)
 
 
+_INDEXED_PLUGIN = """
+from spreadsheet_dl.plugins import PluginInterface
+
+LOADS = globals().get("LOADS", 0) + 1
+
+class IndexedPlugin(PluginInterface):
+    @property
+    def name(self) -> str:
+        return "indexed"
+
+    @property
+    def version(self) -> str:
+        return "{version}"
+
+    @property
+    def author(self) -> str:
+        return "Index Author"
+
+    def initialize(self, config=None):
+        self.config = config
+"""
+
+
+class TestPluginIndex:
+    """Tests for the cached plugin manifest index."""
+
+    @pytest.fixture
+    def plugin_dir(self, tmp_path: Path) -> Path:
+        plugin_file = tmp_path / "indexed_plugin.py"
+        plugin_file.write_text(_INDEXED_PLUGIN.format(version="1.0.0"))
+        return tmp_path
+
+    def test_entries_record_metadata(self, plugin_dir: Path) -> None:
+        entries = PluginIndex(plugin_dir).entries()
+
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry.name == "indexed"
+        assert entry.version == "1.0.0"
+        assert entry.author == "Index Author"
+        assert entry.entry_point == "indexed_plugin:IndexedPlugin"
+        assert entry.path == plugin_dir / "indexed_plugin.py"
+
+        data = json.loads((plugin_dir / PluginIndex.INDEX_FILENAME).read_text())
+        record = data["files"]["indexed_plugin.py"]
+        assert record["plugins"][0]["name"] == "indexed"
+        assert set(record) == {"mtime_ns", "size", "sha256", "plugins"}
+
+    def test_unchanged_files_are_not_imported(
+        self, plugin_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        PluginIndex(plugin_dir).entries()
+
+        def fail(_: Path) -> None:
+            raise AssertionError("plugin module imported")
+
+        monkeypatch.setattr(PluginLoader, "_load_module", staticmethod(fail))
+        entries = PluginIndex(plugin_dir).entries()
+        assert [e.name for e in entries] == ["indexed"]
+
+        # A touched but identical file is re-hashed, not re-imported
+        plugin_file = plugin_dir / "indexed_plugin.py"
+        stat = plugin_file.stat()
+        os.utime(plugin_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert [e.name for e in PluginIndex(plugin_dir).entries()] == ["indexed"]
+
+    def test_changed_file_is_rescanned(self, plugin_dir: Path) -> None:
+        PluginIndex(plugin_dir).entries()
+        plugin_file = plugin_dir / "indexed_plugin.py"
+        plugin_file.write_text(_INDEXED_PLUGIN.format(version="2.0.0"))
+
+        entries = PluginIndex(plugin_dir).entries()
+        assert entries[0].version == "2.0.0"
+
+    def test_removed_file_is_dropped(self, plugin_dir: Path) -> None:
+        PluginIndex(plugin_dir).entries()
+        (plugin_dir / "indexed_plugin.py").unlink()
+
+        assert PluginIndex(plugin_dir).entries() == []
+        data = json.loads((plugin_dir / PluginIndex.INDEX_FILENAME).read_text())
+        assert data["files"] == {}
+
+    def test_corrupt_index_is_rebuilt(self, plugin_dir: Path) -> None:
+        (plugin_dir / PluginIndex.INDEX_FILENAME).write_text("{not json")
+
+        entries = PluginIndex(plugin_dir).entries()
+        assert [e.name for e in entries] == ["indexed"]
+
+    def test_broken_plugin_is_not_cached(self, plugin_dir: Path) -> None:
+        (plugin_dir / "broken.py").write_text("raise RuntimeError('boom')")
+
+        entries = PluginIndex(plugin_dir).entries()
+        assert [e.name for e in entries] == ["indexed"]
+        data = json.loads((plugin_dir / PluginIndex.INDEX_FILENAME).read_text())
+        assert set(data["files"]) == {"indexed_plugin.py"}
+
+    def test_manager_imports_on_enable(
+        self, plugin_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        PluginIndex(plugin_dir).entries()
+        monkeypatch.delitem(sys.modules, "indexed_plugin", raising=False)
+
+        manager = PluginManager(plugin_dirs=[plugin_dir])
+        manager.discover()
+
+        assert "indexed_plugin" not in sys.modules
+        assert manager.list_plugins() == [
+            {
+                "name": "indexed",
+                "version": "1.0.0",
+                "description": "",
+                "author": "Index Author",
+                "enabled": False,
+            }
+        ]
+
+        manager.enable("indexed", {"key": "value"})
+
+        module = sys.modules["indexed_plugin"]
+        assert module.LOADS == 1
+        plugin = manager.get_plugin("indexed")
+        assert plugin is not None
+        assert plugin.config == {"key": "value"}  # type: ignore[attr-defined]
+        assert manager.list_plugins(enabled_only=True)[0]["name"] == "indexed"
+
+    def test_manager_enable_stale_entry(self, plugin_dir: Path) -> None:
+        manager = PluginManager(plugin_dirs=[plugin_dir])
+        manager.discover()
+        (plugin_dir / "indexed_plugin.py").write_text("x = 1\n")
+        sys.modules.pop("indexed_plugin", None)
+
+        with pytest.raises(ValueError, match="Failed to load plugin indexed"):
+            manager.enable("indexed")
+
+
 class TestGlobalPluginManager:
     """Tests for global plugin manager singleton."""
 
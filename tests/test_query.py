@@ -0,0 +1,431 @@
+"""
+Tests for the sheet query engine.
+
+Tests:
+    - Query parsing and error reporting
+    - WHERE predicates, ORDER BY, LIMIT/OFFSET
+    - GROUP BY aggregates
+    - Column projection and streaming from content.xml
+    - Result caching per file modification time
+    - OdsEditor.query_data / find_rows parity
+"""
+
+from __future__ import annotations
+
+import os
+import zipfile
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from spreadsheet_dl.exceptions import (
+    InvalidQueryError,
+    OdsReadError,
+    SheetNotFoundError,
+)
+from spreadsheet_dl.ods_editor import OdsEditor
+from spreadsheet_dl.query import (
+    OdsFileScanner,
+    clear_query_cache,
+    match_rows,
+    parse_query,
+    query_file,
+    run_query,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+pytestmark = [pytest.mark.unit]
+
+LEDGER = [
+    ("2024-01-05", "Food", 12.5, "open", "Lunch"),
+    ("2024-01-07", "Rent", 1200.0, "done", "January rent"),
+    ("2024-01-09", "Food", 40.0, "done", None),
+    ("2024-02-01", "Fuel", 55.25, "open", "Gas station"),
+    ("2024-02-03", "Food", 8.75, "done", "Coffee"),
+    ("2024-02-10", "Misc", None, "open", "Pending refund"),
+]
+
+
+def _write_ledger(path: Path, rows: Sequence[tuple[Any, ...]] = LEDGER) -> Path:
+    """Write a ledger sheet (plus a decoy sheet) with odfpy."""
+    from odf.opendocument import OpenDocumentSpreadsheet
+    from odf.table import Table, TableCell, TableRow
+    from odf.text import P
+
+    doc = OpenDocumentSpreadsheet()
+    decoy = Table(name="Summary")
+    decoy_row = TableRow()
+    decoy_cell = TableCell(valuetype="string")
+    decoy_cell.addElement(P(text="not the ledger"))
+    decoy_row.addElement(decoy_cell)
+    decoy.addElement(decoy_row)
+    doc.spreadsheet.addElement(decoy)
+
+    table = Table(name="Ledger")
+    header = TableRow()
+    for name in ("Date", "Category", "Amount", "Status", "Expense Note"):
+        cell = TableCell(valuetype="string")
+        cell.addElement(P(text=name))
+        header.addElement(cell)
+    table.addElement(header)
+
+    for date, category, amount, status, note in rows:
+        row = TableRow()
+        date_cell = TableCell(valuetype="date", datevalue=date)
+        date_cell.addElement(P(text=date))
+        row.addElement(date_cell)
+        cell = TableCell(valuetype="string")
+        cell.addElement(P(text=category))
+        row.addElement(cell)
+        if amount is None:
+            row.addElement(TableCell())
+        else:
+            cell = TableCell(valuetype="currency", value=str(amount))
+            cell.addElement(P(text=f"{amount:.2f}"))
+            row.addElement(cell)
+        cell = TableCell(valuetype="string")
+        cell.addElement(P(text=status))
+        row.addElement(cell)
+        if note is None:
+            row.addElement(TableCell())
+        else:
+            cell = TableCell(valuetype="string")
+            cell.addElement(P(text=note))
+            row.addElement(cell)
+        table.addElement(row)
+
+    # Trailing blank rows as written by office suites
+    table.addElement(TableRow(numberrowsrepeated=1000))
+    doc.spreadsheet.addElement(table)
+    doc.save(str(path))
+    return path
+
+
+@pytest.fixture
+def ledger(tmp_path: Path) -> Path:
+    """Ledger spreadsheet on disk."""
+    clear_query_cache()
+    return _write_ledger(tmp_path / "ledger.ods")
+
+
+class _CountingScanner(OdsFileScanner):
+    """File scanner that counts decoded cells."""
+
+    decoded = 0
+
+    def value(self, cell: Any) -> Any:
+        self.decoded += 1
+        return super().value(cell)
+
+
+class TestParseQuery:
+    """Tests for the query parser."""
+
+    def test_select_items_and_labels(self) -> None:
+        """Aggregates, aliases and quoted names parse into labels."""
+        query = parse_query(
+            'SELECT Category, COUNT(*) AS n, SUM("Amount") total, '
+            "MAX(Date) GROUP BY Category"
+        )
+        assert [item.label for item in query.select] == [
+            "Category",
+            "n",
+            "total",
+            "MAX(Date)",
+        ]
+        assert query.group_by == ("Category",)
+        assert query.is_aggregate
+
+    def test_query_without_select_selects_everything(self) -> None:
+        """A bare WHERE clause, or an empty query, selects all columns."""
+        assert parse_query("").select[0].column == "*"
+        assert parse_query("WHERE Amount > 10").where is not None
+
+    def test_order_limit_offset(self) -> None:
+        """ORDER BY keys and LIMIT/OFFSET are captured."""
+        query = parse_query("SELECT * ORDER BY Amount DESC, Date LIMIT 5 OFFSET 2")
+        assert [(o.name, o.descending) for o in query.order_by] == [
+            ("Amount", True),
+            ("Date", False),
+        ]
+        assert (query.limit, query.offset) == (5, 2)
+
+    def test_parse_is_memoized(self) -> None:
+        """The same text returns the same parsed query."""
+        assert parse_query("SELECT A WHERE B > 1") is parse_query(
+            "SELECT A WHERE B > 1"
+        )
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "SELECT",
+            "SELECT A WHERE",
+            "SELECT A WHERE B >",
+            "SELECT A WHERE 1 = 2",
+            "SELECT A WHERE B NOT 3",
+            "SELECT A WHERE B = NULL",
+            "SELECT SUM(*)",
+            "SELECT A LIMIT -1",
+            "SELECT A; DROP TABLE x",
+            "SELECT A WHERE B LIKE 5",
+        ],
+    )
+    def test_invalid_queries(self, text: str) -> None:
+        """Malformed queries raise InvalidQueryError."""
+        with pytest.raises(InvalidQueryError) as exc_info:
+            parse_query(text)
+        assert exc_info.value.error_code == "FT-VAL-406"
+
+
+class TestQueryFile:
+    """Tests for queries against files on disk."""
+
+    def test_select_all_skips_blank_rows(self, ledger: Path) -> None:
+        """SELECT * returns header-keyed rows and ignores trailing blanks."""
+        rows = query_file(ledger, "Ledger", "")
+        assert len(rows) == len(LEDGER)
+        assert rows[0] == {
+            "Date": "2024-01-05",
+            "Category": "Food",
+            "Amount": 12.5,
+            "Status": "open",
+            "Expense Note": "Lunch",
+        }
+
+    def test_where_numeric_and_text(self, ledger: Path) -> None:
+        """Numbers compare numerically, strings compare as text."""
+        rows = query_file(
+            ledger,
+            "Ledger",
+            "SELECT Category, Amount WHERE Amount >= 40 AND Status = 'done'",
+        )
+        assert rows == [
+            {"Category": "Rent", "Amount": 1200.0},
+            {"Category": "Food", "Amount": 40.0},
+        ]
+
+    @pytest.mark.parametrize(
+        ("where", "expected"),
+        [
+            ("Category IN ('Fuel', 'Misc')", ["Fuel", "Misc"]),
+            ("Category NOT IN ('Food')", ["Rent", "Fuel", "Misc"]),
+            ("\"Expense Note\" LIKE '%rent%'", ["Rent"]),
+            ("Amount BETWEEN 10 AND 50", ["Food", "Food"]),
+            ("Amount IS NULL", ["Misc"]),
+            ('"Expense Note" IS NULL OR Amount > 1000', ["Rent", "Food"]),
+            ("NOT (Status = 'open' OR Category = 'Food')", ["Rent"]),
+            ("Date >= '2024-02-01' AND Amount < 10", ["Food"]),
+            ("Amount != 12.5", ["Rent", "Food", "Fuel", "Food"]),
+            ("NOT Amount > 15", ["Food", "Food"]),
+            ("NOT Amount BETWEEN 10 AND 50", ["Rent", "Fuel", "Food"]),
+            ("Amount NOT IN (12.5)", ["Rent", "Food", "Fuel", "Food"]),
+            ("\"Expense Note\" NOT LIKE '%rent%'", ["Food", "Fuel", "Food", "Misc"]),
+            # FALSE AND UNKNOWN is FALSE, so NOT makes it match
+            (
+                "NOT (Amount > 1000 AND \"Expense Note\" = 'x')",
+                ["Food", "Rent", "Food", "Fuel", "Food", "Misc"],
+            ),
+        ],
+    )
+    def test_predicates(self, ledger: Path, where: str, expected: list[str]) -> None:
+        """WHERE operators; comparisons involving NULL never match."""
+        rows = query_file(ledger, "Ledger", f"SELECT Category WHERE {where}")
+        assert [row["Category"] for row in rows] == expected
+
+    def test_order_by_nulls_last_and_limit(self, ledger: Path) -> None:
+        """ORDER BY sorts numerically with NULLs last, then LIMIT/OFFSET."""
+        rows = query_file(
+            ledger, "Ledger", "SELECT Amount ORDER BY Amount DESC LIMIT 3 OFFSET 1"
+        )
+        assert [row["Amount"] for row in rows] == [55.25, 40.0, 12.5]
+        rows = query_file(ledger, "Ledger", "SELECT Amount ORDER BY Amount")
+        assert [row["Amount"] for row in rows][-2:] == [1200.0, None]
+
+    def test_order_by_column_not_selected(self, ledger: Path) -> None:
+        """Non-grouped queries can sort by any column."""
+        rows = query_file(
+            ledger, "Ledger", "SELECT Category ORDER BY Date DESC LIMIT 2"
+        )
+        assert rows == [{"Category": "Misc"}, {"Category": "Food"}]
+
+    def test_group_by_aggregates(self, ledger: Path) -> None:
+        """GROUP BY computes aggregates per group, ordered by alias."""
+        rows = query_file(
+            ledger,
+            "Ledger",
+            "SELECT Category, COUNT(*) AS n, SUM(Amount) AS total, "
+            "MIN(Date) AS first GROUP BY Category ORDER BY total DESC",
+        )
+        assert rows == [
+            {"Category": "Rent", "n": 1, "total": 1200.0, "first": "2024-01-07"},
+            {"Category": "Food", "n": 3, "total": 61.25, "first": "2024-01-05"},
+            {"Category": "Fuel", "n": 1, "total": 55.25, "first": "2024-02-01"},
+            {"Category": "Misc", "n": 1, "total": None, "first": "2024-02-10"},
+        ]
+
+    def test_aggregate_without_group(self, ledger: Path) -> None:
+        """Aggregates without GROUP BY return a single row."""
+        rows = query_file(
+            ledger,
+            "Ledger",
+            "SELECT COUNT(*), COUNT(Amount), AVG(Amount) WHERE Category = 'Food'",
+        )
+        assert rows == [{"COUNT(*)": 3, "COUNT(Amount)": 3, "AVG(Amount)": 61.25 / 3}]
+        empty = query_file(ledger, "Ledger", "SELECT COUNT(*) WHERE Amount > 1e9")
+        assert empty == [{"COUNT(*)": 0}]
+
+    def test_order_by_aggregate_expression(self, ledger: Path) -> None:
+        """ORDER BY accepts an aggregate expression from the SELECT list."""
+        rows = query_file(
+            ledger,
+            "Ledger",
+            "SELECT Category, SUM(Amount) GROUP BY Category "
+            "ORDER BY SUM(Amount) LIMIT 1",
+        )
+        assert rows == [{"Category": "Fuel", "SUM(Amount)": 55.25}]
+
+    def test_column_letters_and_case_insensitive_names(self, ledger: Path) -> None:
+        """Columns resolve by header (any case) or by column letter."""
+        rows = query_file(ledger, "Ledger", "SELECT B, amount WHERE C > 1000")
+        assert rows == [{"B": "Rent", "amount": 1200.0}]
+
+    def test_unknown_column(self, ledger: Path) -> None:
+        """Unknown columns are reported with the available headers."""
+        with pytest.raises(InvalidQueryError, match="unknown column 'Price'"):
+            query_file(ledger, "Ledger", "SELECT Price")
+
+    def test_ungrouped_column_rejected(self, ledger: Path) -> None:
+        """Non-aggregated columns must appear in GROUP BY."""
+        with pytest.raises(InvalidQueryError, match="must appear in GROUP BY"):
+            query_file(ledger, "Ledger", "SELECT Status, SUM(Amount) GROUP BY Category")
+
+    def test_missing_sheet(self, ledger: Path) -> None:
+        """A missing sheet lists the sheets that exist."""
+        with pytest.raises(SheetNotFoundError) as exc_info:
+            query_file(ledger, "Ledger 2", "SELECT *")
+        assert "Ledger" in str(exc_info.value)
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """A missing file raises OdsReadError."""
+        with pytest.raises(OdsReadError):
+            query_file(tmp_path / "missing.ods", "Ledger", "SELECT *")
+
+    def test_rejects_dtd(self, tmp_path: Path) -> None:
+        """content.xml declaring a DTD is refused."""
+        path = tmp_path / "dtd.ods"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(
+                "content.xml",
+                '<?xml version="1.0"?><!DOCTYPE x [<!ENTITY a "aaaa">]><x>&a;</x>',
+            )
+        with pytest.raises(OdsReadError):
+            query_file(path, "Ledger", "SELECT *")
+
+    def test_results_cached_until_file_changes(self, ledger: Path) -> None:
+        """Repeated queries hit the cache; rewriting the file invalidates it."""
+        first = query_file(ledger, "Ledger", "SELECT COUNT(*) AS n")
+        first[0]["n"] = -1  # callers get copies
+        assert query_file(ledger, "Ledger", "SELECT COUNT(*) AS n") == [{"n": 6}]
+
+        _write_ledger(ledger, LEDGER[:2])
+        stat = ledger.stat()
+        os.utime(ledger, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert query_file(ledger, "Ledger", "SELECT COUNT(*) AS n") == [{"n": 2}]
+
+
+class TestStreamingScan:
+    """Tests for projection and filter push-down in the scanner."""
+
+    def test_only_referenced_cells_are_decoded(self, ledger: Path) -> None:
+        """WHERE columns decode for every row, SELECT columns only on match."""
+        scanner = _CountingScanner(ledger, "Ledger")
+        rows = run_query(scanner, "SELECT Category WHERE Amount > 1000")
+        assert rows == [{"Category": "Rent"}]
+        # 6 Amount cells for the predicate + 1 Category cell for the match
+        assert scanner.decoded == len(LEDGER) + 1
+
+    def test_limit_stops_scan_early(self, tmp_path: Path) -> None:
+        """LIMIT without ORDER BY stops decoding once enough rows matched."""
+        path = _write_ledger(tmp_path / "long.ods", LEDGER * 50)
+        scanner = _CountingScanner(path, "Ledger")
+        rows = run_query(scanner, "SELECT Category LIMIT 2")
+        assert [row["Category"] for row in rows] == ["Food", "Rent"]
+        assert scanner.decoded == 2
+
+    def test_repeated_rows_and_cells(self, tmp_path: Path) -> None:
+        """Repeated rows and cells expand to their logical positions."""
+        from odf.opendocument import OpenDocumentSpreadsheet
+        from odf.table import Table, TableCell, TableRow
+        from odf.text import P
+
+        doc = OpenDocumentSpreadsheet()
+        table = Table(name="Grid")
+        header = TableRow()
+        for name in ("A1", "B1", "C1"):
+            cell = TableCell(valuetype="string")
+            cell.addElement(P(text=name))
+            header.addElement(cell)
+        table.addElement(header)
+        row = TableRow(numberrowsrepeated=3)
+        cell = TableCell(valuetype="float", value="7", numbercolumnsrepeated=2)
+        cell.addElement(P(text="7"))
+        row.addElement(cell)
+        last = TableCell(valuetype="string")
+        last.addElement(P(text="x"))
+        row.addElement(last)
+        table.addElement(row)
+        doc.spreadsheet.addElement(table)
+        path = tmp_path / "grid.ods"
+        doc.save(str(path))
+
+        assert match_rows(OdsFileScanner(path, "Grid"), {"B1": 7}) == [1, 2, 3]
+        assert query_file(path, "Grid", "SELECT SUM(B1), C1 GROUP BY C1") == [
+            {"SUM(B1)": 21.0, "C1": "x"}
+        ]
+
+
+class TestOdsEditorQueries:
+    """Tests for OdsEditor.query_data and find_rows."""
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "",
+            "SELECT Category, Amount WHERE Amount > 20 ORDER BY Amount",
+            "SELECT Status, COUNT(*) AS n GROUP BY Status ORDER BY n DESC",
+        ],
+    )
+    def test_query_data_matches_file_query(self, ledger: Path, query: str) -> None:
+        """In-memory and streaming scans return identical results."""
+        editor = OdsEditor(ledger)
+        assert editor.query_data("Ledger", query) == query_file(ledger, "Ledger", query)
+
+    def test_query_data_sees_unsaved_edits(self, ledger: Path) -> None:
+        """query_data runs over the in-memory document."""
+        editor = OdsEditor(ledger)
+        editor.set_cell_value("Ledger", "B2", "Groceries")
+        rows = editor.query_data("Ledger", "SELECT Category LIMIT 1")
+        assert rows == [{"Category": "Groceries"}]
+
+    def test_find_rows(self, ledger: Path) -> None:
+        """Equality and operator conditions return sheet row indices."""
+        editor = OdsEditor(ledger)
+        assert editor.find_rows("Ledger", {"Category": "Food"}) == [1, 3, 5]
+        assert editor.find_rows(
+            "Ledger", {"Category": "Food", "Amount": {"$gt": 10, "$lte": 40}}
+        ) == [1, 3]
+        assert editor.find_rows("Ledger", {"Amount": None}) == [6]
+        assert editor.find_rows("Ledger", {"Status": {"$in": ["done"]}}) == [2, 3, 5]
+
+    def test_find_rows_unknown_column(self, ledger: Path) -> None:
+        """Conditions on a missing column match nothing."""
+        assert OdsEditor(ledger).find_rows("Ledger", {"Price": 1}) == []
+
+    def test_find_rows_unknown_operator(self, ledger: Path) -> None:
+        """Unsupported operators are rejected."""
+        with pytest.raises(InvalidQueryError, match=r"\$regex"):
+            OdsEditor(ledger).find_rows("Ledger", {"Category": {"$regex": "F.*"}})
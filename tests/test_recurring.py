@@ -161,6 +161,21 @@ def test_generate_for_month_weekly(self) -> None:
         assert len(entries) >= 4
         assert all(e.date.weekday() == 0 for e in entries)
 
+    def test_first_occurrence(self) -> None:
+        """Test finding the first occurrence on or after a date."""
+        manager = RecurringExpenseManager()
+        expense = RecurringExpense(
+            name="Groceries",
+            category=ExpenseCategory.GROCERIES,
+            amount=Decimal("100.00"),
+            frequency=RecurrenceFrequency.WEEKLY,
+            start_date=date(2025, 1, 1),
+            day_of_week=0,  # Monday
+        )
+
+        assert manager.first_occurrence(expense, date(2025, 1, 1)) == date(2025, 1, 6)
+        assert manager.first_occurrence(expense, date(2025, 1, 6)) == date(2025, 1, 6)
+
     def test_generate_for_month_biweekly(self) -> None:
         """Test generating biweekly expenses."""
         manager = RecurringExpenseManager()
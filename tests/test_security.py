@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import io
+import os
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from spreadsheet_dl.exceptions import FileError
+from spreadsheet_dl import security
+from spreadsheet_dl.exceptions import CredentialError, EncryptionError, FileError
 from spreadsheet_dl.security import (
     AuditLogEntry,
+    CredentialStore,
     DecryptionError,
     EncryptionMetadata,
     FileEncryptor,
     IntegrityError,
     SecurityAuditLog,
+    _derive_key_pbkdf2,
+    _encrypt_aes_gcm,
     check_password_strength,
     generate_password,
 )
@@ -201,6 +208,269 @@ def test_unicode_password(self, tmp_path: Path) -> None:
         assert decrypted_file.read_bytes() == b"test content"
 
 
+class TestChunkedEncryption:
+    """Tests for the chunked streaming encryption format."""
+
+    @pytest.fixture
+    def encryptor(self, tmp_path: Path) -> FileEncryptor:
+        """Create an encryptor logging to a temporary audit log."""
+        return FileEncryptor(SecurityAuditLog(tmp_path / "audit.log"))
+
+    def test_multi_frame_roundtrip(
+        self, encryptor: FileEncryptor, tmp_path: Path
+    ) -> None:
+        """Test files spanning many frames decrypt correctly."""
+        content = os.urandom(10_000)
+        source = tmp_path / "data.ods"
+        source.write_bytes(content)
+
+        metadata = encryptor.encrypt_file(
+            source, tmp_path / "data.enc", "password", chunk_size=1024
+        )
+        encryptor.decrypt_file(tmp_path / "data.enc", tmp_path / "out.ods", "password")
+
+        assert metadata.chunk_size == 1024
+        assert metadata.content_hash == hashlib.sha256(content).hexdigest()
+        assert (tmp_path / "out.ods").read_bytes() == content
+
+    def test_stream_roundtrip(self, encryptor: FileEncryptor) -> None:
+        """Test encrypting and decrypting between in-memory streams."""
+        content = b"row,value\n" * 5000
+        encrypted = io.BytesIO()
+        encryptor.encrypt_stream(
+            io.BytesIO(content), encrypted, "password", chunk_size=4096
+        )
+
+        encrypted.seek(0)
+        decrypted = io.BytesIO()
+        metadata = encryptor.decrypt_stream(encrypted, decrypted, "password")
+
+        assert decrypted.getvalue() == content
+        assert metadata.content_hash == hashlib.sha256(content).hexdigest()
+
+    def test_open_writer(self, encryptor: FileEncryptor) -> None:
+        """Test writing plaintext incrementally through open_writer."""
+        encrypted = io.BytesIO()
+        with encryptor.open_writer(encrypted, "password", chunk_size=100) as out:
+            for i in range(50):
+                out.write(f"line {i}\n".encode())
+
+        encrypted.seek(0)
+        decrypted = io.BytesIO()
+        encryptor.decrypt_stream(encrypted, decrypted, "password")
+        assert decrypted.getvalue() == b"".join(
+            f"line {i}\n".encode() for i in range(50)
+        )
+
+    def test_truncated_stream(self, encryptor: FileEncryptor) -> None:
+        """Test a stream missing its final frame is rejected."""
+        encrypted = io.BytesIO()
+        encryptor.encrypt_stream(
+            io.BytesIO(b"x" * 5000), encrypted, "password", chunk_size=1000
+        )
+        truncated = io.BytesIO(encrypted.getvalue()[:-60])
+
+        with pytest.raises(IntegrityError, match="truncated"):
+            encryptor.decrypt_stream(truncated, io.BytesIO(), "password")
+
+    def test_aborted_stream(
+        self,
+        encryptor: FileEncryptor,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a source failing mid-read does not produce a sealed stream."""
+
+        class FailingSource(io.RawIOBase):
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def readable(self) -> bool:
+                return True
+
+            def read(self, size: int = -1) -> bytes:
+                self.calls += 1
+                if self.calls > 1:
+                    raise OSError("disk went away")
+                return b"A" * 10
+
+        encrypted = io.BytesIO()
+        with pytest.raises(EncryptionError):
+            encryptor.encrypt_stream(FailingSource(), encrypted, "password")
+
+        encrypted.seek(0)
+        with pytest.raises(IntegrityError, match="truncated"):
+            encryptor.decrypt_stream(encrypted, io.BytesIO(), "password")
+
+        source = tmp_path / "data.ods"
+        source.write_bytes(b"z" * 5000)
+        output = tmp_path / "data.enc"
+
+        def fail_midway(src: Any, dst: Any, *args: Any) -> None:
+            dst.write(b"partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(encryptor, "_encrypt_stream", fail_midway)
+        with pytest.raises(EncryptionError):
+            encryptor.encrypt_file(source, output, "password")
+        assert not output.exists()
+
+    def test_reordered_frames(self, encryptor: FileEncryptor) -> None:
+        """Test swapping two frames fails authentication."""
+        encrypted = io.BytesIO()
+        encryptor.encrypt_stream(
+            io.BytesIO(b"a" * 100 + b"b" * 100), encrypted, "password", chunk_size=100
+        )
+        data = encrypted.getvalue()
+        frame_size = 1 + 4 + 16 + 100
+        body_start = len(data) - 2 * frame_size - (1 + 4 + 16 + 32)
+        first = data[body_start : body_start + frame_size]
+        second = data[body_start + frame_size : body_start + 2 * frame_size]
+        swapped = (
+            data[:body_start] + second + first + data[body_start + 2 * frame_size :]
+        )
+
+        with pytest.raises(IntegrityError):
+            encryptor.decrypt_stream(io.BytesIO(swapped), io.BytesIO(), "password")
+
+    def test_failed_decrypt_leaves_no_output(
+        self, encryptor: FileEncryptor, tmp_path: Path
+    ) -> None:
+        """Test a failed decrypt does not leave partial plaintext behind."""
+        source = tmp_path / "data.ods"
+        source.write_bytes(b"y" * 5000)
+        encryptor.encrypt_file(source, tmp_path / "data.enc", "pw", chunk_size=1000)
+        data = (tmp_path / "data.enc").read_bytes()
+        (tmp_path / "data.enc").write_bytes(data[:-10])
+
+        with pytest.raises(IntegrityError):
+            encryptor.decrypt_file(tmp_path / "data.enc", tmp_path / "out.ods", "pw")
+        assert list(tmp_path.glob("*out.ods*")) == []
+
+    def test_reads_legacy_format(
+        self, encryptor: FileEncryptor, tmp_path: Path
+    ) -> None:
+        """Test single-shot version 1 files are still decrypted."""
+        content = b"legacy budget content"
+        salt = os.urandom(32)
+        nonce = os.urandom(12)
+        key = _derive_key_pbkdf2("password", salt, 1000)
+        ciphertext, tag = _encrypt_aes_gcm(content, key, nonce)
+        metadata = EncryptionMetadata(
+            iterations=1000,
+            salt=salt,
+            nonce=nonce,
+            content_hash=hashlib.sha256(content).hexdigest(),
+        )
+        legacy = tmp_path / "legacy.enc"
+        encryptor._write_encrypted_file(legacy, ciphertext, tag, metadata)
+
+        assert legacy.read_bytes()[6:8] == b"\x00\x01"
+        encryptor.decrypt_file(legacy, tmp_path / "out.ods", "password")
+        assert (tmp_path / "out.ods").read_bytes() == content
+
+    def test_invalid_chunk_size(self, encryptor: FileEncryptor) -> None:
+        """Test non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError, match="chunk_size"):
+            encryptor.open_writer(io.BytesIO(), "password", chunk_size=0)
+
+
+class TestCredentialStoreSession:
+    """Tests for CredentialStore unlock/lock sessions."""
+
+    PASSWORD = "MyStr0ng!Pass24"
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> CredentialStore:
+        """Create a credential store with one saved credential."""
+        store = CredentialStore(tmp_path / "credentials.enc")
+        store._encryptor = FileEncryptor(SecurityAuditLog(tmp_path / "audit.log"))
+        store.store_credential("api_key", "secret", self.PASSWORD)
+        return store
+
+    def test_session_reads_without_password(self, store: CredentialStore) -> None:
+        """Test credentials are served from the unlocked session."""
+        with store.session(self.PASSWORD):
+            assert store.is_unlocked
+            assert store.get_credential("api_key") == "secret"
+            assert store.list_credentials() == ["api_key"]
+        assert not store.is_unlocked
+
+    def test_session_writes_persist(self, store: CredentialStore) -> None:
+        """Test session writes reach the store file."""
+        with store.session(self.PASSWORD):
+            store.store_credential("token", "abc")
+            assert store.delete_credential("api_key")
+
+        assert store.list_credentials(self.PASSWORD) == ["token"]
+        assert store.get_credential("token", self.PASSWORD) == "abc"
+
+    def test_locked_store_requires_password(self, store: CredentialStore) -> None:
+        """Test calls without a password fail while locked."""
+        with pytest.raises(CredentialError, match="locked"):
+            store.get_credential("api_key")
+
+    def test_wrong_password(
+        self, store: CredentialStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed unlock fails and zeroes the derived key."""
+        zeroized: list[bytearray] = []
+
+        def record(buffer: bytearray) -> None:
+            zeroized.append(buffer)
+            real_zeroize(buffer)
+
+        real_zeroize = security._zeroize
+        monkeypatch.setattr(security, "_zeroize", record)
+
+        with pytest.raises(IntegrityError):
+            store.unlock("Wr0ng!Password99")
+        assert not store.is_unlocked
+        assert len(zeroized) == 1
+        assert len(zeroized[0]) == 32 and not any(zeroized[0])
+
+    def test_ttl_expiry(self, store: CredentialStore) -> None:
+        """Test sessions lock themselves once the TTL passes."""
+        store.unlock(self.PASSWORD, ttl=0)
+
+        assert not store.is_unlocked
+        with pytest.raises(CredentialError):
+            store.get_credential("api_key")
+
+    def test_lock_zeroes_key(self, store: CredentialStore) -> None:
+        """Test lock() overwrites the cached key."""
+        store.unlock(self.PASSWORD)
+        key = store._session_key
+        assert key is not None and any(key)
+
+        store.lock()
+
+        assert not any(key)
+        assert store._session_credentials == {}
+
+    def test_no_temp_files(
+        self, store: CredentialStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test reads and writes stay in memory."""
+        import tempfile
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("temporary file created")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", fail)
+        monkeypatch.setattr(tempfile, "mkstemp", fail)
+
+        assert store.get_credential("api_key", self.PASSWORD) == "secret"
+        store.store_credential("other", "value", self.PASSWORD)
+        assert store.list_credentials(self.PASSWORD) == ["api_key", "other"]
+
+    def test_new_store_weak_password(self, tmp_path: Path) -> None:
+        """Test unlocking a new store enforces password strength."""
+        store = CredentialStore(tmp_path / "new.enc")
+        with pytest.raises(ValueError, match="too weak"):
+            store.unlock("weak")
+
+
 class TestSecurityAuditLog:
     """Tests for SecurityAuditLog class."""
 
@@ -10,13 +10,17 @@
     - Large dataset handling (1000+ rows)
     - Context manager support
     - Error handling
+    - Incremental JSON and JSON Lines readers
 
 Implements comprehensive coverage for Streaming I/O
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
+import json
+import zipfile
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import pytest
 
@@ -27,6 +31,8 @@
     StreamingReader,
     StreamingRow,
     StreamingWriter,
+    iter_json_array,
+    iter_json_lines,
     stream_read,
     stream_write,
 )
@@ -572,6 +578,91 @@ def test_round_trip(self, tmp_path: Path) -> None:
             # First row might be headers depending on implementation
             assert len(rows) >= 2
 
+    def test_encrypted_output(self, tmp_path: Path) -> None:
+        """Test password-protected output is encrypted while written."""
+        from spreadsheet_dl.security import FileEncryptor, SecurityAuditLog
+
+        output_file = tmp_path / "secret.ods.enc"
+        with StreamingWriter(output_file, password="pw") as writer:
+            writer.start_sheet("Test", columns=["Name", "Age"])
+            writer.write_row(["Alice", 30])
+            writer.end_sheet()
+
+        assert output_file.read_bytes().startswith(FileEncryptor.MAGIC_BYTES)
+
+        decrypted = tmp_path / "secret.ods"
+        encryptor = FileEncryptor(SecurityAuditLog(tmp_path / "audit.log"))
+        metadata = encryptor.decrypt_file(output_file, decrypted, "pw")
+        assert metadata.original_filename == "secret.ods"
+
+        with StreamingReader(decrypted) as reader:
+            assert reader.sheet_names() == ["Test"]
+
+    def test_rows_spill_to_disk(self, tmp_path: Path) -> None:
+        """Test memory while writing does not grow with the row count."""
+        import tracemalloc
+
+        def peak_while_writing(rows: int) -> int:
+            writer = StreamingWriter(tmp_path / f"rows{rows}.ods", chunk_size=200)
+            writer.start_sheet("Data", columns=["Item", "Value"])
+            tracemalloc.start()
+            for i in range(rows):
+                writer.write_row([f"Item {i}", i * 1.5])
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            writer.close()
+            return peak
+
+        assert peak_while_writing(5_000) < 2 * peak_while_writing(500)
+
+        with StreamingReader(tmp_path / "rows5000.ods") as reader:
+            assert reader.row_count("Data") == 5_001
+
+    def test_spilled_sheets_keep_styles(self, tmp_path: Path) -> None:
+        """Test styles used only by spilled rows survive into content.xml."""
+        from odf.opendocument import load
+
+        output_file = tmp_path / "styled.ods"
+        with StreamingWriter(output_file, chunk_size=2) as writer:
+            writer.start_sheet("First", columns=["A"])
+            writer.write_rows([[1], [2], [3]])
+            writer.start_sheet("Second")
+            writer.write_row([StreamingCell(value="Total", style="total")])
+
+        with zipfile.ZipFile(output_file) as zf:
+            content = zf.read("content.xml").decode()
+        assert "__rows_" not in content
+        assert 'style:name="DefaultTotal"' in content
+        assert 'table:style-name="DefaultTotal"' in content
+
+        doc = load(str(output_file))
+        assert doc.spreadsheet is not None
+        with StreamingReader(output_file) as reader:
+            assert [reader.row_count(name) for name in reader.sheet_names()] == [4, 1]
+
+    def test_encrypted_output_failure(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed encrypted render leaves no sealed partial file."""
+        from spreadsheet_dl import ods_packaging
+
+        def fail_midway(
+            members: object, output: BinaryIO, *args: Any, **kw: Any
+        ) -> None:
+            output.write(b"PK partial")
+            raise OSError("disk full")
+
+        monkeypatch.setattr(ods_packaging, "write_package", fail_midway)
+        output_file = tmp_path / "secret.ods.enc"
+        writer = StreamingWriter(output_file, password="pw")
+        writer.start_sheet("Test", columns=["Name"])
+        writer.write_row(["Alice"])
+        writer.end_sheet()
+
+        with pytest.raises(OSError, match="disk full"):
+            writer.close()
+        assert not output_file.exists()
+
 
 # ==============================================================================
 # Convenience Functions Tests
@@ -600,6 +691,91 @@ def test_stream_write_with_chunk_size(self, tmp_path: Path) -> None:
         assert writer._chunk_size == 500
 
 
+class TestIncrementalJSON:
+    """Tests for iter_json_array and iter_json_lines."""
+
+    def test_array_across_chunks(self) -> None:
+        """Elements split across tiny chunks decode intact."""
+        items = [{"t": i, "v": i * 1.5, "tag": f"s{i}"} for i in range(50)]
+        doc = json.dumps(items, indent=2)
+        assert list(iter_json_array(io.StringIO(doc), chunk_size=3)) == items
+
+    def test_number_at_chunk_boundary(self) -> None:
+        """A number ending a chunk is not cut short."""
+        assert list(iter_json_array(io.StringIO("[123456, 7]"), chunk_size=4)) == [
+            123456,
+            7,
+        ]
+
+    def test_array_under_key(self) -> None:
+        """The first non-empty array under a listed key is streamed."""
+        doc = '{"meta": {"n": 2}, "readings": [], "data": [1, 2], "samples": [3]}'
+        assert list(iter_json_array(io.StringIO(doc), ("readings", "data"))) == [1, 2]
+
+    @pytest.mark.parametrize(
+        "doc",
+        [
+            '{"samples": [3], "data": [1, 2], "readings": []}',
+            '{"data": [1, 2], "samples": [3]}',
+            '{"samples": [3], "readings": [], "data": [1, 2]}',
+        ],
+    )
+    def test_key_priority(self, doc: str) -> None:
+        """Keys are chosen in priority order, not document order."""
+        keys = ("readings", "data", "samples")
+        assert list(iter_json_array(io.StringIO(doc), keys, chunk_size=4)) == [1, 2]
+
+    def test_empty_array_under_key(self) -> None:
+        """An empty array under a listed key yields nothing, not the object."""
+        doc = '{"site": "x", "readings": []}'
+        assert (
+            list(iter_json_array(io.StringIO(doc), ("readings",), whole_object=True))
+            == []
+        )
+
+    def test_object_without_array(self) -> None:
+        """Objects without a listed array yield nothing or the object itself."""
+        doc = '{"sensor": "S1", "pm25": 12}'
+        assert list(iter_json_array(io.StringIO(doc), ("readings",))) == []
+        assert list(
+            iter_json_array(io.StringIO(doc), ("readings",), whole_object=True)
+        ) == [{"sensor": "S1", "pm25": 12}]
+
+    @pytest.mark.parametrize(
+        "doc",
+        [
+            "[1, 2",
+            "[1 2]",
+            '{"a" 1}',
+            "[1, 2] trailing junk",
+            '{"data": [1]} {}',
+            '{"data": [1], "b": x}',
+        ],
+    )
+    def test_malformed(self, doc: str) -> None:
+        """Malformed documents raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(io.StringIO(doc), ("data",)))
+
+    def test_trailing_whitespace(self) -> None:
+        """Whitespace after the top-level value is allowed."""
+        assert list(iter_json_array(io.StringIO("[1, 2]\n\n  "))) == [1, 2]
+
+    def test_scalar_document(self) -> None:
+        """A top-level scalar is rejected."""
+        with pytest.raises(ValueError, match="expected an array or an object"):
+            list(iter_json_array(io.StringIO("42")))
+
+    def test_json_lines(self) -> None:
+        """JSON Lines skips blank lines and reports the bad line number."""
+        fp = io.StringIO('{"a": 1}\n\n{"a": 2}\n{bad\n')
+        values = iter_json_lines(fp)
+        assert next(values) == {"a": 1}
+        assert next(values) == {"a": 2}
+        with pytest.raises(json.JSONDecodeError, match="Line 4"):
+            next(values)
+
+
 # ==============================================================================
 # Integration Tests
 # ==============================================================================
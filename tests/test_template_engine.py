@@ -4,6 +4,8 @@
 Tests:
 """
 
+from pathlib import Path
+
 import pytest
 
 from spreadsheet_dl.template_engine import (
@@ -16,8 +18,10 @@
     RowTemplate,
     SheetTemplate,
     SpreadsheetTemplate,
+    TemplateLoader,
     TemplateVariable,
     VariableType,
+    load_template,
     load_template_from_yaml,
     render_template,
 )
@@ -496,3 +500,39 @@ def test_load_with_components(self) -> None:
         template = load_template_from_yaml(yaml_content)
         assert "header_block" in template.components
         assert template.components["header_block"].description == "Standard header"
+
+    def test_compiled_template_cache(self, tmp_path: Path) -> None:
+        """Test compiled templates are reused until the file changes."""
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        path = template_dir / "report.yaml"
+        path.write_text('meta:\n  name: "Report"\n')
+        cache_dir = tmp_path / "cache"
+
+        assert load_template("report", template_dir).name == "Report"
+        assert not cache_dir.exists()
+        TemplateLoader(template_dir, cache_dir).load("report")
+        assert len(list((cache_dir / "templates").iterdir())) == 1
+
+        path.write_text('meta:\n  name: "Report v2"\n')
+        assert TemplateLoader(template_dir, cache_dir).load("report").name == (
+            "Report v2"
+        )
+
+    def test_compiled_template_cache_relative_path(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test entries loaded via a relative path track the resolved file."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        for directory in (first, second):
+            directory.mkdir()
+            (directory / "report.yaml").write_text('meta:\n  name: "Report"\n')
+        cache_dir = tmp_path / "cache"
+
+        monkeypatch.chdir(first)
+        TemplateLoader(cache_dir=cache_dir).load_from_file("report.yaml")
+        (first / "report.yaml").write_text('meta:\n  name: "Edited"\n')
+
+        monkeypatch.chdir(second)
+        loader = TemplateLoader(cache_dir=cache_dir)
+        assert loader.load_from_file(first / "report.yaml").name == "Edited"
@@ -162,6 +162,54 @@ def test_style_inheritance_chain(self) -> None:
         assert header.font.weight.is_bold
 
 
+@pytest.mark.skipif(not HAS_YAML, reason="PyYAML not installed")
+class TestCompiledThemeCache:
+    """Tests for the on-disk compiled theme cache."""
+
+    def test_load_all(self) -> None:
+        """Test batch loading every available theme."""
+        loader = ThemeLoader()
+        themes = loader.load_all()
+        assert list(themes) == loader.list_themes()
+        assert themes["corporate"] is loader.load("corporate")
+
+    def test_compiled_theme_reused(self, tmp_path: Path) -> None:
+        """Test a new loader reuses compiled themes instead of parsing."""
+        ThemeLoader(cache_dir=tmp_path).load_all()
+
+        loader = ThemeLoader(cache_dir=tmp_path)
+        loader._parse_theme = None  # type: ignore[assignment,method-assign]
+        assert loader.load("corporate") == ThemeLoader().load("corporate")
+
+    def test_parent_change_invalidates_child(self, tmp_path: Path) -> None:
+        """Test editing a parent theme recompiles themes extending it."""
+        theme_dir = tmp_path / "themes"
+        theme_dir.mkdir()
+        (theme_dir / "base.yaml").write_text(
+            'meta:\n  name: "Base"\ncolors:\n  primary: "#111111"\n'
+        )
+        (theme_dir / "child.yaml").write_text(
+            'meta:\n  name: "Child"\n  extends: base\n'
+        )
+        cache_dir = tmp_path / "cache"
+        child = ThemeLoader(theme_dir, cache_dir).load("child")
+        assert str(child.colors.primary) == "#111111"
+
+        (theme_dir / "base.yaml").write_text(
+            'meta:\n  name: "Base"\ncolors:\n  primary: "#222222"\n'
+        )
+        child = ThemeLoader(theme_dir, cache_dir).load("child")
+        assert str(child.colors.primary) == "#222222"
+
+    def test_cache_dir_from_env(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test SPREADSHEET_DL_CACHE_DIR enables the compiled cache."""
+        monkeypatch.setenv("SPREADSHEET_DL_CACHE_DIR", str(tmp_path))
+        ThemeLoader().load("default")
+        assert list((tmp_path / "themes").glob("*.pickle"))
+
+
 @pytest.mark.skipif(not HAS_YAML, reason="PyYAML not installed")
 class TestThemeColors:
     """Tests for theme color functionality."""
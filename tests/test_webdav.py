@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
-from typing import TYPE_CHECKING
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
+from urllib.parse import unquote, urlsplit
 
 import pytest
 
@@ -14,12 +19,172 @@
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
 
 pytestmark = [pytest.mark.integration]
 
 
+class _DavState:
+    """In-memory tree behind the local WebDAV stand-in."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.dirs = {
+            "/remote.php/dav/files/testuser",
+            "/remote.php/dav/uploads/testuser",
+        }
+        self.files: dict[str, bytes] = {}
+        self.checksums: dict[str, str] = {}
+        self.calls: Counter[str] = Counter()
+        self.fail_puts: set[str] = set()  # path suffixes failing once
+        self.forbidden_dirs: set[str] = set()  # path suffixes MKCOL rejects
+        self.active_puts = 0
+        self.peak_puts = 0
+
+    def etag(self, path: str) -> str:
+        return hashlib.md5(self.files[path], usedforsecurity=False).hexdigest()
+
+
+class _DavHandler(BaseHTTPRequestHandler):
+    """Minimal Nextcloud-flavoured WebDAV server for upload tests."""
+
+    state: _DavState
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _path(self, url: str | None = None) -> str:
+        return unquote(urlsplit(url or self.path).path).rstrip("/")
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    def _send(self, status: int, body: str = "", **headers: str) -> None:
+        data = body.encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name.replace("_", "-"), value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _entry(self, path: str) -> str:
+        state = self.state
+        if path in state.dirs:
+            props = "<d:resourcetype><d:collection/></d:resourcetype>"
+        else:
+            props = (
+                f'<d:getetag>"{state.etag(path)}"</d:getetag>'
+                f"<d:getcontentlength>{len(state.files[path])}</d:getcontentlength>"
+                f"<oc:checksums><oc:checksum>{state.checksums.get(path, '')}"
+                "</oc:checksum></oc:checksums>"
+            )
+        return (
+            f"<d:response><d:href>{path}</d:href><d:propstat><d:prop>{props}"
+            "</d:prop></d:propstat></d:response>"
+        )
+
+    def do_PROPFIND(self) -> None:
+        self._body()
+        path = self._path()
+        state = self.state
+        with state.lock:
+            state.calls["PROPFIND"] += 1
+            if path not in state.dirs and path not in state.files:
+                self._send(404)
+                return
+            paths = [path]
+            if self.headers.get("Depth") == "1" and path in state.dirs:
+                paths += sorted(p for p in state.files if p.rsplit("/", 1)[0] == path)
+            body = "".join(self._entry(p) for p in paths)
+        self._send(
+            207,
+            '<d:multistatus xmlns:d="DAV:" xmlns:oc="http://owncloud.org/ns">'
+            f"{body}</d:multistatus>",
+        )
+
+    def do_MKCOL(self) -> None:
+        path = self._path()
+        state = self.state
+        with state.lock:
+            state.calls["MKCOL"] += 1
+            if path in state.dirs:
+                self._send(405)
+            elif any(path.endswith(s) for s in state.forbidden_dirs):
+                self._send(403)
+            elif path.rsplit("/", 1)[0] not in state.dirs:
+                self._send(409)
+            else:
+                state.dirs.add(path)
+                self._send(201)
+
+    def do_PUT(self) -> None:
+        data = self._body()
+        path = self._path()
+        state = self.state
+        with state.lock:
+            state.calls["PUT"] += 1
+            state.active_puts += 1
+            state.peak_puts = max(state.peak_puts, state.active_puts)
+        try:
+            threading.Event().wait(0.02)
+            with state.lock:
+                failing = {s for s in state.fail_puts if path.endswith(s)}
+                if failing:
+                    state.fail_puts -= failing
+                    self._send(500)
+                    return
+                if path.rsplit("/", 1)[0] not in state.dirs:
+                    self._send(409)
+                    return
+                state.files[path] = data
+                if checksum := self.headers.get("OC-Checksum"):
+                    state.checksums[path] = checksum
+                self._send(201, OC_ETag=f'"{state.etag(path)}"')
+        finally:
+            with state.lock:
+                state.active_puts -= 1
+
+    def do_MOVE(self) -> None:
+        source = self._path().removesuffix("/.file")
+        target = self._path(self.headers["Destination"])
+        state = self.state
+        with state.lock:
+            state.calls["MOVE"] += 1
+            names = sorted(p for p in state.files if p.rsplit("/", 1)[0] == source)
+            state.files[target] = b"".join(state.files.pop(p) for p in names)
+            state.checksums[target] = self.headers.get("OC-Checksum", "")
+            state.dirs.discard(source)
+            self._send(201, OC_ETag=f'"{state.etag(target)}"')
+
+
+@pytest.fixture
+def dav_server() -> Iterator[tuple[NextcloudConfig, _DavState]]:
+    """Run a local WebDAV stand-in, yielding a client config and its state."""
+    state = _DavState()
+    handler = type("Handler", (_DavHandler,), {"state": state})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield (
+            NextcloudConfig(
+                server_url=f"http://127.0.0.1:{server.server_address[1]}",
+                username="testuser",
+                password="testpass",
+            ),
+            state,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 class TestNextcloudConfig:
     """Tests for NextcloudConfig."""
 
@@ -225,3 +390,125 @@ def test_download_file(
 
         assert result == local_path
         # File should exist (mock content written)
+
+
+class TestWebDAVUploads:
+    """Upload behavior against a local WebDAV stand-in."""
+
+    FILES = "/remote.php/dav/files/testuser"
+
+    @staticmethod
+    def _reports(tmp_path: Path, count: int) -> list[tuple[Path, str]]:
+        jobs = []
+        for index in range(count):
+            path = tmp_path / f"report-{index}.ods"
+            path.write_bytes(f"report {index}".encode() * 50)
+            jobs.append((path, f"Reports/2025-01/account-{index % 3}/{path.name}"))
+        return jobs
+
+    def test_directory_cache(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test repeated uploads into one folder probe it only once."""
+        config, state = dav_server
+        client = WebDAVClient(config)
+        for path, remote in self._reports(tmp_path, 6)[::3]:
+            client.upload_file(path, remote)
+            client.upload_file(path, remote)
+
+        assert state.calls["MKCOL"] == 4
+        assert state.calls["PROPFIND"] == 4
+        assert f"{self.FILES}/Finance/Reports/2025-01/account-0" in state.dirs
+
+    def test_upload_many_concurrent(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test bulk uploads run concurrently and keep input order."""
+        config, state = dav_server
+        client = WebDAVClient(config)
+        jobs = self._reports(tmp_path, 12)
+
+        results = client.upload_many(jobs, max_workers=4)
+
+        assert [r.local_path for r in results] == [path for path, _ in jobs]
+        assert not any(r.error or r.skipped for r in results)
+        assert 1 < state.peak_puts <= 4
+        remote = f"{self.FILES}/Finance/Reports/2025-01/account-2/report-5.ods"
+        assert state.files[remote] == jobs[5][0].read_bytes()
+
+    def test_skips_unchanged_files(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test files whose size and checksum match are not re-sent."""
+        config, state = dav_server
+        jobs = self._reports(tmp_path, 4)
+        WebDAVClient(config).upload_many(jobs)
+        jobs[1][0].write_bytes(b"changed")
+
+        results = WebDAVClient(config).upload_many(jobs, skip_unchanged=True)
+
+        assert [r.skipped for r in results] == [True, False, True, True]
+        assert state.calls["PUT"] == 5
+
+    def test_skips_by_etag(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test a matching ETag from the last upload skips the file."""
+        config, state = dav_server
+        client = WebDAVClient(config)
+        (path, remote), *_ = self._reports(tmp_path, 1)
+        client.upload_file(path, remote)
+        state.checksums.clear()  # server without checksum support
+
+        assert client.upload_many([(path, remote)], skip_unchanged=True)[0].skipped
+        assert state.calls["PUT"] == 1
+
+    def test_chunked_upload_resumes(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test large files upload in chunks and resume after a failure."""
+        config, state = dav_server
+        client = WebDAVClient(config)
+        path = tmp_path / "archive.ods"
+        data = os.urandom(10_000)
+        path.write_bytes(data)
+        state.fail_puts.add("/00003")
+
+        with pytest.raises(ConnectionError):
+            client.upload_file(path, chunk_size=4096)
+        assert state.calls["PUT"] == 3
+
+        client.upload_file(path, chunk_size=4096)
+
+        assert state.calls["PUT"] == 4
+        assert state.files[f"{self.FILES}/Finance/archive.ods"] == data
+        result = client.upload_many([path], skip_unchanged=True, chunk_size=4096)[0]
+        assert result.skipped
+
+    def test_upload_many_reports_errors(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test one failing file does not stop the rest."""
+        config, _ = dav_server
+        jobs = self._reports(tmp_path, 3)
+        missing = tmp_path / "missing.ods"
+
+        results = WebDAVClient(config).upload_many([*jobs, missing])
+
+        assert [r.error is None for r in results] == [True, True, True, False]
+        assert "not found" in (results[-1].error or "")
+
+    def test_upload_many_directory_failure(
+        self, dav_server: tuple[NextcloudConfig, _DavState], tmp_path: Path
+    ) -> None:
+        """Test a directory that cannot be created only fails its own files."""
+        config, state = dav_server
+        state.forbidden_dirs.add("/account-1")
+        jobs = self._reports(tmp_path, 6)
+
+        results = WebDAVClient(config).upload_many(jobs)
+
+        failed = [r.error is not None for r in results]
+        assert failed == [False, True, False, False, True, False]
+        assert "Failed to create directory" in (results[1].error or "")
+        assert state.calls["PUT"] == 4